@@ -41,6 +41,11 @@ from ...skills.runtime.skill_runtime import normalize_skill_name_list
 from ..base.domain_agent import DomainAgent
 from .adk_agent_hooks import AdkAgentHooks
 from .adk_event_converter import AdkEventConverter
+from .response_selection import (
+    ResponseCandidateSelector,
+    current_response_listener,
+    iter_event_texts,
+)
 from .tool_conversion import build_adk_agent, create_function_tools
 from ...framework.adk.live_communicator import AdkLiveCommunicator, SessionHistoryRecorder
 from ...framework.adk.llm_callbacks import (
@@ -1109,10 +1114,11 @@ class AdkDomainAgent(DomainAgent):
                 new_message=content
             )
 
-            # Process events to get final response with enhanced selection logic
-            all_responses = []
+            # Select the final response incrementally; only the best candidate is kept
+            selector = ResponseCandidateSelector()
+            listener = current_response_listener()
             token_usage: Optional[Dict[str, Any]] = None
-            
+
             async for event in events:
                 event_usage = getattr(event, "usage_metadata", None) or getattr(event, "usage", None)
                 if event_usage and not token_usage:
@@ -1124,68 +1130,20 @@ class AdkDomainAgent(DomainAgent):
                         if meta_usage:
                             token_usage = self._usage_to_dict(meta_usage)
 
-                # Process all events with content
-                if event.content:
-                    # Extract text from parts
-                    if hasattr(event.content, 'parts') and event.content.parts:
-                        for part in event.content.parts:
-                            if hasattr(part, 'text') and part.text:
-                                text = part.text.strip()
-                                if text and len(text) > 10:  # Minimum content threshold
-                                    all_responses.append({
-                                        'text': text,
-                                        'is_final': event.is_final_response(),
-                                        'length': len(text)
-                                    })
-                    
-                    # Extract text directly from content
-                    if hasattr(event.content, 'text') and event.content.text:
-                        text = event.content.text.strip()
-                        if text and len(text) > 10:
-                            all_responses.append({
-                                'text': text,
-                                'is_final': event.is_final_response(),
-                                'length': len(text)
-                            })
-            
-            # Select best response using general quality heuristics
-            if all_responses:
-                def score_response(resp):
-                    text = resp['text']
-                    score = 0
-                    
-                    # Length score - longer responses often more comprehensive
-                    score += len(text) / 100
-                    
-                    # Content quality indicators
-                    quality_indicators = [
-                        '.',  # Proper sentences
-                        '\n',  # Multi-line structure
-                        ':',  # Explanatory content
-                        '-',  # Lists or bullet points
-                    ]
-                    quality_score = sum(5 for indicator in quality_indicators 
-                                      if text.count(indicator) > 0)
-                    score += quality_score
-                    
-                    # Avoid obviously incomplete responses
-                    incomplete_patterns = ['...', 'please wait', 'loading', 'error occurred']
-                    incomplete_penalty = sum(20 for pattern in incomplete_patterns 
-                                           if pattern.lower() in text.lower())
-                    score -= incomplete_penalty
-                    
-                    # Prefer final responses slightly
-                    if resp['is_final']:
-                        score += 5
-                    
-                    return score
-                
-                best_response = max(all_responses, key=score_response)
-                self._last_usage_metadata = token_usage
-                return best_response['text']
-            else:
-                self._last_usage_metadata = token_usage
-                return "No valid response received from ADK"
+                if not event.content:
+                    continue
+                is_final = None
+                for text in iter_event_texts(event):
+                    if is_final is None:
+                        is_final = bool(event.is_final_response())
+                    selector.offer(text, is_final)
+                    if listener is not None:
+                        listener(text, is_final)
+
+            self._last_usage_metadata = token_usage
+            if selector.best_text is not None:
+                return selector.best_text
+            return "No valid response received from ADK"
 
         except ImportError:
             # ADK not available, return mock response
@@ -14,10 +14,10 @@ from ...contracts import (
     build_error,
 )
 from ...framework.adk.multimodal_utils import (
-    decode_base64_image,
-    detect_image_mime_type,
-    extract_base64_from_data_url,
-    validate_image_format,
+    DEFAULT_MAX_IMAGE_BYTES,
+    DecodedImageCache,
+    decode_image_payload,
+    get_decoded_image_cache,
 )
 
 if TYPE_CHECKING:
@@ -39,8 +39,21 @@ class AdkEventConverter:
     - Core Agent Layer (THIS LAYER): Handles ADK-specific event conversion logic
     """
 
-    def __init__(self):
-        """Initialize the ADK event converter."""
+    def __init__(
+        self,
+        image_cache: Optional[DecodedImageCache] = None,
+        max_image_bytes: Optional[int] = DEFAULT_MAX_IMAGE_BYTES,
+    ):
+        """Initialize the ADK event converter.
+
+        Args:
+            image_cache: Decoded image cache; defaults to the process-wide cache
+                so repeated images are decoded once across turns and sessions.
+            max_image_bytes: Decoded size limit for inline images; larger images
+                are rejected before decoding.
+        """
+        self.image_cache = image_cache if image_cache is not None else get_decoded_image_cache()
+        self.max_image_bytes = max_image_bytes
         # Track in-flight tool interactions so results can reference proposals
         self._pending_tool_interactions: Dict[str, str] = {}
         self._fallback_plan_state: Dict[str, Dict[str, Any]] = {}
@@ -628,33 +641,28 @@ class AdkEventConverter:
                 logger.warning("ImageReference missing base64_data in metadata")
                 return None
             
-            # Extract MIME type and base64 data
-            mime_type, clean_base64 = extract_base64_from_data_url(base64_data)
-            
-            # Auto-detect MIME type if not provided
-            if not mime_type:
-                mime_type = detect_image_mime_type(clean_base64)
-            
-            if not mime_type:
-                logger.warning("Could not determine image MIME type")
-                return None
-            
-            # Validate image format
-            if not validate_image_format(mime_type):
-                logger.warning(f"Unsupported image format: {mime_type}")
-                return None
-            
-            # Decode base64 to bytes
-            image_bytes = decode_base64_image(clean_base64)
-            if not image_bytes:
-                logger.warning("Failed to decode base64 image data")
+            cache_key = DecodedImageCache.make_key(base64_data)
+            image = self.image_cache.get(cache_key)
+            if image is not None and self.max_image_bytes is not None and len(image.data) > self.max_image_bytes:
+                # Cached by a converter with a larger cap: this one must still reject it.
+                logger.warning(
+                    f"Rejected base64 image: decoded size {len(image.data)} exceeds {self.max_image_bytes} bytes"
+                )
                 return None
+            if image is None:
+                # Chunked decode: MIME type, format and size are checked before
+                # the bulk of the payload is decoded.
+                image = decode_image_payload(base64_data, max_bytes=self.max_image_bytes)
+                if image is None:
+                    logger.warning("Failed to decode base64 image data")
+                    return None
+                self.image_cache.put(cache_key, image)
             
             # Return ADK-compatible inline_data format
             return {
                 "inline_data": {
-                    "mime_type": mime_type,
-                    "data": image_bytes
+                    "mime_type": image.mime_type,
+                    "data": image.data
                 }
             }
             
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Incremental final-answer selection for non-live ADK runs.
+
+ADK runners emit several content events per turn (tool narration, partial
+answers, the final response). The domain agent picks the best candidate with
+a quality heuristic; this module scores each candidate once as it arrives and
+keeps only the current best, so memory does not grow with the event count.
+
+Listeners registered with ``listen_for_response_candidates`` receive every
+candidate as it is produced, which is how streaming callers observe a run
+without changing the domain agent call chain.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Optional
+
+MIN_CANDIDATE_LENGTH = 10
+
+_QUALITY_INDICATORS = (".", "\n", ":", "-")
+_INCOMPLETE_PATTERNS = ("...", "please wait", "loading", "error occurred")
+
+ResponseCandidateListener = Callable[[str, bool], None]
+
+_candidate_listener: ContextVar[Optional[ResponseCandidateListener]] = ContextVar(
+    "adk_response_candidate_listener", default=None
+)
+
+
+def score_response_text(text: str, is_final: bool) -> float:
+    """
+    Score a candidate response using general quality heuristics.
+
+    Longer, structured responses score higher; responses that look incomplete
+    are penalized and final responses get a small bonus.
+    """
+    score = len(text) / 100
+    score += sum(5 for indicator in _QUALITY_INDICATORS if indicator in text)
+    lowered = text.lower()
+    score -= sum(20 for pattern in _INCOMPLETE_PATTERNS if pattern in lowered)
+    if is_final:
+        score += 5
+    return score
+
+
+def iter_event_texts(event: Any) -> Iterator[str]:
+    """Yield candidate texts carried by an ADK event, in emission order."""
+    content = getattr(event, "content", None)
+    if not content:
+        return
+    parts = getattr(content, "parts", None)
+    if parts:
+        for part in parts:
+            text = getattr(part, "text", None)
+            if text:
+                text = text.strip()
+                if len(text) > MIN_CANDIDATE_LENGTH:
+                    yield text
+    text = getattr(content, "text", None)
+    if text:
+        text = text.strip()
+        if len(text) > MIN_CANDIDATE_LENGTH:
+            yield text
+
+
+class ResponseCandidateSelector:
+    """
+    Keeps the best-scoring candidate seen so far.
+
+    Ties keep the earliest candidate, matching ``max`` over the full list.
+    """
+
+    def __init__(self) -> None:
+        self.best_text: Optional[str] = None
+        self.best_score: Optional[float] = None
+        self.candidate_count = 0
+
+    def offer(self, text: str, is_final: bool) -> bool:
+        """
+        Consider one candidate.
+
+        Returns:
+            bool: True when the candidate became the current best.
+        """
+        self.candidate_count += 1
+        score = score_response_text(text, is_final)
+        if self.best_score is None or score > self.best_score:
+            self.best_text = text
+            self.best_score = score
+            return True
+        return False
+
+
+def current_response_listener() -> Optional[ResponseCandidateListener]:
+    """Return the candidate listener bound to the current context, if any."""
+    return _candidate_listener.get()
+
+
+@contextmanager
+def listen_for_response_candidates(
+    listener: ResponseCandidateListener,
+) -> Iterator[None]:
+    """
+    Bind ``listener`` to the current context.
+
+    Tasks created inside the block inherit the binding, so the listener sees
+    every candidate produced by domain agent runs started from those tasks.
+    """
+    token = _candidate_listener.set(listener)
+    try:
+        yield
+    finally:
+        _candidate_listener.reset(token)
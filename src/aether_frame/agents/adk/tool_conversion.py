@@ -7,6 +7,7 @@ from typing import Any, Callable, Dict, Iterable, List, Optional
 
 from ...contracts import ToolRequest
 from ...contracts.enums import ToolStatus
+from ...tools.schema_compiler import CompiledSchema, compile_schema
 
 
 def create_function_tools(
@@ -103,12 +104,13 @@ def create_function_tools(
 
             # Derive function signature from tool schema so ADK can expose rich metadata
             schema = getattr(tool, "parameters_schema", {}) or {}
-            signature = _build_signature_from_schema(schema)
+            compiled = compile_schema(schema)
+            signature = compiled.derived("adk_signature", _signature_from_compiled)
             if signature is not None:
                 async_adk_tool.__signature__ = signature
             if schema:
                 async_adk_tool.__doc__ = _augment_doc_with_schema(
-                    async_adk_tool.__doc__, schema
+                    async_adk_tool.__doc__, compiled
                 )
 
             return FunctionTool(func=async_adk_tool)
@@ -242,8 +244,12 @@ def _build_signature_from_schema(schema: Dict[str, Any]) -> Optional[inspect.Sig
     """Construct an inspect.Signature from a JSON schema-like dictionary."""
     if not isinstance(schema, dict):
         return None
+    return compile_schema(schema).derived("adk_signature", _signature_from_compiled)
 
-    if schema.get("type") != "object" or "properties" not in schema:
+
+def _signature_from_compiled(compiled: CompiledSchema) -> Optional[inspect.Signature]:
+    """Build the signature once per compiled schema; cached via ``derived``."""
+    if not compiled.is_object:
         # Fallback: accept opaque payload
         param = inspect.Parameter(
             "payload",
@@ -252,25 +258,19 @@ def _build_signature_from_schema(schema: Dict[str, Any]) -> Optional[inspect.Sig
         )
         return inspect.Signature(parameters=[param])
 
-    if _has_complex_schema_types(schema):
+    if compiled.has_combinators:
         return None
 
-    required_fields = set(schema.get("required", []))
     parameters: List[inspect.Parameter] = []
 
-    for name, prop in schema.get("properties", {}).items():
-        annotation = _schema_type_to_python(prop)
-        if name in required_fields:
-            default = inspect._empty
-        else:
-            default = prop.get("default", None)
+    for prop in compiled.properties:
         param_kwargs = {
-            "name": name,
+            "name": prop.name,
             "kind": inspect.Parameter.KEYWORD_ONLY,
-            "default": default,
+            "default": inspect._empty if prop.required else prop.default,
         }
-        if annotation is not None:
-            param_kwargs["annotation"] = annotation
+        if prop.python_type is not None:
+            param_kwargs["annotation"] = prop.python_type
         parameters.append(inspect.Parameter(**param_kwargs))
 
     if not parameters:
@@ -292,73 +292,14 @@ def _build_signature_from_schema(schema: Dict[str, Any]) -> Optional[inspect.Sig
     return inspect.Signature(parameters=parameters)
 
 
-def _schema_type_to_python(prop_schema: Dict[str, Any]) -> Optional[type]:
-    """Map JSON schema primitive types to Python hints for documentation."""
-    if not isinstance(prop_schema, dict):
-        return None
-
-    for option_key in ("anyOf", "oneOf", "allOf"):
-        options = prop_schema.get(option_key)
-        if not options:
-            continue
-        for option in options:
-            if not isinstance(option, dict):
-                continue
-            opt_type = option.get("type")
-            if opt_type == "null":
-                continue
-            resolved = _schema_type_to_python(option)
-            if resolved is not None:
-                return resolved
-        return None
-
-    schema_type = prop_schema.get("type")
-    if schema_type == "string":
-        return str
-    if schema_type == "integer":
-        return int
-    if schema_type == "number":
-        return float
-    if schema_type == "boolean":
-        return bool
-    if schema_type == "array":
-        return list
-    if schema_type == "object":
-        return dict
-    return None
-
-
-def _has_complex_schema_types(schema: Dict[str, Any]) -> bool:
-    """Detect whether schema includes combinations like anyOf/oneOf/allOf."""
-    if not isinstance(schema, dict):
-        return False
-
-    if any(schema.get(key) for key in ("anyOf", "oneOf", "allOf")):
-        return True
-
-    schema_type = schema.get("type")
-    if schema_type == "object":
-        for prop in (schema.get("properties") or {}).values():
-            if _has_complex_schema_types(prop):
-                return True
-    elif schema_type == "array":
-        return _has_complex_schema_types(schema.get("items", {}))
-
-    return False
-
-
-def _augment_doc_with_schema(doc: Optional[str], schema: Dict[str, Any]) -> str:
+def _augment_doc_with_schema(doc: Optional[str], compiled: CompiledSchema) -> str:
     """Append schema field descriptions to the tool docstring."""
     lines: List[str] = []
     if doc:
         lines.append(doc)
-    properties = schema.get("properties", {})
-    if properties:
+    if compiled.properties:
         lines.append("\nParameters:")
-        required = set(schema.get("required", []))
-        for name, prop in properties.items():
-            type_name = prop.get("type", "object")
-            description = prop.get("description", "")
-            required_flag = " (required)" if name in required else ""
-            lines.append(f"- {name}{required_flag} [{type_name}]: {description}".rstrip())
+        for prop in compiled.properties:
+            required_flag = " (required)" if prop.required else ""
+            lines.append(f"- {prop.name}{required_flag} [{prop.type_name}]: {prop.description}".rstrip())
     return "\n".join(lines)
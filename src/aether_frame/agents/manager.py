@@ -35,6 +35,8 @@ class AgentManager:
         self._agent_factories: Dict[FrameworkType, Callable] = (
             {}
         )  # framework -> factory
+        # Optional callback(agent_id, timestamp) notified whenever agent activity is recorded
+        self.activity_listener: Optional[Callable[[str, datetime], None]] = None
         self.logger = logging.getLogger(__name__)
 
     # Agent Lifecycle Management
@@ -86,6 +88,7 @@ class AgentManager:
                 getattr(agent_config, "framework_type", None) if agent_config else None
             ),
         }
+        self.mark_agent_activity(agent_id)
 
         return agent_id
 
@@ -101,10 +104,26 @@ class AgentManager:
         """
         if agent_id in self._agents:
             # Update last activity time
-            self._agent_metadata[agent_id]["last_activity"] = datetime.now()
+            self.mark_agent_activity(agent_id)
             return self._agents[agent_id]
         return None
 
+    def mark_agent_activity(self, agent_id: str, at: Optional[datetime] = None) -> None:
+        """
+        Record activity for an agent and notify the activity listener.
+
+        Args:
+            agent_id: Agent identifier
+            at: Activity timestamp (defaults to now)
+        """
+        metadata = self._agent_metadata.get(agent_id)
+        if metadata is None:
+            return
+        timestamp = at or datetime.now()
+        metadata["last_activity"] = timestamp
+        if self.activity_listener is not None:
+            self.activity_listener(agent_id, timestamp)
+
     async def cleanup_agent(self, agent_id: str) -> bool:
         """
         Cleanup all resources for an agent.
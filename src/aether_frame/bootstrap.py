@@ -71,6 +71,9 @@ async def initialize_system(settings: Optional[Settings] = None) -> SystemCompon
                     settings, "enable_adk_native_tools", False
                 ),
                 "enable_builtin": True,
+                "result_cache_max_entries": getattr(
+                    settings, "tool_result_cache_max_entries", 512
+                ),
             }
             mcp_servers = getattr(settings, "mcp_servers", [])
             if mcp_servers:
@@ -92,6 +95,8 @@ async def initialize_system(settings: Optional[Settings] = None) -> SystemCompon
                 await adk_adapter.initialize(config=None, tool_service=tool_service, settings=settings)
                 if hasattr(adk_adapter, "set_skill_catalog"):
                     adk_adapter.set_skill_catalog(skill_catalog)
+                if hasattr(adk_adapter, "start_warm_pool"):
+                    await adk_adapter.start_warm_pool(settings)
                 logger.info(f"ADK framework adapter loaded successfully - type: {type(adk_adapter).__name__}")
             else:
                 raise RuntimeError("Failed to load ADK framework adapter")
@@ -1,12 +1,20 @@
 # -*- coding: utf-8 -*-
 """Unified Interaction Logger - Everything in One Clear Log File."""
 
+import atexit
 import logging
 import json
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+from .log_pipeline import (
+    BackgroundLogPipeline,
+    BatchedFileHandler,
+    BatchedStreamHandler,
+    PipelineQueueHandler,
+)
+
 
 class UnifiedInteractionLogger:
     """
@@ -37,12 +45,14 @@ class UnifiedInteractionLogger:
         self.logger = logging.getLogger("unified_interactions")
         self.logger.setLevel(logging.INFO)
         
-        # Clear existing handlers
+        # Clear existing handlers (including a previous instance's pipeline)
         for handler in self.logger.handlers[:]:
             self.logger.removeHandler(handler)
+            if isinstance(handler, PipelineQueueHandler):
+                handler.pipeline.close()
         
         # File handler with clear formatting
-        file_handler = logging.FileHandler(self.log_file, encoding='utf-8')
+        file_handler = BatchedFileHandler(self.log_file, encoding='utf-8')
         
         # Simple, readable format
         formatter = logging.Formatter(
@@ -50,12 +60,30 @@ class UnifiedInteractionLogger:
             datefmt='%H:%M:%S'
         )
         file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
         
         # Also log to console for immediate feedback
-        console_handler = logging.StreamHandler()
+        console_handler = BatchedStreamHandler()
         console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
+
+        # Formatting and writes happen on a background thread so logging
+        # calls made from the event loop never block on file I/O
+        self._pipeline = BackgroundLogPipeline(
+            [file_handler, console_handler],
+            name="aether-interaction-log",
+        )
+        self.logger.addHandler(self._pipeline.queue_handler)
+        # The writer thread is a daemon: drain it before the interpreter exits
+        atexit.register(self.close)
+
+    def flush(self):
+        """Wait until all queued interaction records are written."""
+        self._pipeline.flush()
+
+    def close(self):
+        """Flush pending records and release the log file."""
+        atexit.unregister(self.close)
+        self.logger.removeHandler(self._pipeline.queue_handler)
+        self._pipeline.close()
     
     def log_user_request(self, session_id: str, task_id: str, user_message: str, agent_config: Dict[str, Any] = None):
         """Log user request."""
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+"""
+Background Log Pipeline - Off-thread formatting and batched writes.
+
+Loggers enqueue records through a bounded QueueHandler on the calling thread
+(typically the event loop); a single background thread formats them and writes
+them to its handlers in batches, flushing once per batch. When the queue is
+full the configured overflow policy decides whether records are dropped or the
+caller waits, and every decision is reflected in the pipeline counters.
+"""
+
+import copy
+import json
+import logging
+import logging.handlers
+import queue
+import threading
+from typing import Any, Dict, List, Optional, Sequence
+
+OVERFLOW_DROP_NEWEST = "drop_newest"
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_BLOCK = "block"
+OVERFLOW_POLICIES = {OVERFLOW_DROP_NEWEST, OVERFLOW_DROP_OLDEST, OVERFLOW_BLOCK}
+
+DEFAULT_MAX_QUEUE_SIZE = 10000
+DEFAULT_BATCH_SIZE = 256
+
+_STOP = object()
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formatter producing one compact JSON object per record."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, Any] = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S")
+            + f".{int(record.msecs):03d}",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for attr in ("execution_id", "flow_step", "component"):
+            value = getattr(record, attr, None)
+            if value:
+                payload[attr] = value
+        key_data = getattr(record, "key_data", None)
+        if key_data:
+            payload["key_data"] = key_data
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exception"] = record.exc_text
+        return json.dumps(
+            payload, ensure_ascii=False, separators=(",", ":"), default=str
+        )
+
+
+class _BatchFlushMixin:
+    """Defers stream flushes until the pipeline finishes a batch."""
+
+    def flush(self) -> None:
+        return
+
+    def flush_batch(self) -> None:
+        super().flush()  # type: ignore[misc]
+
+    def close(self) -> None:
+        self.flush_batch()
+        super().close()  # type: ignore[misc]
+
+
+class BatchedStreamHandler(_BatchFlushMixin, logging.StreamHandler):
+    """StreamHandler flushed once per pipeline batch."""
+
+
+class BatchedFileHandler(_BatchFlushMixin, logging.FileHandler):
+    """FileHandler flushed once per pipeline batch."""
+
+
+class BatchedRotatingFileHandler(_BatchFlushMixin, logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler flushed once per pipeline batch."""
+
+
+class PipelineQueueHandler(logging.handlers.QueueHandler):
+    """Bounded QueueHandler applying the pipeline's overflow policy."""
+
+    def __init__(self, pipeline: "BackgroundLogPipeline"):
+        super().__init__(pipeline._queue)
+        self.pipeline = pipeline
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Resolve the message eagerly but leave formatting to the writer thread."""
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        key_data = getattr(record, "key_data", None)
+        if isinstance(key_data, dict):
+            record.key_data = dict(key_data)
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self.pipeline._offer(record)
+
+
+class BackgroundLogPipeline:
+    """
+    Bounded queue plus a background writer thread shared by one or more loggers.
+
+    Attach ``queue_handler`` to loggers; records are formatted by the target
+    handlers' formatters on the writer thread. Overflow policies:
+
+    - ``drop_newest``: discard the incoming record
+    - ``drop_oldest``: discard the oldest queued record to make room
+    - ``block``: wait up to ``block_timeout`` seconds, then discard
+    """
+
+    def __init__(
+        self,
+        handlers: Sequence[logging.Handler],
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        overflow_policy: str = OVERFLOW_DROP_OLDEST,
+        block_timeout: float = 0.05,
+        name: str = "aether-log-pipeline",
+    ):
+        """Initialize the pipeline and start its writer thread."""
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Unknown overflow policy '{overflow_policy}', "
+                f"expected one of {sorted(OVERFLOW_POLICIES)}"
+            )
+        self.handlers: List[logging.Handler] = list(handlers)
+        self.batch_size = max(1, batch_size)
+        self.overflow_policy = overflow_policy
+        self.block_timeout = block_timeout
+        self._queue: "queue.Queue[Any]" = queue.Queue(max_queue_size)
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, int] = {
+            "enqueued": 0,
+            "dropped": 0,
+            "written": 0,
+            "batches": 0,
+            "handler_errors": 0,
+        }
+        self._reported_drops = 0
+        self.queue_handler = PipelineQueueHandler(self)
+        self._thread: Optional[threading.Thread] = threading.Thread(
+            target=self._run, name=name, daemon=True
+        )
+        self._thread.start()
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[key] += amount
+
+    def _offer(self, record: logging.LogRecord) -> None:
+        if self._thread is None:
+            self._count("dropped")
+            return
+        try:
+            if self.overflow_policy == OVERFLOW_BLOCK:
+                self._queue.put(record, timeout=self.block_timeout)
+            else:
+                self._queue.put_nowait(record)
+            self._count("enqueued")
+            return
+        except queue.Full:
+            pass
+
+        if self.overflow_policy == OVERFLOW_DROP_OLDEST:
+            try:
+                self._queue.get_nowait()
+                self._queue.task_done()
+                self._count("dropped")
+                self._queue.put_nowait(record)
+                self._count("enqueued")
+                return
+            except (queue.Empty, queue.Full):
+                pass
+        self._count("dropped")
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = False
+            written = 0
+            for record in batch:
+                if record is _STOP:
+                    stop = True
+                    continue
+                self._dispatch(record)
+                written += 1
+            self._report_drops()
+            for handler in self.handlers:
+                try:
+                    getattr(handler, "flush_batch", handler.flush)()
+                except Exception:
+                    self._count("handler_errors")
+            self._count("written", written)
+            self._count("batches")
+            for _ in batch:
+                self._queue.task_done()
+            if stop:
+                return
+
+    def _dispatch(self, record: logging.LogRecord) -> None:
+        for handler in self.handlers:
+            if record.levelno < handler.level:
+                continue
+            try:
+                handler.handle(record)
+            except Exception:
+                self._count("handler_errors")
+
+    def _report_drops(self) -> None:
+        with self._stats_lock:
+            dropped = self._stats["dropped"]
+        if dropped == self._reported_drops:
+            return
+        delta = dropped - self._reported_drops
+        self._reported_drops = dropped
+        record = logging.LogRecord(
+            name="aether_frame.log_pipeline",
+            level=logging.WARNING,
+            pathname=__file__,
+            lineno=0,
+            msg="Log pipeline queue full; dropped %d record(s)",
+            args=(delta,),
+            exc_info=None,
+        )
+        self._dispatch(record)
+
+    def flush(self) -> None:
+        """Block until every queued record has been written and flushed."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Drain pending records, stop the writer thread and close handlers."""
+        thread = self._thread
+        if thread is None:
+            return
+        self._thread = None
+        self._queue.put(_STOP)
+        thread.join()
+        for handler in self.handlers:
+            try:
+                handler.close()
+            except Exception:
+                pass
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return enqueue/drop/write counters and the current queue depth."""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["queue_depth"] = self._queue.qsize()
+        return stats
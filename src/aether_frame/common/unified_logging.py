@@ -4,15 +4,26 @@ Simplified Logging Configuration - Single Directory with Clear Flow Tracking
 Unified logging approach that clearly shows execution flow in a single directory.
 """
 
+import atexit
 import logging
-import logging.handlers
 import os
 import sys
+import weakref
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any
 import json
 
+from .log_pipeline import (
+    DEFAULT_MAX_QUEUE_SIZE,
+    OVERFLOW_DROP_OLDEST,
+    BackgroundLogPipeline,
+    BatchedRotatingFileHandler,
+    BatchedStreamHandler,
+    JsonLinesFormatter,
+)
+
 
 def _close_logger_handlers(logger: logging.Logger) -> None:
     """Close and detach all handlers from the provided logger."""
@@ -26,12 +37,136 @@ def _close_logger_handlers(logger: logging.Logger) -> None:
         logger.removeHandler(handler)
 
 
+def _release_logger(name: str) -> bool:
+    """
+    Remove ``name`` from the logging registry if it has no other references.
+
+    Returns True when the logger was released (or was not registered). A
+    logger still held by live code is put back so later ``getLogger`` calls
+    return the same object instead of a fresh, handler-less one.
+    """
+    registry = logging.Logger.manager.loggerDict
+    logger = registry.get(name)
+    if not isinstance(logger, logging.Logger):
+        return True
+    # Placeholders for missing ancestors ("execution") also hold the logger.
+    placeholders = []
+    prefix = name.rpartition(".")[0]
+    while prefix:
+        node = registry.get(prefix)
+        if isinstance(node, logging.PlaceHolder) and logger in node.loggerMap:
+            placeholders.append(node)
+        prefix = prefix.rpartition(".")[0]
+
+    del registry[name]
+    for node in placeholders:
+        node.loggerMap.pop(logger, None)
+    ref = weakref.ref(logger)
+    del logger
+    logger = ref()
+    if logger is None:
+        return True
+    registry[name] = logger
+    for node in placeholders:
+        node.append(logger)
+    return False
+
+
 EXECUTION_LOGGING_ENABLED = os.getenv("AETHER_ENABLE_EXECUTION_LOGS", "1").lower() not in {
     "0",
     "false",
     "no",
 }
 
+EXECUTION_LOG_FORMAT = os.getenv("AETHER_EXECUTION_LOG_FORMAT", "text").lower()
+EXECUTION_LOG_FILENAMES = {
+    "text": "execution_flow.log",
+    "jsonl": "execution_flow.jsonl",
+}
+DEFAULT_EXECUTION_LOG_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_EXECUTION_LOG_BACKUP_COUNT = 5
+DEFAULT_EXECUTION_LOGGER_CACHE_SIZE = 256
+
+
+class _ConsoleOptOutFilter(logging.Filter):
+    """Marks records from loggers that were configured without console output."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.console = False
+        return True
+
+
+class _ConsoleEnabledFilter(logging.Filter):
+    """Drops records marked as file-only before they reach the console handler."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return getattr(record, "console", True)
+
+
+class ExecutionLogSink:
+    """
+    Shared, rotating, asynchronous sink for execution flow logs.
+
+    All execution loggers enqueue records through the queue handler of one
+    BackgroundLogPipeline; its writer thread formats them and appends them in
+    batches to a single rotating file (plus an optional console stream).
+    Records are distinguished by their ``execution_id`` attribute instead of
+    by per-execution files. ``log_format`` selects the human-readable flow
+    format ("text") or compact JSON lines ("jsonl") for the file.
+    """
+
+    def __init__(
+        self,
+        log_file: Path,
+        max_bytes: int = DEFAULT_EXECUTION_LOG_MAX_BYTES,
+        backup_count: int = DEFAULT_EXECUTION_LOG_BACKUP_COUNT,
+        enable_console: bool = True,
+        log_format: str = "text",
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        overflow_policy: str = OVERFLOW_DROP_OLDEST,
+    ):
+        """Initialize the sink and start its writer thread."""
+        self.log_file = log_file
+        flow_formatter = ExecutionFlowFormatter()
+        file_formatter = JsonLinesFormatter() if log_format == "jsonl" else flow_formatter
+
+        file_handler = BatchedRotatingFileHandler(
+            filename=log_file,
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            encoding="utf-8",
+            delay=True,
+        )
+        file_handler.setLevel(logging.DEBUG)  # Capture all details in file
+        file_handler.setFormatter(file_formatter)
+        handlers = [file_handler]
+
+        if enable_console:
+            console_handler = BatchedStreamHandler(sys.stdout)
+            console_handler.setFormatter(flow_formatter)
+            console_handler.addFilter(_ConsoleEnabledFilter())
+            handlers.append(console_handler)
+
+        self.pipeline = BackgroundLogPipeline(
+            handlers,
+            max_queue_size=max_queue_size,
+            overflow_policy=overflow_policy,
+            name="aether-execution-log",
+        )
+        self.queue_handler = self.pipeline.queue_handler
+
+    def flush(self) -> None:
+        """Block until queued records have been written."""
+        self.pipeline.flush()
+
+    def close(self) -> None:
+        """Drain the queue, stop the writer thread, and close the handlers."""
+        self.pipeline.close()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return pipeline enqueue/drop/write counters."""
+        return self.pipeline.get_stats()
+
 
 class UnifiedLoggingConfig:
     """
@@ -39,14 +174,33 @@ class UnifiedLoggingConfig:
     
     Features:
     - Single 'logs' directory (no subdirectories)
-    - Clear execution flow tracking
+    - One shared rotating execution log, formatted and written in batches
+      by a background thread (text or JSON lines)
+    - Bounded LRU of named execution loggers
     - Structured logging with execution context
     - Key execution points logging
     """
 
-    def __init__(self, log_base_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        log_base_dir: Optional[Path] = None,
+        max_bytes: int = DEFAULT_EXECUTION_LOG_MAX_BYTES,
+        backup_count: int = DEFAULT_EXECUTION_LOG_BACKUP_COUNT,
+        logger_cache_size: int = DEFAULT_EXECUTION_LOGGER_CACHE_SIZE,
+        log_format: Optional[str] = None,
+    ):
         """Initialize unified logging configuration."""
         self.log_base_dir = log_base_dir or Path("logs")
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.logger_cache_size = logger_cache_size
+        self.log_format = log_format or EXECUTION_LOG_FORMAT
+        if self.log_format not in EXECUTION_LOG_FILENAMES:
+            self.log_format = "text"
+        self._sink: Optional[ExecutionLogSink] = None
+        self._loggers: "OrderedDict[str, logging.Logger]" = OrderedDict()
+        # Evicted loggers still referenced elsewhere; released once unreferenced.
+        self._retained: set = set()
         self._ensure_log_directory()
 
     def _ensure_log_directory(self):
@@ -59,7 +213,20 @@ class UnifiedLoggingConfig:
             with open(gitignore_path, "w", encoding="utf-8") as f:
                 f.write("# Aether Frame Unified Logs\n")
                 f.write("*.log\n")
+                f.write("*.log.*\n")
                 f.write("*.json\n")
+                f.write("*.jsonl*\n")
+
+    def get_sink(self) -> ExecutionLogSink:
+        """Return the shared execution log sink, starting it on first use."""
+        if self._sink is None:
+            self._sink = ExecutionLogSink(
+                self.log_base_dir / EXECUTION_LOG_FILENAMES[self.log_format],
+                max_bytes=self.max_bytes,
+                backup_count=self.backup_count,
+                log_format=self.log_format,
+            )
+        return self._sink
 
     def setup_execution_logger(
         self,
@@ -69,6 +236,11 @@ class UnifiedLoggingConfig:
     ) -> logging.Logger:
         """
         Setup unified execution logger that tracks the complete flow.
+
+        Loggers share the configuration's asynchronous sink and are kept in a
+        bounded LRU. A logger evicted from the LRU is dropped from the logging
+        registry only once nothing else references it; until then it keeps its
+        handler, so ``getLogger`` keeps returning the same configured object.
         
         Args:
             execution_id: Unique execution identifier
@@ -79,43 +251,69 @@ class UnifiedLoggingConfig:
             logging.Logger: Configured execution logger
         """
         logger_name = f"execution.{execution_id}"
-        logger = logging.getLogger(logger_name)
-        _close_logger_handlers(logger)
+        logger = self._loggers.get(logger_name)
+        if logger is None:
+            logger = logging.getLogger(logger_name)
+            queue_handler = self.get_sink().queue_handler
+            if logger_name in self._retained:
+                # Evicted but still referenced: it is already configured.
+                self._retained.discard(logger_name)
+            if logger.handlers != [queue_handler]:
+                _close_logger_handlers(logger)
+                logger.addHandler(queue_handler)
+            logger.propagate = False
+            self._loggers[logger_name] = logger
+            if len(self._loggers) > self.logger_cache_size:
+                while len(self._loggers) > self.logger_cache_size:
+                    self._retained.add(self._loggers.popitem(last=False)[0])
+                self._release_unreferenced()
+        else:
+            self._loggers.move_to_end(logger_name)
 
         # Set level
         numeric_level = getattr(logging, level.upper(), logging.INFO)
         logger.setLevel(numeric_level)
-        
-        # Unified formatter with execution context
-        unified_formatter = ExecutionFlowFormatter()
-        
-        # Console handler (if enabled)
-        if enable_console:
-            console_handler = logging.StreamHandler(sys.stdout)
-            console_handler.setLevel(numeric_level)
-            console_handler.setFormatter(unified_formatter)
-            logger.addHandler(console_handler)
-        
-        # Single file handler for complete execution
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_file = self.log_base_dir / f"execution_{execution_id}_{timestamp}.log"
-        
-        file_handler = logging.FileHandler(
-            filename=log_file,
-            encoding='utf-8'
-        )
-        file_handler.setLevel(logging.DEBUG)  # Capture all details in file
-        file_handler.setFormatter(unified_formatter)
-        logger.addHandler(file_handler)
-        
-        logger.propagate = False
+
+        for existing in list(logger.filters):
+            if isinstance(existing, _ConsoleOptOutFilter):
+                logger.removeFilter(existing)
+        if not enable_console:
+            logger.addFilter(_ConsoleOptOutFilter())
+
         return logger
 
+    def _release_unreferenced(self) -> None:
+        """Drop retained loggers that nothing outside the registry references."""
+        for name in list(self._retained):
+            if _release_logger(name):
+                self._retained.discard(name)
+
     def create_execution_context(self, execution_id: str) -> 'ExecutionContext':
         """Create execution context for flow tracking."""
         logger = self.setup_execution_logger(execution_id)
         return ExecutionContext(execution_id, logger)
 
+    def flush(self) -> None:
+        """Wait for pending execution records to reach their handlers."""
+        if self._sink is not None:
+            self._sink.flush()
+
+    def shutdown(self) -> None:
+        """Flush and stop the shared sink and release cached loggers."""
+        while self._loggers:
+            self._retained.add(self._loggers.popitem(last=False)[0])
+        self._release_unreferenced()
+        # Loggers still held elsewhere stay registered but stop using the sink.
+        for name in self._retained:
+            logger = logging.Logger.manager.loggerDict.get(name)
+            if isinstance(logger, logging.Logger):
+                for handler in list(logger.handlers):
+                    logger.removeHandler(handler)
+        self._retained.clear()
+        if self._sink is not None:
+            self._sink.close()
+            self._sink = None
+
 
 class ExecutionFlowFormatter(logging.Formatter):
     """Formatter that clearly shows execution flow and key data."""
@@ -142,9 +340,9 @@ class ExecutionFlowFormatter(logging.Formatter):
         if record.exc_info:
             base_format += "\n" + self.formatException(record.exc_info)
         
-        # Add key data if present
+        # Add key data if present (single line keeps formatting cheap)
         if hasattr(record, 'key_data') and record.key_data:
-            key_data_str = json.dumps(record.key_data, ensure_ascii=False, indent=2)
+            key_data_str = json.dumps(record.key_data, ensure_ascii=False, default=str)
             base_format += f"\n>>> KEY DATA: {key_data_str}"
         
         return base_format
@@ -334,6 +532,7 @@ def get_unified_logging_config() -> UnifiedLoggingConfig:
     global _global_unified_config
     if _global_unified_config is None:
         _global_unified_config = UnifiedLoggingConfig()
+        atexit.register(_global_unified_config.shutdown)
     return _global_unified_config
 
 
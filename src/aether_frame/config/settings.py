@@ -123,6 +123,20 @@ class Settings(BaseSettings):
     session_idle_check_interval_seconds: int = 300
     runner_idle_timeout_seconds: int = 43200  # 12 hours by default
     agent_idle_timeout_seconds: int = 43200  # 12 hours by default
+    session_recovery_backend: str = "memory"  # memory | sqlite | file
+    session_recovery_path: Optional[str] = None  # Backend default when unset
+    session_recovery_ttl_seconds: int = 0  # Disabled by default
+    session_recovery_max_records: int = 0  # Unbounded by default
+    adk_session_backend: str = "memory"  # memory | sqlite
+    adk_session_db_path: Optional[str] = None  # Backend default when unset
+    adk_session_event_window: int = 0  # Recent events loaded per turn; 0 loads all
+    agent_switch_history_max_events: int = 0  # Events read on agent switch; 0 reads all
+    agent_switch_history_token_budget: int = 0  # Handoff token budget; 0 keeps everything
+
+    # Conversation context windowing
+    enable_conversation_windowing: bool = False  # Only models with a known context window are windowed
+    conversation_history_budget_ratio: float = 0.6  # Share of the model context window
+    conversation_token_budgets: Dict[str, int] = Field(default_factory=dict)  # Model family -> budget
 
     # Observability settings
     enable_metrics: bool = True
@@ -139,6 +153,8 @@ class Settings(BaseSettings):
     enable_mcp_tools: bool = False
     enable_adk_native_tools: bool = False
     mcp_servers: List[Dict[str, Any]] = Field(default_factory=list)
+    # Upper bound on cached results for tools that opt into result caching
+    tool_result_cache_max_entries: int = 512
     enable_skills: bool = True
     skills_root: Optional[str] = None
     skills_categories: List[str] = Field(
@@ -160,6 +176,8 @@ class Settings(BaseSettings):
     agent_id_prefix: str = "agent"
     domain_agent_id_prefix: str = "domain_agent"
     max_sessions_per_agent: int = 100
+    adk_warm_pool_size: int = 0  # Spare agents kept per hot config; 0 disables the pool
+    adk_warm_pool_configs: List[Dict[str, Any]] = Field(default_factory=list)  # AgentConfig fields of hot configs
 
     # Default model fallbacks
     default_adk_model: str = "gemini-1.5-flash"
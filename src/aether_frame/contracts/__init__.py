@@ -50,6 +50,8 @@ from .responses import AgentResponse, TaskResult, ToolResult
 from .streaming import (
     CHUNK_KIND_PLAN_DELTA,
     CHUNK_KIND_PLAN_SUMMARY,
+    CHUNK_KIND_RESPONSE_DELTA,
+    CHUNK_KIND_RESPONSE_FINAL,
     CHUNK_KIND_TOOL_COMPLETE,
     CHUNK_KIND_TOOL_PROGRESS,
     CHUNK_KIND_TOOL_PROPOSAL,
@@ -61,6 +63,7 @@ from .streaming import (
     LiveExecutionResult,
     LiveSession,
     TaskStreamChunk,
+    task_result_to_chunk,
 )
 
 __all__ = [
@@ -108,6 +111,9 @@ __all__ = [
     "CHUNK_KIND_TOOL_PROGRESS",
     "CHUNK_KIND_TOOL_COMPLETE",
     "CHUNK_KIND_TOOL_ERROR",
+    "CHUNK_KIND_RESPONSE_DELTA",
+    "CHUNK_KIND_RESPONSE_FINAL",
+    "task_result_to_chunk",
     # Enums
     "FrameworkType",
     "TaskStatus",
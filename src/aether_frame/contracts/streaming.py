@@ -5,7 +5,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Optional, Union
 
-from .enums import InteractionType, TaskChunkType
+from .enums import InteractionType, TaskChunkType, TaskStatus
+from .responses import TaskResult
 
 if TYPE_CHECKING:
     pass
@@ -23,6 +24,8 @@ CHUNK_KIND_TOOL_RESULT = "tool.result"  # Final tool execution result returned t
 CHUNK_KIND_TOOL_PROGRESS = "tool.delta"  # Optional intermediate progress log while a tool is running.
 CHUNK_KIND_TOOL_COMPLETE = "tool.complete"  # Tool wrapper completion marker (success or graceful finish).
 CHUNK_KIND_TOOL_ERROR = "tool.error"  # Tool execution failure details.
+CHUNK_KIND_RESPONSE_DELTA = "response.delta"  # Candidate answer text emitted while a non-live run is in progress.
+CHUNK_KIND_RESPONSE_FINAL = "response.final"  # Terminal chunk of a non-live run carrying the TaskResult.
 
 
 @dataclass
@@ -41,6 +44,39 @@ class TaskStreamChunk:
     interaction_id: Optional[str] = None
 
 
+def task_result_to_chunk(result: TaskResult, sequence_id: int) -> TaskStreamChunk:
+    """
+    Wrap a finished TaskResult as the terminal chunk of a task stream.
+
+    Successful results become ``COMPLETE`` chunks whose content is the first
+    response message; anything else becomes an ``ERROR`` chunk. The result
+    itself is attached as ``metadata["task_result"]``.
+    """
+    metadata: Dict[str, Any] = {
+        "task_result": result,
+        "status": result.status.value if result.status else None,
+        "session_id": result.session_id,
+        "agent_id": result.agent_id,
+    }
+    if result.status == TaskStatus.SUCCESS:
+        content = result.messages[0].content if result.messages else ""
+        chunk_type = TaskChunkType.COMPLETE
+    else:
+        content = result.error_message or "Task execution failed"
+        chunk_type = TaskChunkType.ERROR
+        if result.error is not None:
+            metadata["error_payload"] = result.error.to_dict()
+    return TaskStreamChunk(
+        task_id=result.task_id,
+        chunk_type=chunk_type,
+        sequence_id=sequence_id,
+        content=content if isinstance(content, (str, dict)) else str(content),
+        is_final=True,
+        metadata=metadata,
+        chunk_kind=CHUNK_KIND_RESPONSE_FINAL,
+    )
+
+
 @dataclass
 class InteractionRequest:
     """Request for user interaction during task execution."""
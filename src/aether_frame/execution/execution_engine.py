@@ -2,7 +2,7 @@
 """Execution Engine - Central orchestration for task processing."""
 
 import logging
-from typing import Optional
+from typing import AsyncIterator, Optional
 from datetime import datetime
 
 from ..config.settings import Settings
@@ -13,7 +13,9 @@ from ..contracts import (
     TaskRequest,
     TaskResult,
     TaskStatus,
+    TaskStreamChunk,
     build_error,
+    task_result_to_chunk,
 )
 from ..streaming import StreamSession, create_stream_session
 from ..framework.framework_registry import FrameworkRegistry
@@ -47,35 +49,10 @@ class ExecutionEngine:
         """
         self.logger.info(f"Starting task execution - task_id: {task_request.task_id}, task_type: {task_request.task_type}, agent_id: {task_request.agent_id}")
             
-        # Validate task request has proper context
-        # Option 1: Continuing with existing agent (agent_id + session_id)
-        # Option 2: Continuing existing session (session_id only, backward compatibility)
-        # Option 3: Creating new agent/session (agent_config)
-        if not (task_request.agent_id or task_request.session_id or task_request.agent_config):
-            error_msg = "TaskRequest must have either agent_id (existing agent), session_id (existing session), or agent_config (new session)"
-            self.logger.error(f"Context missing - {error_msg}")
-            provided_context = {
-                "agent_id": task_request.agent_id,
-                "session_id": task_request.session_id,
-                "has_agent_config": bool(task_request.agent_config),
-            }
-            error_payload = build_error(
-                ErrorCode.REQUEST_VALIDATION,
-                error_msg,
-                source="execution_engine.validate_context",
-                details=provided_context,
-            )
-            return TaskResult(
-                task_id=task_request.task_id,
-                status=TaskStatus.ERROR,
-                error_message=error_msg,
-                error=error_payload,
-                metadata={
-                    "error_stage": "execution_engine.validate_context",
-                    "provided_context": provided_context,
-                },
-            )
-            
+        context_error = self._validate_task_context(task_request)
+        if context_error is not None:
+            return context_error
+
         strategy = None  # Track strategy for better error reporting
         try:
             # Route task to determine execution strategy
@@ -88,26 +65,7 @@ class ExecutionEngine:
             )
 
             if not framework_adapter:
-                error_msg = f"Framework {strategy.framework_type} not available"
-                self.logger.error(f"Framework adapter not available - {error_msg}")
-                error_payload = build_error(
-                    ErrorCode.FRAMEWORK_UNAVAILABLE,
-                    error_msg,
-                    source="execution_engine.get_adapter",
-                    details={"framework": strategy.framework_type.value},
-                )
-                return TaskResult(
-                    task_id=task_request.task_id,
-                    status=TaskStatus.ERROR,
-                    error_message=error_msg,
-                    error=error_payload,
-                    metadata={
-                        "error_stage": "execution_engine.get_adapter",
-                        "framework": strategy.framework_type.value,
-                    },
-                    session_id=task_request.session_id,
-                    agent_id=task_request.agent_id,
-                )
+                return self._framework_unavailable_result(task_request, strategy)
             
             self.logger.info(f"Framework adapter retrieved - type: {type(framework_adapter).__name__}")
 
@@ -118,34 +76,145 @@ class ExecutionEngine:
             return result
 
         except Exception as e:
-            error_type = type(e).__name__
-            error_msg = f"Execution engine failed ({error_type}): {str(e)}"
-            self.logger.error(f"Task execution failed - task_id: {task_request.task_id}, error: {error_msg}")
-            framework_type = None
-            try:
-                framework_type = strategy.framework_type.value  # type: ignore[name-defined]
-            except Exception:
-                framework_type = None
-            error_payload = build_error(
-                ErrorCode.INTERNAL_ERROR,
-                error_msg,
-                source="execution_engine.execute_task",
-                details={"error_type": error_type, "framework": framework_type},
+            return self._execution_failure_result(task_request, strategy, e)
+
+    async def execute_task_stream(
+        self, task_request: TaskRequest
+    ) -> AsyncIterator[TaskStreamChunk]:
+        """
+        Execute a task like ``execute_task`` but stream progress as it happens.
+
+        Intermediate response chunks are yielded as the framework produces
+        them; the stream always ends with one final chunk whose
+        ``metadata["task_result"]`` holds the TaskResult ``execute_task``
+        would have returned. Failures are reported as a final ERROR chunk
+        rather than raised.
+
+        Args:
+            task_request: The task to be executed
+
+        Yields:
+            TaskStreamChunk: Intermediate chunks followed by the final chunk
+        """
+        self.logger.info(f"Starting streaming task execution - task_id: {task_request.task_id}, task_type: {task_request.task_type}, agent_id: {task_request.agent_id}")
+
+        context_error = self._validate_task_context(task_request)
+        if context_error is not None:
+            yield task_result_to_chunk(context_error, sequence_id=0)
+            return
+
+        strategy = None
+        sequence_id = 0
+        try:
+            strategy = await self.task_router.route_task(task_request)
+            framework_adapter = await self.framework_registry.get_adapter(
+                strategy.framework_type
             )
-            return TaskResult(
-                task_id=task_request.task_id,
-                status=TaskStatus.ERROR,
-                error_message=error_msg,
-                error=error_payload,
-                session_id=task_request.session_id,
-                agent_id=task_request.agent_id,
-                metadata={
-                    "error_stage": "execution_engine.execute_task",
-                    "error_type": error_type,
-                    "framework": framework_type,
-                },
+            if not framework_adapter:
+                yield task_result_to_chunk(
+                    self._framework_unavailable_result(task_request, strategy),
+                    sequence_id=0,
+                )
+                return
+
+            async for chunk in framework_adapter.execute_task_stream(task_request, strategy):
+                sequence_id = chunk.sequence_id + 1
+                yield chunk
+                if chunk.is_final:
+                    return
+        except Exception as e:
+            yield task_result_to_chunk(
+                self._execution_failure_result(task_request, strategy, e),
+                sequence_id=sequence_id,
             )
 
+    def _validate_task_context(self, task_request: TaskRequest) -> Optional[TaskResult]:
+        """Return an error result when the request carries no agent/session context."""
+        # Option 1: Continuing with existing agent (agent_id + session_id)
+        # Option 2: Continuing existing session (session_id only, backward compatibility)
+        # Option 3: Creating new agent/session (agent_config)
+        if task_request.agent_id or task_request.session_id or task_request.agent_config:
+            return None
+
+        error_msg = "TaskRequest must have either agent_id (existing agent), session_id (existing session), or agent_config (new session)"
+        self.logger.error(f"Context missing - {error_msg}")
+        provided_context = {
+            "agent_id": task_request.agent_id,
+            "session_id": task_request.session_id,
+            "has_agent_config": bool(task_request.agent_config),
+        }
+        error_payload = build_error(
+            ErrorCode.REQUEST_VALIDATION,
+            error_msg,
+            source="execution_engine.validate_context",
+            details=provided_context,
+        )
+        return TaskResult(
+            task_id=task_request.task_id,
+            status=TaskStatus.ERROR,
+            error_message=error_msg,
+            error=error_payload,
+            metadata={
+                "error_stage": "execution_engine.validate_context",
+                "provided_context": provided_context,
+            },
+        )
+
+    def _framework_unavailable_result(self, task_request: TaskRequest, strategy) -> TaskResult:
+        """Build the error result for a routed framework without an adapter."""
+        error_msg = f"Framework {strategy.framework_type} not available"
+        self.logger.error(f"Framework adapter not available - {error_msg}")
+        error_payload = build_error(
+            ErrorCode.FRAMEWORK_UNAVAILABLE,
+            error_msg,
+            source="execution_engine.get_adapter",
+            details={"framework": strategy.framework_type.value},
+        )
+        return TaskResult(
+            task_id=task_request.task_id,
+            status=TaskStatus.ERROR,
+            error_message=error_msg,
+            error=error_payload,
+            metadata={
+                "error_stage": "execution_engine.get_adapter",
+                "framework": strategy.framework_type.value,
+            },
+            session_id=task_request.session_id,
+            agent_id=task_request.agent_id,
+        )
+
+    def _execution_failure_result(
+        self, task_request: TaskRequest, strategy, error: Exception
+    ) -> TaskResult:
+        """Build the error result for an unexpected exception during execution."""
+        error_type = type(error).__name__
+        error_msg = f"Execution engine failed ({error_type}): {str(error)}"
+        self.logger.error(f"Task execution failed - task_id: {task_request.task_id}, error: {error_msg}")
+        framework_type = None
+        try:
+            framework_type = strategy.framework_type.value
+        except Exception:
+            framework_type = None
+        error_payload = build_error(
+            ErrorCode.INTERNAL_ERROR,
+            error_msg,
+            source="execution_engine.execute_task",
+            details={"error_type": error_type, "framework": framework_type},
+        )
+        return TaskResult(
+            task_id=task_request.task_id,
+            status=TaskStatus.ERROR,
+            error_message=error_msg,
+            error=error_payload,
+            session_id=task_request.session_id,
+            agent_id=task_request.agent_id,
+            metadata={
+                "error_stage": "execution_engine.execute_task",
+                "error_type": error_type,
+                "framework": framework_type,
+            },
+        )
+
     async def execute_task_live(
         self, task_request: TaskRequest, context: ExecutionContext
     ) -> LiveExecutionResult:
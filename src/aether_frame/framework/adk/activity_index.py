@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""Activity indexes backing ADK idle cleanup."""
+
+import heapq
+import itertools
+from datetime import datetime
+from typing import Dict, Hashable, List, Optional, Tuple
+
+
+class IdleActivityIndex:
+    """
+    Min-heap of keys ordered by their last recorded activity.
+
+    ``touch`` records the latest activity for a key; superseded heap entries are
+    skipped lazily when they surface, and the heap is compacted once stale
+    entries outnumber live ones. ``pop_expired`` therefore only visits keys whose
+    recorded activity is at or before the cutoff, plus the stale entries ahead
+    of them.
+
+    Callers re-validate popped keys against the source of truth and ``touch``
+    them again when they turn out to still be in use.
+    """
+
+    _COMPACT_SLACK = 64
+
+    def __init__(self) -> None:
+        self._heap: List[Tuple[datetime, int, Hashable]] = []
+        self._latest: Dict[Hashable, datetime] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._latest)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._latest
+
+    def touch(self, key: Hashable, last_activity: datetime) -> None:
+        """Record ``last_activity`` for ``key``, replacing any earlier value."""
+        if self._latest.get(key) == last_activity:
+            return
+        self._latest[key] = last_activity
+        heapq.heappush(self._heap, (last_activity, next(self._counter), key))
+        if len(self._heap) > 2 * len(self._latest) + self._COMPACT_SLACK:
+            self._compact()
+
+    def discard(self, key: Hashable) -> None:
+        """Stop tracking ``key``; its heap entries are dropped lazily."""
+        self._latest.pop(key, None)
+
+    def last_activity(self, key: Hashable) -> Optional[datetime]:
+        """Return the recorded activity for ``key``, if tracked."""
+        return self._latest.get(key)
+
+    def pop_expired(self, cutoff: datetime) -> List[Hashable]:
+        """Remove and return keys whose recorded activity is at or before ``cutoff``."""
+        expired: List[Hashable] = []
+        heap = self._heap
+        while heap and heap[0][0] <= cutoff:
+            last_activity, _, key = heapq.heappop(heap)
+            if self._latest.get(key) != last_activity:
+                continue
+            del self._latest[key]
+            expired.append(key)
+        return expired
+
+    def _compact(self) -> None:
+        self._heap = [
+            (last_activity, next(self._counter), key)
+            for key, last_activity in self._latest.items()
+        ]
+        heapq.heapify(self._heap)
+
+
+class RunnerLoadIndex:
+    """
+    Per-config-hash min-heaps of runners ordered by live session count.
+
+    The runner manager reports session counts as sessions are created and
+    removed; superseded heap entries are skipped lazily when they surface, as
+    in ``IdleActivityIndex``. ``least_loaded`` therefore costs O(log n)
+    amortized instead of a scan over every runner of the config. Only runners
+    registered with ``track`` are indexed; count updates for other runners are
+    ignored.
+    """
+
+    _COMPACT_SLACK = 64
+
+    def __init__(self) -> None:
+        self._heaps: Dict[str, List[Tuple[int, int, str]]] = {}
+        self._entries: Dict[str, Tuple[str, int]] = {}  # runner_id -> (config_hash, session_count)
+        self._by_config: Dict[str, Dict[str, int]] = {}  # config_hash -> {runner_id: session_count}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, runner_id: str) -> bool:
+        return runner_id in self._entries
+
+    def track(self, config_hash: str, runner_id: str, session_count: int = 0) -> None:
+        """Index ``runner_id`` under ``config_hash`` with its current session count."""
+        self.discard(runner_id)
+        self._entries[runner_id] = (config_hash, session_count)
+        self._by_config.setdefault(config_hash, {})[runner_id] = session_count
+        self._push(config_hash, runner_id, session_count)
+
+    def update(self, runner_id: str, session_count: int) -> None:
+        """Record the live session count of a tracked runner."""
+        entry = self._entries.get(runner_id)
+        if entry is None or entry[1] == session_count:
+            return
+        config_hash = entry[0]
+        self._entries[runner_id] = (config_hash, session_count)
+        self._by_config[config_hash][runner_id] = session_count
+        self._push(config_hash, runner_id, session_count)
+
+    def discard(self, runner_id: str) -> None:
+        """Stop tracking ``runner_id``; its heap entries are dropped lazily."""
+        entry = self._entries.pop(runner_id, None)
+        if entry is None:
+            return
+        config_hash = entry[0]
+        runners = self._by_config.get(config_hash, {})
+        runners.pop(runner_id, None)
+        if not runners:
+            self._by_config.pop(config_hash, None)
+            self._heaps.pop(config_hash, None)
+
+    def session_count(self, runner_id: str) -> Optional[int]:
+        """Return the recorded session count for ``runner_id``, if tracked."""
+        entry = self._entries.get(runner_id)
+        return entry[1] if entry else None
+
+    def least_loaded(self, config_hash: str) -> Optional[Tuple[str, int]]:
+        """Return ``(runner_id, session_count)`` of the least-loaded runner for ``config_hash``."""
+        heap = self._heaps.get(config_hash)
+        while heap:
+            session_count, _, runner_id = heap[0]
+            if self._entries.get(runner_id) == (config_hash, session_count):
+                return runner_id, session_count
+            heapq.heappop(heap)
+        return None
+
+    def count_below(self, config_hash: str, limit: int) -> int:
+        """Count tracked runners for ``config_hash`` holding fewer than ``limit`` sessions."""
+        return sum(1 for session_count in self._by_config.get(config_hash, {}).values() if session_count < limit)
+
+    def _push(self, config_hash: str, runner_id: str, session_count: int) -> None:
+        heap = self._heaps.setdefault(config_hash, [])
+        heapq.heappush(heap, (session_count, next(self._counter), runner_id))
+        runners = self._by_config.get(config_hash, {})
+        if len(heap) > 2 * len(runners) + self._COMPACT_SLACK:
+            self._heaps[config_hash] = heap = [
+                (count, next(self._counter), tracked_runner) for tracked_runner, count in runners.items()
+            ]
+            heapq.heapify(heap)
+
+
+class AgentRunnerMapping(dict):
+    """
+    ``agent_id -> runner_id`` dict that maintains the reverse ``runner_id -> agent_ids`` index.
+
+    Drop-in replacement for the plain mapping shared between the adapter and
+    the runner manager, so reverse lookups no longer scan every agent.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__()
+        self._runner_agents: Dict[str, Dict[str, None]] = {}
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, agent_id: str, runner_id: str) -> None:
+        if agent_id in self:
+            self._unlink(agent_id, dict.__getitem__(self, agent_id))
+        super().__setitem__(agent_id, runner_id)
+        self._runner_agents.setdefault(runner_id, {})[agent_id] = None
+
+    def __delitem__(self, agent_id: str) -> None:
+        runner_id = dict.__getitem__(self, agent_id)
+        super().__delitem__(agent_id)
+        self._unlink(agent_id, runner_id)
+
+    def pop(self, agent_id, *default):
+        if agent_id not in self:
+            if default:
+                return default[0]
+            raise KeyError(agent_id)
+        runner_id = dict.__getitem__(self, agent_id)
+        del self[agent_id]
+        return runner_id
+
+    def popitem(self):
+        agent_id, runner_id = super().popitem()
+        self._unlink(agent_id, runner_id)
+        return agent_id, runner_id
+
+    def setdefault(self, agent_id, runner_id=None):
+        if agent_id not in self:
+            self[agent_id] = runner_id
+        return dict.__getitem__(self, agent_id)
+
+    def update(self, *args, **kwargs) -> None:
+        for agent_id, runner_id in dict(*args, **kwargs).items():
+            self[agent_id] = runner_id
+
+    def clear(self) -> None:
+        super().clear()
+        self._runner_agents.clear()
+
+    def agents_for_runner(self, runner_id: Optional[str]) -> List[str]:
+        """Return agent IDs mapped to ``runner_id`` in insertion order."""
+        return list(self._runner_agents.get(runner_id, ()))
+
+    def agent_for_runner(self, runner_id: Optional[str]) -> Optional[str]:
+        """Return the first agent mapped to ``runner_id``, if any."""
+        agents = self._runner_agents.get(runner_id)
+        return next(iter(agents)) if agents else None
+
+    def _unlink(self, agent_id: str, runner_id: str) -> None:
+        agents = self._runner_agents.get(runner_id)
+        if agents is None:
+            return
+        agents.pop(agent_id, None)
+        if not agents:
+            del self._runner_agents[runner_id]
+
+
+def agents_for_runner(mapping: Optional[Dict[str, str]], runner_id: Optional[str]) -> List[str]:
+    """Reverse lookup that uses the maintained index when ``mapping`` provides one."""
+    if not mapping or not runner_id:
+        return []
+    if isinstance(mapping, AgentRunnerMapping):
+        return mapping.agents_for_runner(runner_id)
+    return [agent_id for agent_id, mapped in mapping.items() if mapped == runner_id]
+
@@ -4,12 +4,14 @@
 import asyncio
 import contextlib
 import logging
+import time
 from copy import deepcopy
 from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 from datetime import datetime
 from uuid import uuid4
 
 from ...contracts import (
+    CHUNK_KIND_RESPONSE_DELTA,
     AgentConfig,
     ErrorCode,
     ErrorCategory,
@@ -22,15 +24,26 @@ from ...contracts import (
     TaskStatus,
     TaskStreamChunk,
     build_error,
+    task_result_to_chunk,
 )
+from ...agents.adk.response_selection import listen_for_response_candidates
 from ...agents.base.domain_agent import DomainAgent
 from ...execution.task_router import ExecutionStrategy
+from ...observability.metrics_backend import (
+    adjust_in_flight,
+    observe_stage_latency,
+    set_in_flight,
+    time_stage,
+)
 from ..base.framework_adapter import FrameworkAdapter
 from .approval_broker import AdkApprovalBroker, ApprovalAwareCommunicator
+from .warm_pool import AgentWarmPool, build_warm_pool_config
 from .live_communicator import AdkLiveCommunicator
 from ...skills.runtime.skill_runtime import SkillRuntime, normalize_skill_name_list
 from ...tools.resolver import ToolResolver, ToolNotFoundError
+from .activity_index import AgentRunnerMapping, agents_for_runner
 from .adk_session_manager import AdkSessionManager, SessionClearedError
+from .context_window import ContextWindowManager, ContextWindowResult, resolve_history_token_budget
 from .session_recovery import recovery_record_to_messages
 
 if TYPE_CHECKING:
@@ -70,13 +83,13 @@ class AdkFrameworkAdapter(FrameworkAdapter):
         self.agent_manager = AgentManager()
         
         # Agent to Runner mapping management (initialize before RunnerManager)
-        self._agent_runners: Dict[str, str] = {}  # agent_id -> runner_id
+        self._agent_runners: Dict[str, str] = AgentRunnerMapping()  # agent_id -> runner_id
         self._agent_sessions: Dict[str, List[str]] = {}  # agent_id -> [session_ids]
-        self._config_agents: Dict[str, List[str]] = {}  # config_hash -> [agent_ids]
         self._mapping_lock = asyncio.Lock()
         
         # ADK Session Manager for chat session coordination
         self.adk_session_manager = AdkSessionManager()
+        self.agent_manager.activity_listener = self.adk_session_manager.note_agent_activity
         
         # Runner Manager for correct session lifecycle
         from .runner_manager import RunnerManager
@@ -85,8 +98,12 @@ class AdkFrameworkAdapter(FrameworkAdapter):
             agent_runner_mapping=self._agent_runners,
             agent_cleanup_callback=self._handle_agent_cleanup,
             agent_sessions_mapping=self._agent_sessions,
+            idle_retention_callback=self._is_warm_pool_capacity,
         )
         self._skill_runtime: Optional[SkillRuntime] = None
+        self._warm_pool: Optional[AgentWarmPool] = None
+        # Shared so its name index and UniversalTool memo survive across agent builds
+        self._tool_resolver: Optional[ToolResolver] = None
         
         self.logger = logging.getLogger(__name__)
 
@@ -130,11 +147,22 @@ class AdkFrameworkAdapter(FrameworkAdapter):
         """Cleanup chat session resources via session manager entrypoint."""
         if not chat_session_id:
             return False
-        return await self.adk_session_manager.cleanup_chat_session(
+        cleaned = await self.adk_session_manager.cleanup_chat_session(
             chat_session_id,
             self.runner_manager,
             agent_manager=self.agent_manager,
         )
+        self._publish_in_flight_gauges()
+        return cleaned
+
+    def _publish_in_flight_gauges(self) -> None:
+        """Export current runner and chat session counts to the metrics backend."""
+        runners = getattr(self.runner_manager, "runners", None)
+        if isinstance(runners, dict):
+            set_in_flight("runners", len(runners))
+        chat_sessions = getattr(self.adk_session_manager, "chat_sessions", None)
+        if isinstance(chat_sessions, dict):
+            set_in_flight("sessions", len(chat_sessions))
 
     async def _handle_agent_cleanup(self, agent_id: str) -> None:
         """Handle cleanup for agents tied 1:1 with runners."""
@@ -154,34 +182,21 @@ class AdkFrameworkAdapter(FrameworkAdapter):
 
         async with self._mapping_lock:
             if agent_id in self._agent_runners:
+                self.runner_manager.load_index.discard(self._agent_runners[agent_id])
                 del self._agent_runners[agent_id]
 
             if agent_id in self._agent_sessions:
                 del self._agent_sessions[agent_id]
 
-            if config_hash and config_hash in self._config_agents:
-                self._config_agents[config_hash] = [
-                    existing_agent for existing_agent in self._config_agents[config_hash]
-                    if existing_agent != agent_id
-                ]
-                if not self._config_agents[config_hash]:
-                    del self._config_agents[config_hash]
-            else:
-                for hash_key in list(self._config_agents.keys()):
-                    if agent_id in self._config_agents[hash_key]:
-                        self._config_agents[hash_key] = [
-                            existing_agent for existing_agent in self._config_agents[hash_key]
-                            if existing_agent != agent_id
-                        ]
-                        if not self._config_agents[hash_key]:
-                            del self._config_agents[hash_key]
-
         # Delegate to AgentManager for actual domain agent cleanup
         try:
             await self.agent_manager.cleanup_agent(agent_id)
         except Exception as exc:
             self.logger.warning(f"AgentManager cleanup failed for {agent_id}: {exc}")
 
+        if config_hash and self._warm_pool is not None:
+            self._warm_pool.request_replenish(config_hash)
+
     # === Core Interface Methods ===
 
     async def initialize(self, config: Optional[Dict[str, Any]] = None, tool_service = None, settings = None):
@@ -209,6 +224,16 @@ class AdkFrameworkAdapter(FrameworkAdapter):
             self.runner_manager.settings = settings
             self.logger.info(f"Updated RunnerManager settings without rebuild to preserve data")
 
+        # Switch to durable session storage before any runner or session exists
+        try:
+            self.adk_session_manager.configure_session_service(settings)
+        except Exception as exc:
+            self.logger.warning(f"Failed to configure ADK session service: {exc}")
+        try:
+            self.adk_session_manager.configure_recovery_store(settings)
+        except Exception as exc:
+            self.logger.warning(f"Failed to configure session recovery store: {exc}")
+
         # Start idle cleanup watcher when settings available
         try:
             self.adk_session_manager.start_idle_cleanup(self.runner_manager, self.agent_manager, settings)
@@ -374,9 +399,7 @@ class AdkFrameworkAdapter(FrameworkAdapter):
                 await self._handle_agent_cleanup(agent_id)
                 raise self.ExecutionError(f"Runner {runner_id} not found", task_request)
 
-            metadata = self.agent_manager._agent_metadata.get(agent_id)
-            if metadata is not None:
-                metadata["last_activity"] = datetime.now()
+            self.agent_manager.mark_agent_activity(agent_id)
 
             return domain_agent, runner_id, runner_context_dict
             
@@ -498,41 +521,154 @@ class AdkFrameworkAdapter(FrameworkAdapter):
         config_hash: str,
         max_sessions: int,
     ) -> Optional[Tuple[str, "AdkDomainAgent", str]]:
-        """Pick a reusable agent for the given config hash if capacity allows."""
-        async with self._mapping_lock:
-            candidate_ids = list(self._config_agents.get(config_hash, []))
-        if not candidate_ids:
-            return None
-
-        valid_candidates: List[str] = []
+        """Pick the least-loaded reusable agent for the given config hash if capacity allows."""
+        load_index = self.runner_manager.load_index
         selected: Optional[Tuple[str, "AdkDomainAgent", str]] = None
-
-        for agent_id in candidate_ids:
-            domain_agent = self.agent_manager._agents.get(agent_id)
-            if not domain_agent:
+        takes_last_slot = False
+
+        while True:
+            least_loaded = load_index.least_loaded(config_hash)
+            if least_loaded is None:
+                break
+            runner_id, session_count = least_loaded
+            agent_ids = agents_for_runner(self._agent_runners, runner_id)
+            domain_agent = self.agent_manager._agents.get(agent_ids[0]) if agent_ids else None
+            if domain_agent is None or runner_id not in self.runner_manager.runners:
+                # Agent or runner went away without cleanup reaching the index.
+                load_index.discard(runner_id)
                 continue
+            if session_count < max_sessions:
+                selected = (agent_ids[0], domain_agent, runner_id)
+                takes_last_slot = session_count + 1 >= max_sessions
+            break
 
-            runner_id = self._agent_runners.get(agent_id)
-            if not runner_id:
-                continue
+        # Least-loaded first means every agent is full once the chosen one is.
+        if self._warm_pool is not None and (selected is None or takes_last_slot):
+            self._warm_pool.request_replenish(config_hash, reserved=int(takes_last_slot))
 
-            runner_context = self.runner_manager.runners.get(runner_id)
-            if not runner_context:
-                continue
+        return selected
+
+    async def _provision_agent_for_config(
+        self,
+        agent_config: AgentConfig,
+        config_hash: str,
+        task_request: Optional[TaskRequest] = None,
+        engine_session_id: Optional[str] = None,
+    ) -> Tuple[str, "AdkDomainAgent", str]:
+        """
+        Create a domain agent with a dedicated runner and register it for reuse.
+
+        Used inline by Pattern 3 and in the background by the warm pool; the new
+        agent is appended to the config hash's candidates without any session.
+        """
+        agent_id = self.agent_manager.generate_agent_id()
+        self.logger.info(f"Generated agent_id: {agent_id}, session_id: {engine_session_id}")
 
-            valid_candidates.append(agent_id)
+        with time_stage("agent_creation"):
+            domain_agent = await self._create_domain_agent_for_config(agent_config, task_request)
 
-            session_count = await self.runner_manager.get_runner_session_count(runner_id)
-            if selected is None and session_count < max_sessions:
-                selected = (agent_id, domain_agent, runner_id)
+        try:
+            self.agent_manager._agents[agent_id] = domain_agent
+            self.agent_manager._agent_configs[agent_id] = agent_config
+            self.agent_manager._agent_metadata[agent_id] = {
+                "created_at": datetime.now(),
+                "last_activity": datetime.now(),
+                "agent_type": agent_config.agent_type,
+                "framework_type": FrameworkType.ADK,
+            }
+            self.agent_manager.mark_agent_activity(agent_id)
+
+            self.logger.info(f"✅ Agent {agent_id} registered with AgentManager")
+
+        except Exception as e:
+            raise self.ExecutionError(
+                f"Failed to register agent with AgentManager: {str(e)}",
+                task_request
+            )
+
+        adk_agent = domain_agent.adk_agent
+
+        with time_stage("runner_creation"):
+            runner_id, _ = await self.runner_manager.get_or_create_runner(
+                agent_config,
+                task_request,
+                adk_agent,
+                engine_session_id=engine_session_id,
+                create_session=False,
+                allow_reuse=False,
+            )
+        self._publish_in_flight_gauges()
 
         async with self._mapping_lock:
-            if valid_candidates:
-                self._config_agents[config_hash] = valid_candidates
-            else:
-                self._config_agents.pop(config_hash, None)
+            self._agent_runners[agent_id] = runner_id
+            self._agent_sessions[agent_id] = []
+            self.runner_manager.load_index.track(
+                config_hash, runner_id, await self.runner_manager.get_runner_session_count(runner_id)
+            )
 
-        return selected
+        return agent_id, domain_agent, runner_id
+
+    async def _count_available_agents(self, config_hash: str) -> int:
+        """Count registered agents for ``config_hash`` that can accept another session."""
+        max_sessions = getattr(self.runner_manager.settings, "max_sessions_per_agent", 100)
+        return self.runner_manager.load_index.count_below(config_hash, max_sessions)
+
+    def _is_warm_pool_capacity(self, runner_id: str) -> bool:
+        """
+        Return True when tearing down ``runner_id`` would drop a hot config below its warm target.
+
+        Idle spares are kept instead of being reaped and then rebuilt by the
+        replenish that follows their cleanup; surplus runners still expire.
+        """
+        if self._warm_pool is None:
+            return False
+        runner_context = self.runner_manager.runners.get(runner_id) or {}
+        config_hash = runner_context.get("config_hash")
+        if not config_hash or not self._warm_pool.is_declared(config_hash):
+            return False
+        max_sessions = getattr(self.runner_manager.settings, "max_sessions_per_agent", 100)
+        available = self.runner_manager.load_index.count_below(config_hash, max_sessions)
+        return available <= self._warm_pool.target_size
+
+    async def start_warm_pool(self, settings=None) -> int:
+        """
+        Pre-create agents and runners for the hot configs declared in settings.
+
+        Call after tools and skills are attached so warm agents match the ones
+        requests would create. Returns the number of agents created.
+        """
+        source_settings = settings or self.runner_manager.settings
+        pool_size = getattr(source_settings, "adk_warm_pool_size", 0) or 0
+        entries = getattr(source_settings, "adk_warm_pool_configs", None) or []
+        if pool_size <= 0 or not entries:
+            return 0
+
+        pool = AgentWarmPool(
+            target_size=pool_size,
+            provision=lambda agent_config, config_hash: self._provision_agent_for_config(
+                agent_config, config_hash
+            ),
+            available_capacity=self._count_available_agents,
+        )
+        for entry in entries:
+            try:
+                agent_config = build_warm_pool_config(entry, self._get_default_agent_type())
+                skill_names = self._extract_configured_skill_names(agent_config)
+                if skill_names:
+                    if not self._skill_runtime:
+                        raise ValueError("skill runtime is not configured")
+                    self._skill_runtime.validate_skill_names(skill_names)
+            except Exception as exc:  # noqa: BLE001
+                self.logger.warning(f"Skipping invalid warm pool config {entry!r}: {exc}")
+                continue
+            pool.declare(self.runner_manager.compute_config_hash(agent_config), agent_config)
+
+        if not pool.enabled:
+            return 0
+        self._warm_pool = pool
+        created = await pool.warm_up()
+        self.logger.info(f"Warm pool ready - configs: {len(entries)}, agents_created: {created}")
+        return created
 
     async def _create_runtime_context_for_new_agent(self, task_request: TaskRequest) -> "RuntimeContext":
         """Create RuntimeContext for new agent and session (agent_config only)."""
@@ -558,9 +694,7 @@ class AdkFrameworkAdapter(FrameworkAdapter):
             adk_session = runner_context_dict["sessions"].get(session_id)
             agent_config = self.agent_manager._agent_configs.get(agent_id, task_request.agent_config)
 
-            metadata = self.agent_manager._agent_metadata.get(agent_id)
-            if metadata is not None:
-                metadata["last_activity"] = datetime.now()
+            self.agent_manager.mark_agent_activity(agent_id)
             async with self._mapping_lock:
                 if agent_id not in self._agent_sessions:
                     self._agent_sessions[agent_id] = []
@@ -584,46 +718,15 @@ class AdkFrameworkAdapter(FrameworkAdapter):
             )
 
         else:
-            agent_id = self.agent_manager.generate_agent_id()
-            self.logger.info(f"Generated agent_id: {agent_id}, session_id: {session_id}")
-
-            domain_agent = await self._create_domain_agent_for_config(task_request.agent_config, task_request)
-
-            try:
-                self.agent_manager._agents[agent_id] = domain_agent
-                self.agent_manager._agent_configs[agent_id] = task_request.agent_config
-                self.agent_manager._agent_metadata[agent_id] = {
-                    "created_at": datetime.now(),
-                    "last_activity": datetime.now(),
-                    "agent_type": task_request.agent_config.agent_type,
-                    "framework_type": FrameworkType.ADK,
-                }
-
-                self.logger.info(f"✅ Agent {agent_id} registered with AgentManager")
-
-            except Exception as e:
-                raise self.ExecutionError(
-                    f"Failed to register agent with AgentManager: {str(e)}",
-                    task_request
-                )
-
-            adk_agent = domain_agent.adk_agent
-
-            runner_id, _ = await self.runner_manager.get_or_create_runner(
+            agent_id, domain_agent, runner_id = await self._provision_agent_for_config(
                 task_request.agent_config,
-                task_request,
-                adk_agent,
+                config_hash,
+                task_request=task_request,
                 engine_session_id=session_id,
-                create_session=False,
-                allow_reuse=False,
             )
-
-            async with self._mapping_lock:
-                self._agent_runners[agent_id] = runner_id
-                self._agent_sessions[agent_id] = []
-                agents = list(self._config_agents.get(config_hash, []))
-                agents.append(agent_id)
-                self._config_agents[config_hash] = agents
+            # A hot config ran out of warm capacity; refill it off the request path.
+            if self._warm_pool is not None:
+                self._warm_pool.request_replenish(config_hash, reserved=int(max_sessions <= 1))
 
             runner_context_dict = self.runner_manager.runners[runner_id]
             adk_session = runner_context_dict["sessions"].get(session_id)
@@ -783,6 +886,63 @@ class AdkFrameworkAdapter(FrameworkAdapter):
                 ),
             )
 
+    async def execute_task_stream(
+        self, task_request: TaskRequest, strategy: ExecutionStrategy
+    ) -> AsyncIterator[TaskStreamChunk]:
+        """
+        Execute a task through the regular (non-live) path while streaming responses.
+
+        The task runs through ``execute_task`` unchanged, so session
+        coordination, recovery and error handling are identical. Every response
+        candidate the domain agent sees from ``runner.run_async`` is yielded as
+        a ``RESPONSE`` chunk as soon as it arrives, followed by one final chunk
+        wrapping the TaskResult.
+        """
+        pending: "asyncio.Queue[Any]" = asyncio.Queue()
+        done_marker = object()
+
+        def on_candidate(text: str, is_final_response: bool) -> None:
+            pending.put_nowait((text, is_final_response, time.perf_counter()))
+
+        with listen_for_response_candidates(on_candidate):
+            execution = asyncio.create_task(self.execute_task(task_request, strategy))
+        execution.add_done_callback(lambda _: pending.put_nowait(done_marker))
+
+        sequence_id = 0
+        adjust_in_flight("streams", 1)
+        try:
+            while True:
+                item = await pending.get()
+                if item is done_marker:
+                    break
+                text, is_final_response, enqueued_at = item
+                observe_stage_latency(
+                    "queue_wait",
+                    time.perf_counter() - enqueued_at,
+                    {"queue": "response_candidates"},
+                )
+                yield TaskStreamChunk(
+                    task_id=task_request.task_id,
+                    chunk_type=TaskChunkType.RESPONSE,
+                    sequence_id=sequence_id,
+                    content=text,
+                    metadata={
+                        "framework": "adk",
+                        "is_final_response": is_final_response,
+                    },
+                    chunk_kind=CHUNK_KIND_RESPONSE_DELTA,
+                )
+                sequence_id += 1
+            result = execution.result()
+        finally:
+            adjust_in_flight("streams", -1)
+            if not execution.done():
+                execution.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await execution
+
+        yield task_result_to_chunk(result, sequence_id)
+
     async def _handle_agent_creation(self, task_request: TaskRequest, strategy: ExecutionStrategy) -> TaskResult:
         """Handle agent creation mode (original Pattern 3)."""
         from ...contracts import RuntimeContext
@@ -906,13 +1066,15 @@ class AdkFrameworkAdapter(FrameworkAdapter):
 
         for attempt in range(2):
             try:
-                coordination_result = await self.adk_session_manager.coordinate_chat_session(
-                    chat_session_id=business_session_id,
-                    target_agent_id=task_request.agent_id,
-                    user_id=user_id,
-                    task_request=task_request,
-                    runner_manager=self.runner_manager,
-                )
+                with time_stage("session_coordination", stage=stage_label):
+                    coordination_result = await self.adk_session_manager.coordinate_chat_session(
+                        chat_session_id=business_session_id,
+                        target_agent_id=task_request.agent_id,
+                        user_id=user_id,
+                        task_request=task_request,
+                        runner_manager=self.runner_manager,
+                    )
+                self._publish_in_flight_gauges()
                 return coordination_result, recovery_record
             except SessionClearedError as exc:
                 if attempt == 1:
@@ -979,6 +1141,38 @@ class AdkFrameworkAdapter(FrameworkAdapter):
 
         raise RuntimeError("Session coordination did not complete successfully")
 
+    def _resolve_model_identifier(self, task_request: TaskRequest) -> Optional[str]:
+        """Model identifier of the agent serving ``task_request``."""
+        agent_config = task_request.agent_config
+        if agent_config is None and task_request.agent_id:
+            agent_config = self.agent_manager._agent_configs.get(task_request.agent_id)
+        model_config = getattr(agent_config, "model_config", None) or {}
+        return model_config.get("model") or self._get_default_adk_model()
+
+    def _apply_context_window(self, task_request: TaskRequest) -> Optional[ContextWindowResult]:
+        """Trim ``task_request.messages`` to the model's history token budget."""
+        if not task_request.messages:
+            return None
+        model_identifier = self._resolve_model_identifier(task_request)
+        budget = resolve_history_token_budget(model_identifier, getattr(self.runner_manager, "settings", None))
+        if not budget:
+            return None
+
+        window = ContextWindowManager(budget).apply(task_request.messages)
+        if window.dropped_count:
+            task_request.messages = window.messages
+            self.logger.info(
+                "Conversation history windowed",
+                extra={
+                    "task_id": task_request.task_id,
+                    "model": model_identifier,
+                    "budget_tokens": budget,
+                    "dropped_messages": window.dropped_count,
+                    "dropped_tokens": window.dropped_tokens,
+                },
+            )
+        return window
+
     async def _handle_conversation(self, task_request: TaskRequest, strategy: ExecutionStrategy) -> TaskResult:
         """Handle conversation mode with SessionManager coordination."""
         from ...contracts import RuntimeContext
@@ -1041,6 +1235,8 @@ class AdkFrameworkAdapter(FrameworkAdapter):
         if coordination_result is None:
             raise RuntimeError("Failed to coordinate chat session after recovery attempt")
 
+        context_window = self._apply_context_window(task_request)
+
         # Replace chat_session_id with adk_session_id
         original_session_id = task_request.session_id
         task_request.session_id = coordination_result.adk_session_id
@@ -1123,6 +1319,8 @@ class AdkFrameworkAdapter(FrameworkAdapter):
             "execution_id": runtime_context.execution_id,
             "pattern": "conversation"
         })
+        if context_window is not None:
+            result.metadata["context_window"] = context_window.to_metadata()
         
         if self.logger.isEnabledFor(logging.DEBUG):
             response_preview = None
@@ -1304,7 +1502,9 @@ class AdkFrameworkAdapter(FrameworkAdapter):
                 )
             else:
                 try:
-                    resolver = ToolResolver(tool_service)
+                    resolver = self._tool_resolver
+                    if resolver is None or resolver.tool_service is not tool_service:
+                        resolver = self._tool_resolver = ToolResolver(tool_service)
                     universal_tools = await resolver.resolve_tools(tool_names)
                     if universal_tools:
                         await domain_agent.update_tools(universal_tools)
@@ -1579,12 +1779,14 @@ class AdkFrameworkAdapter(FrameworkAdapter):
         wrapped_communicator = ApprovalAwareCommunicator(communicator, broker)
 
         async def orchestrated_stream():
+            adjust_in_flight("streams", 1)
             try:
                 async for chunk in live_stream:
                     chunk = await broker.on_chunk(chunk)
                     if chunk is not None:
                         yield chunk
             finally:
+                adjust_in_flight("streams", -1)
                 self.logger.info("ADK orchestrated_stream finalizing broker")
                 await broker.finalize()
                 broker.close()
@@ -1690,10 +1892,15 @@ class AdkFrameworkAdapter(FrameworkAdapter):
 
     async def shutdown(self):
         """Shutdown ADK framework adapter and RunnerManager."""
+        if self._warm_pool is not None:
+            await self._warm_pool.close()
+            self._warm_pool = None
         await self.adk_session_manager.stop_idle_cleanup()
         # Cleanup RunnerManager sessions
         if hasattr(self.runner_manager, 'cleanup_all'):
             await self.runner_manager.cleanup_all()
+        await self.adk_session_manager.close_session_service()
+        await self.adk_session_manager.close_recovery_store()
 
         # No global session service to cleanup (each session has its own)
         self._initialized = False
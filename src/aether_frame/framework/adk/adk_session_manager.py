@@ -4,7 +4,7 @@
 import asyncio
 import inspect
 import logging
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
@@ -15,12 +15,17 @@ except ImportError:
     MemoryEntry = None  # type: ignore[assignment]
 
 from ...contracts import KnowledgeSource, TaskRequest
+from .activity_index import AgentRunnerMapping, IdleActivityIndex, agents_for_runner
 from .adk_session_models import ChatSessionInfo, CoordinationResult
+from .history_handoff import HistorySummarizer, prepare_history_handoff
 from .session_recovery import (
     InMemorySessionRecoveryStore,
     SessionRecoveryRecord,
     SessionRecoveryStore,
+    load_recovery_records,
+    save_recovery_records,
 )
+from .session_recovery_stores import create_session_recovery_store
 
 DEFAULT_RUNNER_IDLE_TIMEOUT_SECONDS = 12 * 60 * 60  # 12 hours
 DEFAULT_AGENT_IDLE_TIMEOUT_SECONDS = 12 * 60 * 60  # 12 hours
@@ -59,6 +64,11 @@ class AdkSessionManager:
 
         # Session recovery store for restored chat sessions
         self._recovery_store: SessionRecoveryStore = recovery_store or InMemorySessionRecoveryStore()
+        self._owns_recovery_store = False
+        self._shared_session_service = None
+
+        # Optional summarizer for history dropped by the agent-switch token budget
+        self.history_summarizer: Optional[HistorySummarizer] = None
         self._pending_recoveries: Dict[str, SessionRecoveryRecord] = {}
 
         self.logger.info("ADKSessionManager initialized")
@@ -71,6 +81,12 @@ class AdkSessionManager:
         self._runner_idle_timeout_seconds: Optional[int] = None
         self._agent_idle_timeout_seconds: Optional[int] = None
         self._idle_check_interval_seconds: int = 300
+
+        # Activity indexes: each sweep only visits entries whose last activity crossed a timeout
+        self._session_idle_index = IdleActivityIndex()
+        self._runner_idle_index = IdleActivityIndex()
+        self._agent_idle_index = IdleActivityIndex()
+        self._idle_indexes_seeded = False
     
     def _default_session_service_factory(self):
         """Default factory that creates InMemorySessionService."""
@@ -87,6 +103,16 @@ class AdkSessionManager:
         self._maybe_bind_recovery_store(session_service)
         return session_service
 
+    def runner_session_service(self, session_service):
+        """Return the view of ``session_service`` a Runner should read through.
+
+        The shared durable service windows runner reads; history extraction
+        keeps using the full service stored in the runner context.
+        """
+        if session_service is not None and session_service is self._shared_session_service:
+            return session_service.runner_view()
+        return session_service
+
     def start_idle_cleanup(self, runner_manager, agent_manager, settings=None):
         """Start background idle cleanup watcher if configured."""
         session_timeout = None
@@ -133,6 +159,7 @@ class AdkSessionManager:
         self._idle_check_interval_seconds = interval or self._idle_check_interval_seconds
         self._idle_runner_manager = runner_manager
         self._idle_agent_manager = agent_manager
+        self._seed_idle_indexes()
 
         if self._idle_cleanup_task and not self._idle_cleanup_task.done():
             return
@@ -166,6 +193,93 @@ class AdkSessionManager:
             self.logger.info("Idle cleanup watcher stopped")
         self._idle_runner_manager = None
         self._idle_agent_manager = None
+        self._idle_indexes_seeded = False
+
+    def note_chat_session_activity(self, chat_session: ChatSessionInfo) -> None:
+        """Index the chat session's current ``last_activity``."""
+        self._session_idle_index.touch(chat_session.chat_session_id, chat_session.last_activity)
+
+    def note_runner_activity(self, runner_id: str, last_activity: datetime) -> None:
+        """Index runner activity reported by the runner manager."""
+        self._runner_idle_index.touch(runner_id, last_activity)
+
+    def note_agent_activity(self, agent_id: str, last_activity: datetime) -> None:
+        """Index agent activity reported by the agent manager."""
+        self._agent_idle_index.touch(agent_id, last_activity)
+
+    def _touch_chat_session(self, chat_session: ChatSessionInfo) -> None:
+        chat_session.last_activity = datetime.now()
+        self.note_chat_session_activity(chat_session)
+
+    def _seed_idle_indexes(self) -> None:
+        """Index every tracked session, runner and agent once from their current timestamps."""
+        for chat_session in self.chat_sessions.values():
+            self.note_chat_session_activity(chat_session)
+        for runner_id, context in getattr(self._idle_runner_manager, "runners", {}).items():
+            last_activity = context.get("last_activity") or context.get("created_at")
+            if last_activity:
+                self._runner_idle_index.touch(runner_id, last_activity)
+        for agent_id, record in getattr(self._idle_agent_manager, "_agent_metadata", {}).items():
+            last_activity = record.get("last_activity") or record.get("created_at")
+            if last_activity:
+                self._agent_idle_index.touch(agent_id, last_activity)
+        self._idle_indexes_seeded = True
+
+    def configure_session_service(self, settings=None) -> None:
+        """Share one durable session service across runners when ``settings`` select one."""
+
+        backend = getattr(settings, "adk_session_backend", None) if settings else None
+        if not backend or str(backend).lower() == "memory":
+            return
+        if str(backend).lower() != "sqlite":
+            raise ValueError(f"Unsupported ADK session backend: {backend}")
+
+        from .sqlite_session_service import DEFAULT_SESSION_DB_PATH, AdkSqliteSessionService
+
+        path = getattr(settings, "adk_session_db_path", None) or DEFAULT_SESSION_DB_PATH
+        session_service = AdkSqliteSessionService(
+            path,
+            runner_event_window=getattr(settings, "adk_session_event_window", None),
+        )
+        self._shared_session_service = session_service
+        self.session_service_factory = lambda: session_service
+        self.logger.info(
+            "ADK session service configured",
+            extra={"backend": backend, "path": path},
+        )
+
+    async def close_session_service(self) -> None:
+        """Close the shared session service created by ``configure_session_service``."""
+
+        session_service = self._shared_session_service
+        if session_service is None:
+            return
+        self._shared_session_service = None
+        self.session_service_factory = self._default_session_service_factory
+        await session_service.close()
+
+    def configure_recovery_store(self, settings=None) -> None:
+        """Switch to the durable recovery store selected by ``settings``, if any."""
+
+        backend = getattr(settings, "session_recovery_backend", None) if settings else None
+        if not backend or str(backend).lower() == "memory":
+            return
+        self._recovery_store = create_session_recovery_store(settings)
+        self._owns_recovery_store = True
+        self.logger.info(
+            "Session recovery store configured",
+            extra={"backend": backend, "path": getattr(settings, "session_recovery_path", None)},
+        )
+
+    async def close_recovery_store(self) -> None:
+        """Close the recovery store when it was created by this manager."""
+
+        if not self._owns_recovery_store:
+            return
+        close = getattr(self._recovery_store, "close", None)
+        if close is not None:
+            await close()
+        self._owns_recovery_store = False
 
     def _maybe_bind_recovery_store(self, session_service: Any) -> None:
         """Adopt recovery store provided by session service when available."""
@@ -199,16 +313,48 @@ class AdkSessionManager:
     async def _perform_idle_cleanup(self):
         if not self._idle_runner_manager:
             return
+        if not self._idle_indexes_seeded:
+            self._seed_idle_indexes()
 
         now = datetime.now()
 
         # Session-level cleanup
         if self._session_idle_timeout_seconds:
+            cutoff = now - timedelta(seconds=self._session_idle_timeout_seconds)
             stale_entries = []
-            for chat_session_id, info in list(self.chat_sessions.items()):
+            for chat_session_id in self._session_idle_index.pop_expired(cutoff):
+                info = self.chat_sessions.get(chat_session_id)
+                if info is None:
+                    continue
+                if info.last_activity > cutoff:
+                    self.note_chat_session_activity(info)
+                    continue
                 idle_seconds = (now - info.last_activity).total_seconds()
-                if idle_seconds >= self._session_idle_timeout_seconds:
-                    stale_entries.append((chat_session_id, info, idle_seconds))
+                stale_entries.append((chat_session_id, info, idle_seconds))
+
+            archived_records: Dict[str, SessionRecoveryRecord] = {}
+            if stale_entries:
+                try:
+                    archived_records = await self._archive_chat_session_states(
+                        [info for _, info, _ in stale_entries],
+                        runner_manager=self._idle_runner_manager,
+                        reason="session_idle_timeout",
+                    )
+                except Exception as exc:
+                    self.logger.exception(
+                        "Failed to archive idle sessions",
+                        extra={"session_count": len(stale_entries), "error": str(exc)},
+                    )
+                    # Keep the sessions so their history is not lost; retry on the next sweep
+                    for _, info, _ in stale_entries:
+                        self.note_chat_session_activity(info)
+                    stale_entries = []
+
+            missing_ids = [
+                chat_session_id for chat_session_id, _, _ in stale_entries if chat_session_id not in archived_records
+            ]
+            if missing_ids:
+                archived_records.update(await load_recovery_records(self._recovery_store, missing_ids))
 
             for chat_session_id, info, idle_seconds in stale_entries:
                 self.logger.warning(
@@ -221,14 +367,9 @@ class AdkSessionManager:
                     },
                 )
                 try:
-                    await self._archive_chat_session_state(
-                        chat_session=info,
-                        runner_manager=self._idle_runner_manager,
-                        reason="session_idle_timeout",
-                    )
                     await self._cleanup_session_only(info, self._idle_runner_manager)
                     self.chat_sessions.pop(chat_session_id, None)
-                    archived_record = await self._recovery_store.load(chat_session_id)
+                    archived_record = archived_records.get(chat_session_id)
                     archived_at = archived_record.archived_at if archived_record else None
                     self._mark_session_cleared(
                         chat_session_id,
@@ -253,10 +394,23 @@ class AdkSessionManager:
                             "error": str(exc),
                         },
                     )
+                    if chat_session_id in self.chat_sessions:
+                        # Retry on the next sweep
+                        self.note_chat_session_activity(info)
+
+        runners = getattr(self._idle_runner_manager, "runners", {})
 
         # Runner-level cleanup
         if self._runner_idle_timeout_seconds:
-            for runner_id, context in list(self._idle_runner_manager.runners.items()):
+            cutoff = now - timedelta(seconds=self._runner_idle_timeout_seconds)
+            for runner_id in self._runner_idle_index.pop_expired(cutoff):
+                context = runners.get(runner_id)
+                if not context:
+                    continue
+                last_activity = context.get("last_activity") or context.get("created_at")
+                if last_activity and last_activity > cutoff:
+                    self._runner_idle_index.touch(runner_id, last_activity)
+                    continue
                 await self._evaluate_runner_agent_idle(
                     runner_manager=self._idle_runner_manager,
                     agent_manager=self._idle_agent_manager,
@@ -265,15 +419,27 @@ class AdkSessionManager:
                     now=now,
                     trigger="runner_idle_scan",
                 )
+                if runner_id in runners:
+                    # Still holding sessions or tasks; releasing them records new activity
+                    self._runner_idle_index.touch(runner_id, now)
 
         # Agent-level cleanup
         if self._agent_idle_timeout_seconds and self._idle_agent_manager:
+            cutoff = now - timedelta(seconds=self._agent_idle_timeout_seconds)
             metadata = getattr(self._idle_agent_manager, "_agent_metadata", {})
-            for agent_id, data in list(metadata.items()):
-                mapped_runner = None
-                if self._idle_runner_manager and hasattr(self._idle_runner_manager, "agent_runner_mapping"):
-                    mapped_runner = self._idle_runner_manager.agent_runner_mapping.get(agent_id)
-                if mapped_runner and mapped_runner in getattr(self._idle_runner_manager, "runners", {}):
+            mapping = getattr(self._idle_runner_manager, "agent_runner_mapping", None) or {}
+            for agent_id in self._agent_idle_index.pop_expired(cutoff):
+                record = metadata.get(agent_id)
+                if not record:
+                    continue
+                last_activity = record.get("last_activity") or record.get("created_at")
+                if last_activity and last_activity > cutoff:
+                    self._agent_idle_index.touch(agent_id, last_activity)
+                    continue
+                mapped_runner = mapping.get(agent_id)
+                if mapped_runner and mapped_runner in runners:
+                    # Agents with a live runner are torn down together with the runner
+                    self._agent_idle_index.touch(agent_id, now)
                     continue
                 await self._evaluate_runner_agent_idle(
                     runner_manager=self._idle_runner_manager,
@@ -283,18 +449,34 @@ class AdkSessionManager:
                     now=now,
                     trigger="agent_idle_scan",
                 )
+                if agent_id in metadata:
+                    self._agent_idle_index.touch(agent_id, now)
+
+        await self._purge_expired_recovery_records()
+
+    async def _purge_expired_recovery_records(self) -> None:
+        """Let the recovery store drop records past its retention window."""
+
+        purge_expired = getattr(self._recovery_store, "purge_expired", None)
+        if purge_expired is None:
+            return
+        try:
+            purged = await purge_expired()
+        except Exception as exc:  # noqa: BLE001
+            self.logger.warning("Failed to purge expired recovery records", extra={"error": str(exc)})
+            return
+        if purged:
+            self.logger.info("Purged expired recovery records", extra={"purged_count": purged})
 
     def _find_agent_id_for_runner(self, runner_id: Optional[str]) -> Optional[str]:
-        """Best-effort reverse lookup of agent_id from runner mapping."""
+        """Reverse lookup of agent_id from the runner mapping."""
         if not runner_id or not self._idle_runner_manager:
             return None
-        mapping = getattr(self._idle_runner_manager, "agent_runner_mapping", {})
-        if not mapping:
-            return None
-        for agent_id, mapped_runner in mapping.items():
-            if mapped_runner == runner_id:
-                return agent_id
-        return None
+        mapping = getattr(self._idle_runner_manager, "agent_runner_mapping", None)
+        if isinstance(mapping, AgentRunnerMapping):
+            return mapping.agent_for_runner(runner_id)
+        agents = agents_for_runner(mapping, runner_id)
+        return agents[0] if agents else None
 
     async def _evaluate_runner_agent_idle(
         self,
@@ -314,6 +496,7 @@ class AdkSessionManager:
         agent_timeout = self._agent_idle_timeout_seconds or DEFAULT_AGENT_IDLE_TIMEOUT_SECONDS
 
         runner_cleaned = False
+        runner_retained = False
 
         if runner_manager and runner_id:
             runner_context = getattr(runner_manager, "runners", {}).get(runner_id)
@@ -324,13 +507,21 @@ class AdkSessionManager:
                     (now - last_activity).total_seconds() if last_activity else None
                 )
                 active_tasks = runner_context.get("active_tasks", 0)
-                if (
+                idle_expired = (
                     runner_timeout
                     and runner_idle_seconds is not None
                     and runner_idle_seconds >= runner_timeout
                     and session_count == 0
                     and active_tasks == 0
-                ):
+                )
+                should_retain = getattr(runner_manager, "should_retain_idle_runner", None)
+                if idle_expired and callable(should_retain) and should_retain(runner_id):
+                    runner_retained = True
+                    self.logger.debug(
+                        "Runner idle timeout skipped; runner is retained as warm capacity",
+                        extra={"runner_id": runner_id, "trigger": trigger},
+                    )
+                elif idle_expired:
                     self.logger.warning(
                         "Runner idle timeout reached; tearing down runner",
                         extra={
@@ -390,6 +581,7 @@ class AdkSessionManager:
                     and agent_idle_seconds is not None
                     and agent_idle_seconds >= agent_timeout
                     and (runner_cleaned or not runner_active)
+                    and not runner_retained
                 ):
                     self.logger.warning(
                         "Agent idle timeout reached; tearing down agent",
@@ -439,8 +631,8 @@ class AdkSessionManager:
             chat_session_id=chat_session_id,
             active_agent_id=record.agent_id,
         )
-        chat_session.last_activity = datetime.now()
         self.chat_sessions[chat_session_id] = chat_session
+        self._touch_chat_session(chat_session)
         self._pending_recoveries[chat_session_id] = record
         cleared_metadata = self._cleared_sessions.pop(chat_session_id, None)
 
@@ -530,7 +722,7 @@ class AdkSessionManager:
                     )
 
                 # Existing session, continue conversation
-                chat_session.last_activity = datetime.now()
+                self._touch_chat_session(chat_session)
                 
                 coordination_result = CoordinationResult(
                     adk_session_id=session_id, 
@@ -592,26 +784,45 @@ class AdkSessionManager:
                         f"{target_agent_id} for chat_session={chat_session.chat_session_id}")
         
         previous_agent_id = chat_session.active_agent_id
-        
-        # 1. Extract chat history from current session before cleanup
-        chat_history = None
+        settings = getattr(runner_manager, "settings", None)
+        max_events = getattr(settings, "agent_switch_history_max_events", None)
+        token_budget = getattr(settings, "agent_switch_history_token_budget", None)
+
+        # 1. Extract a compact transcript from the current session before cleanup
+        handoff = None
         if chat_session.active_adk_session_id:
-            self.logger.info(f"Attempting to extract chat history from session {chat_session.active_adk_session_id}")
-            chat_history = await self._extract_chat_history(chat_session, runner_manager)
-            self.logger.info(f"Extracted chat history: {len(chat_history) if chat_history else 0} messages")
+            chat_history = await self._extract_chat_history(
+                chat_session,
+                runner_manager,
+                max_events=max_events if isinstance(max_events, int) and max_events > 0 else None,
+            )
+            handoff = await prepare_history_handoff(
+                chat_history,
+                token_budget=token_budget if isinstance(token_budget, int) else None,
+                summarizer=self.history_summarizer,
+            )
+            self.logger.info(
+                "Prepared history handoff",
+                extra={
+                    "chat_session_id": chat_session.chat_session_id,
+                    "message_count": len(handoff.messages),
+                    "dropped_count": handoff.dropped_count,
+                    "dropped_tokens": handoff.dropped_tokens,
+                    "summarized": handoff.summarized,
+                },
+            )
             await self._cleanup_session_only(chat_session, runner_manager)
-        
+
         # 2. Get runner for target agent and create session
         # Since we have agent_id, the runner should already exist
         runner_id = await runner_manager.get_runner_for_agent(target_agent_id)
         new_adk_session_id = await runner_manager._create_session_in_runner(
             runner_id, task_request=task_request, external_session_id=f"adk_session_{uuid4().hex[:12]}"
         )
-        
-        # 3. Inject chat history into new session if available
-        if chat_history:
-            self.logger.info(f"Attempting to inject {len(chat_history)} messages into new session {new_adk_session_id}")
-            await self._inject_chat_history(runner_id, new_adk_session_id, chat_history, runner_manager)
+
+        # 3. Transfer the transcript into the new session in one bulk append
+        if handoff and handoff.messages:
+            await self._inject_chat_history(runner_id, new_adk_session_id, handoff.messages, runner_manager)
         else:
             self.logger.info("No chat history to inject into new session")
         
@@ -620,7 +831,7 @@ class AdkSessionManager:
         chat_session.active_adk_session_id = new_adk_session_id
         chat_session.active_runner_id = runner_id
         chat_session.last_switch_at = datetime.now()
-        chat_session.last_activity = datetime.now()
+        self._touch_chat_session(chat_session)
 
         coordination_result = CoordinationResult(
             adk_session_id=new_adk_session_id, 
@@ -668,7 +879,7 @@ class AdkSessionManager:
         chat_session.active_agent_id = target_agent_id
         chat_session.active_adk_session_id = new_adk_session_id
         chat_session.active_runner_id = runner_id
-        chat_session.last_activity = datetime.now()
+        self._touch_chat_session(chat_session)
 
         coordination_result = CoordinationResult(
             adk_session_id=new_adk_session_id, 
@@ -706,37 +917,33 @@ class AdkSessionManager:
         chat_session: ChatSessionInfo,
         runner_manager,
         reason: str,
-    ) -> None:
+    ) -> Optional[SessionRecoveryRecord]:
         """Collect session state before cleanup for future recovery."""
 
-        if not self._recovery_store:
-            return
+        archived = await self._archive_chat_session_states([chat_session], runner_manager, reason)
+        return archived.get(chat_session.chat_session_id)
 
-        chat_history: List[Dict[str, Any]] = []
-        if chat_session.active_adk_session_id:
-            try:
-                extracted_history = await self._extract_chat_history(chat_session, runner_manager)
-                if extracted_history:
-                    chat_history = extracted_history
-            except Exception as exc:  # noqa: BLE001
-                self.logger.warning(
-                    "Failed to extract chat history before cleanup",
-                    extra=
-                    {
-                        "chat_session_id": chat_session.chat_session_id,
-                        "reason": reason,
-                        "error": str(exc),
-                    },
-                )
+    async def _archive_chat_session_states(
+        self,
+        chat_sessions: List[ChatSessionInfo],
+        runner_manager,
+        reason: str,
+    ) -> Dict[str, SessionRecoveryRecord]:
+        """
+        Archive several chat sessions with a single recovery store write.
 
-        agent_config = None
-        runner_id = chat_session.active_runner_id
-        if runner_id and runner_manager:
-            runner_context = getattr(runner_manager, "runners", {}).get(runner_id)
-            if runner_context:
-                agent_config = runner_context.get("agent_config")
+        History is extracted concurrently; sessions without an active agent are
+        skipped. Returns the saved records keyed by chat session ID.
+        """
+
+        if not self._recovery_store:
+            return {}
 
-        if not chat_session.active_agent_id:
+        archivable: List[ChatSessionInfo] = []
+        for chat_session in chat_sessions:
+            if chat_session.active_agent_id:
+                archivable.append(chat_session)
+                continue
             self.logger.debug(
                 "Skipping archive for chat session without active agent",
                 extra={
@@ -744,25 +951,65 @@ class AdkSessionManager:
                     "reason": reason,
                 },
             )
-            return
+        if not archivable:
+            return {}
 
-        record = SessionRecoveryRecord(
-            chat_session_id=chat_session.chat_session_id,
-            user_id=chat_session.user_id,
-            agent_id=chat_session.active_agent_id,
-            agent_config=agent_config,
-            chat_history=chat_history,
-        )
-        await self._recovery_store.save(record)
-        self.logger.info(
-            "Archived chat session state",
-            extra={
-                "chat_session_id": chat_session.chat_session_id,
-                "reason": reason,
-                "history_count": len(chat_history),
-            },
+        histories = await asyncio.gather(
+            *(self._collect_archive_history(chat_session, runner_manager, reason) for chat_session in archivable)
         )
 
+        runners = getattr(runner_manager, "runners", {}) if runner_manager else {}
+        records: List[SessionRecoveryRecord] = []
+        for chat_session, chat_history in zip(archivable, histories):
+            agent_config = None
+            runner_context = runners.get(chat_session.active_runner_id) if chat_session.active_runner_id else None
+            if runner_context:
+                agent_config = runner_context.get("agent_config")
+            records.append(
+                SessionRecoveryRecord(
+                    chat_session_id=chat_session.chat_session_id,
+                    user_id=chat_session.user_id,
+                    agent_id=chat_session.active_agent_id,
+                    agent_config=agent_config,
+                    chat_history=chat_history,
+                )
+            )
+
+        await save_recovery_records(self._recovery_store, records)
+        for record in records:
+            self.logger.info(
+                "Archived chat session state",
+                extra={
+                    "chat_session_id": record.chat_session_id,
+                    "reason": reason,
+                    "history_count": len(record.chat_history),
+                },
+            )
+        return {record.chat_session_id: record for record in records}
+
+    async def _collect_archive_history(
+        self,
+        chat_session: ChatSessionInfo,
+        runner_manager,
+        reason: str,
+    ) -> List[Dict[str, Any]]:
+        if not chat_session.active_adk_session_id:
+            return []
+        try:
+            extracted_history = await self._extract_chat_history(chat_session, runner_manager)
+        except Exception as exc:  # noqa: BLE001
+            self.logger.warning(
+                "Failed to extract chat history before cleanup",
+                extra=
+                {
+                    "chat_session_id": chat_session.chat_session_id,
+                    "reason": reason,
+                    "error": str(exc),
+                },
+            )
+            return []
+        return extracted_history or []
+
     async def _maybe_apply_recovery_payload(
         self,
         chat_session: ChatSessionInfo,
@@ -929,6 +1176,7 @@ class AdkSessionManager:
                 user_id=user_id,
                 chat_session_id=chat_session_id
             )
+            self.note_chat_session_activity(self.chat_sessions[chat_session_id])
             self.logger.info(f"Created new chat session tracking: {chat_session_id}")
         
         return self.chat_sessions[chat_session_id]
@@ -1092,13 +1340,19 @@ class AdkSessionManager:
         )
         return True
 
-    async def _extract_chat_history(self, chat_session: ChatSessionInfo, runner_manager):
+    async def _extract_chat_history(
+        self,
+        chat_session: ChatSessionInfo,
+        runner_manager,
+        max_events: Optional[int] = None,
+    ):
         """
         Extract chat history from current session using ADK official API.
         
         Args:
             chat_session: The chat session to extract history from
             runner_manager: Runner manager instance
+            max_events: Only read the most recent events when set
             
         Returns:
             List of chat messages or None if extraction fails
@@ -1111,7 +1365,7 @@ class AdkSessionManager:
                 self.logger.warning(f"Cannot extract history - missing runner_id: {runner_id} or session_id: {session_id}")
                 return None
             
-            self.logger.info(f"🔍 DEBUG: Starting history extraction from runner {runner_id}, session {session_id}")
+            self.logger.debug(f"Extracting chat history from runner {runner_id}, session {session_id}")
             
             # Get runner context
             runner_context = runner_manager.runners.get(runner_id)
@@ -1139,37 +1393,31 @@ class AdkSessionManager:
                 self.logger.warning(f"Missing app_name({app_name}) or user_id({user_id}) in runner context")
                 return None
             
-            self.logger.info(f"🔍 DEBUG: Using SessionService API: app_name={app_name}, user_id={user_id}, session_id={session_id}")
-            
+            get_session_kwargs = {}
+            if max_events:
+                try:
+                    from google.adk.sessions.base_session_service import GetSessionConfig
+                    get_session_kwargs["config"] = GetSessionConfig(num_recent_events=max_events)
+                except ImportError:
+                    pass
+
             # Get the session object first
             try:
                 session_obj = await session_service.get_session(
                     app_name=app_name,
                     user_id=user_id,
-                    session_id=session_id
+                    session_id=session_id,
+                    **get_session_kwargs,
                 )
                 
                 if session_obj and hasattr(session_obj, 'events'):
-                    self.logger.debug(f"Retrieved session with {len(session_obj.events) if session_obj.events else 0} events")
-                    
-                    # Log extracted events for debugging
-                    for i, event in enumerate(session_obj.events):
-                        author = getattr(event, 'author', 'Unknown')
-                        content = getattr(event, 'content', None)
-                        if content and hasattr(content, 'parts') and content.parts:
-                            text = content.parts[0].text if hasattr(content.parts[0], 'text') else 'No text'
-                            self.logger.debug(f"Event {i+1}: author={author}, text={text[:100]}...")
-                        else:
-                            self.logger.debug(f"Event {i+1}: author={author}, no content")
-                    
-                    # Parse events from session object
-                    chat_history = await self._parse_adk_events_to_history(session_obj.events)
-                    self.logger.debug(f"Parsed {len(chat_history) if chat_history else 0} messages from session events")
-                    
-                    # Log parsed history
-                    for i, msg in enumerate(chat_history):
-                        self.logger.debug(f"Parsed message {i+1}: role={msg.get('role')}, content={msg.get('content', '')[:100]}...")
-                    
+                    events = session_obj.events or []
+                    if max_events and len(events) > max_events:
+                        events = events[-max_events:]
+                    chat_history = await self._parse_adk_events_to_history(events)
+                    self.logger.debug(
+                        f"Parsed {len(chat_history)} messages from {len(events)} session events"
+                    )
                     return chat_history
                 else:
                     self.logger.info("No session found or session has no events attribute")
@@ -1251,6 +1499,9 @@ class AdkSessionManager:
     async def _inject_chat_history(self, runner_id: str, session_id: str, chat_history, runner_manager):
         """
         Inject chat history into new session using ADK official API.
+
+        Events are built once from the transcript and written with a single
+        bulk append when the session service supports it.
         
         Args:
             runner_id: Target runner ID
@@ -1263,13 +1514,6 @@ class AdkSessionManager:
                 self.logger.debug("No chat history to inject")
                 return
             
-            self.logger.info(f"Starting history injection into runner {runner_id}, session {session_id}")
-            self.logger.debug(f"Injecting {len(chat_history)} messages")
-            
-            # Log what we're injecting for debugging
-            for i, msg in enumerate(chat_history):
-                self.logger.debug(f"Message {i+1} to inject: role={msg.get('role')}, content={msg.get('content', '')[:100]}...")
-            
             # Get runner context
             runner_context = runner_manager.runners.get(runner_id)
             if not runner_context:
@@ -1306,50 +1550,60 @@ class AdkSessionManager:
                 if not target_session:
                     self.logger.warning(f"Target session {session_id} not found for history injection")
                     return
-                
-                self.logger.debug(f"Target session found, current events: {len(target_session.events) if hasattr(target_session, 'events') and target_session.events else 0}")
                     
             except Exception as e:
                 self.logger.error(f"Failed to get target session {session_id}: {e}")
                 return
             
-            # Create and inject events for each message using official API
-            injected_count = 0
-            for i, msg in enumerate(chat_history):
-                try:
-                    self.logger.debug(f"Creating event {i+1} from message: {msg}")
-                    event = await self._create_event_from_message(msg)
-                    if event:
-                        self.logger.debug(f"Created event {i+1}: author={event.author}, content_parts={len(event.content.parts) if event.content and hasattr(event.content, 'parts') else 0}")
-                        # Use official ADK API to append event
-                        await session_service.append_event(target_session, event)
-                        injected_count += 1
-                        self.logger.debug(f"Successfully appended event {i+1} to session")
-                    else:
-                        self.logger.warning(f"Failed to create event from message {i+1}")
-                        
-                except Exception as e:
-                    self.logger.warning(f"Failed to inject message {i+1}: {msg} - Error: {e}")
-                    continue
+            events = []
+            for msg in chat_history:
+                event = await self._create_event_from_message(msg)
+                if event:
+                    events.append(event)
             
+            injected_count = await self._append_events_bulk(session_service, target_session, events)
             self.logger.info(f"Successfully injected {injected_count}/{len(chat_history)} events into session {session_id}")
             
-            # Verify injection by getting session again
-            try:
-                updated_session = await session_service.get_session(
-                    app_name=app_name,
-                    user_id=user_id,
-                    session_id=session_id
-                )
-                if updated_session and hasattr(updated_session, 'events'):
-                    self.logger.debug(f"After injection, session has {len(updated_session.events)} total events")
-                
-            except Exception as e:
-                self.logger.warning(f"Failed to verify injection: {e}")
-            
         except Exception as e:
             self.logger.error(f"Failed to inject chat history into session {session_id}: {e}")
 
+    async def _append_events_bulk(self, session_service, session, events) -> int:
+        """Append ``events`` in one call when the service offers ``append_events``.
+
+        If the bulk call fails, the session is reloaded and the events are
+        appended one by one so a single bad event does not drop the rest.
+        """
+        if not events:
+            return 0
+        append_events = getattr(session_service, "append_events", None)
+        if append_events is not None:
+            try:
+                await append_events(session, events)
+                return len(events)
+            except Exception as e:
+                self.logger.warning(f"Bulk history injection failed, appending events individually: {e}")
+                # The failed call may have applied some events to the in-memory session.
+                try:
+                    reloaded = await session_service.get_session(
+                        app_name=session.app_name, user_id=session.user_id, session_id=session.id
+                    )
+                except Exception as reload_error:
+                    self.logger.warning(f"Failed to reload session {session.id} after bulk failure: {reload_error}")
+                    reloaded = None
+                if reloaded is not None:
+                    session = reloaded
+                    persisted_ids = {event.id for event in session.events}
+                    events = [event for event in events if event.id not in persisted_ids]
+
+        injected_count = 0
+        for event in events:
+            try:
+                await session_service.append_event(session, event)
+                injected_count += 1
+            except Exception as e:
+                self.logger.warning(f"Failed to inject event {event.id}: {e}")
+        return injected_count
+
     def _extract_history_from_session_state(self, session_obj):
         """Fallback extractor when SessionService is unavailable."""
         if not session_obj:
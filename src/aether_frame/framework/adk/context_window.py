@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+"""
+Token-budgeted windowing of conversation messages.
+
+``ContextWindowManager`` trims a request's message list to a per-model token
+budget before it is converted to ADK content. Pinned messages (system
+prompts, knowledge context, anything flagged ``metadata["pinned"]``) are
+always kept; the remaining budget is filled with the most recent messages.
+Token counts are estimated with a CJK-aware character heuristic whose
+results are cached per text, so repeated history costs nothing to re-measure.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from .model_factory import AdkModelFactory
+
+CHARS_PER_TOKEN = 4
+MESSAGE_OVERHEAD_TOKENS = 4
+IMAGE_PART_TOKENS = 258
+FILE_PART_TOKENS = 258
+DEFAULT_HISTORY_BUDGET_RATIO = 0.6
+
+PINNED_ROLES = frozenset({"system"})
+PINNED_METADATA_KEYS = ("pinned", "knowledge")
+
+
+def _is_wide_char(char: str) -> bool:
+    code = ord(char)
+    return (
+        0x3040 <= code <= 0x30FF  # Hiragana / Katakana
+        or 0x3400 <= code <= 0x9FFF  # CJK ideographs
+        or 0xAC00 <= code <= 0xD7AF  # Hangul
+        or 0xF900 <= code <= 0xFAFF
+        or 0xFF00 <= code <= 0xFFEF  # Full-width forms
+    )
+
+
+class TokenEstimator:
+    """
+    Approximate tokenizer with an LRU cache keyed by text.
+
+    Latin text is counted at ~4 characters per token and CJK characters at one
+    token each, which tracks BPE tokenizers closely enough for budgeting.
+    """
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[str, int]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def estimate_text(self, text: Optional[str]) -> int:
+        """Estimate tokens for ``text``."""
+        if not text:
+            return 0
+        cached = self._cache.get(text)
+        if cached is not None:
+            self._cache.move_to_end(text)
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        if text.isascii():
+            tokens = (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+        else:
+            wide = sum(1 for char in text if _is_wide_char(char))
+            narrow = len(text) - wide
+            tokens = wide + (narrow + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+        self._cache[text] = tokens
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return tokens
+
+    def estimate_message(self, message: Any) -> int:
+        """Estimate tokens for a ``UniversalMessage`` or message dict."""
+        if isinstance(message, Mapping):
+            content = message.get("content")
+        else:
+            content = getattr(message, "content", None)
+
+        tokens = MESSAGE_OVERHEAD_TOKENS
+        if isinstance(content, str):
+            return tokens + self.estimate_text(content)
+        if isinstance(content, list):
+            for part in content:
+                if isinstance(part, str):
+                    tokens += self.estimate_text(part)
+                    continue
+                tokens += self.estimate_text(getattr(part, "text", None))
+                if getattr(part, "image_reference", None) is not None:
+                    tokens += IMAGE_PART_TOKENS
+                if getattr(part, "file_reference", None) is not None:
+                    tokens += FILE_PART_TOKENS
+                function_call = getattr(part, "function_call", None)
+                if function_call is not None:
+                    tokens += self.estimate_text(str(getattr(function_call, "parameters", "") or ""))
+            return tokens
+        if content is not None:
+            tokens += self.estimate_text(str(content))
+        return tokens
+
+
+_default_estimator = TokenEstimator()
+
+
+def default_token_estimator() -> TokenEstimator:
+    """Return the process-wide shared estimator."""
+    return _default_estimator
+
+
+def resolve_history_token_budget(
+    model_identifier: Optional[str],
+    settings: Any = None,
+) -> Optional[int]:
+    """
+    Resolve the history token budget for a model.
+
+    ``settings.conversation_token_budgets`` maps model families to explicit
+    budgets, matched by the same longest-family rule as the context window
+    table (``AdkModelFactory.match_model_family``); otherwise the budget is
+    the model's context window scaled by
+    ``settings.conversation_history_budget_ratio``.
+    Returns ``None`` when windowing is not enabled or the model's context
+    window is unknown.
+    """
+    if settings is None or not getattr(settings, "enable_conversation_windowing", False):
+        return None
+
+    overrides = getattr(settings, "conversation_token_budgets", None)
+    if isinstance(overrides, Mapping):
+        family = AdkModelFactory.match_model_family(model_identifier, overrides)
+        if family is not None:
+            budget = overrides[family]
+            return int(budget) if budget and budget > 0 else None
+
+    ratio = getattr(settings, "conversation_history_budget_ratio", None)
+    if not isinstance(ratio, (int, float)) or ratio <= 0:
+        ratio = DEFAULT_HISTORY_BUDGET_RATIO
+    context_window = AdkModelFactory.context_window_tokens(model_identifier)
+    if not context_window:
+        return None
+    return int(context_window * ratio)
+
+
+def is_pinned_message(message: Any) -> bool:
+    """Return True for messages that must survive windowing."""
+    if isinstance(message, Mapping):
+        role = message.get("role")
+        metadata = message.get("metadata")
+    else:
+        role = getattr(message, "role", None)
+        metadata = getattr(message, "metadata", None)
+    if role in PINNED_ROLES:
+        return True
+    if isinstance(metadata, Mapping):
+        return any(metadata.get(key) for key in PINNED_METADATA_KEYS)
+    return False
+
+
+@dataclass
+class ContextWindowResult:
+    """Outcome of windowing one request."""
+
+    messages: List[Any]
+    budget_tokens: int
+    kept_tokens: int = 0
+    dropped_count: int = 0
+    dropped_tokens: int = 0
+    pinned_count: int = 0
+
+    def to_metadata(self) -> Dict[str, int]:
+        """Summary suitable for ``TaskResult.metadata``."""
+        return {
+            "budget_tokens": self.budget_tokens,
+            "kept_tokens": self.kept_tokens,
+            "dropped_messages": self.dropped_count,
+            "dropped_tokens": self.dropped_tokens,
+            "pinned_messages": self.pinned_count,
+        }
+
+
+@dataclass
+class ContextWindowManager:
+    """Sliding window over conversation messages with pinned messages."""
+
+    budget_tokens: int
+    estimator: TokenEstimator = field(default_factory=default_token_estimator)
+
+    def apply(self, messages: Sequence[Any]) -> ContextWindowResult:
+        """
+        Window ``messages`` to the budget, preserving their original order.
+
+        The newest message is always kept, even when it alone exceeds the
+        budget. A window never starts with an orphaned tool result.
+        """
+        messages = list(messages or [])
+        costs = [self.estimator.estimate_message(message) for message in messages]
+        pinned = [is_pinned_message(message) for message in messages]
+
+        keep = list(pinned)
+        used = sum(cost for cost, is_pinned in zip(costs, pinned) if is_pinned)
+        newest = next((index for index in range(len(messages) - 1, -1, -1) if not pinned[index]), None)
+
+        window_start = None
+        for index in range(len(messages) - 1, -1, -1):
+            if pinned[index]:
+                continue
+            if index != newest and used + costs[index] > self.budget_tokens:
+                break
+            keep[index] = True
+            used += costs[index]
+            window_start = index
+
+        # Drop tool results whose originating call fell out of the window.
+        if window_start is not None and window_start != newest:
+            for index in range(window_start, len(messages)):
+                if pinned[index]:
+                    continue
+                if _role(messages[index]) != "tool" or index == newest:
+                    break
+                keep[index] = False
+                used -= costs[index]
+
+        result = ContextWindowResult(
+            messages=[message for message, kept in zip(messages, keep) if kept],
+            budget_tokens=self.budget_tokens,
+            kept_tokens=used,
+            pinned_count=sum(pinned),
+        )
+        result.dropped_count = len(messages) - len(result.messages)
+        result.dropped_tokens = sum(cost for cost, kept in zip(costs, keep) if not kept)
+        return result
+
+
+def _role(message: Any) -> Optional[str]:
+    if isinstance(message, Mapping):
+        return message.get("role")
+    return getattr(message, "role", None)
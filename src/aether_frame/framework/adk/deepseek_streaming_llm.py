@@ -47,6 +47,8 @@ from google.adk.models.llm_response import LlmResponse
 from google.genai import types
 from litellm import ChatCompletionAssistantMessage, ChatCompletionMessageToolCall, Function
 
+from ...observability.metrics_backend import time_stream
+from .history_buffer import NormalizedHistoryBuffer, capture_tool_calls
 from .history_orientation import HistoryOrientationManager, content_text_signature
 
 logger = logging.getLogger(__name__)
@@ -203,7 +205,9 @@ class DeepSeekStreamingLLM(LiteLlm):
         self, llm_request: LlmRequest, stream: bool = False
     ) -> AsyncGenerator[LlmResponse, None]:
         if not stream:
-            async for resp in super().generate_content_async(llm_request, stream=False):
+            async for resp in time_stream(
+                "llm_call", super().generate_content_async(llm_request, stream=False), model=self.model
+            ):
                 yield resp
             return
 
@@ -356,7 +360,7 @@ class DeepSeekStreamingLLM(LiteLlm):
                     aggregated_with_tool.usage_metadata = usage_metadata
                 yield aggregated_with_tool
 
-        async for response in _generator():
+        async for response in time_stream("llm_call", _generator(), first_item_stage="ttft", model=self.model):
             yield response
 
     @asynccontextmanager
@@ -380,6 +384,7 @@ class DeepSeekLiveConnection(BaseLlmConnection):
         self._stream_task: Optional[asyncio.Task] = None
         self._lock = asyncio.Lock()
         self._tool_calls: Dict[str, Dict[str, Any]] = {}
+        self._normalized_history = NormalizedHistoryBuffer(self._tool_calls)
         self._last_response: Optional[LlmResponse] = None
         self._text_accumulator: List[str] = []
         self._had_final_text = False
@@ -394,6 +399,7 @@ class DeepSeekLiveConnection(BaseLlmConnection):
             logger.debug("DeepSeekStreaming: send_history count=%s", len(history))
             cloned_history = [_clone_content(item) for item in history]
             self._history = self._history_order.prepare_history(cloned_history)
+            self._normalized_history.reset()
             await self._restart_stream()
 
     async def send_content(self, content: types.Content) -> None:
@@ -465,79 +471,13 @@ class DeepSeekLiveConnection(BaseLlmConnection):
         self._pending_restart = False
 
     def _prepare_request(self) -> LlmRequest:
-        request = self._base_request.model_copy(deep=True)
-        request.contents = self._normalize_history()
-        return request
+        # The base request is a private deep copy taken at connect time and the
+        # model only appends to ``contents``, so a shallow copy with a fresh
+        # contents list is enough to keep turns isolated.
+        return self._base_request.model_copy(update={"contents": self._normalize_history()})
 
     def _normalize_history(self) -> List[types.Content]:
-        normalized: List[types.Content] = []
-        existing_call_ids: set[str] = set()
-        emitted_call_ids: set[str] = set()
-        pending_tool_responses: Dict[str, types.Content] = {}
-        for recorded in self._history:
-            for part in getattr(recorded, "parts", None) or []:
-                function_call = getattr(part, "function_call", None)
-                if function_call and function_call.id:
-                    existing_call_ids.add(function_call.id)
-        for content in self._history:
-            cloned = _clone_content(content)
-            parts = getattr(cloned, "parts", None) or []
-
-            tool_response_part = next(
-                (part for part in parts if getattr(part, "function_response", None)),
-                None,
-            )
-            if tool_response_part:
-                tool_response = tool_response_part.function_response
-                call_id = tool_response.id if tool_response else ""
-                args = self._tool_calls.get(call_id) or {}
-                payload = tool_response.response if tool_response else {}
-                if not args and isinstance(payload, dict):
-                    args = payload.get("arguments") or {}
-                tool_name = (
-                    tool_response.name
-                    if tool_response
-                    else payload.get("tool_name") if isinstance(payload, dict) else "tool_call"
-                )
-                assistant_content = types.Content(
-                    role="model",
-                    parts=[types.Part(function_call=types.FunctionCall(name=tool_name, args=args, id=call_id or None))],
-                )
-                should_inject_call = not call_id or call_id not in existing_call_ids
-                if should_inject_call:
-                    cloned.role = "tool"
-                    normalized.append(assistant_content)
-                    if call_id:
-                        existing_call_ids.add(call_id)
-                        emitted_call_ids.add(call_id)
-                    normalized.append(cloned)
-                    continue
-                if call_id and call_id in emitted_call_ids:
-                    cloned.role = "tool"
-                    normalized.append(cloned)
-                    continue
-                if call_id:
-                    cloned.role = "tool"
-                    pending_tool_responses[call_id] = cloned
-                    continue
-                cloned.role = "tool"
-                normalized.append(cloned)
-                continue
-
-            self._capture_tool_calls(cloned)
-            normalized.append(cloned)
-            emitted_by_content: List[str] = []
-            for part in getattr(cloned, "parts", None) or []:
-                function_call = getattr(part, "function_call", None)
-                if function_call and function_call.id:
-                    emitted_call_ids.add(function_call.id)
-                    emitted_by_content.append(function_call.id)
-            for call_id in emitted_by_content:
-                pending = pending_tool_responses.pop(call_id, None)
-                if pending:
-                    pending.role = "tool"
-                    normalized.append(pending)
-        return normalized
+        return list(self._normalized_history.sync(self._history))
 
     async def _emit_stream(self, request: LlmRequest) -> None:
         try:
@@ -613,12 +553,7 @@ class DeepSeekLiveConnection(BaseLlmConnection):
         return combined.strip()
 
     def _capture_tool_calls(self, content: types.Content) -> None:
-        for part in getattr(content, "parts", None) or []:
-            function_call = getattr(part, "function_call", None)
-            if function_call:
-                call_id = function_call.id or function_call.name
-                if call_id:
-                    self._tool_calls[call_id] = function_call.args or {}
+        capture_tool_calls(content, self._tool_calls)
 
     async def _emit_sentinel(self) -> None:
         if self._sentinel_emitted:
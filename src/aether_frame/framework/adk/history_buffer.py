@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""Incremental tool-call aware history normalization for live LLM connections."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Set
+
+from google.genai import types
+
+
+def capture_tool_calls(content: types.Content, tool_calls: Dict[str, Dict[str, Any]]) -> None:
+    """Record function-call arguments keyed by call id (or name) into ``tool_calls``."""
+    for part in getattr(content, "parts", None) or []:
+        function_call = getattr(part, "function_call", None)
+        if function_call:
+            call_id = function_call.id or function_call.name
+            if call_id:
+                tool_calls[call_id] = function_call.args or {}
+
+
+def _function_call_ids(content: types.Content) -> List[str]:
+    ids: List[str] = []
+    for part in getattr(content, "parts", None) or []:
+        function_call = getattr(part, "function_call", None)
+        if function_call and function_call.id:
+            ids.append(function_call.id)
+    return ids
+
+
+class NormalizedHistoryBuffer:
+    """
+    Maintains the OpenAI-compatible view of a live connection's history.
+
+    Tool responses are re-labelled with the ``tool`` role and paired with their
+    function call: a synthetic call is injected when the original call is not
+    part of the history, and a response recorded before its call is held back
+    until the call appears. Contents are processed once as they are appended;
+    unchanged prefix contents are shared with the source history rather than
+    cloned, and tool responses are shallow copies that only override ``role``.
+
+    The only case that requires reprocessing is a function call arriving after
+    a synthetic call was already injected for the same id; the buffer then
+    rebuilds from the full history so the result matches a from-scratch pass.
+    """
+
+    def __init__(self, tool_calls: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Args:
+            tool_calls: Shared mapping of call id -> arguments captured by the
+                connection; used to fill arguments of injected calls.
+        """
+        self._tool_calls = tool_calls
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all processed contents."""
+        self._normalized: List[types.Content] = []
+        self._source_count = 0
+        self._source_tail: Optional[types.Content] = None
+        self._existing_call_ids: Set[str] = set()
+        self._emitted_call_ids: Set[str] = set()
+        self._injected_call_ids: Set[str] = set()
+        self._pending_tool_responses: Dict[str, types.Content] = {}
+
+    def sync(self, history: List[types.Content]) -> List[types.Content]:
+        """
+        Bring the normalized view up to date with ``history``.
+
+        ``history`` is expected to grow by appending; if it was replaced or
+        reordered since the last call the buffer rebuilds from scratch.
+
+        Returns:
+            The normalized contents. The list is owned by the buffer and must
+            be copied before being mutated.
+        """
+        if not self._is_extension_of_processed(history):
+            self._rebuild(history)
+            return self._normalized
+
+        for content in history[self._source_count:]:
+            if not self._append(content):
+                self._rebuild(history)
+                return self._normalized
+        self._mark_processed(history)
+        return self._normalized
+
+    @property
+    def processed_count(self) -> int:
+        """Number of source history contents reflected in the normalized view."""
+        return self._source_count
+
+    def _is_extension_of_processed(self, history: List[types.Content]) -> bool:
+        if self._source_count == 0:
+            return True
+        if len(history) < self._source_count:
+            return False
+        return history[self._source_count - 1] is self._source_tail
+
+    def _mark_processed(self, history: List[types.Content]) -> None:
+        self._source_count = len(history)
+        self._source_tail = history[-1] if history else None
+
+    def _rebuild(self, history: List[types.Content]) -> None:
+        self.reset()
+        for content in history:
+            self._existing_call_ids.update(_function_call_ids(content))
+        for content in history:
+            self._append(content, lookahead=True)
+        self._mark_processed(history)
+
+    def _append(self, content: types.Content, lookahead: bool = False) -> bool:
+        """Normalize one content; return False when a rebuild is required."""
+        call_ids = _function_call_ids(content)
+        if not lookahead:
+            if any(call_id in self._injected_call_ids for call_id in call_ids):
+                return False
+            self._existing_call_ids.update(call_ids)
+
+        parts = getattr(content, "parts", None) or []
+        tool_response_part = next(
+            (part for part in parts if getattr(part, "function_response", None)),
+            None,
+        )
+        if tool_response_part:
+            self._append_tool_response(content, tool_response_part.function_response)
+            return True
+
+        capture_tool_calls(content, self._tool_calls)
+        self._normalized.append(content)
+        for call_id in call_ids:
+            self._emitted_call_ids.add(call_id)
+            pending = self._pending_tool_responses.pop(call_id, None)
+            if pending:
+                self._normalized.append(pending)
+        return True
+
+    def _append_tool_response(
+        self, content: types.Content, tool_response: types.FunctionResponse
+    ) -> None:
+        tool_content = content.model_copy(update={"role": "tool"})
+        call_id = tool_response.id if tool_response else ""
+
+        if not call_id or call_id not in self._existing_call_ids:
+            args = self._tool_calls.get(call_id) or {}
+            payload = tool_response.response if tool_response else {}
+            if not args and isinstance(payload, dict):
+                args = payload.get("arguments") or {}
+            tool_name = (
+                tool_response.name
+                if tool_response
+                else payload.get("tool_name") if isinstance(payload, dict) else "tool_call"
+            )
+            self._normalized.append(
+                types.Content(
+                    role="model",
+                    parts=[
+                        types.Part(
+                            function_call=types.FunctionCall(
+                                name=tool_name,
+                                args=args,
+                                id=call_id or None,
+                            )
+                        )
+                    ],
+                )
+            )
+            if call_id:
+                self._existing_call_ids.add(call_id)
+                self._emitted_call_ids.add(call_id)
+                self._injected_call_ids.add(call_id)
+            self._normalized.append(tool_content)
+            return
+
+        if call_id in self._emitted_call_ids:
+            self._normalized.append(tool_content)
+            return
+
+        self._pending_tool_responses[call_id] = tool_content
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+Chat history handoff between ADK sessions.
+
+On an agent switch the previous session's history is reduced to a compact
+``{"role", "content", "timestamp"}`` transcript and written into the new
+session in one bulk operation. ``prepare_history_handoff`` optionally fits
+the transcript into a token budget: the most recent messages are kept and,
+when a summarizer is supplied, the dropped prefix is replaced by a single
+summary message.
+"""
+
+from __future__ import annotations
+
+import inspect
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from .context_window import default_token_estimator
+
+HistoryMessage = Dict[str, Any]
+HistorySummarizer = Callable[[List[HistoryMessage]], Union[Optional[str], Awaitable[Optional[str]]]]
+
+SUMMARY_PREFIX = "Summary of the earlier conversation:"
+
+
+def estimate_message_tokens(message: HistoryMessage) -> int:
+    """Estimate tokens for one transcript message with the shared cached estimator."""
+    return default_token_estimator().estimate_message(message)
+
+
+@dataclass
+class HistoryHandoff:
+    """Transcript prepared for injection into a new session."""
+
+    messages: List[HistoryMessage]
+    dropped_count: int = 0
+    dropped_tokens: int = 0
+    summarized: bool = False
+
+
+def fit_history_to_token_budget(
+    history: Sequence[HistoryMessage],
+    token_budget: int,
+) -> Tuple[List[HistoryMessage], List[HistoryMessage]]:
+    """
+    Keep the longest suffix of ``history`` whose estimated size fits ``token_budget``.
+
+    Returns:
+        Tuple of (kept messages, dropped prefix), both in chronological order.
+    """
+    used = 0
+    start = len(history)
+    while start > 0:
+        cost = estimate_message_tokens(history[start - 1])
+        if used + cost > token_budget:
+            break
+        used += cost
+        start -= 1
+    return list(history[start:]), list(history[:start])
+
+
+async def prepare_history_handoff(
+    history: Optional[Sequence[HistoryMessage]],
+    *,
+    token_budget: Optional[int] = None,
+    summarizer: Optional[HistorySummarizer] = None,
+) -> HistoryHandoff:
+    """
+    Build the transcript handed to the next session.
+
+    Args:
+        history: Transcript extracted from the previous session.
+        token_budget: Maximum estimated tokens to carry over; ``None`` or a
+            non-positive value keeps everything.
+        summarizer: Optional callable (sync or async) turning the dropped
+            messages into summary text. Its output is kept only when it fits
+            the budget together with the retained messages.
+    """
+    messages = list(history or [])
+    if not token_budget or token_budget <= 0:
+        return HistoryHandoff(messages=messages)
+
+    kept, dropped = fit_history_to_token_budget(messages, token_budget)
+    if not dropped:
+        return HistoryHandoff(messages=kept)
+
+    handoff = HistoryHandoff(
+        messages=kept,
+        dropped_count=len(dropped),
+        dropped_tokens=sum(estimate_message_tokens(message) for message in dropped),
+    )
+    if summarizer is None:
+        return handoff
+
+    # The summary takes budget from the retained messages; when that pushes more
+    # messages out, summarize once more so they are covered by the summary too.
+    for _ in range(2):
+        summary_message = await _summarize(summarizer, dropped)
+        if summary_message is None:
+            return handoff
+        budget_left = token_budget - estimate_message_tokens(summary_message)
+        if budget_left < 0:
+            return handoff
+        retained, trimmed = fit_history_to_token_budget(kept, budget_left)
+        if not trimmed:
+            break
+        dropped = dropped + trimmed
+        kept = retained
+
+    handoff.messages = [summary_message, *retained]
+    handoff.dropped_count = len(messages) - len(retained)
+    handoff.dropped_tokens = sum(estimate_message_tokens(message) for message in messages[: handoff.dropped_count])
+    handoff.summarized = True
+    return handoff
+
+
+async def _summarize(summarizer: HistorySummarizer, dropped: List[HistoryMessage]) -> Optional[HistoryMessage]:
+    summary = summarizer(dropped)
+    if inspect.isawaitable(summary):
+        summary = await summary
+    if not summary:
+        return None
+    return {
+        "role": "user",
+        "content": f"{SUMMARY_PREFIX} {summary}",
+        "timestamp": dropped[-1].get("timestamp"),
+    }
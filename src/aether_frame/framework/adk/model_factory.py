@@ -2,7 +2,40 @@
 """ADK Model Factory for custom model handling."""
 
 import os
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Iterable, Optional, Union
+
+
+# Context window sizes (tokens) by model family, without the provider prefix.
+# A model matches the longest family it equals or extends with a version
+# suffix (``gpt-4o-2024-08-06`` -> ``gpt-4o``); unmatched models are not windowed.
+_CONTEXT_WINDOW_TOKENS: Dict[str, int] = {
+    "gemini-1.5-pro": 2_000_000,
+    "gemini-1.5-flash": 1_000_000,
+    "gemini-2.0-flash": 1_000_000,
+    "gemini-2.5-pro": 1_000_000,
+    "gemini-2.5-flash": 1_000_000,
+    "gpt-4.1": 1_000_000,
+    "gpt-4.1-mini": 1_000_000,
+    "gpt-4.1-nano": 1_000_000,
+    "gpt-4o": 128_000,
+    "gpt-4o-mini": 128_000,
+    "gpt-4-turbo": 128_000,
+    "gpt-4-32k": 32_768,
+    "gpt-4": 8_192,
+    "gpt-3.5-turbo": 16_385,
+    "gpt-35-turbo": 16_385,
+    "o1-preview": 128_000,
+    "o1-mini": 128_000,
+    "deepseek-chat": 64_000,
+    "deepseek-reasoner": 64_000,
+    "qwen-long": 1_000_000,
+    "qwen-max": 32_768,
+    "qwen-plus": 32_768,
+    "qwen-turbo": 32_768,
+}
+
+# Characters that may follow a family name in a versioned model name.
+_MODEL_SUFFIX_SEPARATORS = ("-", "@", ":")
 
 
 class AdkModelFactory:
@@ -248,3 +281,47 @@ class AdkModelFactory:
         if "qwen" in model_lower or "dashscope" in model_lower:
             return True
         return False
+
+    @staticmethod
+    def context_window_tokens(model_identifier: Optional[str]) -> Optional[int]:
+        """
+        Return the context window size for a model identifier.
+        
+        Args:
+            model_identifier: Model identifier string, optionally with a
+                provider prefix such as ``azure/``
+            
+        Returns:
+            Context window in tokens, or None when the model is not listed
+        """
+        family = AdkModelFactory.match_model_family(model_identifier, _CONTEXT_WINDOW_TOKENS)
+        return _CONTEXT_WINDOW_TOKENS[family] if family is not None else None
+
+    @staticmethod
+    def match_model_family(model_identifier: Optional[str], families: Iterable[str]) -> Optional[str]:
+        """
+        Return the longest family in ``families`` that names ``model_identifier``.
+
+        The provider prefix (``azure/``) is ignored. A family matches when it
+        equals the model name or is followed by a version separator, so
+        ``gpt-4`` matches ``gpt-4-0613`` but not ``gpt-4o``.
+        
+        Args:
+            model_identifier: Model identifier string
+            families: Candidate family names (case-insensitive)
+            
+        Returns:
+            The matching family as given in ``families``, or None
+        """
+        model_name = (model_identifier or "").lower().rsplit("/", 1)[-1]
+        if not model_name:
+            return None
+        best: Optional[str] = None
+        for family in families:
+            name = family.lower().rsplit("/", 1)[-1]
+            if model_name == name or (
+                model_name.startswith(name) and model_name[len(name)] in _MODEL_SUFFIX_SEPARATORS
+            ):
+                if best is None or len(name) > len(best.lower().rsplit("/", 1)[-1]):
+                    best = family
+        return best
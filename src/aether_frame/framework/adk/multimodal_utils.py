@@ -2,11 +2,32 @@
 """Multimodal utilities for ADK framework integration."""
 
 import base64
+import binascii
+import hashlib
 import logging
-from typing import Optional, Tuple
+import re
+import threading
+from collections import OrderedDict
+from typing import Iterator, NamedTuple, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_IMAGE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_IMAGE_CACHE_MAX_ENTRIES = 256
+# Inline image limit accepted by Gemini; larger payloads are rejected before decoding.
+DEFAULT_MAX_IMAGE_BYTES = 20 * 1024 * 1024
+# Base64 characters decoded per step; must be a multiple of 4.
+BASE64_CHUNK_CHARS = 64 * 1024
+
+_NON_BASE64_CHARS = re.compile(r"[^A-Za-z0-9+/=]")
+
+
+class DecodedImage(NamedTuple):
+    """Decoded image payload and its MIME type."""
+
+    mime_type: str
+    data: bytes
+
 
 def detect_image_mime_type(base64_data: str) -> Optional[str]:
     """
@@ -24,52 +45,193 @@ def detect_image_mime_type(base64_data: str) -> Optional[str]:
             base64_data[:20] + "=="
         )  # Add padding for safety
         
-        # Check common image format magic numbers
-        if header_bytes.startswith(b'\xff\xd8\xff'):
-            return "image/jpeg"
-        elif header_bytes.startswith(b'\x89PNG\r\n\x1a\n'):
-            return "image/png"
-        elif header_bytes.startswith(b'GIF8'):
-            return "image/gif"
-        elif header_bytes.startswith(b'RIFF') and b'WEBP' in header_bytes[:12]:
-            return "image/webp"
-        elif header_bytes.startswith(b'BM'):
-            return "image/bmp"
-        else:
+        mime_type = detect_image_mime_type_from_bytes(header_bytes)
+        if mime_type is None:
             logger.warning(
                 f"Unknown image format, header bytes: {header_bytes[:8].hex()}"
             )
-            return None
+        return mime_type
             
     except Exception as e:
         logger.error(f"Failed to detect MIME type: {str(e)}")
         return None
 
 
-def decode_base64_image(base64_data: str) -> Optional[bytes]:
+def detect_image_mime_type_from_bytes(header_bytes: bytes) -> Optional[str]:
+    """
+    Detect MIME type from the leading bytes of a decoded image.
+    
+    Args:
+        header_bytes: At least the first 12 bytes of the image
+        
+    Returns:
+        MIME type string or None if the magic number is not recognised
+    """
+    # Check common image format magic numbers
+    if header_bytes.startswith(b'\xff\xd8\xff'):
+        return "image/jpeg"
+    elif header_bytes.startswith(b'\x89PNG\r\n\x1a\n'):
+        return "image/png"
+    elif header_bytes.startswith(b'GIF8'):
+        return "image/gif"
+    elif header_bytes.startswith(b'RIFF') and b'WEBP' in header_bytes[:12]:
+        return "image/webp"
+    elif header_bytes.startswith(b'BM'):
+        return "image/bmp"
+    return None
+
+
+def decode_base64_image(base64_data: str, max_bytes: Optional[int] = None) -> Optional[bytes]:
     """
     Decode base64 image data to bytes.
     
     Args:
-        base64_data: Base64 encoded image data
+        base64_data: Base64 encoded image data, optionally as a data URL
+        max_bytes: Optional limit on the decoded size
         
     Returns:
         Decoded image bytes or None if decoding fails
     """
     try:
-        # Remove data URL prefix if present (data:image/jpeg;base64,...)
-        if base64_data.startswith('data:'):
-            base64_data = base64_data.split(',', 1)[1]
-        
-        # Decode base64 to bytes
-        image_bytes = base64.b64decode(base64_data)
-        return image_bytes
+        # Skip the data URL prefix (data:image/jpeg;base64,...) without copying the payload
+        _, offset = _locate_base64_payload(base64_data)
+        return _decode_base64_chunks(base64_data, offset, max_bytes=max_bytes)
         
     except Exception as e:
         logger.error(f"Failed to decode base64 image: {str(e)}")
         return None
 
 
+def decode_image_payload(
+    base64_data: str,
+    max_bytes: Optional[int] = DEFAULT_MAX_IMAGE_BYTES,
+    chunk_chars: int = BASE64_CHUNK_CHARS,
+) -> Optional[DecodedImage]:
+    """
+    Validate and decode a base64 image (raw or data URL) in fixed-size chunks.
+    
+    The decoded size is checked against ``max_bytes`` and a MIME type declared
+    in a data URL is validated before any decoding; otherwise the MIME type is
+    resolved from the magic bytes of the first chunk, so unsupported images are
+    rejected without decoding the rest of the payload. Chunks are written into a single preallocated buffer.
+    
+    Args:
+        base64_data: Base64 encoded image data, optionally as a data URL
+        max_bytes: Maximum decoded size; ``None`` disables the limit
+        chunk_chars: Base64 characters decoded per step
+        
+    Returns:
+        DecodedImage or None if the image is invalid, unsupported or too large
+    """
+    try:
+        declared_mime_type, offset = _locate_base64_payload(base64_data)
+        if declared_mime_type and not validate_image_format(declared_mime_type):
+            raise ValueError(f"unsupported image format: {declared_mime_type}")
+        mime_type: Optional[str] = None
+
+        def check_header(header_bytes: bytes) -> None:
+            nonlocal mime_type
+            mime_type = declared_mime_type or detect_image_mime_type_from_bytes(header_bytes)
+            if not mime_type:
+                raise ValueError(f"unknown image format, header bytes: {header_bytes[:8].hex()}")
+            if not validate_image_format(mime_type):
+                raise ValueError(f"unsupported image format: {mime_type}")
+
+        image_bytes = _decode_base64_chunks(
+            base64_data,
+            offset,
+            max_bytes=max_bytes,
+            chunk_chars=chunk_chars,
+            check_header=check_header,
+        )
+        if not image_bytes or not mime_type:
+            logger.warning("Image payload is empty")
+            return None
+        return DecodedImage(mime_type, image_bytes)
+
+    except Exception as e:
+        logger.warning(f"Rejected base64 image: {str(e)}")
+        return None
+
+
+def estimate_decoded_size(base64_data: str, offset: int = 0) -> int:
+    """
+    Return an upper bound for the decoded size of ``base64_data[offset:]``.
+    
+    Line breaks are excluded, so the bound is exact for well-formed payloads.
+    """
+    length = len(base64_data) - offset
+    length -= base64_data.count("\n", offset) + base64_data.count("\r", offset)
+    padding = 0
+    if base64_data.endswith("=="):
+        padding = 2
+    elif base64_data.endswith("="):
+        padding = 1
+    return max(0, length * 3 // 4 - padding)
+
+
+def _locate_base64_payload(base64_data: str) -> Tuple[Optional[str], int]:
+    """Return (declared MIME type, payload offset) for raw base64 or a data URL."""
+    if not base64_data.startswith("data:"):
+        return None, 0
+    comma = base64_data.find(",")
+    if comma < 0:
+        raise ValueError("data URL has no payload")
+    mime_type = base64_data[5:comma].split(";", 1)[0]
+    return mime_type or None, comma + 1
+
+
+def _iter_base64_chunks(base64_data: str, offset: int, chunk_chars: int) -> Iterator[bytes]:
+    """Decode ``base64_data[offset:]`` chunk by chunk, ignoring non-alphabet characters."""
+    pending = ""
+    for start in range(offset, len(base64_data), chunk_chars):
+        chunk = base64_data[start:start + chunk_chars]
+        if _NON_BASE64_CHARS.search(chunk):
+            chunk = _NON_BASE64_CHARS.sub("", chunk)
+        if pending:
+            chunk = pending + chunk
+        usable = len(chunk) - len(chunk) % 4
+        pending = chunk[usable:]
+        if usable:
+            yield binascii.a2b_base64(chunk[:usable] if pending else chunk)
+    if pending:
+        raise binascii.Error("Incorrect padding")
+
+
+def _decode_base64_chunks(
+    base64_data: str,
+    offset: int,
+    *,
+    max_bytes: Optional[int] = None,
+    chunk_chars: int = BASE64_CHUNK_CHARS,
+    check_header=None,
+) -> bytes:
+    """Decode into one preallocated buffer, enforcing ``max_bytes`` up front."""
+    if chunk_chars <= 0 or chunk_chars % 4:
+        raise ValueError("chunk_chars must be a positive multiple of 4")
+    capacity = estimate_decoded_size(base64_data, offset)
+    if max_bytes is not None and capacity > max_bytes:
+        raise ValueError(f"image of ~{capacity} bytes exceeds the {max_bytes} byte limit")
+
+    buffer = bytearray(capacity)
+    position = 0
+    with memoryview(buffer) as view:
+        for decoded in _iter_base64_chunks(base64_data, offset, chunk_chars):
+            if check_header is not None and position == 0:
+                check_header(decoded)
+            end = position + len(decoded)
+            if end > capacity:
+                raise ValueError("decoded image is larger than its encoded size allows")
+            view[position:end] = decoded
+            position = end
+    if position == 0 and check_header is not None:
+        check_header(b"")
+    del buffer[position:]
+    # Blob.data is validated as ``bytes``; freezing once here lets the same object
+    # be cached and handed to ``types.Blob`` without further copies.
+    return bytes(buffer)
+
+
 def validate_image_format(mime_type: str) -> bool:
     """
     Validate if the image format is supported.
@@ -117,4 +279,89 @@ def extract_base64_from_data_url(data_url: str) -> Tuple[Optional[str], Optional
         
     except Exception as e:
         logger.error(f"Failed to parse data URL: {str(e)}")
-        return None, None
\ No newline at end of file
+        return None, None
+
+
+class DecodedImageCache:
+    """
+    Content-addressed LRU cache of decoded images bounded by total bytes.
+
+    Entries are keyed by a digest of the base64 payload, so the same image
+    sent again on a later turn (or by another session) is decoded only once.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_IMAGE_CACHE_MAX_BYTES,
+        max_entries: int = DEFAULT_IMAGE_CACHE_MAX_ENTRIES,
+    ):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, DecodedImage]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evicted_bytes = 0
+
+    @staticmethod
+    def make_key(base64_data: str) -> str:
+        """Return the cache key for a base64 payload or data URL."""
+        return hashlib.blake2b(base64_data.encode("ascii", "ignore"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[DecodedImage]:
+        """Return the cached image for ``key`` and mark it most recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, image: DecodedImage) -> None:
+        """Store ``image``; images larger than the whole budget are not cached."""
+        size = len(image.data)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= len(previous.data)
+            self._entries[key] = image
+            self.current_bytes += size
+            while self._entries and (
+                self.current_bytes > self.max_bytes or len(self._entries) > self.max_entries
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= len(evicted.data)
+                self.evicted_bytes += len(evicted.data)
+
+    def clear(self) -> None:
+        """Drop all cached images."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> dict:
+        """Return cache counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evicted_bytes": self.evicted_bytes,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_decoded_image_cache = DecodedImageCache()
+
+
+def get_decoded_image_cache() -> DecodedImageCache:
+    """Return the process-wide decoded image cache."""
+    return _decoded_image_cache
@@ -17,6 +17,7 @@ except ImportError:
 
 from ...contracts import AgentConfig
 from ...config.settings import Settings
+from .activity_index import RunnerLoadIndex, agents_for_runner
 
 
 class RunnerManager:
@@ -37,6 +38,7 @@ class RunnerManager:
         agent_runner_mapping=None,
         agent_cleanup_callback=None,
         agent_sessions_mapping=None,
+        idle_retention_callback=None,
     ):
         """Initialize runner manager."""
         self.logger = logging.getLogger(__name__)
@@ -44,6 +46,7 @@ class RunnerManager:
         self.session_manager = session_manager  # SessionManager instance for creating session services
         self.agent_runner_mapping = agent_runner_mapping  # External agent_id -> runner_id mapping
         self.agent_cleanup_callback = agent_cleanup_callback  # Optional callback executed when runner is cleaned
+        self.idle_retention_callback = idle_retention_callback  # Optional runner_id -> keep-when-idle predicate
         self._agent_sessions = agent_sessions_mapping if agent_sessions_mapping is not None else {}
         self._agent_sessions_lock = asyncio.Lock()
         
@@ -54,6 +57,7 @@ class RunnerManager:
         self._config_locks: Dict[str, asyncio.Lock] = {}
         self._config_creation_tasks: Dict[str, asyncio.Future] = {}
         self._runner_locks: Dict[str, asyncio.Lock] = {}
+        self.load_index = RunnerLoadIndex()  # config_hash -> runners by session count
         
         # Runner availability check
         self.logger.info("RunnerManager initialized")
@@ -227,10 +231,14 @@ class RunnerManager:
                     )
                     memory_service = None
 
+            runner_session_service = session_service
+            if self.session_manager and hasattr(self.session_manager, "runner_session_service"):
+                runner_session_service = self.session_manager.runner_session_service(session_service)
+
             runner_kwargs = {
                 "agent": adk_agent,
                 "app_name": self.settings.default_app_name,
-                "session_service": session_service,
+                "session_service": runner_session_service,
             }
             if memory_service is not None:
                 runner_kwargs["memory_service"] = memory_service
@@ -254,6 +262,7 @@ class RunnerManager:
                 "memory_service": memory_service,
                 "active_tasks": 0,
             }
+            self._notify_runner_activity(runner_id, now)
             
             self.logger.info(f"Created ADK Runner {runner_id} with dedicated SessionService")
             return runner_id
@@ -262,11 +271,19 @@ class RunnerManager:
             self.logger.error(f"Failed to create Runner {runner_id}: {str(e)}")
             raise RuntimeError(f"Runner creation failed: {str(e)}")
 
-    def mark_runner_activity(self, runner_id: str) -> None:
+    def mark_runner_activity(self, runner_id: str, at: Optional[datetime] = None) -> None:
         """Update last_activity timestamp for the runner if it exists."""
         context = self.runners.get(runner_id)
         if context:
-            context["last_activity"] = datetime.now()
+            timestamp = at or datetime.now()
+            context["last_activity"] = timestamp
+            self._notify_runner_activity(runner_id, timestamp)
+
+    def _notify_runner_activity(self, runner_id: str, timestamp: datetime) -> None:
+        """Forward runner activity to the session manager's idle index."""
+        note_activity = getattr(self.session_manager, "note_runner_activity", None)
+        if callable(note_activity):
+            note_activity(runner_id, timestamp)
 
     @asynccontextmanager
     async def acquire_runner(self, runner_id: str):
@@ -284,7 +301,7 @@ class RunnerManager:
                 context = self.runners.get(runner_id)
                 if context and context.get("active_tasks"):
                     context["active_tasks"] -= 1
-                    context["last_activity"] = datetime.now()
+                    self.mark_runner_activity(runner_id)
 
     async def _create_session_in_runner(self, runner_id: str, task_request = None, external_session_id: str = None) -> str:
         """
@@ -306,7 +323,7 @@ class RunnerManager:
             if not runner_context:
                 raise ValueError(f"Runner {runner_id} not found")
             session_service = runner_context["session_service"]
-            runner_context["last_activity"] = datetime.now()
+            self.mark_runner_activity(runner_id)
         
         # H5: Use external session_id if provided, otherwise generate
         session_id = external_session_id or f"{self.settings.session_id_prefix}_{uuid4().hex[:12]}"
@@ -341,7 +358,8 @@ class RunnerManager:
                     raise RuntimeError(f"Runner {runner_id} not available after session creation")
                 runner_context["sessions"][session_id] = adk_session
                 runner_context.setdefault("session_user_ids", {})[session_id] = user_id
-                runner_context["last_activity"] = datetime.now()
+                self.load_index.update(runner_id, len(runner_context["sessions"]))
+                self.mark_runner_activity(runner_id)
                 self.session_to_runner[session_id] = runner_id
                 
             self.logger.info(f"Created ADK Session {session_id} in Runner {runner_id}")
@@ -368,6 +386,8 @@ class RunnerManager:
         async with runner_lock:
             try:
                 session_ids = list(runner_context["sessions"].keys())
+                # Shared durable services outlive the runner: drop its rows too.
+                await self._delete_runner_sessions(runner_id, runner_context)
                 for session_id in session_ids:
                     if session_id in self.session_to_runner:
                         del self.session_to_runner[session_id]
@@ -389,17 +409,14 @@ class RunnerManager:
                 
                 agents_to_cleanup = []
                 if self.agent_runner_mapping:
-                    stale_agents = [
-                        agent_id
-                        for agent_id, mapped_runner in self.agent_runner_mapping.items()
-                        if mapped_runner == runner_id
-                    ]
+                    stale_agents = agents_for_runner(self.agent_runner_mapping, runner_id)
                     for agent_id in stale_agents:
                         del self.agent_runner_mapping[agent_id]
                     agents_to_cleanup = stale_agents
                 
                 del self.runners[runner_id]
                 self._runner_locks.pop(runner_id, None)
+                self.load_index.discard(runner_id)
 
                 if agents_to_cleanup and self.agent_cleanup_callback:
                     for agent_id in agents_to_cleanup:
@@ -415,6 +432,35 @@ class RunnerManager:
                 self.logger.error(f"Failed to cleanup Runner {runner_id}: {str(e)}")
                 return False
 
+    def should_retain_idle_runner(self, runner_id: str) -> bool:
+        """Return True when an idle runner must not be torn down (e.g. it is warm pool capacity)."""
+        if not self.idle_retention_callback:
+            return False
+        try:
+            return bool(self.idle_retention_callback(runner_id))
+        except Exception as exc:
+            self.logger.warning(f"Idle retention check failed for runner {runner_id}: {exc}")
+            return False
+
+    async def _delete_runner_sessions(self, runner_id: str, runner_context: Dict[str, Any]) -> None:
+        session_service = runner_context.get("session_service")
+        if not session_service or not hasattr(session_service, "delete_session"):
+            return
+        session_user_map = runner_context.get("session_user_ids") or {}
+        for session_id, adk_session in list(runner_context["sessions"].items()):
+            app_name = getattr(adk_session, "app_name", None) or runner_context.get("app_name")
+            user_id = getattr(adk_session, "user_id", None) or session_user_map.get(session_id)
+            if not app_name or not user_id:
+                continue
+            try:
+                await session_service.delete_session(
+                    app_name=app_name, user_id=user_id, session_id=session_id
+                )
+            except Exception as exc:
+                self.logger.warning(
+                    f"Failed to delete ADK session {session_id} while cleaning up runner {runner_id}: {exc}"
+                )
+
     async def get_runner_stats(self) -> Dict[str, Any]:
         """Get Runner manager statistics."""
         return {
@@ -471,6 +517,7 @@ class RunnerManager:
                     self.logger.info(f"Deleted ADK session {session_id} through SessionService")
                 
                 del runner_context["sessions"][session_id]
+                self.load_index.update(runner_id, len(runner_context["sessions"]))
                 session_user_map = runner_context.get("session_user_ids")
                 if session_user_map and session_id in session_user_map:
                     del session_user_map[session_id]
@@ -478,7 +525,7 @@ class RunnerManager:
                 if session_id in self.session_to_runner:
                     del self.session_to_runner[session_id]
 
-                runner_context["last_activity"] = datetime.now()
+                self.mark_runner_activity(runner_id)
                 
                 self.logger.info(f"Removed session {session_id} from runner {runner_id}")
                 return True
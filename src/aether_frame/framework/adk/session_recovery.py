@@ -3,13 +3,15 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass, field, fields
 from datetime import datetime, timezone
 from threading import RLock
 from types import SimpleNamespace
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
-from ...contracts import AgentConfig, UniversalMessage
+from ...contracts import AgentConfig, FrameworkType, UniversalMessage
+
+_AGENT_CONFIG_FIELDS = {config_field.name for config_field in fields(AgentConfig)}
 
 
 @dataclass(frozen=True)
@@ -39,6 +41,53 @@ class SessionRecoveryRecord:
             "archived_at": self.archived_at.isoformat(),
         }
 
+    def to_payload(self) -> Dict[str, object]:
+        """Return the full record as JSON-compatible data for durable stores."""
+
+        agent_config_payload: Optional[Dict[str, object]] = None
+        if isinstance(self.agent_config, AgentConfig):
+            agent_config_payload = asdict(self.agent_config)
+            framework_type = agent_config_payload.get("framework_type")
+            if isinstance(framework_type, FrameworkType):
+                agent_config_payload["framework_type"] = framework_type.value
+
+        return {
+            "chat_session_id": self.chat_session_id,
+            "user_id": self.user_id,
+            "agent_id": self.agent_id,
+            "agent_config": agent_config_payload,
+            "chat_history": list(self.chat_history or []),
+            "archived_at": self.archived_at.isoformat(),
+        }
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "SessionRecoveryRecord":
+        """Rebuild a record produced by :meth:`to_payload`."""
+
+        agent_config = None
+        config_payload = payload.get("agent_config")
+        if isinstance(config_payload, dict):
+            kwargs = {key: value for key, value in config_payload.items() if key in _AGENT_CONFIG_FIELDS}
+            if "framework_type" in kwargs:
+                kwargs["framework_type"] = FrameworkType(kwargs["framework_type"])
+            try:
+                agent_config = AgentConfig(**kwargs)
+            except TypeError:
+                agent_config = None
+
+        archived_at = datetime.fromisoformat(payload["archived_at"])
+        if archived_at.tzinfo is None:
+            archived_at = archived_at.replace(tzinfo=timezone.utc)
+
+        return cls(
+            chat_session_id=payload["chat_session_id"],
+            user_id=payload["user_id"],
+            agent_id=payload["agent_id"],
+            agent_config=agent_config,
+            chat_history=list(payload.get("chat_history") or []),
+            archived_at=archived_at,
+        )
+
 
 class SessionRecoveryStore:
     """Abstract persistence for session recovery records."""
@@ -52,6 +101,32 @@ class SessionRecoveryStore:
     async def purge(self, chat_session_id: str) -> None:
         raise NotImplementedError
 
+    async def save_many(self, records: Sequence[SessionRecoveryRecord]) -> None:
+        """Store several records; backends override this to write in one batch."""
+
+        for record in records:
+            await self.save(record)
+
+    async def load_many(self, chat_session_ids: Iterable[str]) -> Dict[str, SessionRecoveryRecord]:
+        """Return the stored records for ``chat_session_ids``, omitting missing ones."""
+
+        loaded: Dict[str, SessionRecoveryRecord] = {}
+        for chat_session_id in chat_session_ids:
+            record = await self.load(chat_session_id)
+            if record is not None:
+                loaded[chat_session_id] = record
+        return loaded
+
+    async def purge_expired(self) -> int:
+        """Drop records past the store's retention window; returns the count removed."""
+
+        return 0
+
+    async def close(self) -> None:
+        """Release resources held by the store."""
+
+        return None
+
 
 class InMemorySessionRecoveryStore(SessionRecoveryStore):
     """Simple in-memory store for development and unit testing."""
@@ -74,6 +149,19 @@ class InMemorySessionRecoveryStore(SessionRecoveryStore):
         with self._lock:
             self._records.pop(chat_session_id, None)
 
+    async def save_many(self, records: Sequence[SessionRecoveryRecord]) -> None:
+        with self._lock:
+            for record in records:
+                self._records[record.chat_session_id] = record
+
+    async def load_many(self, chat_session_ids: Iterable[str]) -> Dict[str, SessionRecoveryRecord]:
+        with self._lock:
+            return {
+                chat_session_id: self._records[chat_session_id]
+                for chat_session_id in chat_session_ids
+                if chat_session_id in self._records
+            }
+
 
 class InMemoryArchiveSessionService:
     """Mock SessionService with archive APIs backed by SessionRecoveryStore."""
@@ -109,6 +197,36 @@ class InMemoryArchiveSessionService:
         return self.recovery_store
 
 
+async def save_recovery_records(store: Any, records: Sequence[SessionRecoveryRecord]) -> None:
+    """Save ``records`` through the store's batch API, falling back to ``save``."""
+
+    if not records:
+        return
+    save_many = getattr(store, "save_many", None)
+    if save_many is not None:
+        await save_many(records)
+        return
+    for record in records:
+        await store.save(record)
+
+
+async def load_recovery_records(store: Any, chat_session_ids: Iterable[str]) -> Dict[str, SessionRecoveryRecord]:
+    """Load records through the store's batch API, falling back to ``load``."""
+
+    chat_session_ids = list(chat_session_ids)
+    if not chat_session_ids:
+        return {}
+    load_many = getattr(store, "load_many", None)
+    if load_many is not None:
+        return await load_many(chat_session_ids)
+    loaded: Dict[str, SessionRecoveryRecord] = {}
+    for chat_session_id in chat_session_ids:
+        record = await store.load(chat_session_id)
+        if record is not None:
+            loaded[chat_session_id] = record
+    return loaded
+
+
 def recovery_record_to_messages(
     record: SessionRecoveryRecord,
     *,
@@ -0,0 +1,462 @@
+# -*- coding: utf-8 -*-
+"""
+Durable session recovery stores.
+
+Both stores keep records as zlib-compressed JSON produced by
+``SessionRecoveryRecord.to_payload`` and run all I/O on a dedicated worker
+thread, so the event loop never blocks on disk access and the underlying
+handles are only ever touched from one thread.
+
+* ``SqliteSessionRecoveryStore`` keeps one row per chat session in a SQLite
+  database opened in WAL mode.
+* ``FileSessionRecoveryStore`` appends frames to a single log file, keeps an
+  in-memory offset index and rewrites the log once superseded frames dominate.
+
+Both accept ``ttl_seconds`` (records older than this are treated as missing
+and removed by ``purge_expired``) and ``max_records`` (oldest records are
+evicted once the bound is exceeded).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import json
+import logging
+import os
+import sqlite3
+import struct
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .session_recovery import (
+    InMemorySessionRecoveryStore,
+    SessionRecoveryRecord,
+    SessionRecoveryStore,
+)
+
+DEFAULT_SQLITE_PATH = "data/session_recovery.db"
+DEFAULT_FILE_PATH = "data/session_recovery.log"
+
+
+def _encode_record(record: SessionRecoveryRecord, compression_level: int) -> bytes:
+    payload = json.dumps(record.to_payload(), separators=(",", ":"), ensure_ascii=False, default=str)
+    return zlib.compress(payload.encode("utf-8"), compression_level)
+
+
+def _decode_record(blob: bytes) -> SessionRecoveryRecord:
+    return SessionRecoveryRecord.from_payload(json.loads(zlib.decompress(blob).decode("utf-8")))
+
+
+class _ThreadedRecoveryStore(SessionRecoveryStore):
+    """Base for stores whose blocking I/O runs on a single worker thread."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: Optional[float] = None,
+        max_records: Optional[int] = None,
+        compression_level: int = 6,
+    ):
+        self.ttl_seconds = ttl_seconds if ttl_seconds and ttl_seconds > 0 else None
+        self.max_records = max_records if max_records and max_records > 0 else None
+        self.compression_level = compression_level
+        self.logger = logging.getLogger(__name__)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=type(self).__name__)
+        self._closed = False
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self._closed:
+            raise RuntimeError(f"{type(self).__name__} is closed")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    def _expiry_cutoff(self) -> Optional[float]:
+        if self.ttl_seconds is None:
+            return None
+        return time.time() - self.ttl_seconds
+
+    async def save(self, record: SessionRecoveryRecord) -> None:
+        await self.save_many([record])
+
+    async def load(self, chat_session_id: str) -> Optional[SessionRecoveryRecord]:
+        return (await self.load_many([chat_session_id])).get(chat_session_id)
+
+    async def purge(self, chat_session_id: str) -> None:
+        await self._run(self._purge_sync, [chat_session_id])
+
+    async def save_many(self, records: Sequence[SessionRecoveryRecord]) -> None:
+        if not records:
+            return
+        # Later records for the same chat session win, as with repeated ``save`` calls.
+        latest = {record.chat_session_id: record for record in records}
+        rows = [
+            (record.chat_session_id, record.archived_at.timestamp(), _encode_record(record, self.compression_level))
+            for record in latest.values()
+        ]
+        await self._run(self._save_sync, rows)
+
+    async def load_many(self, chat_session_ids: Iterable[str]) -> Dict[str, SessionRecoveryRecord]:
+        chat_session_ids = list(dict.fromkeys(chat_session_ids))
+        if not chat_session_ids:
+            return {}
+        blobs: Dict[str, bytes] = await self._run(self._load_sync, chat_session_ids)
+        return {chat_session_id: _decode_record(blob) for chat_session_id, blob in blobs.items()}
+
+    async def purge_expired(self) -> int:
+        cutoff = self._expiry_cutoff()
+        if cutoff is None:
+            return 0
+        return await self._run(self._purge_expired_sync, cutoff)
+
+    async def close(self) -> None:
+        if self._closed:
+            return
+        await self._run(self._close_sync)
+        self._closed = True
+        self._executor.shutdown(wait=True)
+
+    def _save_sync(self, rows: List[Tuple[str, float, bytes]]) -> None:
+        raise NotImplementedError
+
+    def _load_sync(self, chat_session_ids: List[str]) -> Dict[str, bytes]:
+        raise NotImplementedError
+
+    def _purge_sync(self, chat_session_ids: List[str]) -> None:
+        raise NotImplementedError
+
+    def _purge_expired_sync(self, cutoff: float) -> int:
+        raise NotImplementedError
+
+    def _close_sync(self) -> None:
+        raise NotImplementedError
+
+
+class SqliteSessionRecoveryStore(_ThreadedRecoveryStore):
+    """SQLite-backed recovery store using WAL journaling."""
+
+    _TABLE = "session_recovery"
+    _QUERY_CHUNK = 500
+
+    def __init__(
+        self,
+        path: str = DEFAULT_SQLITE_PATH,
+        *,
+        ttl_seconds: Optional[float] = None,
+        max_records: Optional[int] = None,
+        compression_level: int = 6,
+    ):
+        super().__init__(ttl_seconds=ttl_seconds, max_records=max_records, compression_level=compression_level)
+        self.path = str(path)
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self._TABLE} ("
+                "chat_session_id TEXT PRIMARY KEY, "
+                "archived_at REAL NOT NULL, "
+                "payload BLOB NOT NULL)"
+            )
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self._TABLE}_archived_at "
+                f"ON {self._TABLE} (archived_at)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _save_sync(self, rows: List[Tuple[str, float, bytes]]) -> None:
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {self._TABLE} (chat_session_id, archived_at, payload) "
+                "VALUES (?, ?, ?)",
+                rows,
+            )
+            cutoff = self._expiry_cutoff()
+            if cutoff is not None:
+                conn.execute(f"DELETE FROM {self._TABLE} WHERE archived_at < ?", (cutoff,))
+            if self.max_records is not None:
+                conn.execute(
+                    f"DELETE FROM {self._TABLE} WHERE chat_session_id IN ("
+                    f"SELECT chat_session_id FROM {self._TABLE} "
+                    "ORDER BY archived_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_records,),
+                )
+
+    def _load_sync(self, chat_session_ids: List[str]) -> Dict[str, bytes]:
+        conn = self._connection()
+        cutoff = self._expiry_cutoff()
+        blobs: Dict[str, bytes] = {}
+        for start in range(0, len(chat_session_ids), self._QUERY_CHUNK):
+            chunk = chat_session_ids[start:start + self._QUERY_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT chat_session_id, archived_at, payload FROM {self._TABLE} "
+                f"WHERE chat_session_id IN ({placeholders})",
+                chunk,
+            )
+            for chat_session_id, archived_at, payload in rows:
+                if cutoff is not None and archived_at < cutoff:
+                    continue
+                blobs[chat_session_id] = payload
+        return blobs
+
+    def _purge_sync(self, chat_session_ids: List[str]) -> None:
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                f"DELETE FROM {self._TABLE} WHERE chat_session_id = ?",
+                [(chat_session_id,) for chat_session_id in chat_session_ids],
+            )
+
+    def _purge_expired_sync(self, cutoff: float) -> int:
+        conn = self._connection()
+        with conn:
+            cursor = conn.execute(f"DELETE FROM {self._TABLE} WHERE archived_at < ?", (cutoff,))
+        return cursor.rowcount
+
+    def _close_sync(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class FileSessionRecoveryStore(_ThreadedRecoveryStore):
+    """
+    Append-only recovery log.
+
+    Each frame is ``op | archived_at | key length | payload length`` followed
+    by the UTF-8 chat session ID and, for saves, the compressed record. Purges
+    append tombstone frames. The offset index is rebuilt by scanning the log
+    on first use; a truncated trailing frame left by a crash is cut off.
+    """
+
+    _HEADER = struct.Struct(">BdHI")
+    _OP_SAVE = 1
+    _OP_PURGE = 0
+
+    def __init__(
+        self,
+        path: str = DEFAULT_FILE_PATH,
+        *,
+        ttl_seconds: Optional[float] = None,
+        max_records: Optional[int] = None,
+        compression_level: int = 6,
+        compact_min_bytes: int = 1 << 20,
+        fsync: bool = False,
+    ):
+        super().__init__(ttl_seconds=ttl_seconds, max_records=max_records, compression_level=compression_level)
+        self.path = str(path)
+        self.compact_min_bytes = compact_min_bytes
+        self.fsync = fsync
+        # chat_session_id -> (payload offset, payload length, archived_at, frame length)
+        self._index: Optional[Dict[str, Tuple[int, int, float, int]]] = None
+        self._writer = None
+        self._reader = None
+        self._size = 0
+        self._live_bytes = 0
+
+    # === Log management ===
+
+    def _ensure_open(self) -> Dict[str, Tuple[int, int, float, int]]:
+        if self._index is not None:
+            return self._index
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        Path(self.path).touch(exist_ok=True)
+        self._index = {}
+        self._live_bytes = 0
+        with open(self.path, "rb") as handle:
+            data = handle.read()
+        offset = 0
+        while offset + self._HEADER.size <= len(data):
+            op, archived_at, key_length, payload_length = self._HEADER.unpack_from(data, offset)
+            key_start = offset + self._HEADER.size
+            payload_start = key_start + key_length
+            frame_end = payload_start + payload_length
+            if frame_end > len(data) or op not in (self._OP_SAVE, self._OP_PURGE):
+                break
+            chat_session_id = data[key_start:payload_start].decode("utf-8")
+            self._forget(chat_session_id)
+            if op == self._OP_SAVE:
+                self._remember(chat_session_id, payload_start, payload_length, archived_at, frame_end - offset)
+            offset = frame_end
+        if offset < len(data):
+            self.logger.warning(
+                "Truncating incomplete session recovery log tail",
+                extra={"path": self.path, "valid_bytes": offset, "file_bytes": len(data)},
+            )
+            with open(self.path, "r+b") as handle:
+                handle.truncate(offset)
+        self._size = offset
+        self._writer = open(self.path, "ab")
+        self._reader = open(self.path, "rb")
+        return self._index
+
+    def _remember(self, chat_session_id: str, offset: int, length: int, archived_at: float, frame_length: int) -> None:
+        self._index[chat_session_id] = (offset, length, archived_at, frame_length)
+        self._live_bytes += frame_length
+
+    def _forget(self, chat_session_id: str) -> bool:
+        entry = self._index.pop(chat_session_id, None)
+        if entry is None:
+            return False
+        self._live_bytes -= entry[3]
+        return True
+
+    def _append_frames(self, frames: List[Tuple[int, str, float, bytes]]) -> None:
+        buffer = bytearray()
+        placements = []
+        for op, chat_session_id, archived_at, payload in frames:
+            key = chat_session_id.encode("utf-8")
+            frame_start = self._size + len(buffer)
+            buffer += self._HEADER.pack(op, archived_at, len(key), len(payload))
+            buffer += key
+            payload_start = self._size + len(buffer)
+            buffer += payload
+            placements.append((op, chat_session_id, archived_at, payload_start, len(payload), self._size + len(buffer) - frame_start))
+        self._writer.write(buffer)
+        self._writer.flush()
+        if self.fsync:
+            os.fsync(self._writer.fileno())
+        self._size += len(buffer)
+        for op, chat_session_id, archived_at, payload_start, payload_length, frame_length in placements:
+            self._forget(chat_session_id)
+            if op == self._OP_SAVE:
+                self._remember(chat_session_id, payload_start, payload_length, archived_at, frame_length)
+
+    def _tombstones(self, chat_session_ids: Iterable[str]) -> List[Tuple[int, str, float, bytes]]:
+        now = time.time()
+        return [
+            (self._OP_PURGE, chat_session_id, now, b"")
+            for chat_session_id in chat_session_ids
+            if chat_session_id in self._index
+        ]
+
+    def _maybe_compact(self) -> None:
+        dead_bytes = self._size - self._live_bytes
+        if self._size < self.compact_min_bytes or dead_bytes <= self._live_bytes:
+            return
+        temp_path = f"{self.path}.compact"
+        entries = sorted(self._index.items(), key=lambda item: item[1][0])
+        new_index: Dict[str, Tuple[int, int, float, int]] = {}
+        size = 0
+        with open(temp_path, "wb") as handle:
+            for chat_session_id, (offset, length, archived_at, _) in entries:
+                self._reader.seek(offset)
+                payload = self._reader.read(length)
+                key = chat_session_id.encode("utf-8")
+                header = self._HEADER.pack(self._OP_SAVE, archived_at, len(key), len(payload))
+                handle.write(header)
+                handle.write(key)
+                handle.write(payload)
+                frame_length = len(header) + len(key) + len(payload)
+                new_index[chat_session_id] = (size + len(header) + len(key), len(payload), archived_at, frame_length)
+                size += frame_length
+            handle.flush()
+            os.fsync(handle.fileno())
+        self._writer.close()
+        self._reader.close()
+        os.replace(temp_path, self.path)
+        self._index = new_index
+        self._size = size
+        self._live_bytes = size
+        self._writer = open(self.path, "ab")
+        self._reader = open(self.path, "rb")
+        self.logger.debug(
+            "Compacted session recovery log",
+            extra={"path": self.path, "records": len(new_index), "dead_bytes": dead_bytes},
+        )
+
+    # === Worker-thread operations ===
+
+    def _save_sync(self, rows: List[Tuple[str, float, bytes]]) -> None:
+        index = self._ensure_open()
+        frames = [(self._OP_SAVE, chat_session_id, archived_at, payload) for chat_session_id, archived_at, payload in rows]
+        self._append_frames(frames)
+
+        evicted: List[str] = []
+        cutoff = self._expiry_cutoff()
+        if cutoff is not None:
+            evicted.extend(key for key, entry in index.items() if entry[2] < cutoff)
+        if self.max_records is not None:
+            excess = len(index) - len(evicted) - self.max_records
+            if excess > 0:
+                evicted_set = set(evicted)
+                candidates = ((entry[2], key) for key, entry in index.items() if key not in evicted_set)
+                evicted.extend(key for _, key in heapq.nsmallest(excess, candidates))
+        if evicted:
+            self._append_frames(self._tombstones(evicted))
+        self._maybe_compact()
+
+    def _load_sync(self, chat_session_ids: List[str]) -> Dict[str, bytes]:
+        index = self._ensure_open()
+        cutoff = self._expiry_cutoff()
+        blobs: Dict[str, bytes] = {}
+        for chat_session_id in chat_session_ids:
+            entry = index.get(chat_session_id)
+            if entry is None:
+                continue
+            offset, length, archived_at, _ = entry
+            if cutoff is not None and archived_at < cutoff:
+                continue
+            self._reader.seek(offset)
+            blobs[chat_session_id] = self._reader.read(length)
+        return blobs
+
+    def _purge_sync(self, chat_session_ids: List[str]) -> None:
+        self._ensure_open()
+        tombstones = self._tombstones(chat_session_ids)
+        if tombstones:
+            self._append_frames(tombstones)
+            self._maybe_compact()
+
+    def _purge_expired_sync(self, cutoff: float) -> int:
+        index = self._ensure_open()
+        tombstones = self._tombstones([key for key, entry in index.items() if entry[2] < cutoff])
+        if tombstones:
+            self._append_frames(tombstones)
+            self._maybe_compact()
+        return len(tombstones)
+
+    def _close_sync(self) -> None:
+        for handle in (self._writer, self._reader):
+            if handle is not None:
+                handle.close()
+        self._writer = None
+        self._reader = None
+        self._index = None
+
+
+def create_session_recovery_store(settings: Any = None) -> SessionRecoveryStore:
+    """
+    Build the recovery store selected by ``settings.session_recovery_backend``.
+
+    Supported backends are ``memory`` (default), ``sqlite`` and ``file``.
+    """
+
+    backend = str(getattr(settings, "session_recovery_backend", None) or "memory").lower()
+    path = getattr(settings, "session_recovery_path", None)
+    ttl_seconds = getattr(settings, "session_recovery_ttl_seconds", None)
+    max_records = getattr(settings, "session_recovery_max_records", None)
+
+    if backend == "memory":
+        return InMemorySessionRecoveryStore()
+    if backend == "sqlite":
+        return SqliteSessionRecoveryStore(
+            path or DEFAULT_SQLITE_PATH, ttl_seconds=ttl_seconds, max_records=max_records
+        )
+    if backend == "file":
+        return FileSessionRecoveryStore(
+            path or DEFAULT_FILE_PATH, ttl_seconds=ttl_seconds, max_records=max_records
+        )
+    raise ValueError(f"Unsupported session recovery backend: {backend}")
@@ -0,0 +1,449 @@
+# -*- coding: utf-8 -*-
+"""
+SQLite-backed ADK SessionService.
+
+Local stand-in for the Redis/Postgres services sketched in
+``docs/context_engineering.md``. Events are appended one row at a time and
+each session row keeps a running event count, so appends never rewrite the
+session and ``get_session`` can read only the most recent events through the
+``(session, seq)`` primary key instead of materializing the whole history.
+
+All SQLite access runs on a single worker thread owned by the service. One
+instance is meant to be shared by every runner; call ``close`` on shutdown.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from google.adk.errors.already_exists_error import AlreadyExistsError
+from google.adk.errors.session_not_found_error import SessionNotFoundError
+from google.adk.events import Event
+from google.adk.sessions import BaseSessionService, Session, State
+from google.adk.sessions.base_session_service import GetSessionConfig, ListSessionsResponse
+
+DEFAULT_SESSION_DB_PATH = "data/adk_sessions.db"
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS adk_sessions ("
+    "app_name TEXT NOT NULL, user_id TEXT NOT NULL, session_id TEXT NOT NULL, "
+    "state TEXT NOT NULL, event_count INTEGER NOT NULL DEFAULT 0, "
+    "last_update_time REAL NOT NULL, "
+    "PRIMARY KEY (app_name, user_id, session_id))",
+    "CREATE TABLE IF NOT EXISTS adk_events ("
+    "app_name TEXT NOT NULL, user_id TEXT NOT NULL, session_id TEXT NOT NULL, "
+    "seq INTEGER NOT NULL, event_id TEXT NOT NULL, timestamp REAL NOT NULL, "
+    "payload TEXT NOT NULL, "
+    "PRIMARY KEY (app_name, user_id, session_id, seq))",
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_adk_events_event_id "
+    "ON adk_events (app_name, user_id, session_id, event_id)",
+    "CREATE INDEX IF NOT EXISTS idx_adk_events_timestamp "
+    "ON adk_events (app_name, user_id, session_id, timestamp)",
+    "CREATE TABLE IF NOT EXISTS adk_app_states ("
+    "app_name TEXT PRIMARY KEY, state TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS adk_user_states ("
+    "app_name TEXT NOT NULL, user_id TEXT NOT NULL, state TEXT NOT NULL, "
+    "PRIMARY KEY (app_name, user_id))",
+)
+
+
+def _split_state_delta(delta: Optional[Dict[str, Any]]) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    """Split a state delta into app-, user- and session-scoped parts, dropping temp keys."""
+    app_delta: Dict[str, Any] = {}
+    user_delta: Dict[str, Any] = {}
+    session_delta: Dict[str, Any] = {}
+    for key, value in (delta or {}).items():
+        if key.startswith(State.APP_PREFIX):
+            app_delta[key[len(State.APP_PREFIX):]] = value
+        elif key.startswith(State.USER_PREFIX):
+            user_delta[key[len(State.USER_PREFIX):]] = value
+        elif not key.startswith(State.TEMP_PREFIX):
+            session_delta[key] = value
+    return app_delta, user_delta, session_delta
+
+
+class AdkSqliteSessionService(BaseSessionService):
+    """
+    Durable SessionService with per-event appends and windowed reads.
+
+    ``get_session`` returns the full history unless the caller passes
+    ``num_recent_events``, so history extraction for archives and agent-switch
+    handoffs always sees every event. Runners read through ``runner_view()``,
+    which applies ``runner_event_window`` to their per-turn loads.
+
+    Args:
+        path: SQLite database path (``":memory:"`` for a private in-process database).
+        runner_event_window: Number of recent events loaded per runner turn.
+            ``None`` loads the full history, matching ``InMemorySessionService``.
+    """
+
+    def __init__(self, path: str = DEFAULT_SESSION_DB_PATH, *, runner_event_window: Optional[int] = None):
+        self.path = str(path)
+        self.runner_event_window = runner_event_window if runner_event_window and runner_event_window > 0 else None
+        self.logger = logging.getLogger(__name__)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="AdkSqliteSessionService")
+        self._conn: Optional[sqlite3.Connection] = None
+        self._closed = False
+
+    # === BaseSessionService interface ===
+
+    async def create_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        state: Optional[Dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+    ) -> Session:
+        session_id = session_id.strip() if session_id else None
+        session_id = session_id or str(uuid.uuid4())
+        now = time.time()
+        app_delta, user_delta, session_state = _split_state_delta(state)
+        await self._run(self._create_session_sync, app_name, user_id, session_id, session_state, app_delta, user_delta, now)
+        session = Session(
+            id=session_id,
+            app_name=app_name,
+            user_id=user_id,
+            state=session_state,
+            last_update_time=now,
+        )
+        return await self._run(self._merge_scoped_state_sync, session)
+
+    async def get_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        config: Optional[GetSessionConfig] = None,
+    ) -> Optional[Session]:
+        session_id = session_id.strip() if session_id else session_id
+        num_recent_events = config.num_recent_events if config else None
+        after_timestamp = config.after_timestamp if config else None
+        return await self._run(
+            self._get_session_sync, app_name, user_id, session_id, num_recent_events, after_timestamp
+        )
+
+    async def list_sessions(self, *, app_name: str, user_id: Optional[str] = None) -> ListSessionsResponse:
+        sessions = await self._run(self._list_sessions_sync, app_name, user_id)
+        return ListSessionsResponse(sessions=sessions)
+
+    async def delete_session(self, *, app_name: str, user_id: str, session_id: str) -> None:
+        session_id = session_id.strip() if session_id else session_id
+        await self._run(self._delete_session_sync, app_name, user_id, session_id)
+
+    async def get_user_state(self, *, app_name: str, user_id: str) -> Dict[str, Any]:
+        return await self._run(self._load_user_state_sync, app_name, user_id)
+
+    async def append_event(self, session: Session, event: Event) -> Event:
+        if event.partial:
+            return event
+        if any(existing == event for existing in session.events if existing.id == event.id):
+            return event
+        # Updates the caller's session object (state delta + events) in memory.
+        event = await super().append_event(session=session, event=event)
+        session.last_update_time = event.timestamp
+        await self._run(self._append_event_sync, session.app_name, session.user_id, session.id, event)
+        return event
+
+    # === Extensions ===
+
+    async def append_events(self, session: Session, events: List[Event]) -> List[Event]:
+        """Append several events to ``session`` and persist them in one transaction."""
+        appended: List[Event] = []
+        for event in events:
+            if event.partial:
+                continue
+            event = await super().append_event(session=session, event=event)
+            session.last_update_time = event.timestamp
+            appended.append(event)
+        if appended:
+            await self._run(self._append_events_sync, session.app_name, session.user_id, session.id, appended)
+        return appended
+
+    def runner_view(self) -> BaseSessionService:
+        """Return the service handed to runners: windowed when ``runner_event_window`` is set."""
+        if self.runner_event_window is None:
+            return self
+        return _RunnerSessionView(self, self.runner_event_window)
+
+    async def get_event_count(self, *, app_name: str, user_id: str, session_id: str) -> int:
+        """Return the number of persisted events for a session without loading them."""
+        return await self._run(self._event_count_sync, app_name, user_id, session_id)
+
+    async def close(self) -> None:
+        """Close the database connection and stop the worker thread."""
+        if self._closed:
+            return
+        await self._run(self._close_sync)
+        self._closed = True
+        self._executor.shutdown(wait=True)
+
+    # === Worker-thread helpers ===
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self._closed:
+            raise RuntimeError("AdkSqliteSessionService is closed")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _create_session_sync(
+        self,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        session_state: Dict[str, Any],
+        app_delta: Dict[str, Any],
+        user_delta: Dict[str, Any],
+        now: float,
+    ) -> None:
+        conn = self._connection()
+        with conn:
+            try:
+                conn.execute(
+                    "INSERT INTO adk_sessions (app_name, user_id, session_id, state, event_count, last_update_time) "
+                    "VALUES (?, ?, ?, ?, 0, ?)",
+                    (app_name, user_id, session_id, json.dumps(session_state, default=str), now),
+                )
+            except sqlite3.IntegrityError as exc:
+                raise AlreadyExistsError(f"Session with id {session_id} already exists.") from exc
+            self._apply_scoped_deltas_sync(conn, app_name, user_id, app_delta, user_delta)
+
+    def _get_session_sync(
+        self,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        num_recent_events: Optional[int],
+        after_timestamp: Optional[float],
+    ) -> Optional[Session]:
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT state, event_count, last_update_time FROM adk_sessions "
+            "WHERE app_name = ? AND user_id = ? AND session_id = ?",
+            (app_name, user_id, session_id),
+        ).fetchone()
+        if row is None:
+            return None
+        state_json, event_count, last_update_time = row
+
+        events: List[Event] = []
+        if num_recent_events != 0:
+            first_seq = event_count - num_recent_events if num_recent_events else 0
+            query = (
+                "SELECT payload FROM adk_events "
+                "WHERE app_name = ? AND user_id = ? AND session_id = ? AND seq > ?"
+            )
+            params: List[Any] = [app_name, user_id, session_id, first_seq]
+            if after_timestamp:
+                query += " AND timestamp >= ?"
+                params.append(after_timestamp)
+            query += " ORDER BY seq"
+            events = [Event.model_validate_json(payload) for (payload,) in conn.execute(query, params)]
+            # Never start the window on a tool response: pull in earlier events
+            # until the function call that produced it is included.
+            while num_recent_events and first_seq > 0 and events and events[0].get_function_responses():
+                payload_row = conn.execute(
+                    "SELECT payload FROM adk_events "
+                    "WHERE app_name = ? AND user_id = ? AND session_id = ? AND seq = ?",
+                    (app_name, user_id, session_id, first_seq),
+                ).fetchone()
+                first_seq -= 1
+                if payload_row is not None:
+                    events.insert(0, Event.model_validate_json(payload_row[0]))
+
+        session = Session(
+            id=session_id,
+            app_name=app_name,
+            user_id=user_id,
+            state=json.loads(state_json),
+            events=events,
+            last_update_time=last_update_time,
+        )
+        return self._merge_scoped_state_sync(session)
+
+    def _list_sessions_sync(self, app_name: str, user_id: Optional[str]) -> List[Session]:
+        conn = self._connection()
+        query = "SELECT user_id, session_id, state, last_update_time FROM adk_sessions WHERE app_name = ?"
+        params: List[Any] = [app_name]
+        if user_id is not None:
+            query += " AND user_id = ?"
+            params.append(user_id)
+        query += " ORDER BY last_update_time, user_id, session_id"
+        sessions = [
+            Session(
+                id=row_session_id,
+                app_name=app_name,
+                user_id=row_user_id,
+                state=json.loads(state_json),
+                last_update_time=last_update_time,
+            )
+            for row_user_id, row_session_id, state_json, last_update_time in conn.execute(query, params)
+        ]
+        return [self._merge_scoped_state_sync(session) for session in sessions]
+
+    def _delete_session_sync(self, app_name: str, user_id: str, session_id: str) -> None:
+        conn = self._connection()
+        key = (app_name, user_id, session_id)
+        with conn:
+            conn.execute("DELETE FROM adk_events WHERE app_name = ? AND user_id = ? AND session_id = ?", key)
+            conn.execute("DELETE FROM adk_sessions WHERE app_name = ? AND user_id = ? AND session_id = ?", key)
+
+    def _append_event_sync(self, app_name: str, user_id: str, session_id: str, event: Event) -> None:
+        self._append_events_sync(app_name, user_id, session_id, [event])
+
+    def _append_events_sync(self, app_name: str, user_id: str, session_id: str, events: List[Event]) -> None:
+        conn = self._connection()
+        key = (app_name, user_id, session_id)
+        with conn:
+            row = conn.execute(
+                "SELECT state, event_count FROM adk_sessions WHERE app_name = ? AND user_id = ? AND session_id = ?",
+                key,
+            ).fetchone()
+            if row is None:
+                raise SessionNotFoundError(f"Session {session_id} not found.")
+            state_json, event_count = row
+            state = None
+
+            for event in events:
+                inserted = conn.execute(
+                    "INSERT OR IGNORE INTO adk_events "
+                    "(app_name, user_id, session_id, seq, event_id, timestamp, payload) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (*key, event_count + 1, event.id, event.timestamp, event.model_dump_json(exclude_none=True)),
+                ).rowcount
+                if not inserted:
+                    # Re-delivered event; state deltas were already applied with the original.
+                    continue
+                event_count += 1
+
+                state_delta = event.actions.state_delta if event.actions else None
+                app_delta, user_delta, session_delta = _split_state_delta(state_delta)
+                if session_delta:
+                    if state is None:
+                        state = json.loads(state_json)
+                    state.update(session_delta)
+                self._apply_scoped_deltas_sync(conn, app_name, user_id, app_delta, user_delta)
+
+            if state is not None:
+                state_json = json.dumps(state, default=str)
+            conn.execute(
+                "UPDATE adk_sessions SET state = ?, event_count = ?, last_update_time = ? "
+                "WHERE app_name = ? AND user_id = ? AND session_id = ?",
+                (state_json, event_count, events[-1].timestamp, *key),
+            )
+
+    def _event_count_sync(self, app_name: str, user_id: str, session_id: str) -> int:
+        row = self._connection().execute(
+            "SELECT event_count FROM adk_sessions WHERE app_name = ? AND user_id = ? AND session_id = ?",
+            (app_name, user_id, session_id),
+        ).fetchone()
+        return row[0] if row else 0
+
+    def _apply_scoped_deltas_sync(
+        self,
+        conn: sqlite3.Connection,
+        app_name: str,
+        user_id: str,
+        app_delta: Dict[str, Any],
+        user_delta: Dict[str, Any],
+    ) -> None:
+        if app_delta:
+            state = self._load_app_state_sync(app_name)
+            state.update(app_delta)
+            conn.execute(
+                "INSERT OR REPLACE INTO adk_app_states (app_name, state) VALUES (?, ?)",
+                (app_name, json.dumps(state, default=str)),
+            )
+        if user_delta:
+            state = self._load_user_state_sync(app_name, user_id)
+            state.update(user_delta)
+            conn.execute(
+                "INSERT OR REPLACE INTO adk_user_states (app_name, user_id, state) VALUES (?, ?, ?)",
+                (app_name, user_id, json.dumps(state, default=str)),
+            )
+
+    def _load_app_state_sync(self, app_name: str) -> Dict[str, Any]:
+        row = self._connection().execute(
+            "SELECT state FROM adk_app_states WHERE app_name = ?", (app_name,)
+        ).fetchone()
+        return json.loads(row[0]) if row else {}
+
+    def _load_user_state_sync(self, app_name: str, user_id: str) -> Dict[str, Any]:
+        row = self._connection().execute(
+            "SELECT state FROM adk_user_states WHERE app_name = ? AND user_id = ?", (app_name, user_id)
+        ).fetchone()
+        return json.loads(row[0]) if row else {}
+
+    def _merge_scoped_state_sync(self, session: Session) -> Session:
+        for key, value in self._load_app_state_sync(session.app_name).items():
+            session.state[State.APP_PREFIX + key] = value
+        for key, value in self._load_user_state_sync(session.app_name, session.user_id).items():
+            session.state[State.USER_PREFIX + key] = value
+        return session
+
+    def _close_sync(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class _RunnerSessionView(BaseSessionService):
+    """Runner-facing view of a shared service that windows ``get_session`` reads."""
+
+    def __init__(self, service: AdkSqliteSessionService, event_window: int):
+        self._service = service
+        self.event_window = event_window
+
+    async def create_session(self, **kwargs: Any) -> Session:
+        return await self._service.create_session(**kwargs)
+
+    async def get_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        config: Optional[GetSessionConfig] = None,
+    ) -> Optional[Session]:
+        if config is None or config.num_recent_events is None:
+            config = GetSessionConfig(
+                num_recent_events=self.event_window,
+                after_timestamp=config.after_timestamp if config else None,
+            )
+        return await self._service.get_session(
+            app_name=app_name, user_id=user_id, session_id=session_id, config=config
+        )
+
+    async def list_sessions(self, **kwargs: Any) -> ListSessionsResponse:
+        return await self._service.list_sessions(**kwargs)
+
+    async def delete_session(self, **kwargs: Any) -> None:
+        await self._service.delete_session(**kwargs)
+
+    async def append_event(self, session: Session, event: Event) -> Event:
+        return await self._service.append_event(session, event)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._service, name)
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+Pre-warmed agent/runner capacity for hot agent configurations.
+
+``AgentWarmPool`` keeps at least ``target_size`` agents with free session
+capacity registered for every declared config hash, so the first turn of a
+new conversation only pays for ADK session creation. The pool does not own
+agents: it asks the adapter how many usable agents a config currently has
+and calls back into the adapter to provision more, which registers them in
+the same mappings the request path reuses from.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from ...contracts import AgentConfig
+
+ProvisionCallback = Callable[[AgentConfig, str], Awaitable[Any]]
+CapacityCallback = Callable[[str], Awaitable[int]]
+
+
+@dataclass
+class WarmPoolStats:
+    """Counters describing pool activity."""
+
+    provisioned: int = 0
+    failures: int = 0
+    replenish_requests: int = 0
+
+
+class AgentWarmPool:
+    """Maintains spare agents for declared hot configurations."""
+
+    def __init__(
+        self,
+        *,
+        target_size: int,
+        provision: ProvisionCallback,
+        available_capacity: CapacityCallback,
+    ) -> None:
+        """
+        Args:
+            target_size: Agents with free capacity to keep per declared config.
+            provision: Creates and registers one agent+runner for a config.
+            available_capacity: Returns how many registered agents for a config
+                hash can still accept a session.
+        """
+        self.target_size = max(0, int(target_size))
+        self._provision = provision
+        self._available_capacity = available_capacity
+        self._configs: Dict[str, AgentConfig] = {}
+        self._fill_tasks: Dict[str, asyncio.Task] = {}
+        self._closed = False
+        self.stats = WarmPoolStats()
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def enabled(self) -> bool:
+        return self.target_size > 0 and bool(self._configs)
+
+    def declare(self, config_hash: str, agent_config: AgentConfig) -> None:
+        """Register ``agent_config`` as hot under ``config_hash``."""
+        self._configs[config_hash] = agent_config
+
+    def is_declared(self, config_hash: str) -> bool:
+        """Return True when ``config_hash`` is a hot config kept warm by the pool."""
+        return config_hash in self._configs
+
+    async def warm_up(self) -> int:
+        """Fill every declared config to the target size; returns agents created."""
+        created = 0
+        for config_hash in list(self._configs):
+            created += await self._fill(config_hash)
+        return created
+
+    def request_replenish(self, config_hash: str, reserved: int = 0) -> None:
+        """
+        Top up ``config_hash`` in the background if it is declared and not already filling.
+
+        ``reserved`` counts slots already promised to requests whose ADK
+        sessions do not exist yet, so capacity they will use is not counted
+        as available.
+        """
+        if self._closed or self.target_size <= 0 or config_hash not in self._configs:
+            return
+        running = self._fill_tasks.get(config_hash)
+        if running and not running.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self.stats.replenish_requests += 1
+        task = loop.create_task(self._fill(config_hash, reserved), name=f"adk_warm_pool_{config_hash}")
+        self._fill_tasks[config_hash] = task
+        task.add_done_callback(lambda done, key=config_hash: self._on_fill_done(key, done))
+
+    async def close(self) -> None:
+        """Cancel outstanding background fills."""
+        self._closed = True
+        tasks = [task for task in self._fill_tasks.values() if not task.done()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._fill_tasks.clear()
+
+    async def _fill(self, config_hash: str, reserved: int = 0) -> int:
+        agent_config = self._configs.get(config_hash)
+        if agent_config is None:
+            return 0
+        created = 0
+        available = await self._available_capacity(config_hash) - reserved
+        while not self._closed and available < self.target_size:
+            try:
+                await self._provision(agent_config, config_hash)
+            except Exception as exc:  # noqa: BLE001
+                # Stop this round; the next consumption retries.
+                self.stats.failures += 1
+                self.logger.warning(f"Warm pool provisioning failed for config hash {config_hash}: {exc}")
+                break
+            created += 1
+            self.stats.provisioned += 1
+            available = await self._available_capacity(config_hash) - reserved
+        if created:
+            self.logger.info(
+                f"Warm pool provisioned {created} agent(s) for config hash {config_hash} "
+                f"({available}/{self.target_size} available)"
+            )
+        return created
+
+    def _on_fill_done(self, config_hash: str, task: asyncio.Task) -> None:
+        if self._fill_tasks.get(config_hash) is task:
+            self._fill_tasks.pop(config_hash, None)
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.warning(f"Warm pool refill crashed for config hash {config_hash}: {task.exception()}")
+
+
+def build_warm_pool_config(entry: Dict[str, Any], default_agent_type: Optional[str] = None) -> AgentConfig:
+    """
+    Build an ``AgentConfig`` from a ``Settings.adk_warm_pool_configs`` entry.
+
+    Entries carry ``AgentConfig`` fields; a top-level ``skill_names`` list is
+    moved into ``framework_config`` the same way requests declare skills.
+    """
+    fields = dict(entry)
+    skill_names = fields.pop("skill_names", None)
+    if default_agent_type and not fields.get("agent_type"):
+        fields["agent_type"] = default_agent_type
+    fields.setdefault("system_prompt", "You are a helpful AI assistant.")
+    framework_config = dict(fields.get("framework_config") or {})
+    if skill_names is not None:
+        framework_config["skill_names"] = list(skill_names)
+    fields["framework_config"] = framework_config
+    return AgentConfig(**fields)
@@ -2,7 +2,7 @@
 """Framework Adapter Abstract Base Class."""
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional
 
 from ...contracts import (
     AgentRequest,
@@ -11,6 +11,8 @@ from ...contracts import (
     LiveExecutionResult,
     TaskRequest,
     TaskResult,
+    TaskStreamChunk,
+    task_result_to_chunk,
 )
 
 if TYPE_CHECKING:
@@ -59,6 +61,27 @@ class FrameworkAdapter(ABC):
         """
         pass
 
+    async def execute_task_stream(
+        self, task_request: TaskRequest, strategy: "ExecutionStrategy"
+    ) -> AsyncIterator[TaskStreamChunk]:
+        """
+        Execute a task and stream its progress as TaskStreamChunks.
+
+        The stream always ends with exactly one final chunk wrapping the
+        TaskResult (see ``task_result_to_chunk``). The default implementation
+        only emits that final chunk; frameworks that can observe intermediate
+        responses override this to yield them as they arrive.
+
+        Args:
+            task_request: The universal task request
+            strategy: Execution strategy containing framework type and execution mode
+
+        Yields:
+            TaskStreamChunk: Intermediate chunks followed by the final chunk
+        """
+        result = await self.execute_task(task_request, strategy)
+        yield task_result_to_chunk(result, sequence_id=0)
+
     @abstractmethod
     async def execute_task_live(
         self, task_request: TaskRequest, context: ExecutionContext
@@ -2,8 +2,9 @@
 """ADK Observer - Integration with ADK monitoring and observability."""
 
 import logging
+from collections import deque
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Deque, Dict, Optional
 
 from ...contracts import AgentRequest, TaskResult, TaskStatus
 from ...observability.adk_logging import (
@@ -11,6 +12,7 @@ from ...observability.adk_logging import (
     log_context_execution_complete,
     log_context_execution_error,
 )
+from ...observability.latency_sketch import LatencySketch, StreamingStats
 from ...observability.metrics_backend import get_metrics_backend, MetricsBackend
 
 if TYPE_CHECKING:
@@ -18,21 +20,59 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("aether_frame.infrastructure.adk.observer")
 
+DEFAULT_MAX_EVENTS = 1000
+DEFAULT_MAX_TRACES = 500
+
 
 class AdkObserver:
     """
     ADK Observer provides integration with ADK's native monitoring and observability
     features, enabling metrics collection, tracing, and performance monitoring.
+
+    Raw events, traces and performance samples are kept in fixed-capacity ring
+    buffers for inspection; totals, execution-time statistics, latency
+    percentiles and success counts are maintained as streaming aggregates, so
+    memory stays bounded and summaries do not rescan history.
     """
 
-    def __init__(self, adk_client=None):
-        """Initialize ADK observer."""
+    def __init__(
+        self,
+        adk_client=None,
+        max_events: int = DEFAULT_MAX_EVENTS,
+        max_traces: int = DEFAULT_MAX_TRACES,
+    ):
+        """Initialize ADK observer.
+
+        Args:
+            adk_client: Optional ADK client used for monitoring integration
+            max_events: Capacity of each event and performance ring buffer
+            max_traces: Capacity of the trace ring buffer
+        """
         self.adk_client = adk_client
-        self._metrics: Dict[str, List[Dict[str, Any]]] = {}
-        self._traces: List[Dict[str, Any]] = []
-        self._performance_data: List[Dict[str, Any]] = []
+        self.max_events = max_events
+        self.max_traces = max_traces
+        self._metrics: Dict[str, Deque[Dict[str, Any]]] = {}
+        self._traces: Deque[Dict[str, Any]] = deque(maxlen=max_traces)
+        self._trace_index: Dict[str, Dict[str, Any]] = {}
+        self._performance_data: Deque[Dict[str, Any]] = deque(maxlen=max_events)
+        self._reset_aggregates()
         self.metrics_backend: MetricsBackend = get_metrics_backend()
 
+    def _reset_aggregates(self) -> None:
+        self._event_counts: Dict[str, int] = {}
+        self._trace_count = 0
+        self._completion_count = 0
+        self._success_count = 0
+        self._execution_time_stats = StreamingStats()
+        self._latency_sketch = LatencySketch()
+
+    def _record_event(self, metric: str, event: Dict[str, Any]) -> None:
+        buffer = self._metrics.get(metric)
+        if buffer is None:
+            buffer = self._metrics[metric] = deque(maxlen=self.max_events)
+        buffer.append(event)
+        self._event_counts[metric] = self._event_counts.get(metric, 0) + 1
+
     async def record_execution_start(
         self,
         task_id: str,
@@ -63,9 +103,7 @@ class AdkObserver:
             # await self.adk_client.monitoring.record_event(event)
 
             # For now, store locally
-            if "execution_events" not in self._metrics:
-                self._metrics["execution_events"] = []
-            self._metrics["execution_events"].append(event)
+            self._record_event("execution_events", event)
 
             key_data = {"task_id": task_id, "agent_id": agent_id}
             key_data.update(metadata)
@@ -137,11 +175,14 @@ class AdkObserver:
                     "status": result.status.value,
                 }
                 self._performance_data.append(performance_event)
+                self._execution_time_stats.add(derived_execution_time)
+                self._latency_sketch.add(derived_execution_time)
 
             # Store locally
-            if "execution_events" not in self._metrics:
-                self._metrics["execution_events"] = []
-            self._metrics["execution_events"].append(event)
+            self._record_event("execution_events", event)
+            self._completion_count += 1
+            if result.status.value == "success":
+                self._success_count += 1
 
             key_data = {
                 "task_id": task_id,
@@ -226,9 +267,7 @@ class AdkObserver:
             # await self.adk_client.monitoring.record_error(event)
 
             # Store locally
-            if "execution_errors" not in self._metrics:
-                self._metrics["execution_errors"] = []
-            self._metrics["execution_errors"].append(event)
+            self._record_event("execution_errors", event)
 
             key_data = {"task_id": task_id, "agent_id": agent_id}
             key_data.update(metadata)
@@ -284,8 +323,13 @@ class AdkObserver:
             # TODO: Integrate with ADK tracing
             # await self.adk_client.tracing.start_trace(trace_id, operation, metadata)
 
-            # Store locally
+            # Store locally; the oldest trace drops out once the buffer is full
+            if len(self._traces) == self._traces.maxlen:
+                evicted = self._traces[0]
+                self._trace_index.pop(evicted["trace_id"], None)
             self._traces.append(trace)
+            self._trace_index[trace_id] = trace
+            self._trace_count += 1
 
             return trace_id
 
@@ -306,12 +350,11 @@ class AdkObserver:
         """
         try:
             # Find and update trace
-            for trace in self._traces:
-                if trace["trace_id"] == trace_id:
-                    trace["end_time"] = datetime.now().isoformat()
-                    trace["status"] = status
-                    trace["result_metadata"] = result_metadata
-                    break
+            trace = self._trace_index.get(trace_id)
+            if trace is not None:
+                trace["end_time"] = datetime.now().isoformat()
+                trace["status"] = status
+                trace["result_metadata"] = result_metadata
 
             # TODO: Integrate with ADK tracing
             # await self.adk_client.tracing.end_trace(trace_id, status, result_metadata)
@@ -341,10 +384,9 @@ class AdkObserver:
             }
 
             # Find trace and add span
-            for trace in self._traces:
-                if trace["trace_id"] == trace_id:
-                    trace["spans"].append(span)
-                    break
+            trace = self._trace_index.get(trace_id)
+            if trace is not None:
+                trace["spans"].append(span)
 
             # TODO: Integrate with ADK tracing
             # await self.adk_client.tracing.add_span(trace_id, span)
@@ -362,36 +404,24 @@ class AdkObserver:
         """
         try:
             summary = {
-                "total_executions": len(self._metrics.get("execution_events", [])),
-                "total_errors": len(self._metrics.get("execution_errors", [])),
-                "total_traces": len(self._traces),
+                "total_executions": self._event_counts.get("execution_events", 0),
+                "total_errors": self._event_counts.get("execution_errors", 0),
+                "total_traces": self._trace_count,
                 "timestamp": datetime.now().isoformat(),
             }
 
-            # Calculate average execution time
-            if self._performance_data:
-                execution_times = [
-                    d["execution_time"]
-                    for d in self._performance_data
-                    if d.get("execution_time")
-                ]
-                if execution_times:
-                    summary["avg_execution_time"] = sum(execution_times) / len(
-                        execution_times
-                    )
-                    summary["min_execution_time"] = min(execution_times)
-                    summary["max_execution_time"] = max(execution_times)
+            # Execution time statistics from streaming aggregates
+            stats = self._execution_time_stats
+            if stats.count:
+                summary["avg_execution_time"] = stats.mean
+                summary["min_execution_time"] = stats.minimum
+                summary["max_execution_time"] = stats.maximum
+                for name, value in self._latency_sketch.percentiles().items():
+                    summary[f"{name}_execution_time"] = value
 
             # Calculate success rate
-            events = self._metrics.get("execution_events", [])
-            completion_events = [
-                e for e in events if e["event_type"] == "execution_completion"
-            ]
-            if completion_events:
-                successful = len(
-                    [e for e in completion_events if e.get("status") == "success"]
-                )
-                summary["success_rate"] = successful / len(completion_events)
+            if self._completion_count:
+                summary["success_rate"] = self._success_count / self._completion_count
 
             return summary
 
@@ -417,9 +447,9 @@ class AdkObserver:
         try:
             if format_type == "json":
                 return {
-                    "metrics": self._metrics,
-                    "traces": self._traces,
-                    "performance_data": self._performance_data,
+                    "metrics": {key: list(events) for key, events in self._metrics.items()},
+                    "traces": list(self._traces),
+                    "performance_data": list(self._performance_data),
                     "summary": await self.get_metrics_summary(),
                 }
             elif format_type == "prometheus":
@@ -450,4 +480,6 @@ class AdkObserver:
         """Cleanup observer resources."""
         self._metrics.clear()
         self._traces.clear()
+        self._trace_index.clear()
         self._performance_data.clear()
+        self._reset_aggregates()
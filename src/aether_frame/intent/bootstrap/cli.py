@@ -8,14 +8,23 @@ from pathlib import Path
 from typing import List, Optional, Sequence
 
 from .io import (
+    PrelabelOutputWriter,
+    iter_input_trace_samples,
     load_capability_seed_file,
     load_input_trace_samples,
     load_reviewed_labels,
     write_draft_registry_outputs,
     write_prelabel_outputs,
 )
+from .dedup import DEDUP_METHODS, DEFAULT_MINHASH_THRESHOLD
 from .drafting import build_draft_registry_artifacts
-from .labeling import prelabel_samples
+from .labeling import (
+    DEFAULT_BATCH_SIZE,
+    SCORING_BACKENDS,
+    LabelingSummaryBuilder,
+    iter_prelabel_batches,
+    prelabel_samples,
+)
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -35,6 +44,24 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--public-benchmark-config")
     parser.add_argument("--enable-helper-labeling", action="store_true")
     parser.add_argument("--enable-llm-summarization", action="store_true")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Stream prelabel-review input and label it across N worker processes.",
+    )
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument(
+        "--scoring-backend",
+        choices=sorted(SCORING_BACKENDS),
+        default="index",
+        help="Prelabel scorer; 'sparse' needs NumPy and SciPy.",
+    )
+    parser.add_argument(
+        "--dedup",
+        choices=DEDUP_METHODS,
+        help="Collapse near-duplicate samples and review one representative per cluster.",
+    )
+    parser.add_argument("--dedup-threshold", type=float, default=DEFAULT_MINHASH_THRESHOLD)
     return parser
 
 
@@ -46,9 +73,20 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         if not args.capability_seeds:
             raise ValueError("--capability-seeds is required for prelabel-review mode")
 
+        if args.workers is not None:
+            if args.dedup:
+                raise ValueError("--dedup needs the whole input and cannot be combined with --workers")
+            return _run_streaming_prelabel(args)
+
         input_traces = load_input_trace_samples(Path(args.input_traces))
         seed_file = load_capability_seed_file(Path(args.capability_seeds))
-        records, summary = prelabel_samples(input_traces, seed_file)
+        records, summary = prelabel_samples(
+            input_traces,
+            seed_file,
+            backend=args.scoring_backend,
+            dedup=args.dedup,
+            dedup_threshold=args.dedup_threshold,
+        )
         write_prelabel_outputs(
             output_dir=Path(args.output_dir),
             records=records,
@@ -81,6 +119,26 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     )
 
 
+def _run_streaming_prelabel(args: argparse.Namespace) -> int:
+    if args.workers < 1:
+        raise ValueError("--workers must be at least 1")
+
+    seed_file = load_capability_seed_file(Path(args.capability_seeds))
+    summary = LabelingSummaryBuilder()
+    with PrelabelOutputWriter(Path(args.output_dir)) as writer:
+        for records, batch_summary in iter_prelabel_batches(
+            iter_input_trace_samples(Path(args.input_traces)),
+            seed_file,
+            workers=args.workers,
+            batch_size=args.batch_size,
+            backend=args.scoring_backend,
+        ):
+            writer.write_records(records)
+            summary.merge(batch_summary)
+        writer.write_summary(summary.build())
+    return 0
+
+
 def cli_main() -> None:
     raise SystemExit(main())
 
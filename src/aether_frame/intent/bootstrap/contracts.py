@@ -41,6 +41,10 @@ class PrelabelRecord:
     llm_output_text: Optional[str] = None
     final_status: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Set only by near-duplicate collapsing; kept out of ``metadata`` so
+    # sample metadata can never be mistaken for cluster membership.
+    duplicate_of: Optional[str] = None
+    duplicate_cluster_size: Optional[int] = None
 
 
 @dataclass
@@ -58,6 +62,9 @@ class LabelingSummary:
     needs_review_count: int = 0
     unknown_count: int = 0
     top_confusions: List[Dict[str, Any]] = field(default_factory=list)
+    collapsed_sample_count: int = 0
+    duplicate_cluster_sizes: Dict[str, int] = field(default_factory=dict)
+    top_duplicate_clusters: List[Dict[str, Any]] = field(default_factory=list)
 
 
 @dataclass
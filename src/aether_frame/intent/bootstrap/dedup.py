@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""Near-duplicate grouping of trace samples ahead of prelabeling."""
+
+from __future__ import annotations
+
+import hashlib
+import random
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Sequence, Set, Tuple
+
+DEDUP_METHODS = ("tokens", "minhash")
+DEFAULT_MINHASH_THRESHOLD = 0.8
+MINHASH_PERMUTATIONS = 64
+MINHASH_BANDS = 16
+
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+@dataclass
+class SampleCluster:
+    """Indices of samples that share one prelabel; the first is the representative."""
+
+    members: List[int] = field(default_factory=list)
+
+    @property
+    def representative(self) -> int:
+        return self.members[0]
+
+    @property
+    def size(self) -> int:
+        return len(self.members)
+
+
+def group_near_duplicates(
+    token_sets: Sequence[Set[str]],
+    *,
+    method: str = "tokens",
+    threshold: float = DEFAULT_MINHASH_THRESHOLD,
+) -> List[SampleCluster]:
+    """
+    Group samples whose token sets are identical or nearly identical.
+
+    ``"tokens"`` groups samples with the same normalized token set; prelabel
+    scores depend only on that set, so collapsing is lossless. ``"minhash"``
+    additionally uses leader clustering: each distinct token set joins the
+    earliest existing representative whose Jaccard similarity to it is at
+    least ``threshold``, or starts a new cluster. Candidates come from MinHash
+    signatures and LSH banding and are verified against the exact token sets,
+    so every member is within ``threshold`` of its representative.
+
+    Samples without tokens are never grouped. Clusters and their members keep
+    input order, so the representative is the earliest sample.
+    """
+    if method not in DEDUP_METHODS:
+        raise ValueError(f"Unknown dedup method: {method}")
+
+    frozen = [frozenset(tokens) for tokens in token_sets]
+    leaders = list(range(len(token_sets)))
+
+    exact: Dict[FrozenSet[str], int] = {}
+    for index, tokens in enumerate(frozen):
+        if not tokens:
+            continue
+        leaders[index] = exact.setdefault(tokens, index)
+
+    if method == "minhash":
+        hasher = _MinHasher(MINHASH_PERMUTATIONS)
+        rows = MINHASH_PERMUTATIONS // MINHASH_BANDS
+        # Only representatives are indexed, so candidates are always leaders.
+        buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+        # One signature per distinct token set, in input order; exact duplicates follow their first sample.
+        for tokens, index in exact.items():
+            signature = hasher.signature(tokens)
+            keys = [(band, tuple(signature[band * rows:(band + 1) * rows])) for band in range(MINHASH_BANDS)]
+            candidates = sorted({leader for key in keys for leader in buckets.get(key, ())})
+            leader = next(
+                (candidate for candidate in candidates if _jaccard(frozen[candidate], tokens) >= threshold),
+                None,
+            )
+            if leader is not None:
+                leaders[index] = leader
+                continue
+            for key in keys:
+                buckets.setdefault(key, []).append(index)
+
+    clusters: Dict[int, SampleCluster] = {}
+    for index in range(len(token_sets)):
+        clusters.setdefault(_leader(leaders, index), SampleCluster()).members.append(index)
+    return sorted(clusters.values(), key=lambda cluster: cluster.representative)
+
+
+class _MinHasher:
+    def __init__(self, permutations: int, seed: int = 1):
+        rng = random.Random(seed)
+        self._coefficients = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(permutations)
+        ]
+
+    def signature(self, tokens: FrozenSet[str]) -> List[int]:
+        hashes = [_stable_hash(token) for token in tokens]
+        return [
+            min((a * value + b) % _MERSENNE_PRIME for value in hashes)
+            for a, b in self._coefficients
+        ]
+
+
+def _stable_hash(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def _jaccard(left: FrozenSet[str], right: FrozenSet[str]) -> float:
+    return len(left & right) / len(left | right)
+
+
+def _leader(leaders: List[int], index: int) -> int:
+    # Exact duplicates point at their first sample, which may itself have joined a leader.
+    while leaders[index] != index:
+        index = leaders[index]
+    return index
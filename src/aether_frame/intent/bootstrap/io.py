@@ -6,7 +6,7 @@ from __future__ import annotations
 from dataclasses import asdict
 import json
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
 
 from .contracts import (
     CapabilitySeedFile,
@@ -21,8 +21,13 @@ from .contracts import (
 
 def load_input_trace_samples(path: Path) -> List[InputTraceSample]:
     """Load input trace rows from JSONL or JSON array files."""
-    records = _load_records(path)
-    return [_input_trace_from_dict(record) for record in records]
+    return list(iter_input_trace_samples(path))
+
+
+def iter_input_trace_samples(path: Path) -> Iterator[InputTraceSample]:
+    """Yield input trace rows lazily; JSONL files are read line by line."""
+    for record in _iter_records(path):
+        yield _input_trace_from_dict(record)
 
 
 def load_capability_seed_file(path: Path) -> CapabilitySeedFile:
@@ -51,41 +56,66 @@ def write_prelabel_outputs(
     summary: LabelingSummary,
 ) -> None:
     """Write the narrowed MVP outputs into the target directory."""
-    output_dir.mkdir(parents=True, exist_ok=True)
-    review_dir = output_dir / "review_payloads"
-    review_dir.mkdir(parents=True, exist_ok=True)
+    with PrelabelOutputWriter(output_dir) as writer:
+        writer.write_records(records)
+        writer.write_summary(summary)
 
-    _write_jsonl(output_dir / "prelabels.jsonl", [asdict(record) for record in records])
-    (output_dir / "labeling_summary.json").write_text(
-        json.dumps(asdict(summary), indent=2, ensure_ascii=True),
-        encoding="utf-8",
-    )
 
-    review_payloads = []
-    unknown_rows = []
-    for record in records:
+class PrelabelOutputWriter:
+    """
+    Incremental writer for prelabel-review outputs.
+
+    ``prelabels.jsonl``, ``review_payloads/label_studio.jsonl`` and
+    ``unknown_samples.jsonl`` are appended record by record, so outputs of any
+    size are written without holding all records in memory.
+    """
+
+    def __init__(self, output_dir: Path):
+        self.output_dir = output_dir
+        output_dir.mkdir(parents=True, exist_ok=True)
+        review_dir = output_dir / "review_payloads"
+        review_dir.mkdir(parents=True, exist_ok=True)
+
+        self._prelabels: Optional[TextIO] = (output_dir / "prelabels.jsonl").open("w", encoding="utf-8")
+        self._review_payloads: Optional[TextIO] = (review_dir / "label_studio.jsonl").open("w", encoding="utf-8")
+        self._unknown: Optional[TextIO] = (output_dir / "unknown_samples.jsonl").open("w", encoding="utf-8")
+
+    def __enter__(self) -> "PrelabelOutputWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def write(self, record: PrelabelRecord) -> None:
+        """Append one record to the prelabel, review and unknown outputs."""
         row = asdict(record)
+        _write_jsonl_row(self._prelabels, row)
         if record.predicted_intent == "unknown":
-            unknown_rows.append(row)
+            _write_jsonl_row(self._unknown, row)
+        if record.duplicate_of is not None:
+            # The cluster representative is reviewed on behalf of its duplicates.
+            return
         if record.needs_review or record.predicted_intent == "unknown":
-            review_payloads.append(
-                {
-                    "id": record.sample_id,
-                    "data": {
-                        "sample_id": record.sample_id,
-                        "conversation_id": record.conversation_id,
-                        "text": record.text,
-                        "predicted_intent": record.predicted_intent,
-                        "confidence": record.confidence,
-                        "top_candidates": row["top_candidates"],
-                        "review_reason": record.review_reason,
-                        "llm_output_text": record.llm_output_text,
-                    },
-                }
-            )
+            _write_jsonl_row(self._review_payloads, _review_payload(record, row))
+
+    def write_records(self, records: Iterable[PrelabelRecord]) -> None:
+        """Append several records."""
+        for record in records:
+            self.write(record)
+
+    def write_summary(self, summary: LabelingSummary) -> None:
+        """Write ``labeling_summary.json``."""
+        (self.output_dir / "labeling_summary.json").write_text(
+            json.dumps(asdict(summary), indent=2, ensure_ascii=True),
+            encoding="utf-8",
+        )
 
-    _write_jsonl(review_dir / "label_studio.jsonl", review_payloads)
-    _write_jsonl(output_dir / "unknown_samples.jsonl", unknown_rows)
+    def close(self) -> None:
+        """Close all output files."""
+        for handle in (self._prelabels, self._review_payloads, self._unknown):
+            if handle is not None:
+                handle.close()
+        self._prelabels = self._review_payloads = self._unknown = None
 
 
 def write_draft_registry_outputs(*, output_dir: Path, artifacts: Dict[str, Any]) -> None:
@@ -110,23 +140,28 @@ def write_draft_registry_outputs(*, output_dir: Path, artifacts: Dict[str, Any])
 
 
 def _load_records(path: Path) -> List[Dict[str, Any]]:
+    return list(_iter_records(path))
+
+
+def _iter_records(path: Path) -> Iterator[Dict[str, Any]]:
     suffix = path.suffix.lower()
     if suffix == ".json":
         payload = json.loads(path.read_text(encoding="utf-8"))
         if not isinstance(payload, list):
             raise ValueError("JSON input file must contain an array of objects")
-        return [_ensure_dict(row, context=str(path)) for row in payload]
+        for row in payload:
+            yield _ensure_dict(row, context=str(path))
+        return
     if suffix != ".jsonl":
         raise ValueError(f"Unsupported input file format: {path}")
 
-    records: List[Dict[str, Any]] = []
-    for line_no, line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
-        stripped = line.strip()
-        if not stripped:
-            continue
-        row = json.loads(stripped)
-        records.append(_ensure_dict(row, context=f"{path}:{line_no}"))
-    return records
+    with path.open(encoding="utf-8") as handle:
+        for line_no, line in enumerate(handle, start=1):
+            stripped = line.strip()
+            if not stripped:
+                continue
+            row = json.loads(stripped)
+            yield _ensure_dict(row, context=f"{path}:{line_no}")
 
 
 def _ensure_dict(value: Any, *, context: str) -> Dict[str, Any]:
@@ -240,6 +275,24 @@ def _optional_dict(value: Any) -> Dict[str, Any]:
     return dict(value)
 
 
-def _write_jsonl(path: Path, rows: Iterable[Dict[str, Any]]) -> None:
-    content = "".join(json.dumps(row, ensure_ascii=True) + "\n" for row in rows)
-    path.write_text(content, encoding="utf-8")
+def _review_payload(record: PrelabelRecord, row: Dict[str, Any]) -> Dict[str, Any]:
+    payload = {
+        "id": record.sample_id,
+        "data": {
+            "sample_id": record.sample_id,
+            "conversation_id": record.conversation_id,
+            "text": record.text,
+            "predicted_intent": record.predicted_intent,
+            "confidence": record.confidence,
+            "top_candidates": row["top_candidates"],
+            "review_reason": record.review_reason,
+            "llm_output_text": record.llm_output_text,
+        },
+    }
+    if record.duplicate_cluster_size:
+        payload["data"]["duplicate_cluster_size"] = record.duplicate_cluster_size
+    return payload
+
+
+def _write_jsonl_row(handle: TextIO, row: Dict[str, Any]) -> None:
+    handle.write(json.dumps(row, ensure_ascii=True) + "\n")
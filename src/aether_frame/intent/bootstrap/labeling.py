@@ -5,7 +5,10 @@ from __future__ import annotations
 
 import math
 import re
-from typing import Dict, Iterable, List, Set, Tuple
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 
 from .contracts import (
     CandidateScore,
@@ -15,11 +18,14 @@ from .contracts import (
     LabelingSummary,
     PrelabelRecord,
 )
+from .dedup import DEFAULT_MINHASH_THRESHOLD, SampleCluster, group_near_duplicates
 
 
 UNKNOWN_THRESHOLD = 0.2
 CONFUSION_MARGIN = 0.08
 LOW_CONFIDENCE_REVIEW_THRESHOLD = 0.55
+DEFAULT_BATCH_SIZE = 1000
+TOP_DUPLICATE_CLUSTERS = 10
 
 STOP_WORDS = {
     "a",
@@ -48,64 +54,383 @@ STOP_WORDS = {
 def prelabel_samples(
     samples: Iterable[InputTraceSample],
     seeds: CapabilitySeedFile,
+    *,
+    backend: str = "index",
+    dedup: Optional[str] = None,
+    dedup_threshold: float = DEFAULT_MINHASH_THRESHOLD,
 ) -> Tuple[List[PrelabelRecord], LabelingSummary]:
-    """Produce machine-assisted prelabels and a compact summary."""
-    enabled_seeds = [seed for seed in seeds.capability_seeds if seed.enabled]
-    records: List[PrelabelRecord] = []
-    confusion_counts: Dict[Tuple[str, str], int] = {}
-    predicted_counts: Dict[str, int] = {}
-    needs_review_count = 0
-    unknown_count = 0
-
-    for sample in samples:
-        record = _prelabel_one_sample(sample, enabled_seeds)
-        records.append(record)
-
-        predicted_counts[record.predicted_intent] = (
-            predicted_counts.get(record.predicted_intent, 0) + 1
+    """
+    Produce machine-assisted prelabels and a compact summary.
+
+    ``backend`` selects the scorer: ``"index"`` (inverted index, no extra
+    dependencies) or ``"sparse"`` (NumPy/SciPy sparse matrix product). Both
+    produce identical records.
+
+    ``dedup`` (``"tokens"`` or ``"minhash"``, see ``group_near_duplicates``)
+    collapses near-duplicate samples: one representative per cluster is
+    scored and its label is fanned out to the other members, which are
+    marked with ``PrelabelRecord.duplicate_of`` and left out of review payloads.
+    """
+    seed_index = _build_seed_index(seeds, backend)
+    records, summary = _prelabel_batch_with_index(
+        samples, seed_index, dedup=dedup, dedup_threshold=dedup_threshold
+    )
+    return records, summary.build()
+
+
+def iter_prelabel_batches(
+    samples: Iterable[InputTraceSample],
+    seeds: CapabilitySeedFile,
+    *,
+    workers: int = 1,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    backend: str = "index",
+) -> Iterator[Tuple[List[PrelabelRecord], "LabelingSummaryBuilder"]]:
+    """
+    Prelabel ``samples`` lazily in batches, optionally across a process pool.
+
+    Batches are yielded in input order together with their partial summary
+    counters, which callers merge with ``LabelingSummaryBuilder.merge``. At most
+    ``2 * workers`` batches are in flight, so memory stays bounded by the batch
+    size rather than the input size.
+    """
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    batches = _batched(samples, batch_size)
+
+    if workers <= 1:
+        seed_index = _build_seed_index(seeds, backend)
+        for batch in batches:
+            yield _prelabel_batch_with_index(batch, seed_index)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_prelabel_worker,
+        initargs=(seeds, backend),
+    ) as pool:
+        pending = deque()
+        for batch in batches:
+            pending.append(pool.submit(_prelabel_batch_in_worker, batch))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+class LabelingSummaryBuilder:
+    """Mergeable counters behind ``LabelingSummary``."""
+
+    def __init__(self) -> None:
+        self.total_samples = 0
+        self.predicted_intent_counts: Dict[str, int] = {}
+        self.needs_review_count = 0
+        self.unknown_count = 0
+        self.confusion_counts: Dict[Tuple[str, str], int] = {}
+        self.collapsed_sample_count = 0
+        self.cluster_size_counts: Dict[int, int] = {}
+        self.duplicate_clusters: List[Tuple[int, str]] = []
+
+    def add(self, record: PrelabelRecord) -> None:
+        """Count one prelabel record."""
+        self.total_samples += 1
+        self.predicted_intent_counts[record.predicted_intent] = (
+            self.predicted_intent_counts.get(record.predicted_intent, 0) + 1
         )
         if record.needs_review:
-            needs_review_count += 1
+            self.needs_review_count += 1
         if record.predicted_intent == "unknown":
-            unknown_count += 1
+            self.unknown_count += 1
 
         if record.review_reason == "high_confusion" and len(record.top_candidates) >= 2:
             a = record.top_candidates[0].intent_name
             b = record.top_candidates[1].intent_name
             key = tuple(sorted((a, b)))
-            confusion_counts[key] = confusion_counts.get(key, 0) + 1
-
-    summary = LabelingSummary(
-        total_samples=len(records),
-        predicted_intent_counts=predicted_counts,
-        needs_review_count=needs_review_count,
-        unknown_count=unknown_count,
-        top_confusions=[
-            {"intent_a": a, "intent_b": b, "count": count}
-            for (a, b), count in sorted(
-                confusion_counts.items(), key=lambda item: (-item[1], item[0])
+            self.confusion_counts[key] = self.confusion_counts.get(key, 0) + 1
+
+    def add_cluster(self, size: int, representative_sample_id: str) -> None:
+        """Count one near-duplicate cluster of ``size`` samples."""
+        if size < 2:
+            return
+        self.collapsed_sample_count += size - 1
+        self.cluster_size_counts[size] = self.cluster_size_counts.get(size, 0) + 1
+        self.duplicate_clusters.append((size, representative_sample_id))
+
+    def merge(self, other: "LabelingSummaryBuilder") -> None:
+        """Fold another builder's counters into this one."""
+        self.total_samples += other.total_samples
+        for intent_name, count in other.predicted_intent_counts.items():
+            self.predicted_intent_counts[intent_name] = (
+                self.predicted_intent_counts.get(intent_name, 0) + count
             )
-        ],
-    )
+        self.needs_review_count += other.needs_review_count
+        self.unknown_count += other.unknown_count
+        for key, count in other.confusion_counts.items():
+            self.confusion_counts[key] = self.confusion_counts.get(key, 0) + count
+        self.collapsed_sample_count += other.collapsed_sample_count
+        for size, count in other.cluster_size_counts.items():
+            self.cluster_size_counts[size] = self.cluster_size_counts.get(size, 0) + count
+        self.duplicate_clusters.extend(other.duplicate_clusters)
+
+    def build(self) -> LabelingSummary:
+        """Return the summary for everything counted so far."""
+        return LabelingSummary(
+            total_samples=self.total_samples,
+            predicted_intent_counts=dict(self.predicted_intent_counts),
+            needs_review_count=self.needs_review_count,
+            unknown_count=self.unknown_count,
+            top_confusions=[
+                {"intent_a": a, "intent_b": b, "count": count}
+                for (a, b), count in sorted(
+                    self.confusion_counts.items(), key=lambda item: (-item[1], item[0])
+                )
+            ],
+            collapsed_sample_count=self.collapsed_sample_count,
+            duplicate_cluster_sizes={
+                str(size): count for size, count in sorted(self.cluster_size_counts.items())
+            },
+            top_duplicate_clusters=[
+                {"representative_sample_id": sample_id, "size": size}
+                for size, sample_id in sorted(
+                    self.duplicate_clusters, key=lambda item: (-item[0], item[1])
+                )[:TOP_DUPLICATE_CLUSTERS]
+            ],
+        )
+
+
+_worker_seed_index: Optional["SeedIndex"] = None
+
+
+def _init_prelabel_worker(seeds: CapabilitySeedFile, backend: str) -> None:
+    global _worker_seed_index
+    _worker_seed_index = _build_seed_index(seeds, backend)
+
+
+def _prelabel_batch_in_worker(
+    samples: List[InputTraceSample],
+) -> Tuple[List[PrelabelRecord], LabelingSummaryBuilder]:
+    return _prelabel_batch_with_index(samples, _worker_seed_index)
+
+
+def _prelabel_batch_with_index(
+    samples: Iterable[InputTraceSample],
+    seed_index: "SeedIndex",
+    *,
+    dedup: Optional[str] = None,
+    dedup_threshold: float = DEFAULT_MINHASH_THRESHOLD,
+) -> Tuple[List[PrelabelRecord], LabelingSummaryBuilder]:
+    samples = list(samples)
+    texts = [sample.user_message.strip() for sample in samples]
+    token_sets = [_tokenize(text) for text in texts]
+    summary = LabelingSummaryBuilder()
+
+    if not dedup:
+        candidate_lists = seed_index.top_candidates_batch(token_sets)
+        records = [
+            _build_prelabel_record(sample, text, candidate_scores)
+            for sample, text, candidate_scores in zip(samples, texts, candidate_lists)
+        ]
+    else:
+        clusters = group_near_duplicates(token_sets, method=dedup, threshold=dedup_threshold)
+        candidate_lists = seed_index.top_candidates_batch(
+            [token_sets[cluster.representative] for cluster in clusters]
+        )
+        records = [None] * len(samples)
+        for cluster, candidate_scores in zip(clusters, candidate_lists):
+            _fan_out_cluster(cluster, candidate_scores, samples, texts, records)
+            summary.add_cluster(cluster.size, samples[cluster.representative].sample_id)
+
+    for record in records:
+        summary.add(record)
     return records, summary
 
 
-def _prelabel_one_sample(
-    sample: InputTraceSample,
-    seeds: List[CapabilitySeedIntent],
-) -> PrelabelRecord:
-    text = sample.user_message.strip()
-    sample_tokens = _tokenize(text)
-
-    candidate_scores: List[CandidateScore] = []
-    for seed in seeds:
-        score = _score_seed(sample_tokens, seed)
-        candidate_scores.append(
-            CandidateScore(intent_name=seed.intent_name, score=round(score, 4))
+def _fan_out_cluster(
+    cluster: SampleCluster,
+    candidate_scores: List[CandidateScore],
+    samples: List[InputTraceSample],
+    texts: List[str],
+    records: List[Optional[PrelabelRecord]],
+) -> None:
+    representative_id = samples[cluster.representative].sample_id
+    for index in cluster.members:
+        record = _build_prelabel_record(samples[index], texts[index], list(candidate_scores))
+        if cluster.size > 1:
+            if index == cluster.representative:
+                record.duplicate_cluster_size = cluster.size
+            else:
+                record.duplicate_of = representative_id
+        records[index] = record
+
+
+def _build_seed_index(seeds: CapabilitySeedFile, backend: str = "index") -> "SeedIndex":
+    try:
+        index_cls = SCORING_BACKENDS[backend]
+    except KeyError as exc:
+        raise ValueError(f"Unknown scoring backend: {backend}") from exc
+    return index_cls([seed for seed in seeds.capability_seeds if seed.enabled])
+
+
+def _batched(
+    samples: Iterable[InputTraceSample], batch_size: int
+) -> Iterator[List[InputTraceSample]]:
+    iterator = iter(samples)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+class SeedIndex:
+    """
+    Inverted index over capability seed tokens.
+
+    Seed texts are tokenized once; scoring a sample walks the posting lists of
+    its tokens to count overlaps, which yields the same cosine-overlap scores
+    as comparing the sample against every seed's token set.
+    """
+
+    def __init__(self, seeds: Sequence[CapabilitySeedIntent]):
+        self.seeds = list(seeds)
+        self.seed_tokens: List[FrozenSet[str]] = [
+            frozenset(_seed_tokens(seed)) for seed in self.seeds
+        ]
+        self.postings: Dict[str, List[int]] = {}
+        for seed_id, tokens in enumerate(self.seed_tokens):
+            for token in tokens:
+                self.postings.setdefault(token, []).append(seed_id)
+        # Zero-score candidates are ranked by intent name, ties by seed order.
+        self._name_order = sorted(
+            range(len(self.seeds)), key=lambda seed_id: self.seeds[seed_id].intent_name
+        )
+
+    def __len__(self) -> int:
+        return len(self.seeds)
+
+    def overlap_counts(self, sample_tokens: Set[str]) -> Dict[int, int]:
+        """Return ``seed_id -> shared token count`` for seeds sharing any token."""
+        counts: Dict[int, int] = {}
+        for token in sample_tokens:
+            for seed_id in self.postings.get(token, ()):
+                counts[seed_id] = counts.get(seed_id, 0) + 1
+        return counts
+
+    def top_candidates(self, sample_tokens: Set[str], limit: int = 3) -> List[CandidateScore]:
+        """Return the ``limit`` best seeds ordered by (-score, intent_name)."""
+        scores: List[Tuple[int, float]] = []
+        if sample_tokens:
+            sample_size = len(sample_tokens)
+            for seed_id, overlap in self.overlap_counts(sample_tokens).items():
+                scores.append(
+                    (seed_id, overlap / math.sqrt(sample_size * len(self.seed_tokens[seed_id])))
+                )
+        return self.rank(scores, limit)
+
+    def top_candidates_batch(
+        self, token_sets: Sequence[Set[str]], limit: int = 3
+    ) -> List[List[CandidateScore]]:
+        """Return ``top_candidates`` for each token set."""
+        return [self.top_candidates(tokens, limit) for tokens in token_sets]
+
+    def rank(self, scores: Iterable[Tuple[int, float]], limit: int = 3) -> List[CandidateScore]:
+        """Order raw ``(seed_id, score)`` pairs into the top ``limit`` candidates."""
+        scored: List[Tuple[float, str, int]] = []
+        for seed_id, score in scores:
+            rounded = round(float(score), 4)
+            if rounded > 0:
+                scored.append((-rounded, self.seeds[seed_id].intent_name, seed_id))
+        scored.sort()
+
+        candidates = [
+            CandidateScore(intent_name=name, score=-negative_score)
+            for negative_score, name, _ in scored[:limit]
+        ]
+        if len(candidates) < limit:
+            ranked = {seed_id for _, _, seed_id in scored}
+            for seed_id in self._name_order:
+                if len(candidates) >= limit:
+                    break
+                if seed_id not in ranked:
+                    candidates.append(
+                        CandidateScore(intent_name=self.seeds[seed_id].intent_name, score=0.0)
+                    )
+        return candidates
+
+
+class SparseSeedIndex(SeedIndex):
+    """
+    Seed index that scores whole batches with one sparse matrix product.
+
+    Samples and seeds become binary sample x vocabulary and vocabulary x seed
+    CSR matrices; their product holds every overlap count, which is scaled by
+    the token-set sizes into the same cosine-overlap scores as ``SeedIndex``.
+    Requires NumPy and SciPy.
+    """
+
+    def __init__(self, seeds: Sequence[CapabilitySeedIntent]):
+        super().__init__(seeds)
+        np, sparse = _import_sparse_backend()
+        self._np = np
+        self.vocabulary: Dict[str, int] = {
+            token: column for column, token in enumerate(sorted(self.postings))
+        }
+        rows: List[int] = []
+        columns: List[int] = []
+        for token, seed_ids in self.postings.items():
+            rows.extend([self.vocabulary[token]] * len(seed_ids))
+            columns.extend(seed_ids)
+        self._seed_matrix = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (rows, columns)),
+            shape=(len(self.vocabulary), len(self.seeds)),
+        )
+        self._seed_sizes = np.array([len(tokens) for tokens in self.seed_tokens], dtype=np.int64)
+        self._sparse = sparse
+
+    def top_candidates(self, sample_tokens: Set[str], limit: int = 3) -> List[CandidateScore]:
+        return self.top_candidates_batch([sample_tokens], limit)[0]
+
+    def top_candidates_batch(
+        self, token_sets: Sequence[Set[str]], limit: int = 3
+    ) -> List[List[CandidateScore]]:
+        np = self._np
+        rows: List[int] = []
+        columns: List[int] = []
+        for row, tokens in enumerate(token_sets):
+            for token in tokens:
+                column = self.vocabulary.get(token)
+                if column is not None:
+                    rows.append(row)
+                    columns.append(column)
+        sample_matrix = self._sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (rows, columns)),
+            shape=(len(token_sets), len(self.vocabulary)),
+        )
+        overlaps = (sample_matrix @ self._seed_matrix).tocsr()
+        overlaps.sort_indices()
+
+        sample_sizes = np.array([len(tokens) for tokens in token_sets], dtype=np.int64)
+        row_ids = np.repeat(np.arange(len(token_sets)), np.diff(overlaps.indptr))
+        scores = overlaps.data / np.sqrt(
+            (sample_sizes[row_ids] * self._seed_sizes[overlaps.indices]).astype(np.float64)
         )
 
-    candidate_scores.sort(key=lambda item: (-item.score, item.intent_name))
+        pairs = list(zip(overlaps.indices.tolist(), scores.tolist()))
+        indptr = overlaps.indptr.tolist()
+        return [
+            self.rank(pairs[indptr[row]:indptr[row + 1]], limit)
+            for row in range(len(token_sets))
+        ]
 
+
+SCORING_BACKENDS = {"index": SeedIndex, "sparse": SparseSeedIndex}
+
+
+def _build_prelabel_record(
+    sample: InputTraceSample,
+    text: str,
+    candidate_scores: List[CandidateScore],
+) -> PrelabelRecord:
     top_score = candidate_scores[0].score if candidate_scores else 0.0
     second_score = candidate_scores[1].score if len(candidate_scores) > 1 else 0.0
 
@@ -131,7 +456,7 @@ def _prelabel_one_sample(
         text=text,
         predicted_intent=predicted_intent,
         confidence=confidence,
-        top_candidates=candidate_scores[:3],
+        top_candidates=candidate_scores,
         needs_review=needs_review,
         review_reason=review_reason,
         llm_output_text=sample.llm_output_text,
@@ -149,24 +474,24 @@ def _prelabel_one_sample(
     )
 
 
-def _score_seed(sample_tokens: Set[str], seed: CapabilitySeedIntent) -> float:
-    if not sample_tokens:
-        return 0.0
+def _import_sparse_backend():
+    try:
+        import numpy as np
+        from scipy import sparse
+    except ImportError as exc:  # pragma: no cover - depends on env
+        raise RuntimeError(
+            "The sparse scoring backend requires NumPy and SciPy. Install them or use the index backend."
+        ) from exc
+    return np, sparse
+
 
+def _seed_tokens(seed: CapabilitySeedIntent) -> Set[str]:
     seed_text_parts = [
         seed.intent_name.replace("_", " "),
         seed.description,
         *seed.example_messages,
     ]
-    seed_tokens = _tokenize(" ".join(seed_text_parts))
-    if not seed_tokens:
-        return 0.0
-
-    overlap = sample_tokens & seed_tokens
-    if not overlap:
-        return 0.0
-
-    return len(overlap) / math.sqrt(len(sample_tokens) * len(seed_tokens))
+    return _tokenize(" ".join(seed_text_parts))
 
 
 def _tokenize(text: str) -> Set[str]:
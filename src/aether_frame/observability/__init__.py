@@ -1,4 +1,4 @@
 # -*- coding: utf-8 -*-
 """Observability helpers for Aether Frame."""
 
-__all__ = ["adk_logging", "metrics_backend"]
+__all__ = ["adk_logging", "latency_sketch", "metrics_backend"]
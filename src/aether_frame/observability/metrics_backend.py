@@ -5,10 +5,65 @@ from __future__ import annotations
 
 import os
 import logging
-from typing import Any, Dict, Optional
+import time
+from contextlib import contextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple, TypeVar
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Sub-second resolution for per-stage latencies.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+EXECUTION_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1200)
+
+# stage -> (metric name, description, label names)
+STAGE_METRICS: Dict[str, Tuple[str, str, Tuple[str, ...]]] = {
+    "ttft": (
+        "aether_llm_time_to_first_token_seconds",
+        "Time from LLM request to the first streamed chunk",
+        ("model",),
+    ),
+    "llm_call": (
+        "aether_llm_call_duration_seconds",
+        "LLM call duration",
+        ("model", "status"),
+    ),
+    "tool_call": (
+        "aether_tool_call_duration_seconds",
+        "Tool execution duration by tool namespace",
+        ("namespace", "status"),
+    ),
+    "session_coordination": (
+        "aether_session_coordination_seconds",
+        "Chat session coordination duration",
+        ("stage", "status"),
+    ),
+    "runner_creation": (
+        "aether_runner_creation_seconds",
+        "ADK runner creation duration",
+        ("status",),
+    ),
+    "agent_creation": (
+        "aether_agent_creation_seconds",
+        "Domain agent creation duration",
+        ("status",),
+    ),
+    "queue_wait": (
+        "aether_queue_wait_seconds",
+        "Time items wait in internal queues before being consumed",
+        ("queue",),
+    ),
+}
+
+# kind -> (gauge name, description)
+IN_FLIGHT_GAUGES: Dict[str, Tuple[str, str]] = {
+    "streams": ("aether_active_streams", "Streaming executions in progress"),
+    "runners": ("aether_active_runners", "ADK runners currently held"),
+    "sessions": ("aether_active_sessions", "Chat sessions currently tracked"),
+    "tool_queue": ("aether_tool_queue_depth", "Tool calls waiting for a per-server concurrency or rate slot"),
+}
+
 
 class MetricsBackend:
     """Interface for observability metrics backends."""
@@ -36,6 +91,17 @@ class MetricsBackend:
     ) -> None:
         return
 
+    def observe_stage_latency(
+        self, stage: str, seconds: float, labels: Optional[Dict[str, Any]] = None
+    ) -> None:
+        return
+
+    def adjust_in_flight(self, kind: str, delta: int) -> None:
+        return
+
+    def set_in_flight(self, kind: str, value: int) -> None:
+        return
+
 
 class NullMetricsBackend(MetricsBackend):
     """No-op backend when metrics export is disabled."""
@@ -46,7 +112,7 @@ class PrometheusMetricsBackend(MetricsBackend):
 
     def __init__(self, port: int = 9400):
         try:
-            from prometheus_client import Counter, Histogram, start_http_server
+            from prometheus_client import Counter, Gauge, Histogram, start_http_server
         except ImportError as exc:
             raise RuntimeError(
                 "prometheus_client is required for Prometheus metrics backend"
@@ -65,8 +131,15 @@ class PrometheusMetricsBackend(MetricsBackend):
             "adk_execution_duration_seconds",
             "Execution duration in seconds",
             labelnames=label_names,
-            buckets=(1, 5, 10, 30, 60, 120, 300, 600, 1200),
+            buckets=EXECUTION_BUCKETS,
         )
+        self._stage_histograms = {
+            stage: Histogram(name, description, labelnames=labelnames, buckets=LATENCY_BUCKETS)
+            for stage, (name, description, labelnames) in STAGE_METRICS.items()
+        }
+        self._in_flight_gauges = {
+            kind: Gauge(name, description) for kind, (name, description) in IN_FLIGHT_GAUGES.items()
+        }
 
     @staticmethod
     def _extract_labels(metadata: Dict[str, Any], agent_id: Optional[str]) -> Dict[str, str]:
@@ -104,6 +177,28 @@ class PrometheusMetricsBackend(MetricsBackend):
         labels = self._extract_labels(metadata, agent_id)
         self._execution_counter.labels(status="error", **labels).inc()
 
+    def observe_stage_latency(
+        self, stage: str, seconds: float, labels: Optional[Dict[str, Any]] = None
+    ) -> None:
+        histogram = self._stage_histograms.get(stage)
+        if histogram is None:
+            return
+        labels = labels or {}
+        label_values = {
+            name: str(labels.get(name) or "unknown") for name in STAGE_METRICS[stage][2]
+        }
+        histogram.labels(**label_values).observe(seconds)
+
+    def adjust_in_flight(self, kind: str, delta: int) -> None:
+        gauge = self._in_flight_gauges.get(kind)
+        if gauge is not None:
+            gauge.inc(delta)
+
+    def set_in_flight(self, kind: str, value: int) -> None:
+        gauge = self._in_flight_gauges.get(kind)
+        if gauge is not None:
+            gauge.set(value)
+
 
 _METRICS_BACKEND: Optional[MetricsBackend] = None
 
@@ -126,3 +221,106 @@ def get_metrics_backend() -> MetricsBackend:
         _METRICS_BACKEND = NullMetricsBackend()
 
     return _METRICS_BACKEND
+
+
+@contextmanager
+def time_stage(stage: str, /, **labels: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Observe the duration of the enclosed block as ``stage`` latency.
+
+    The yielded label dict may be updated inside the block (for example with
+    the call's status); ``status`` defaults to ``success``, ``error`` when the
+    block raises, or ``cancelled`` when it is cancelled or its generator is
+    closed early. Metric failures never propagate to the caller.
+    """
+    start = time.perf_counter()
+    try:
+        yield labels
+    except Exception:
+        labels.setdefault("status", "error")
+        raise
+    except BaseException:
+        labels.setdefault("status", "cancelled")
+        raise
+    finally:
+        labels.setdefault("status", "success")
+        observe_stage_latency(stage, time.perf_counter() - start, labels)
+
+
+async def time_stream(
+    stage: str,
+    stream: AsyncIterator[T],
+    /,
+    first_item_stage: Optional[str] = None,
+    **labels: Any,
+) -> AsyncIterator[T]:
+    """
+    Re-yield ``stream``, observing only the time spent fetching from it.
+
+    Time the consumer holds each item is excluded, so slow consumers do not
+    inflate ``stage`` latency. One observation is made when the stream ends,
+    with ``status`` set as in ``time_stage``. When ``first_item_stage`` is
+    given, the wait for the first item is also observed under that stage.
+    """
+    started = time.perf_counter()
+    fetching = 0.0
+    first = True
+    try:
+        while True:
+            fetch_started = time.perf_counter()
+            try:
+                item = await stream.__anext__()
+            except StopAsyncIteration:
+                break
+            finally:
+                fetching += time.perf_counter() - fetch_started
+            if first and first_item_stage:
+                observe_stage_latency(first_item_stage, time.perf_counter() - started, labels)
+            first = False
+            yield item
+    except Exception:
+        labels.setdefault("status", "error")
+        raise
+    except BaseException:
+        labels.setdefault("status", "cancelled")
+        raise
+    finally:
+        labels.setdefault("status", "success")
+        observe_stage_latency(stage, fetching, labels)
+        aclose = getattr(stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def observe_stage_latency(stage: str, seconds: float, labels: Optional[Dict[str, Any]] = None) -> None:
+    """Record a stage latency on the global backend, ignoring backend failures."""
+    try:
+        get_metrics_backend().observe_stage_latency(stage, seconds, labels)
+    except Exception:  # pragma: no cover - metrics must not break execution
+        logger.debug("Failed to record %s latency", stage, exc_info=True)
+
+
+@contextmanager
+def track_in_flight(kind: str) -> Iterator[None]:
+    """Count the enclosed block in the ``kind`` in-flight gauge."""
+    adjust_in_flight(kind, 1)
+    try:
+        yield
+    finally:
+        adjust_in_flight(kind, -1)
+
+
+def adjust_in_flight(kind: str, delta: int) -> None:
+    """Move the ``kind`` in-flight gauge on the global backend by ``delta``."""
+    try:
+        get_metrics_backend().adjust_in_flight(kind, delta)
+    except Exception:  # pragma: no cover - metrics must not break execution
+        logger.debug("Failed to adjust %s gauge", kind, exc_info=True)
+
+
+def set_in_flight(kind: str, value: int) -> None:
+    """Set the ``kind`` in-flight gauge on the global backend."""
+    try:
+        get_metrics_backend().set_in_flight(kind, value)
+    except Exception:  # pragma: no cover - metrics must not break execution
+        logger.debug("Failed to set %s gauge", kind, exc_info=True)
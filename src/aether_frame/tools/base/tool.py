@@ -2,10 +2,13 @@
 """Tool Abstract Base Class."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from ...contracts import ToolRequest, ToolResult
 
+if TYPE_CHECKING:
+    from ..result_cache import ToolCachePolicy
+
 
 class Tool(ABC):
     """
@@ -14,8 +17,14 @@ class Tool(ABC):
     Tools provide specific functionality that can be invoked by agents
     during task execution. This includes builtin tools, external API tools,
     MCP tools, and framework-native tools.
+
+    Tools whose results depend only on their parameters may set
+    ``cache_policy`` to let ``ToolService`` serve repeated calls from its
+    result cache.
     """
 
+    cache_policy: Optional["ToolCachePolicy"] = None
+
     def __init__(self, name: str, namespace: Optional[str] = None):
         """Initialize tool."""
         self.name = name
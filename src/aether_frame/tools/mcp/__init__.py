@@ -3,6 +3,14 @@
 
 from .config import MCPServerConfig
 from .client import MCPClient, MCPConnectionError, MCPToolError
+from .session_pool import MCPSessionPool
 from .tool_wrapper import MCPTool
 
-__all__ = ["MCPServerConfig", "MCPClient", "MCPConnectionError", "MCPToolError", "MCPTool"]
+__all__ = [
+    "MCPServerConfig",
+    "MCPClient",
+    "MCPConnectionError",
+    "MCPToolError",
+    "MCPTool",
+    "MCPSessionPool",
+]
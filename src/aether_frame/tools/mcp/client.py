@@ -3,6 +3,7 @@
 
 import asyncio
 import contextlib
+import itertools
 import logging
 import time
 from typing import Any, AsyncIterator, Dict, List, Optional
@@ -15,6 +16,7 @@ import mcp.types as types
 
 from aether_frame.contracts.contexts import UniversalTool
 from .config import MCPServerConfig
+from .session_pool import MCPSessionPool
 
 
 class MCPConnectionError(Exception):
@@ -27,6 +29,10 @@ class MCPToolError(Exception):
     pass
 
 
+# Queued behind any progress events once the tool call finishes.
+_TOOL_DONE = object()
+
+
 class MCPClient:
     """Enhanced MCP client with real notification-based streaming support.
     
@@ -37,6 +43,7 @@ class MCPClient:
         config: MCP server configuration
         _session: Active MCP client session
         _progress_handlers: Dict of progress token -> asyncio queues for events
+        _session_pool: Warm sessions for calls carrying per-request headers
     """
     
     def __init__(self, config: MCPServerConfig):
@@ -49,7 +56,15 @@ class MCPClient:
         self._session: Optional[ClientSession] = None
         self._connected = False
         self._progress_handlers: Dict[str, asyncio.Queue] = {}
+        self._progress_tokens = itertools.count(1)
         self._connect_task: Optional[asyncio.Task[None]] = None
+        self._session_pool = MCPSessionPool(
+            self._open_session,
+            max_per_key=config.session_pool_max_per_key,
+            max_idle_sessions=config.session_pool_max_idle,
+            idle_timeout=config.session_idle_timeout,
+            health_check_interval=config.session_health_check_interval,
+        )
         self._logger = logging.getLogger(__name__)
     
     async def __aenter__(self):
@@ -131,6 +146,7 @@ class MCPClient:
     async def disconnect(self) -> None:
         """Close connection to MCP server."""
         await self._cancel_connect_task()
+        await self._session_pool.close()
         await self._cleanup_connection()
 
     async def _cancel_connect_task(self) -> None:
@@ -254,33 +270,42 @@ class MCPClient:
             f"Failed to connect to MCP server after {attempts} attempts: {last_error}"
         )
 
+    @asynccontextmanager
+    async def _open_session(self, headers: Dict[str, str]):
+        """Open and initialize a standalone session using the given headers."""
+        async with streamablehttp_client(
+            url=self.config.endpoint,
+            headers=headers,
+            timeout=self.config.timeout
+        ) as (read_stream, write_stream, _):
+            async with ClientSession(
+                read_stream,
+                write_stream,
+                message_handler=self._notification_handler
+            ) as session:
+                await session.initialize()
+                yield session
+
     @asynccontextmanager
     async def _session_scope(self, extra_headers: Optional[Dict[str, str]] = None):
-        """Context manager yielding session with merged headers."""
+        """Context manager yielding session with merged headers.
+
+        Calls carrying extra headers borrow a pooled session keyed by the
+        merged header set, so repeated calls for the same user context reuse
+        an initialized connection instead of repeating the MCP handshake.
+        """
         if extra_headers:
             merged_headers = dict(self.config.headers)
             merged_headers.update({str(k): str(v) for k, v in extra_headers.items()})
-            temp_stream_context = streamablehttp_client(
-                url=self.config.endpoint,
-                headers=merged_headers,
-                timeout=self.config.timeout
-            )
-            read_stream, write_stream, _ = await temp_stream_context.__aenter__()
-            temp_session_context = ClientSession(
-                read_stream,
-                write_stream,
-                message_handler=self._notification_handler
-            )
-            temp_session = await temp_session_context.__aenter__()
-            await temp_session.initialize()
-            try:
-                yield temp_session
-            finally:
-                await temp_session_context.__aexit__(None, None, None)
-                await temp_stream_context.__aexit__(None, None, None)
+            async with self._session_pool.session(merged_headers) as session:
+                yield session
         else:
             await self._ensure_persistent_connection()
             yield self._session
+
+    def get_session_pool_stats(self) -> Dict[str, int]:
+        """Return counters for the header-scoped session pool."""
+        return self._session_pool.get_stats()
     
     async def discover_tools(self, cursor: Optional[str] = None) -> List[UniversalTool]:
         """Discover available tools from MCP server.
@@ -346,14 +371,16 @@ class MCPClient:
         arguments: Dict[str, Any],
         extra_headers: Optional[Dict[str, str]] = None,
     ) -> Any:
-        """Execute tool synchronously by collecting streaming result.
+        """Execute tool and return its final result.
         
-        This method now internally uses call_tool_stream and collects the final result,
-        providing a unified interface while maintaining backward compatibility.
+        Callers that do not consume progress events skip the streaming
+        machinery entirely: no progress token, queue or callback is set up and
+        the call completes as soon as the server responds.
         
         Args:
             name: Tool name (without namespace prefix)  
             arguments: Tool execution arguments
+            extra_headers: Optional per-call headers (e.g. user context)
             
         Returns:
             Tool execution result
@@ -362,29 +389,34 @@ class MCPClient:
             MCPConnectionError: When not connected to server
             MCPToolError: When tool execution fails
         """
+        if not self._connected or not self._session:
+            raise MCPConnectionError("Not connected to MCP server")
+
         try:
-            final_result = None
-            async for chunk in self.call_tool_stream(
-                name, arguments, extra_headers=extra_headers
-            ):
-                if chunk.get("type") == "complete_result" and chunk.get("is_final"):
-                    final_result = chunk.get("content")
-                    break
-                elif chunk.get("type") == "error":
-                    error_msg = chunk.get("error", "Tool execution failed")
-                    raise MCPToolError(error_msg)
-            
-            if final_result is None:
-                raise MCPToolError("No result received from tool execution")
-                
-            return final_result
-            
-        except MCPToolError:
+            async with self._session_scope(extra_headers=extra_headers) as session:
+                result = await session.call_tool(name, arguments)
+        except (MCPToolError, MCPConnectionError):
             raise
-        except MCPConnectionError:
-            raise  # Keep connection errors as-is
         except Exception as e:
             raise MCPToolError(f"Tool execution failed: {e}")
+
+        if result is None:
+            raise MCPToolError("No result received from tool execution")
+        return self._extract_result_content(result)
+
+    @staticmethod
+    def _extract_result_content(result: Any) -> Any:
+        """Unwrap single text/data content items from an MCP call result."""
+        if hasattr(result, 'content') and result.content:
+            if len(result.content) == 1:
+                content_item = result.content[0]
+                if hasattr(content_item, 'text'):
+                    return content_item.text
+                if hasattr(content_item, 'data'):
+                    return content_item.data
+                return content_item
+            return result.content
+        return result
     
     async def call_tool_stream(
         self, 
@@ -394,12 +426,15 @@ class MCPClient:
     ) -> AsyncIterator[Dict[str, Any]]:
         """Execute tool with REAL streaming via progress notifications.
         
-        This implementation uses MCP's notification system to receive real-time
-        progress updates from the server during tool execution.
+        Progress callbacks and the tool call's completion feed one queue, so
+        events are yielded as soon as they arrive and the stream ends as soon
+        as the call finishes, without polling. The progress handler is always
+        removed and an unfinished call is cancelled when the stream closes.
         
         Args:
             name: Tool name (without namespace prefix)
             arguments: Tool execution arguments
+            extra_headers: Optional per-call headers (e.g. user context)
             
         Yields:
             Real-time progress events and final result
@@ -411,16 +446,13 @@ class MCPClient:
         if not self._connected or not self._session:
             raise MCPConnectionError("Not connected to MCP server")
         
+        start_time = time.time()
+        progress_token = f"stream_{int(start_time * 1000)}_{next(self._progress_tokens)}"
+        progress_queue: asyncio.Queue = asyncio.Queue()
+        self._progress_handlers[progress_token] = progress_queue
+        tool_task: Optional[asyncio.Task] = None
+
         try:
-            start_time = time.time()
-            
-            # Generate unique progress token for this operation
-            progress_token = f"stream_{int(time.time() * 1000)}_{hash(name) % 10000}"
-            
-            # Create progress event queue for this operation
-            progress_queue = asyncio.Queue()
-            self._progress_handlers[progress_token] = progress_queue
-            
             # Emit start event
             yield {
                 "type": "stream_start",
@@ -431,26 +463,22 @@ class MCPClient:
                 "transport": "streamable_http_with_real_notifications"
             }
             
-            # Create progress callback to capture progress events from MCP SDK
             async def progress_callback(progress: float, total: float = 1.0, message: str = ""):
                 """Official MCP SDK progress callback function."""
-                progress_event = {
+                queue = self._progress_handlers.get(progress_token)
+                if queue is None:
+                    return
+                queue.put_nowait({
                     "type": "progress_update",
                     "progress": progress,
                     "total": total,
                     "message": message,
                     "progress_token": progress_token,
                     "timestamp": time.time()
-                }
-                
-                # Send to the appropriate progress handler queue
-                if progress_token in self._progress_handlers:
-                    queue = self._progress_handlers[progress_token]
-                    await queue.put(progress_event)
-                    print(f"✅ Progress via callback: {progress}/{total} - {message}")
+                })
+                self._logger.debug("MCP progress %s: %s/%s - %s", progress_token, progress, total, message)
             
             async with self._session_scope(extra_headers=extra_headers) as session:
-                # Execute tool with official progress_callback parameter
                 tool_task = asyncio.create_task(
                     session.call_tool(
                         name,
@@ -458,60 +486,34 @@ class MCPClient:
                         progress_callback=progress_callback  # Official MCP SDK parameter!
                     )
                 )
+                tool_task.add_done_callback(lambda _: progress_queue.put_nowait(_TOOL_DONE))
                 
-                # Monitor for progress events and tool completion
-                while not tool_task.done():
-                    try:
-                        # Wait for progress event with short timeout
-                        progress_event = await asyncio.wait_for(
-                            progress_queue.get(), 
-                            timeout=0.1
-                        )
-                        
-                        if progress_event is None:
-                            # End signal
+                try:
+                    while True:
+                        progress_event = await progress_queue.get()
+                        # _TOOL_DONE: call finished; None: connection torn down
+                        if progress_event is _TOOL_DONE or progress_event is None:
                             break
-                        
-                        # Yield real-time progress event
                         yield progress_event
-                        
-                    except asyncio.TimeoutError:
-                        # No progress event, continue monitoring
-                        continue
-                
-                # Get the final result
-                result = await tool_task
+                    
+                    result = await tool_task
+                finally:
+                    # Stop the call before the scope hands the session back to the pool.
+                    if not tool_task.done():
+                        tool_task.cancel()
+                        with contextlib.suppress(asyncio.CancelledError, Exception):
+                            await tool_task
             end_time = time.time()
             
-            # Yield any remaining progress events
-            while True:
-                try:
-                    progress_event = progress_queue.get_nowait()
-                    if progress_event is None:
-                        break
+            # Progress reported after completion is still delivered
+            while not progress_queue.empty():
+                progress_event = progress_queue.get_nowait()
+                if progress_event is not None and progress_event is not _TOOL_DONE:
                     yield progress_event
-                except asyncio.QueueEmpty:
-                    break
-            
-            # Extract content from result
-            if hasattr(result, 'content') and result.content:
-                if len(result.content) == 1:
-                    content_item = result.content[0]
-                    if hasattr(content_item, 'text'):
-                        final_content = content_item.text
-                    elif hasattr(content_item, 'data'):
-                        final_content = content_item.data
-                    else:
-                        final_content = content_item
-                else:
-                    final_content = result.content
-            else:
-                final_content = result
             
-            # Return complete result
             yield {
                 "type": "complete_result",
-                "content": final_content,
+                "content": self._extract_result_content(result),
                 "tool_name": name,
                 "progress_token": progress_token,
                 "timestamp": end_time,
@@ -530,9 +532,11 @@ class MCPClient:
                 "transport": "streamable_http_with_real_notifications"
             }
         finally:
-            # Clean up progress handler
-            if progress_token in self._progress_handlers:
-                del self._progress_handlers[progress_token]
+            self._progress_handlers.pop(progress_token, None)
+            if tool_task is not None and not tool_task.done():
+                tool_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await tool_task
     
     @property
     def is_connected(self) -> bool:
@@ -18,6 +18,20 @@ class MCPServerConfig:
         endpoint: Server endpoint URL (e.g., "http://localhost:8000/mcp")
         headers: Optional HTTP headers for authentication and custom headers
         timeout: Request timeout in seconds (default: 30)
+        session_pool_max_per_key: Maximum pooled sessions open at once for the
+            same per-request header set (default: 4)
+        session_pool_max_idle: Maximum idle pooled sessions kept across all
+            header sets (default: 16)
+        session_idle_timeout: Seconds an idle pooled session is kept before it
+            is closed (default: 300)
+        session_health_check_interval: Idle seconds after which a pooled
+            session is pinged before reuse (default: 30)
+        max_concurrent_calls: Maximum tool calls in flight against this server;
+            0 disables the limit (default: 8)
+        rate_limit_per_second: Sustained tool calls per second admitted to
+            this server; 0 disables rate limiting (default: 0)
+        rate_limit_burst: Calls admitted back-to-back before the rate limit
+            applies (default: 1)
     
     Example:
         >>> config = MCPServerConfig(
@@ -36,6 +50,13 @@ class MCPServerConfig:
     timeout: int = 30
     max_connect_retries: int = 3
     retry_backoff_seconds: float = 5.0
+    session_pool_max_per_key: int = 4
+    session_pool_max_idle: int = 16
+    session_idle_timeout: float = 300.0
+    session_health_check_interval: float = 30.0
+    max_concurrent_calls: int = 8
+    rate_limit_per_second: float = 0.0
+    rate_limit_burst: int = 1
     
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
@@ -43,6 +64,8 @@ class MCPServerConfig:
         self._validate_endpoint()
         self._validate_timeout()
         self._validate_retries()
+        self._validate_session_pool()
+        self._validate_call_limits()
     
     def _validate_name(self) -> None:
         """Validate server name field.
@@ -116,6 +139,26 @@ class MCPServerConfig:
             raise ValueError("retry_backoff_seconds must be a number")
         if self.retry_backoff_seconds < 0:
             raise ValueError("retry_backoff_seconds cannot be negative")
+
+    def _validate_session_pool(self) -> None:
+        """Validate header-scoped session pool settings."""
+        for field_name in ("session_pool_max_per_key", "session_pool_max_idle"):
+            value = getattr(self, field_name)
+            if not isinstance(value, int) or value <= 0:
+                raise ValueError(f"{field_name} must be a positive integer")
+        for field_name in ("session_idle_timeout", "session_health_check_interval"):
+            value = getattr(self, field_name)
+            if not isinstance(value, (int, float)) or value < 0:
+                raise ValueError(f"{field_name} must be a non-negative number")
+
+    def _validate_call_limits(self) -> None:
+        """Validate per-server tool call concurrency and rate limits."""
+        if not isinstance(self.max_concurrent_calls, int) or self.max_concurrent_calls < 0:
+            raise ValueError("max_concurrent_calls must be a non-negative integer")
+        if not isinstance(self.rate_limit_per_second, (int, float)) or self.rate_limit_per_second < 0:
+            raise ValueError("rate_limit_per_second must be a non-negative number")
+        if not isinstance(self.rate_limit_burst, int) or self.rate_limit_burst <= 0:
+            raise ValueError("rate_limit_burst must be a positive integer")
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary format.
@@ -130,6 +173,13 @@ class MCPServerConfig:
             "timeout": self.timeout,
             "max_connect_retries": self.max_connect_retries,
             "retry_backoff_seconds": self.retry_backoff_seconds,
+            "session_pool_max_per_key": self.session_pool_max_per_key,
+            "session_pool_max_idle": self.session_pool_max_idle,
+            "session_idle_timeout": self.session_idle_timeout,
+            "session_health_check_interval": self.session_health_check_interval,
+            "max_concurrent_calls": self.max_concurrent_calls,
+            "rate_limit_per_second": self.rate_limit_per_second,
+            "rate_limit_burst": self.rate_limit_burst,
         }
     
     @classmethod
@@ -162,6 +212,13 @@ class MCPServerConfig:
         timeout = data.get("timeout", 30)
         max_connect_retries = data.get("max_connect_retries", 3)
         retry_backoff_seconds = data.get("retry_backoff_seconds", 5.0)
+        session_pool_max_per_key = data.get("session_pool_max_per_key", 4)
+        session_pool_max_idle = data.get("session_pool_max_idle", 16)
+        session_idle_timeout = data.get("session_idle_timeout", 300.0)
+        session_health_check_interval = data.get("session_health_check_interval", 30.0)
+        max_concurrent_calls = data.get("max_concurrent_calls", 8)
+        rate_limit_per_second = data.get("rate_limit_per_second", 0.0)
+        rate_limit_burst = data.get("rate_limit_burst", 1)
         
         # Validate headers type
         if not isinstance(headers, dict):
@@ -179,4 +236,11 @@ class MCPServerConfig:
             timeout=timeout,
             max_connect_retries=max_connect_retries,
             retry_backoff_seconds=retry_backoff_seconds,
+            session_pool_max_per_key=session_pool_max_per_key,
+            session_pool_max_idle=session_pool_max_idle,
+            session_idle_timeout=session_idle_timeout,
+            session_health_check_interval=session_health_check_interval,
+            max_concurrent_calls=max_concurrent_calls,
+            rate_limit_per_second=rate_limit_per_second,
+            rate_limit_burst=rate_limit_burst,
         )
@@ -0,0 +1,330 @@
+# -*- coding: utf-8 -*-
+"""Header-aware session pool for MCP server connections."""
+
+import asyncio
+import contextlib
+import hashlib
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+)
+
+SessionOpener = Callable[[Dict[str, str]], AsyncContextManager[Any]]
+
+
+def header_fingerprint(headers: Optional[Mapping[str, Any]]) -> str:
+    """Return a stable fingerprint for a set of request headers.
+
+    Header names are compared case-insensitively and surrounding whitespace is
+    ignored, so semantically identical header sets map to the same pool key.
+
+    Args:
+        headers: Header mapping (may be empty or None)
+
+    Returns:
+        Hex digest identifying the normalized header set
+    """
+    digest = hashlib.sha256()
+    if headers:
+        normalized = sorted(
+            (str(name).strip().lower(), str(value).strip())
+            for name, value in headers.items()
+        )
+        for name, value in normalized:
+            digest.update(name.encode("utf-8"))
+            digest.update(b"\x00")
+            digest.update(value.encode("utf-8"))
+            digest.update(b"\x01")
+    return digest.hexdigest()
+
+
+class _PooledSession:
+    """Initialized MCP session whose transport is owned by a dedicated task.
+
+    The streamable HTTP transport runs inside an anyio task group, which must
+    be exited from the same task that entered it. Each pooled session is
+    therefore opened and closed by its own owner task, independent of the
+    caller tasks that borrow it.
+    """
+
+    def __init__(self, key: str, opener: SessionOpener, headers: Dict[str, str]):
+        self.key = key
+        self.session: Any = None
+        self.last_used = time.monotonic()
+        self.generation = 0
+        self._opener = opener
+        self._headers = headers
+        self._ready: Optional[asyncio.Future] = None
+        self._closing: Optional[asyncio.Event] = None
+        self._owner: Optional[asyncio.Task] = None
+
+    async def open(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._ready = loop.create_future()
+        self._closing = asyncio.Event()
+        self._owner = asyncio.create_task(self._run())
+        try:
+            self.session = await self._ready
+        except BaseException:
+            # Failed or cancelled while connecting: do not leave the owner running.
+            owner, self._owner = self._owner, None
+            owner.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await owner
+            raise
+        self.last_used = time.monotonic()
+
+    async def _run(self) -> None:
+        try:
+            async with self._opener(self._headers) as session:
+                self._ready.set_result(session)
+                await self._closing.wait()
+        except asyncio.CancelledError:
+            if not self._ready.done():
+                self._ready.cancel()
+            raise
+        except Exception as exc:
+            if not self._ready.done():
+                self._ready.set_exception(exc)
+
+    async def close(self, timeout: float = 5.0) -> None:
+        if self._closing is not None:
+            self._closing.set()
+        owner = self._owner
+        self._owner = None
+        self.session = None
+        if owner is None or owner.done():
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(owner), timeout=timeout)
+        except (asyncio.TimeoutError, Exception):
+            owner.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await owner
+
+
+class MCPSessionPool:
+    """Bounded pool of initialized MCP sessions keyed by header fingerprint.
+
+    Sessions are checked out for the duration of a call and returned afterwards;
+    a session whose call raised is discarded instead of being reused. Each
+    fingerprint may hold at most ``max_per_key`` sessions at once and further
+    callers wait for one to be released. Idle sessions are evicted after
+    ``idle_timeout`` seconds, and the least recently used idle sessions are
+    closed once more than ``max_idle_sessions`` are parked. Sessions that sat
+    idle for longer than ``health_check_interval`` are pinged before reuse.
+    While any session is parked, a background sweep closes expired sessions
+    every ``sweep_interval`` seconds, so an idle server's connections are
+    released even when no further calls arrive.
+
+    Attributes:
+        max_per_key: Maximum concurrently open sessions per header fingerprint
+        max_idle_sessions: Maximum idle sessions kept across all fingerprints
+        idle_timeout: Seconds an idle session is kept before eviction
+        health_check_interval: Idle seconds after which a session is probed
+    """
+
+    def __init__(
+        self,
+        opener: SessionOpener,
+        *,
+        max_per_key: int = 4,
+        max_idle_sessions: int = 16,
+        idle_timeout: float = 300.0,
+        health_check_interval: float = 30.0,
+        probe_timeout: float = 5.0,
+        sweep_interval: Optional[float] = None,
+    ):
+        """Initialize the pool.
+
+        Args:
+            opener: Factory returning an async context manager that yields an
+                initialized session for the given headers
+            max_per_key: Maximum concurrently open sessions per fingerprint
+            max_idle_sessions: Maximum idle sessions across all fingerprints
+            idle_timeout: Seconds an idle session is kept before eviction
+            health_check_interval: Idle seconds after which a session is pinged
+            probe_timeout: Seconds to wait for a health probe response
+            sweep_interval: Seconds between background idle sweeps; defaults
+                to half of ``idle_timeout`` (at least one second)
+        """
+        self.max_per_key = max_per_key
+        self.max_idle_sessions = max_idle_sessions
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.probe_timeout = probe_timeout
+        self.sweep_interval = (
+            sweep_interval if sweep_interval is not None else max(1.0, idle_timeout / 2)
+        )
+        self._opener = opener
+        self._sweeper: Optional[asyncio.Task] = None
+        self._idle: Dict[str, Deque[_PooledSession]] = {}
+        self._idle_count = 0
+        self._limiters: Dict[str, asyncio.Semaphore] = {}
+        self._refs: Dict[str, int] = {}
+        self._borrowed = 0
+        self._generation = 0
+        self._stats: Dict[str, int] = {
+            "created": 0,
+            "reused": 0,
+            "evicted": 0,
+            "discarded": 0,
+            "probe_failures": 0,
+        }
+        self._logger = logging.getLogger(__name__)
+
+    @asynccontextmanager
+    async def session(self, headers: Dict[str, str]) -> AsyncIterator[Any]:
+        """Borrow a warm session for ``headers``, opening one if necessary."""
+        key = header_fingerprint(headers)
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            limiter = asyncio.Semaphore(self.max_per_key)
+            self._limiters[key] = limiter
+
+        self._refs[key] = self._refs.get(key, 0) + 1
+        entry: Optional[_PooledSession] = None
+        reusable = False
+        acquired = False
+        try:
+            await limiter.acquire()
+            acquired = True
+            self._borrowed += 1
+            await self._evict_expired()
+            entry = await self._checkout(key, headers)
+            yield entry.session
+            reusable = True
+        finally:
+            if acquired:
+                self._borrowed -= 1
+            if entry is not None:
+                if reusable and entry.generation == self._generation:
+                    await self._checkin(entry)
+                else:
+                    self._stats["discarded"] += 1
+                    await entry.close()
+            if acquired:
+                limiter.release()
+            self._refs[key] -= 1
+            if not self._refs[key]:
+                del self._refs[key]
+                if key not in self._idle:
+                    self._limiters.pop(key, None)
+
+    async def _checkout(self, key: str, headers: Dict[str, str]) -> _PooledSession:
+        idle = self._idle.get(key)
+        while idle:
+            entry = idle.pop()
+            self._idle_count -= 1
+            if not idle:
+                del self._idle[key]
+            if await self._is_healthy(entry):
+                self._stats["reused"] += 1
+                return entry
+            self._stats["probe_failures"] += 1
+            await entry.close()
+            idle = self._idle.get(key)
+
+        entry = _PooledSession(key, self._opener, dict(headers))
+        entry.generation = self._generation
+        await entry.open()
+        self._stats["created"] += 1
+        return entry
+
+    async def _is_healthy(self, entry: _PooledSession) -> bool:
+        if time.monotonic() - entry.last_used < self.health_check_interval:
+            return True
+        ping = getattr(entry.session, "send_ping", None)
+        if ping is None:
+            return True
+        try:
+            await asyncio.wait_for(ping(), timeout=self.probe_timeout)
+            return True
+        except Exception as exc:
+            self._logger.debug("Pooled MCP session failed health probe: %s", exc)
+            return False
+
+    async def _checkin(self, entry: _PooledSession) -> None:
+        entry.last_used = time.monotonic()
+        self._idle.setdefault(entry.key, deque()).append(entry)
+        self._idle_count += 1
+        self._ensure_sweeper()
+
+        overflow: List[_PooledSession] = []
+        while self._idle_count > self.max_idle_sessions:
+            oldest_key = min(self._idle, key=lambda k: self._idle[k][0].last_used)
+            overflow.append(self._pop_oldest(oldest_key))
+        await self._close_evicted(overflow)
+
+    async def _evict_expired(self) -> None:
+        cutoff = time.monotonic() - self.idle_timeout
+        expired: List[_PooledSession] = []
+        for key in list(self._idle):
+            while key in self._idle and self._idle[key][0].last_used < cutoff:
+                expired.append(self._pop_oldest(key))
+        await self._close_evicted(expired)
+
+    def _ensure_sweeper(self) -> None:
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.get_running_loop().create_task(self._sweep_idle())
+
+    async def _sweep_idle(self) -> None:
+        # Runs only while sessions are parked; the next check-in restarts it.
+        while self._idle:
+            await asyncio.sleep(self.sweep_interval)
+            try:
+                await self._evict_expired()
+            except Exception as exc:  # pragma: no cover - defensive
+                self._logger.debug("Idle MCP session sweep failed: %s", exc)
+
+    def _pop_oldest(self, key: str) -> _PooledSession:
+        idle = self._idle[key]
+        entry = idle.popleft()
+        self._idle_count -= 1
+        if not idle:
+            del self._idle[key]
+            if key not in self._refs:
+                self._limiters.pop(key, None)
+        return entry
+
+    async def _close_evicted(self, entries: List[_PooledSession]) -> None:
+        if not entries:
+            return
+        self._stats["evicted"] += len(entries)
+        await asyncio.gather(*(entry.close() for entry in entries))
+
+    async def close(self) -> None:
+        """Close all idle sessions; borrowed sessions close when released.
+
+        The pool stays usable afterwards and opens fresh sessions on demand.
+        """
+        self._generation += 1
+        sweeper, self._sweeper = self._sweeper, None
+        if sweeper is not None and not sweeper.done():
+            sweeper.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await sweeper
+        entries = [entry for idle in self._idle.values() for entry in idle]
+        self._idle.clear()
+        self._idle_count = 0
+        if entries:
+            await asyncio.gather(*(entry.close() for entry in entries))
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return pool counters plus current idle/in-use totals."""
+        stats = dict(self._stats)
+        stats["idle"] = self._idle_count
+        stats["in_use"] = self._borrowed
+        stats["keys"] = len(set(self._idle) | set(self._refs))
+        return stats
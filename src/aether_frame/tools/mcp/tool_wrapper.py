@@ -12,6 +12,7 @@ from aether_frame.contracts.responses import ToolStatus
 from aether_frame.contracts.streaming import TaskStreamChunk
 from aether_frame.tools.base.tool import Tool
 from aether_frame.tools.mcp.client import MCPClient, MCPConnectionError, MCPToolError
+from aether_frame.tools.schema_compiler import compile_schema
 
 
 class MCPTool(Tool):
@@ -52,6 +53,8 @@ class MCPTool(Tool):
         self.tool_description = tool_description
         self.tool_schema = tool_schema
         self.parameters_schema = tool_schema
+        # Compiled once at discovery; shared with ADK signature generation
+        self.compiled_schema = compile_schema(tool_schema)
         self._initialized = True  # MCP tools are initialized when created
     
     async def initialize(self, config: Optional[Dict[str, Any]] = None):
@@ -307,30 +310,10 @@ class MCPTool(Tool):
         Returns:
             True if parameters are valid
         """
-        # Basic validation - check if schema has required fields
         if not self.tool_schema:
             return True  # No schema means all parameters are valid
-        
-        schema_properties = self.tool_schema.get("properties", {})
-        required_fields = self.tool_schema.get("required", [])
-        
-        # Check if all required fields are present
-        for field in required_fields:
-            if field not in parameters:
-                return False
-        
-        # Basic type checking for known properties
-        for param_name, param_value in parameters.items():
-            if param_name in schema_properties:
-                expected_type = schema_properties[param_name].get("type")
-                if expected_type == "string" and not isinstance(param_value, str):
-                    return False
-                elif expected_type == "number" and not isinstance(param_value, (int, float)):
-                    return False
-                elif expected_type == "boolean" and not isinstance(param_value, bool):
-                    return False
-        
-        return True
+
+        return self.compiled_schema.validate(parameters)
     
     async def cleanup(self):
         """Cleanup tool resources.
@@ -2,7 +2,7 @@
 """Tool resolver for converting tool names to UniversalTool objects."""
 
 import logging
-from typing import List, Optional, Dict, Any
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 from aether_frame.contracts.contexts import UniversalTool, UserContext
 from aether_frame.tools.service import ToolService
@@ -16,6 +16,84 @@ class ToolNotFoundError(Exception):
     pass
 
 
+class _TrigramIndex:
+    """Substring lookup over a list of strings via character trigrams."""
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, Set[int]] = {}
+        self._texts: List[str] = []
+
+    def add(self, text: str) -> None:
+        position = len(self._texts)
+        self._texts.append(text)
+        for start in range(len(text) - 2):
+            self._postings.setdefault(text[start:start + 3], set()).add(position)
+
+    def find(self, query: str) -> List[int]:
+        """Return positions, in insertion order, of texts containing ``query``."""
+        if len(query) < 3:
+            candidates: Iterable[int] = range(len(self._texts))
+        else:
+            grams = [query[start:start + 3] for start in range(len(query) - 2)]
+            postings = sorted((self._postings.get(gram, set()) for gram in grams), key=len)
+            candidates = sorted(set.intersection(*postings)) if postings[0] else []
+        return [position for position in candidates if query in self._texts[position]]
+
+
+class ToolNameIndex:
+    """
+    Lookup structures over one snapshot of the tool registry.
+
+    Holds the exact name map, a map from every dotted suffix to the tools
+    ending with it, and trigram indexes for partial and similar-name
+    matches. ``UniversalTool`` conversions are memoized per tool instance and
+    carried over to the next snapshot for tools that did not change.
+    """
+
+    def __init__(
+        self,
+        tools: Dict[str, Any],
+        generation: Optional[int] = None,
+        previous: Optional["ToolNameIndex"] = None,
+    ) -> None:
+        self.generation = generation
+        self.tools = dict(tools)
+        self.names: List[str] = list(self.tools)
+        self.suffixes: Dict[str, List[str]] = {}
+        self._short_names = _TrigramIndex()
+        self._lower_names = _TrigramIndex()
+        for full_name in self.names:
+            parts = full_name.split(".")
+            for start in range(1, len(parts)):
+                self.suffixes.setdefault(".".join(parts[start:]), []).append(full_name)
+            self._short_names.add(parts[-1])
+            self._lower_names.add(full_name.lower())
+        self._universal: Dict[str, Tuple[Any, UniversalTool]] = {}
+        if previous is not None:
+            for full_name, (instance, universal_tool) in previous._universal.items():
+                if self.tools.get(full_name) is instance:
+                    self._universal[full_name] = (instance, universal_tool)
+
+    def universal(
+        self, full_name: str, instance: Any, convert: Callable[[Any, str], UniversalTool]
+    ) -> UniversalTool:
+        """Return the memoized ``UniversalTool`` for ``instance``, converting on first use."""
+        cached = self._universal.get(full_name)
+        if cached is not None and cached[0] is instance:
+            return cached[1]
+        universal_tool = convert(instance, full_name)
+        self._universal[full_name] = (instance, universal_tool)
+        return universal_tool
+
+    def partial_matches(self, tool_name: str) -> List[str]:
+        """Tools whose last name segment contains ``tool_name``."""
+        return [self.names[position] for position in self._short_names.find(tool_name)]
+
+    def similar_names(self, tool_name: str, limit: int = 3) -> List[str]:
+        """Tools whose full name contains ``tool_name``, ignoring case."""
+        return [self.names[position] for position in self._lower_names.find(tool_name.lower())][:limit]
+
+
 class ToolResolver:
     """Tool resolver for converting tool names to UniversalTool objects.
     
@@ -35,6 +113,7 @@ class ToolResolver:
         """
         self.tool_service = tool_service
         self._logger = logger
+        self._index: Optional[ToolNameIndex] = None
     
     async def resolve_tools(
         self, 
@@ -54,15 +133,14 @@ class ToolResolver:
             ToolNotFoundError: When a tool is not found or not accessible
         """
         resolved_tools = []
-        available_tools = await self.tool_service.get_tools_dict()
+        index = await self._get_index()
         
         self._logger.debug(f"Resolving tools: {tool_names}")
-        self._logger.debug(f"Available tools: {list(available_tools.keys())}")
         
         for tool_name in tool_names:
             try:
                 universal_tool = await self._resolve_single_tool(
-                    tool_name, available_tools, user_context
+                    tool_name, index, user_context
                 )
                 resolved_tools.append(universal_tool)
                 self._logger.debug(f"✅ Resolved '{tool_name}' to '{universal_tool.name}'")
@@ -73,18 +151,34 @@ class ToolResolver:
         
         self._logger.info(f"Successfully resolved {len(resolved_tools)} tools")
         return resolved_tools
+
+    async def _get_index(self) -> ToolNameIndex:
+        """Return the name index, rebuilding it when the registry changed.
+
+        ``ToolService.registry_generation`` changes on every registration; a
+        service without it is re-read on every call.
+        """
+        generation = getattr(self.tool_service, "registry_generation", None)
+        if not isinstance(generation, int):
+            generation = None
+        index = self._index
+        if index is None or generation is None or index.generation != generation:
+            available_tools = await self.tool_service.get_tools_dict()
+            index = ToolNameIndex(available_tools, generation=generation, previous=index)
+            self._index = index
+        return index
     
     async def _resolve_single_tool(
         self, 
         tool_name: str,
-        available_tools: Dict[str, Any],
+        index: ToolNameIndex,
         user_context: Optional[UserContext] = None
     ) -> UniversalTool:
         """Resolve a single tool name to UniversalTool object.
         
         Args:
             tool_name: Tool name to resolve
-            available_tools: Dict of available tools from ToolService
+            index: Name index over the available tools
             user_context: Optional user context for permission checks
             
         Returns:
@@ -94,10 +188,12 @@ class ToolResolver:
             ToolNotFoundError: When tool is not found or not accessible
         """
         
+        available_tools = index.tools
+
         # Strategy 1: Try exact full name match
         if tool_name in available_tools:
             tool_instance = available_tools[tool_name]
-            universal_tool = self._tool_to_universal(tool_instance, tool_name)
+            universal_tool = index.universal(tool_name, tool_instance, self._tool_to_universal)
             
             # Check permissions
             if await self._check_tool_permission(universal_tool, user_context):
@@ -108,16 +204,13 @@ class ToolResolver:
                 )
         
         # Strategy 2: Try simplified name matching (find tools ending with .{name})
-        simplified_candidates = [
-            full_name for full_name in available_tools.keys()
-            if full_name.endswith(f".{tool_name}")
-        ]
+        simplified_candidates = index.suffixes.get(tool_name, [])
         
         if simplified_candidates:
             # If multiple candidates, prefer the first one (could add priority logic later)
             selected_tool_name = simplified_candidates[0]
             tool_instance = available_tools[selected_tool_name]
-            universal_tool = self._tool_to_universal(tool_instance, selected_tool_name)
+            universal_tool = index.universal(selected_tool_name, tool_instance, self._tool_to_universal)
             
             # Check permissions
             if await self._check_tool_permission(universal_tool, user_context):
@@ -136,15 +229,12 @@ class ToolResolver:
                 )
         
         # Strategy 3: Try partial matching (contains the name)
-        partial_candidates = [
-            full_name for full_name in available_tools.keys()
-            if tool_name in full_name.split('.')[-1]  # Match against the final part
-        ]
+        partial_candidates = index.partial_matches(tool_name)  # Match against the final part
         
         if partial_candidates:
             selected_tool_name = partial_candidates[0]
             tool_instance = available_tools[selected_tool_name]
-            universal_tool = self._tool_to_universal(tool_instance, selected_tool_name)
+            universal_tool = index.universal(selected_tool_name, tool_instance, self._tool_to_universal)
             
             if await self._check_tool_permission(universal_tool, user_context):
                 self._logger.debug(
@@ -162,7 +252,7 @@ class ToolResolver:
                 )
         
         # No matches found
-        similar_tools = self._find_similar_tools(tool_name, available_tools.keys())
+        similar_tools = index.similar_names(tool_name)
         suggestion_text = f". Did you mean: {', '.join(similar_tools)}" if similar_tools else ""
         
         raise ToolNotFoundError(
@@ -244,30 +334,6 @@ class ToolResolver:
         self._logger.warning(f"Access denied for tool '{tool.name}' for user context")
         return False
     
-    def _find_similar_tools(self, target_name: str, available_names: List[str]) -> List[str]:
-        """Find tools with similar names for suggestions.
-        
-        Args:
-            target_name: The name being searched for
-            available_names: List of available tool names
-            
-        Returns:
-            List of similar tool names (up to 3)
-        """
-        similar = []
-        target_lower = target_name.lower()
-        
-        for name in available_names:
-            # Check if target is a substring of the tool name
-            if target_lower in name.lower():
-                similar.append(name)
-            # Check if the last part of the tool name contains target
-            elif target_lower in name.split('.')[-1].lower():
-                similar.append(name)
-        
-        # Return up to 3 most similar matches
-        return similar[:3]
-    
     async def list_available_tools(
         self, 
         namespace_filter: Optional[str] = None,
@@ -283,10 +349,11 @@ class ToolResolver:
             List of available UniversalTool objects
         """
         available_tools = await self.tool_service.get_tools_dict(namespace=namespace_filter)
+        index = await self._get_index()
         universal_tools = []
         
         for tool_name, tool_instance in available_tools.items():
-            universal_tool = self._tool_to_universal(tool_instance, tool_name)
+            universal_tool = index.universal(tool_name, tool_instance, self._tool_to_universal)
             
             # Apply permission check
             if not await self._check_tool_permission(universal_tool, user_context):
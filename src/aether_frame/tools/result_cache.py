@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""
+Opt-in result cache for idempotent tool calls.
+
+Tools are cached only when a ``ToolCachePolicy`` is declared for them, either
+as a ``cache_policy`` attribute on the tool or through the ``cache_tools``
+entry of an ``mcp_servers`` config. Entries are keyed by the tool's full
+name, its canonicalized parameters and the caller headers named by the
+policy, taken from the headers the tool itself would send, so results never
+cross users whose headers differ. Concurrent identical calls share one
+execution, and only successful results are stored.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from ..contracts import ToolRequest, ToolResult, ToolStatus, UserContext
+
+CacheKey = Tuple[str, str, Tuple[Tuple[str, str], ...]]
+
+DEFAULT_VARY_HEADERS = ("Authorization", "X-AF-User-ID", "X-AF-Session-Token", "X-AF-Permissions")
+
+
+@dataclass(frozen=True)
+class ToolCachePolicy:
+    """
+    Caching declaration for one tool.
+
+    Attributes:
+        ttl_seconds: How long a successful result is served from the cache.
+        vary_headers: Request headers (case-insensitive) whose values are part
+            of the cache key; by default the caller's credentials, user id
+            and permissions.
+    """
+
+    ttl_seconds: float = 60.0
+    vary_headers: Tuple[str, ...] = DEFAULT_VARY_HEADERS
+
+    def __post_init__(self) -> None:
+        if self.ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+
+    @classmethod
+    def from_config(cls, value: Any) -> "ToolCachePolicy":
+        """Build a policy from a TTL number or a ``{"ttl_seconds", "vary_headers"}`` dict."""
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return cls(ttl_seconds=float(value))
+        if isinstance(value, dict):
+            vary = value.get("vary_headers", DEFAULT_VARY_HEADERS)
+            return cls(
+                ttl_seconds=float(value.get("ttl_seconds", 60.0)),
+                vary_headers=tuple(str(header) for header in vary),
+            )
+        raise ValueError(f"Unsupported tool cache policy: {value!r}")
+
+
+@dataclass
+class ToolCacheStats:
+    """Cache counters."""
+
+    hits: int = 0
+    misses: int = 0
+    shared: int = 0
+    evictions: int = 0
+
+
+def build_cache_key(
+    full_name: str, tool_request: ToolRequest, policy: ToolCachePolicy, tool: Any = None
+) -> CacheKey:
+    """
+    Return the cache key for ``tool_request`` under ``policy``.
+
+    Header values come from ``tool._build_request_headers`` when the tool
+    builds per-request headers (as MCP tools do), so the key varies on exactly
+    what is sent downstream.
+    """
+    parameters = json.dumps(
+        tool_request.parameters or {}, sort_keys=True, separators=(",", ":"), default=str
+    )
+    headers = _request_headers(tool_request, tool)
+    vary = tuple(
+        (name.lower(), headers.get(name.lower(), "")) for name in sorted(policy.vary_headers, key=str.lower)
+    )
+    return full_name, parameters, vary
+
+
+def _request_headers(tool_request: ToolRequest, tool: Any = None) -> Dict[str, str]:
+    build_headers = getattr(tool, "_build_request_headers", None)
+    if callable(build_headers):
+        return {str(key).lower(): str(value) for key, value in build_headers(tool_request).items()}
+
+    headers: Dict[str, str] = {}
+    metadata_headers = (tool_request.metadata or {}).get("mcp_headers")
+    if isinstance(metadata_headers, dict):
+        for key, value in metadata_headers.items():
+            if value is not None:
+                headers[str(key).lower()] = str(value)
+    user_context = tool_request.user_context
+    if isinstance(user_context, UserContext) and user_context.user_id:
+        headers.setdefault("x-af-user-id", str(user_context.user_id))
+    return headers
+
+
+class ToolResultCache:
+    """LRU cache of tool results with per-entry TTL and single-flight loading."""
+
+    def __init__(self, max_entries: int = 512, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max(0, int(max_entries))
+        self._clock = clock
+        self._entries: "OrderedDict[CacheKey, Tuple[float, float, ToolResult]]" = OrderedDict()
+        self._inflight: Dict[CacheKey, asyncio.Future] = {}
+        self.stats = ToolCacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_execute(
+        self,
+        key: CacheKey,
+        ttl_seconds: float,
+        execute: Callable[[], Awaitable[ToolResult]],
+    ) -> ToolResult:
+        """
+        Serve ``key`` from the cache, join an identical call in flight, or run ``execute``.
+
+        The returned result is a deep copy whose ``metadata["cache"]``
+        records whether it was a hit, shared with a concurrent call, or a
+        miss, so callers cannot modify the stored entry.
+        """
+        now = self._clock()
+        entry = self._entries.get(key)
+        if entry is not None:
+            stored_at, expires_at, result = entry
+            if expires_at > now:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return _annotate(result, hit=True, age=now - stored_at)
+            del self._entries[key]
+
+        pending = self._inflight.get(key)
+        while pending is not None:
+            # asyncio.wait raises only when this task is cancelled and leaves
+            # the shared execution running for the other callers.
+            await asyncio.wait((pending,))
+            if not pending.cancelled():
+                result = pending.result()
+                self.stats.shared += 1
+                return _annotate(result, hit=True, shared=True)
+            # The owner was cancelled: the first waiter to resume takes over
+            # and the others join its execution.
+            pending = self._inflight.get(key)
+
+        self.stats.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await execute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Waiters re-raise it; mark it retrieved so an unshared failure is not logged.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            if result.status == ToolStatus.SUCCESS:
+                self._store(key, ttl_seconds, result)
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+        return _annotate(result, hit=False)
+
+    def invalidate(self, full_name: Optional[str] = None) -> None:
+        """Drop every entry, or only the entries of ``full_name``."""
+        if full_name is None:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if key[0] == full_name]:
+            del self._entries[key]
+
+    def _store(self, key: CacheKey, ttl_seconds: float, result: ToolResult) -> None:
+        if self.max_entries <= 0:
+            return
+        now = self._clock()
+        self._entries[key] = (now, now + ttl_seconds, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+
+def _annotate(result: ToolResult, *, hit: bool, age: Optional[float] = None, shared: bool = False) -> ToolResult:
+    cache_info: Dict[str, Any] = {"hit": hit}
+    if shared:
+        cache_info["shared"] = True
+    if age is not None:
+        cache_info["age_seconds"] = round(age, 3)
+    result = copy.deepcopy(result)
+    return replace(result, metadata={**(result.metadata or {}), "cache": cache_info})
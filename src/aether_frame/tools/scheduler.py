@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+Per-namespace admission control for tool calls.
+
+``ToolCallScheduler`` gates calls to each configured namespace (one MCP
+server per namespace) behind a concurrency semaphore and an optional token
+bucket, so a burst of function calls from one model turn cannot open more
+requests against a server than its ``MCPServerConfig`` allows. Namespaces
+without limits pass straight through. Time spent waiting for a slot is
+reported as ``queue_wait`` latency and the number of waiting calls as the
+``tool_queue`` gauge.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from ..observability.latency_sketch import StreamingStats
+from ..observability.metrics_backend import adjust_in_flight, observe_stage_latency
+
+
+class TokenBucket:
+    """Token bucket refilled at ``rate`` tokens per second up to ``burst``."""
+
+    def __init__(self, rate: float, burst: int = 1, clock: Callable[[], float] = time.monotonic):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._updated = clock()
+
+    def reserve(self) -> float:
+        """
+        Take one token and return the seconds to wait before using it.
+
+        Tokens may go negative: each caller reserves its place immediately, so
+        concurrent waiters are released in reservation order without polling.
+        """
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def refund(self) -> None:
+        """Return a reserved token that was never used."""
+        self._tokens = min(self.burst, self._tokens + 1)
+
+
+@dataclass
+class NamespaceQueueStats:
+    """Admission counters for one namespace."""
+
+    queued: int = 0
+    running: int = 0
+    admitted: int = 0
+    wait: StreamingStats = field(default_factory=StreamingStats)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "queued": self.queued,
+            "running": self.running,
+            "admitted": self.admitted,
+            "wait_mean": self.wait.mean,
+            "wait_max": self.wait.maximum,
+        }
+
+
+class _NamespaceLimiter:
+    def __init__(self, max_concurrent: int, bucket: Optional[TokenBucket]):
+        self.semaphore = asyncio.Semaphore(max_concurrent) if max_concurrent > 0 else None
+        self.bucket = bucket
+        self.stats = NamespaceQueueStats()
+
+
+class ToolCallScheduler:
+    """Applies per-namespace concurrency and rate limits to tool calls."""
+
+    def __init__(self) -> None:
+        self._limiters: Dict[str, _NamespaceLimiter] = {}
+
+    def configure(
+        self,
+        namespace: str,
+        *,
+        max_concurrent: int = 0,
+        rate_per_second: float = 0.0,
+        burst: int = 1,
+    ) -> None:
+        """
+        Set the limits for ``namespace``; zero values disable that limit.
+
+        Reconfiguring replaces the limiter, so calls already admitted under
+        the old limits are not counted against the new ones.
+        """
+        bucket = TokenBucket(rate_per_second, burst) if rate_per_second > 0 else None
+        if max_concurrent <= 0 and bucket is None:
+            self._limiters.pop(namespace, None)
+            return
+        self._limiters[namespace] = _NamespaceLimiter(max_concurrent, bucket)
+
+    def remove(self, namespace: str) -> None:
+        """Drop the limits for ``namespace``."""
+        self._limiters.pop(namespace, None)
+
+    @asynccontextmanager
+    async def slot(self, namespace: Optional[str]) -> AsyncIterator[None]:
+        """Hold an execution slot for one call to ``namespace``."""
+        limiter = self._limiters.get(namespace) if namespace else None
+        if limiter is None:
+            yield
+            return
+
+        stats = limiter.stats
+        start = time.perf_counter()
+        stats.queued += 1
+        adjust_in_flight("tool_queue", 1)
+        reserved = False
+        try:
+            if limiter.bucket is not None:
+                delay = limiter.bucket.reserve()
+                reserved = True
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            if limiter.semaphore is not None:
+                await limiter.semaphore.acquire()
+        except asyncio.CancelledError:
+            # A call cancelled before admission never used its token.
+            if reserved:
+                limiter.bucket.refund()
+            raise
+        finally:
+            stats.queued -= 1
+            adjust_in_flight("tool_queue", -1)
+
+        waited = time.perf_counter() - start
+        stats.wait.add(waited)
+        stats.admitted += 1
+        stats.running += 1
+        observe_stage_latency("queue_wait", waited, {"queue": f"tool:{namespace}"})
+        try:
+            yield
+        finally:
+            stats.running -= 1
+            if limiter.semaphore is not None:
+                limiter.semaphore.release()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return admission counters per limited namespace."""
+        return {namespace: limiter.stats.to_dict() for namespace, limiter in self._limiters.items()}
@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+"""
+Compiled JSON-Schema checks for tool parameters.
+
+``compile_schema`` turns a tool's parameter schema into a tree of small
+check functions once, so validating a call no longer walks the raw schema
+dict. Compiled schemas are cached by a hash of their canonical JSON, which
+lets every tool (and every agent build) sharing a schema reuse one object.
+
+Supported keywords: ``type`` (including type lists, with ``integer`` kept
+distinct from ``number``, integral floats such as ``5.0`` accepted as
+integers, and booleans rejected for both), ``enum``,
+``const``, ``properties``, ``required``, ``additionalProperties``,
+``items``, ``anyOf``, ``oneOf`` and ``allOf``. Other keywords are ignored.
+``None`` for an optional property is treated as absent, matching how
+optional parameters are stripped before they are sent to MCP servers.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Returns None when the value is valid, otherwise a short error message.
+Check = Callable[[Any, str], Optional[str]]
+
+SCHEMA_CACHE_SIZE = 1024
+
+_PYTHON_TYPES: Dict[str, type] = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "string": lambda value: isinstance(value, str),
+    "integer": lambda value: (isinstance(value, int) and not isinstance(value, bool))
+    or (isinstance(value, float) and value.is_integer()),
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "boolean": lambda value: isinstance(value, bool),
+    "array": lambda value: isinstance(value, list),
+    "object": lambda value: isinstance(value, dict),
+    "null": lambda value: value is None,
+}
+
+_COMBINATORS = ("anyOf", "oneOf", "allOf")
+
+
+@dataclass(frozen=True)
+class SchemaProperty:
+    """Top-level property of an object schema, as needed for call signatures."""
+
+    name: str
+    required: bool
+    default: Any = None
+    python_type: Optional[type] = None
+    type_name: str = "object"
+    description: str = ""
+
+
+@dataclass
+class CompiledSchema:
+    """
+    Validator and signature metadata compiled from one parameter schema.
+
+    Attributes:
+        digest: Hash of the canonical schema JSON.
+        schema: The schema the object was compiled from.
+        is_object: Whether the schema is ``"type": "object"`` with ``properties``.
+        properties: Top-level properties in declaration order, whether or not
+            the schema declares a type.
+        has_combinators: Whether ``anyOf``/``oneOf``/``allOf`` appear in the
+            schema, its properties or array items.
+    """
+
+    digest: str
+    schema: Dict[str, Any]
+    is_object: bool
+    properties: Tuple[SchemaProperty, ...]
+    has_combinators: bool
+    _check: Check = field(repr=False)
+    _derived: Dict[str, Any] = field(default_factory=dict, repr=False)
+
+    def validate(self, value: Any) -> bool:
+        """Return True when ``value`` satisfies the schema."""
+        return self._check(value, "$") is None
+
+    def first_error(self, value: Any) -> Optional[str]:
+        """Return the first validation error for ``value``, or None."""
+        return self._check(value, "$")
+
+    def derived(self, key: str, factory: Callable[["CompiledSchema"], Any]) -> Any:
+        """Compute a value from this schema once and cache it under ``key``."""
+        if key not in self._derived:
+            self._derived[key] = factory(self)
+        return self._derived[key]
+
+
+_CACHE: "OrderedDict[str, CompiledSchema]" = OrderedDict()
+
+
+def schema_digest(schema: Dict[str, Any]) -> str:
+    """Return a stable hash of ``schema``."""
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+
+def compile_schema(schema: Optional[Dict[str, Any]]) -> CompiledSchema:
+    """Return the cached compiled form of ``schema``, compiling it on first use."""
+    schema = schema if isinstance(schema, dict) else {}
+    digest = schema_digest(schema)
+    compiled = _CACHE.get(digest)
+    if compiled is not None:
+        _CACHE.move_to_end(digest)
+        return compiled
+
+    required = set(schema.get("required") or [])
+    properties = schema.get("properties")
+    if not isinstance(properties, dict):
+        properties = None
+    compiled = CompiledSchema(
+        digest=digest,
+        schema=schema,
+        is_object=schema.get("type") == "object" and properties is not None,
+        properties=tuple(
+            _describe_property(name, prop, name in required)
+            for name, prop in (properties.items() if properties is not None else ())
+        ),
+        has_combinators=_has_combinators(schema),
+        _check=_compile(schema),
+    )
+    _CACHE[digest] = compiled
+    while len(_CACHE) > SCHEMA_CACHE_SIZE:
+        _CACHE.popitem(last=False)
+    return compiled
+
+
+def _describe_property(name: str, prop: Any, required: bool) -> SchemaProperty:
+    prop = prop if isinstance(prop, dict) else {}
+    return SchemaProperty(
+        name=name,
+        required=required,
+        default=prop.get("default"),
+        python_type=_python_type(prop),
+        type_name=str(prop.get("type", "object")),
+        description=prop.get("description", ""),
+    )
+
+
+def _python_type(prop: Dict[str, Any]) -> Optional[type]:
+    for key in _COMBINATORS:
+        options = prop.get(key)
+        if not options:
+            continue
+        for option in options:
+            if isinstance(option, dict) and option.get("type") != "null":
+                resolved = _python_type(option)
+                if resolved is not None:
+                    return resolved
+        return None
+    schema_type = prop.get("type")
+    return _PYTHON_TYPES.get(schema_type) if isinstance(schema_type, str) else None
+
+
+def _has_combinators(schema: Any) -> bool:
+    if not isinstance(schema, dict):
+        return False
+    if any(schema.get(key) for key in _COMBINATORS):
+        return True
+    schema_type = schema.get("type")
+    if schema_type == "object":
+        return any(_has_combinators(prop) for prop in (schema.get("properties") or {}).values())
+    if schema_type == "array":
+        return _has_combinators(schema.get("items", {}))
+    return False
+
+
+def _compile(schema: Any) -> Check:
+    if not isinstance(schema, dict) or not schema:
+        return _accept
+
+    checks: List[Check] = []
+
+    schema_type = schema.get("type")
+    if schema_type:
+        names = [schema_type] if isinstance(schema_type, str) else list(schema_type)
+        type_checks = [_TYPE_CHECKS[name] for name in names if name in _TYPE_CHECKS]
+        if type_checks:
+            expected = "/".join(names)
+
+            def check_type(value: Any, path: str) -> Optional[str]:
+                if any(type_check(value) for type_check in type_checks):
+                    return None
+                return f"{path}: expected {expected}, got {type(value).__name__}"
+
+            checks.append(check_type)
+
+    if "enum" in schema:
+        allowed = list(schema["enum"])
+
+        def check_enum(value: Any, path: str) -> Optional[str]:
+            return None if _contains(allowed, value) else f"{path}: {value!r} is not one of {allowed!r}"
+
+        checks.append(check_enum)
+
+    if "const" in schema:
+        constant = schema["const"]
+
+        def check_const(value: Any, path: str) -> Optional[str]:
+            return None if _contains([constant], value) else f"{path}: expected {constant!r}"
+
+        checks.append(check_const)
+
+    if isinstance(schema.get("properties"), dict) or "required" in schema or (
+        "additionalProperties" in schema
+    ):
+        checks.append(_compile_object(schema))
+
+    if "items" in schema and isinstance(schema["items"], dict):
+        checks.append(_compile_array(schema["items"]))
+
+    for key in _COMBINATORS:
+        options = schema.get(key)
+        if options:
+            checks.append(_compile_combinator(key, [_compile(option) for option in options]))
+
+    if not checks:
+        return _accept
+    if len(checks) == 1:
+        return checks[0]
+
+    def check_all(value: Any, path: str) -> Optional[str]:
+        for check in checks:
+            error = check(value, path)
+            if error:
+                return error
+        return None
+
+    return check_all
+
+
+def _compile_object(schema: Dict[str, Any]) -> Check:
+    property_checks = {
+        name: _compile(prop) for name, prop in (schema.get("properties") or {}).items()
+    }
+    required = tuple(schema.get("required") or ())
+    additional = schema.get("additionalProperties", True)
+    additional_check = _compile(additional) if isinstance(additional, dict) else None
+
+    def check_object(value: Any, path: str) -> Optional[str]:
+        if not isinstance(value, dict):
+            return None
+        for name in required:
+            if name not in value:
+                return f"{path}: missing required property {name!r}"
+        for name, item in value.items():
+            check = property_checks.get(name)
+            if check is None:
+                if additional is False:
+                    return f"{path}: unexpected property {name!r}"
+                check = additional_check
+                if check is None:
+                    continue
+            if item is None and name not in required:
+                continue
+            error = check(item, f"{path}.{name}")
+            if error:
+                return error
+        return None
+
+    return check_object
+
+
+def _compile_array(items_schema: Dict[str, Any]) -> Check:
+    item_check = _compile(items_schema)
+
+    def check_array(value: Any, path: str) -> Optional[str]:
+        if not isinstance(value, list):
+            return None
+        for index, item in enumerate(value):
+            error = item_check(item, f"{path}[{index}]")
+            if error:
+                return error
+        return None
+
+    return check_array
+
+
+def _compile_combinator(key: str, option_checks: List[Check]) -> Check:
+    def check_combinator(value: Any, path: str) -> Optional[str]:
+        errors = [check(value, path) for check in option_checks]
+        if key == "allOf":
+            return next((error for error in errors if error), None)
+        # oneOf is checked like anyOf: tool schemas use it for alternatives,
+        # rarely for mutually exclusive matches.
+        if any(error is None for error in errors):
+            return None
+        return f"{path}: does not match any allowed schema"
+
+    return check_combinator
+
+
+def _contains(allowed: List[Any], value: Any) -> bool:
+    for option in allowed:
+        if _is_number(value) and _is_number(option):
+            if value == option:
+                return True
+        # Otherwise require matching types so True is not equal to 1.
+        elif type(value) is type(option) and value == option:
+            return True
+    return False
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _accept(value: Any, path: str) -> Optional[str]:
+    return None
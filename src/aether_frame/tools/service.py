@@ -9,7 +9,10 @@ from typing import Any, AsyncIterator, Dict, List, Optional
 from ..contracts import ErrorCode, ToolRequest, ToolResult, ToolStatus, build_error
 from ..contracts.enums import TaskChunkType
 from ..contracts.streaming import TaskStreamChunk
+from ..observability.metrics_backend import time_stage
 from .base.tool import Tool
+from .result_cache import ToolCachePolicy, ToolResultCache, build_cache_key
+from .scheduler import ToolCallScheduler
 
 try:  # Optional MCP dependency
     from .mcp import MCPClient, MCPServerConfig, MCPTool
@@ -96,6 +99,10 @@ class ToolService:
         self._initialized = False
         self._logger = logging.getLogger(__name__)
         self._mcp_server_tasks: List[asyncio.Task] = []
+        self._scheduler = ToolCallScheduler()
+        self._result_cache = ToolResultCache()
+        self._cache_policies: Dict[str, ToolCachePolicy] = {}
+        self._registry_generation = 0
 
     async def initialize(self, config: Optional[Dict[str, Any]] = None):
         """
@@ -105,6 +112,8 @@ class ToolService:
             config: Tool service configuration
         """
         self._config = config or {}
+        if "result_cache_max_entries" in self._config:
+            self._result_cache.max_entries = max(0, int(self._config["result_cache_max_entries"]))
 
         # Load builtin tools
         await self._load_builtin_tools()
@@ -129,8 +138,10 @@ class ToolService:
         # Bootstrap ensures all tools are pre-initialized during registration
         # No need for runtime initialization check
 
-        # Register tool
+        # Register tool; results cached for a replaced tool are stale
         self._tools[tool.full_name] = tool
+        self._result_cache.invalidate(tool.full_name)
+        self._registry_generation += 1
 
         # Update namespace registry
         if tool.namespace:
@@ -138,6 +149,11 @@ class ToolService:
                 self._tool_namespaces[tool.namespace] = []
             self._tool_namespaces[tool.namespace].append(tool.name)
 
+    @property
+    def registry_generation(self) -> int:
+        """Counter bumped whenever the set of registered tools changes."""
+        return self._registry_generation
+
     async def execute_tool(self, tool_request: ToolRequest) -> ToolResult:
         """
         Execute a tool with the given request.
@@ -148,6 +164,99 @@ class ToolService:
         Returns:
             ToolResult: Result of tool execution
         """
+        if tool_request.tool_namespace:
+            full_name = f"{tool_request.tool_namespace}.{tool_request.tool_name}"
+        else:
+            full_name = tool_request.tool_name
+        policy = self._get_cache_policy(full_name)
+        if policy is None:
+            return await self._execute_scheduled_tool(tool_request)
+
+        cache_key = build_cache_key(full_name, tool_request, policy, self._tools.get(full_name))
+        return await self._result_cache.get_or_execute(
+            cache_key, policy.ttl_seconds, lambda: self._execute_scheduled_tool(tool_request)
+        )
+
+    async def _execute_scheduled_tool(self, tool_request: ToolRequest) -> ToolResult:
+        async with self._scheduler.slot(tool_request.tool_namespace):
+            with time_stage("tool_call", namespace=tool_request.tool_namespace or "default") as labels:
+                result = await self._execute_registered_tool(tool_request)
+                labels["status"] = result.status.value if result.status else "unknown"
+        return result
+
+    def _get_cache_policy(self, full_name: str) -> Optional[ToolCachePolicy]:
+        policy = self._cache_policies.get(full_name)
+        if policy is None:
+            policy = getattr(self._tools.get(full_name), "cache_policy", None)
+        return policy
+
+    async def execute_tools(self, tool_requests: List[ToolRequest]) -> List[ToolResult]:
+        """
+        Execute independent tool requests concurrently.
+
+        Each call still passes through its namespace's concurrency and rate
+        limits, so calls to a limited server queue while others proceed.
+
+        Args:
+            tool_requests: Requests to run; their order is preserved in the result
+
+        Returns:
+            List[ToolResult]: One result per request
+        """
+        return list(await asyncio.gather(*(self.execute_tool(request) for request in tool_requests)))
+
+    def configure_namespace_limits(
+        self,
+        namespace: str,
+        *,
+        max_concurrent: int = 0,
+        rate_per_second: float = 0.0,
+        burst: int = 1,
+    ) -> None:
+        """
+        Limit concurrent and per-second calls to tools in ``namespace``.
+
+        MCP servers are configured from their ``MCPServerConfig`` on load;
+        zero values disable the corresponding limit.
+        """
+        self._scheduler.configure(
+            namespace,
+            max_concurrent=max_concurrent,
+            rate_per_second=rate_per_second,
+            burst=burst,
+        )
+
+    def get_scheduler_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return queue depth, running calls and wait times per limited namespace."""
+        return self._scheduler.stats()
+
+    def configure_tool_cache(self, full_name: str, policy: Optional[ToolCachePolicy]) -> None:
+        """
+        Cache successful results of ``full_name`` under ``policy``.
+
+        A policy set here overrides the tool's own ``cache_policy``; passing
+        ``None`` removes the override. Cached results of the tool are dropped
+        either way.
+        """
+        if policy is None:
+            self._cache_policies.pop(full_name, None)
+        else:
+            self._cache_policies[full_name] = policy
+        self._result_cache.invalidate(full_name)
+
+    def get_result_cache_stats(self) -> Dict[str, Any]:
+        """Return result cache size and hit/miss counters."""
+        stats = self._result_cache.stats
+        return {
+            "entries": len(self._result_cache),
+            "max_entries": self._result_cache.max_entries,
+            "hits": stats.hits,
+            "misses": stats.misses,
+            "shared": stats.shared,
+            "evictions": stats.evictions,
+        }
+
+    async def _execute_registered_tool(self, tool_request: ToolRequest) -> ToolResult:
         # Determine full tool name
         if tool_request.tool_namespace:
             full_name = f"{tool_request.tool_namespace}.{tool_request.tool_name}"
@@ -377,16 +486,17 @@ class ToolService:
         stream_callable = getattr(tool, "execute_stream", None)
         if callable(stream_callable):
             try:
-                async for chunk in stream_callable(tool_request):
-                    self._logger.debug(
-                        "ToolService streaming chunk", extra={
-                            "tool": full_name,
-                            "chunk_type": getattr(chunk, "chunk_type", None),
-                            "sequence_id": getattr(chunk, "sequence_id", None),
-                            "is_final": getattr(chunk, "is_final", False),
-                        }
-                    )
-                    yield chunk
+                async with self._scheduler.slot(tool_request.tool_namespace):
+                    async for chunk in stream_callable(tool_request):
+                        self._logger.debug(
+                            "ToolService streaming chunk", extra={
+                                "tool": full_name,
+                                "chunk_type": getattr(chunk, "chunk_type", None),
+                                "sequence_id": getattr(chunk, "sequence_id", None),
+                                "is_final": getattr(chunk, "is_final", False),
+                            }
+                        )
+                        yield chunk
                 return
             except NotImplementedError:
                 # Fall back to synchronous execution
@@ -489,6 +599,8 @@ class ToolService:
 
         self._tools.clear()
         self._tool_namespaces.clear()
+        self._result_cache.invalidate()
+        self._registry_generation += 1
         self._initialized = False
 
     async def _load_builtin_tools(self):
@@ -542,11 +654,33 @@ class ToolService:
                 timeout=server_config.get("timeout", 30),
                 max_connect_retries=server_config.get("max_connect_retries", 3),
                 retry_backoff_seconds=server_config.get("retry_backoff_seconds", 5.0),
+                session_pool_max_per_key=server_config.get("session_pool_max_per_key", 4),
+                session_pool_max_idle=server_config.get("session_pool_max_idle", 16),
+                session_idle_timeout=server_config.get("session_idle_timeout", 300.0),
+                session_health_check_interval=server_config.get(
+                    "session_health_check_interval", 30.0
+                ),
+                max_concurrent_calls=server_config.get("max_concurrent_calls", 8),
+                rate_limit_per_second=server_config.get("rate_limit_per_second", 0.0),
+                rate_limit_burst=server_config.get("rate_limit_burst", 1),
             )
+            cache_policies = {
+                f"{config.name}.{tool_name}": ToolCachePolicy.from_config(policy)
+                for tool_name, policy in (server_config.get("cache_tools") or {}).items()
+            }
         except Exception as exc:  # pragma: no cover - config error logging
             self._logger.error("Invalid MCP server config for %s: %s", server_name, exc)
             return
 
+        self.configure_namespace_limits(
+            config.name,
+            max_concurrent=config.max_concurrent_calls,
+            rate_per_second=config.rate_limit_per_second,
+            burst=config.rate_limit_burst,
+        )
+        for full_name, policy in cache_policies.items():
+            self.configure_tool_cache(full_name, policy)
+
         try:
             client = MCPClient(config)
             client.start_connect()
@@ -86,8 +86,9 @@ async def test_adk_idle_cleanup_end_to_end():
         # Force idle state and perform cleanup sweep
         idle_time = datetime.now() - timedelta(seconds=5)
         chat_info.last_activity = idle_time
-        adapter.runner_manager.runners[runner_id]["last_activity"] = idle_time
-        adapter.agent_manager._agent_metadata[agent_id]["last_activity"] = idle_time
+        adapter.adk_session_manager.note_chat_session_activity(chat_info)
+        adapter.runner_manager.mark_runner_activity(runner_id, at=idle_time)
+        adapter.agent_manager.mark_agent_activity(agent_id, at=idle_time)
 
         await adapter.adk_session_manager._perform_idle_cleanup()
 
@@ -97,7 +98,7 @@ async def test_adk_idle_cleanup_end_to_end():
             adapter.adk_session_manager.get_or_create_chat_session(chat_session_id, user_context.user_id)
 
         if runner_id in adapter.runner_manager.runners:
-            adapter.runner_manager.runners[runner_id]["last_activity"] = idle_time
+            adapter.runner_manager.mark_runner_activity(runner_id, at=idle_time)
             await adapter.adk_session_manager._perform_idle_cleanup()
 
         assert runner_id not in adapter.runner_manager.runners
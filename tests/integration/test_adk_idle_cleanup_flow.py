@@ -170,7 +170,7 @@ async def test_idle_cleanup_cascades_to_runner_and_agent():
 
     # Runner still exists but now idle with zero sessions; force timestamp back and sweep again
     assert runner_id in runner_manager.runners
-    runner_manager.runners[runner_id]["last_activity"] = idle_past
+    runner_manager.mark_runner_activity(runner_id, at=idle_past)
     await session_manager._perform_idle_cleanup()
 
     # Runner resources cleaned up via runner manager on subsequent pass
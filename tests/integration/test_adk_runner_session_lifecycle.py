@@ -124,7 +124,7 @@ async def test_runner_cleanup_triggers_agent_cleanup(monkeypatch):
     # Populate adapter state
     adapter._agent_runners[agent_id] = runner_id
     adapter._agent_sessions[agent_id] = [session_id]
-    adapter._config_agents.setdefault(config_hash, []).append(agent_id)
+    adapter.runner_manager.load_index.track(config_hash, runner_id, 1)
     adapter.agent_manager._agent_configs[agent_id] = agent_config
 
     # Populate runner manager state
@@ -158,5 +158,4 @@ async def test_runner_cleanup_triggers_agent_cleanup(monkeypatch):
     assert runner_id not in adapter.runner_manager.runners
     assert agent_id not in adapter.runner_manager.agent_runner_mapping
     assert session_id not in adapter.runner_manager.session_to_runner
-    if config_hash in adapter._config_agents:
-        assert agent_id not in adapter._config_agents[config_hash]
+    assert runner_id not in adapter.runner_manager.load_index
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the activity/load indexes and agent/runner reverse mapping."""
+
+from datetime import datetime, timedelta
+
+from aether_frame.framework.adk.activity_index import (
+    AgentRunnerMapping,
+    IdleActivityIndex,
+    RunnerLoadIndex,
+    agents_for_runner,
+)
+
+
+def test_index_pops_only_expired_keys_in_activity_order():
+    base = datetime(2026, 1, 1, 12, 0, 0)
+    index = IdleActivityIndex()
+    index.touch("late", base + timedelta(minutes=5))
+    index.touch("early", base)
+    index.touch("fresh", base + timedelta(hours=1))
+
+    assert index.pop_expired(base + timedelta(minutes=10)) == ["early", "late"]
+    assert "fresh" in index
+    assert len(index) == 1
+    assert index.pop_expired(base + timedelta(minutes=10)) == []
+
+
+def test_index_touch_supersedes_previous_activity():
+    base = datetime(2026, 1, 1, 12, 0, 0)
+    index = IdleActivityIndex()
+    index.touch("runner", base)
+    index.touch("runner", base + timedelta(hours=2))
+
+    assert index.pop_expired(base + timedelta(hours=1)) == []
+    assert index.last_activity("runner") == base + timedelta(hours=2)
+
+    # Moving activity backwards is honoured as well
+    index.touch("runner", base)
+    assert index.pop_expired(base + timedelta(hours=1)) == ["runner"]
+
+
+def test_index_discard_and_compaction_keep_heap_bounded():
+    base = datetime(2026, 1, 1, 12, 0, 0)
+    index = IdleActivityIndex()
+    for offset in range(1000):
+        index.touch("hot", base + timedelta(seconds=offset))
+    index.touch("gone", base)
+    index.discard("gone")
+
+    assert len(index._heap) <= 2 * len(index) + IdleActivityIndex._COMPACT_SLACK
+    assert index.pop_expired(base + timedelta(days=1)) == ["hot"]
+
+
+def test_agent_runner_mapping_maintains_reverse_index():
+    mapping = AgentRunnerMapping()
+    mapping["agent-a"] = "runner-1"
+    mapping["agent-b"] = "runner-1"
+    mapping["agent-c"] = "runner-2"
+
+    assert mapping.agents_for_runner("runner-1") == ["agent-a", "agent-b"]
+    assert mapping.agent_for_runner("runner-2") == "agent-c"
+
+    mapping["agent-a"] = "runner-2"
+    del mapping["agent-b"]
+    assert mapping.agents_for_runner("runner-1") == []
+    assert mapping.agents_for_runner("runner-2") == ["agent-c", "agent-a"]
+
+    assert mapping.pop("agent-c") == "runner-2"
+    assert mapping.pop("missing", None) is None
+    mapping.clear()
+    assert mapping == {}
+    assert mapping.agent_for_runner("runner-2") is None
+
+
+def test_agents_for_runner_falls_back_to_scan_for_plain_dicts():
+    assert agents_for_runner({"a": "r1", "b": "r2", "c": "r1"}, "r1") == ["a", "c"]
+    assert agents_for_runner(None, "r1") == []
+
+
+def test_load_index_tracks_least_loaded_runner_per_config():
+    index = RunnerLoadIndex()
+    index.track("hash-a", "r1", 2)
+    index.track("hash-a", "r2", 1)
+    index.track("hash-b", "r3", 0)
+
+    assert index.least_loaded("hash-a") == ("r2", 1)
+    index.update("r2", 3)
+    index.update("untracked", 0)
+    assert index.least_loaded("hash-a") == ("r1", 2)
+    assert index.count_below("hash-a", 3) == 1
+
+    index.discard("r1")
+    assert index.least_loaded("hash-a") == ("r2", 3)
+    index.discard("r2")
+    assert index.least_loaded("hash-a") is None
+    assert index.least_loaded("hash-b") == ("r3", 0)
+    assert len(index) == 1
+
+
+def test_load_index_counts_below_limit_per_config():
+    index = RunnerLoadIndex()
+    index.track("hash-a", "r1", 0)
+    index.track("hash-a", "r2", 2)
+    index.track("hash-b", "r3", 0)
+
+    assert index.count_below("hash-a", 1) == 1
+    index.update("r2", 0)
+    assert index.count_below("hash-a", 1) == 2
+    index.track("hash-b", "r1", 0)  # re-tracking under another config moves the runner
+    assert index.count_below("hash-a", 1) == 1
+    assert index.count_below("hash-b", 1) == 2
+    index.discard("r2")
+    assert index.count_below("hash-a", 1) == 0
+    assert index.count_below("missing", 1) == 0
+
+
+def test_load_index_compaction_keeps_heap_bounded():
+    index = RunnerLoadIndex()
+    index.track("hash", "r1")
+    index.track("hash", "r2")
+    for count in range(500):
+        index.update("r1", count % 7)
+        index.update("r2", (count + 3) % 7)
+
+    assert len(index._heaps["hash"]) <= 2 * 2 + RunnerLoadIndex._COMPACT_SLACK + 1
+    expected = min(("r1", 499 % 7), ("r2", (499 + 3) % 7), key=lambda item: item[1])
+    assert index.least_loaded("hash") == expected
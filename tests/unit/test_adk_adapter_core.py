@@ -1,11 +1,22 @@
 # -*- coding: utf-8 -*-
 """Focused tests for AdkFrameworkAdapter helper and execution paths."""
 
+import asyncio
 from types import SimpleNamespace
 
 import pytest
 
-from aether_frame.contracts import AgentConfig, TaskRequest, TaskStatus, TaskResult, ErrorCode
+from aether_frame.agents.adk.response_selection import current_response_listener
+from aether_frame.contracts import (
+    AgentConfig,
+    ErrorCode,
+    TaskChunkType,
+    TaskRequest,
+    TaskResult,
+    TaskStatus,
+    UniversalMessage,
+)
+from aether_frame.config.settings import Settings
 from aether_frame.framework.adk.adk_adapter import AdkFrameworkAdapter
 
 
@@ -49,7 +60,7 @@ async def test_handle_agent_cleanup_cleans_mappings(adapter, monkeypatch):
     agent_id = "agent-1"
     adapter._agent_runners[agent_id] = "runner-1"
     adapter._agent_sessions[agent_id] = ["adk-1"]
-    adapter._config_agents["hash-1"] = [agent_id]
+    adapter.runner_manager.load_index.track("hash-1", "runner-1")
     adapter.agent_manager._agent_configs[agent_id] = AgentConfig(agent_type="support", system_prompt="hi")
 
     cleaned = []
@@ -62,7 +73,7 @@ async def test_handle_agent_cleanup_cleans_mappings(adapter, monkeypatch):
 
     assert agent_id not in adapter._agent_runners
     assert agent_id not in adapter._agent_sessions
-    assert "hash-1" not in adapter._config_agents
+    assert "runner-1" not in adapter.runner_manager.load_index
     assert cleaned == [agent_id]
 
 
@@ -203,3 +214,170 @@ async def test_handle_conversation_success_flow(adapter, monkeypatch):
     assert result.status == TaskStatus.SUCCESS
     assert result.session_id == "chat-session"
     assert result.metadata["adk_session_id"] == "adk-new"
+
+
+@pytest.mark.asyncio
+async def test_handle_conversation_windows_history_to_model_budget(adapter, monkeypatch):
+    agent_id = "agent-window"
+    adapter.agent_manager._agent_configs[agent_id] = AgentConfig(
+        agent_type="chat", system_prompt="prompt", model_config={"model": "deepseek-chat"}
+    )
+    adapter.runner_manager.settings.enable_conversation_windowing = True
+    adapter.runner_manager.settings.conversation_token_budgets = {"deepseek": 40}
+    messages = [
+        UniversalMessage(role="system", content="pinned"),
+        UniversalMessage(role="user", content="old " * 50),
+        UniversalMessage(role="user", content="current question"),
+    ]
+    task_request = TaskRequest(
+        task_id="t-window",
+        task_type="chat",
+        description="desc",
+        agent_id=agent_id,
+        session_id="chat-session",
+        messages=messages,
+        user_context=SimpleNamespace(get_adk_user_id=lambda: "user"),
+    )
+    seen = {}
+
+    async def fake_coordinate(**kwargs):
+        return SimpleNamespace(adk_session_id="adk-new", switch_occurred=False)
+
+    async def fake_runtime_context(*args, **kwargs):
+        return SimpleNamespace(
+            session_id="adk-new",
+            agent_id=agent_id,
+            runner_id="runner-window",
+            execution_id="exec-window",
+            metadata={"domain_agent": SimpleNamespace()},
+            update_activity=lambda: None,
+        )
+
+    async def fake_execute(task_request_inner, runtime_context, domain_agent):
+        seen["messages"] = list(task_request_inner.messages)
+        return TaskResult(task_id=task_request_inner.task_id, status=TaskStatus.SUCCESS)
+
+    monkeypatch.setattr(adapter.adk_session_manager, "coordinate_chat_session", fake_coordinate)
+    monkeypatch.setattr(adapter, "_create_runtime_context_for_existing_session", fake_runtime_context)
+    monkeypatch.setattr(adapter, "_execute_with_domain_agent", fake_execute)
+
+    result = await adapter._handle_conversation(task_request, strategy=SimpleNamespace())
+
+    assert seen["messages"] == [messages[0], messages[2]]
+    window = result.metadata["context_window"]
+    assert window["budget_tokens"] == 40
+    assert window["dropped_messages"] == 1
+    assert window["dropped_tokens"] > 0
+
+
+@pytest.mark.asyncio
+async def test_execute_task_stream_yields_candidates_before_result(adapter, monkeypatch):
+    request = TaskRequest(task_id="stream-task", task_type="chat", description="demo")
+
+    async def fake_execute_task(task_request, strategy):
+        listener = current_response_listener()
+        listener("Thinking about the answer", False)
+        listener("Here is the final answer.", True)
+        return TaskResult(
+            task_id=task_request.task_id,
+            status=TaskStatus.SUCCESS,
+            messages=[],
+            session_id="chat-1",
+        )
+
+    monkeypatch.setattr(adapter, "execute_task", fake_execute_task)
+
+    chunks = [chunk async for chunk in adapter.execute_task_stream(request, strategy=None)]
+
+    assert [chunk.chunk_type for chunk in chunks] == [
+        TaskChunkType.RESPONSE,
+        TaskChunkType.RESPONSE,
+        TaskChunkType.COMPLETE,
+    ]
+    assert [chunk.sequence_id for chunk in chunks] == [0, 1, 2]
+    assert chunks[1].metadata["is_final_response"] is True
+    assert chunks[-1].is_final
+    assert chunks[-1].metadata["session_id"] == "chat-1"
+    assert current_response_listener() is None
+
+
+@pytest.mark.asyncio
+async def test_warm_pool_serves_first_turn_and_replenishes(adapter, monkeypatch):
+    settings = Settings(
+        adk_warm_pool_size=1,
+        adk_warm_pool_configs=[{"agent_type": "support", "system_prompt": "hi"}],
+        max_sessions_per_agent=1,
+    )
+    adapter.runner_manager.settings = settings
+    created = []
+
+    async def fake_create_domain_agent(*args, **kwargs):
+        agent = FakeAgent()
+        agent.adk_agent = SimpleNamespace()
+        created.append(agent)
+        return agent
+
+    async def fake_get_runner(*args, **kwargs):
+        runner_id = f"runner-{len(created)}"
+        adapter.runner_manager.runners[runner_id] = {
+            "sessions": {},
+            "session_user_ids": {},
+            "config_hash": "hash",
+            "created_at": SimpleNamespace(),
+            "last_activity": SimpleNamespace(),
+        }
+        return runner_id, None
+
+    agent_ids = iter(f"agent-{index}" for index in range(10))
+    monkeypatch.setattr(adapter, "_create_domain_agent_for_config", fake_create_domain_agent)
+    monkeypatch.setattr(adapter.runner_manager, "get_or_create_runner", fake_get_runner)
+    monkeypatch.setattr(adapter.agent_manager, "generate_agent_id", lambda: next(agent_ids))
+
+    assert await adapter.start_warm_pool(settings) == 1
+
+    task_request = TaskRequest(
+        task_id="t-warm",
+        task_type="chat",
+        description="desc",
+        agent_config=AgentConfig(agent_type="support", system_prompt="hi"),
+    )
+    runtime_context = await adapter._create_runtime_context_for_new_agent(task_request)
+    assert runtime_context.agent_id == "agent-0"
+    assert runtime_context.metadata["pattern"] == "reuse_existing_agent"
+
+    # The only slot was taken, so a spare agent is provisioned in the background.
+    await asyncio.gather(*adapter._warm_pool._fill_tasks.values())
+    assert len(created) == 2
+    config_hash = adapter.runner_manager.compute_config_hash(task_request.agent_config)
+    assert dict(adapter._agent_runners) == {"agent-0": "runner-1", "agent-1": "runner-2"}
+    assert "runner-2" in adapter.runner_manager.load_index
+
+    # Once agent-0 holds its session, the idle spare is the warm capacity: the reaper keeps it.
+    adapter.runner_manager.runners["runner-2"]["config_hash"] = config_hash
+    adapter.runner_manager.load_index.update("runner-1", 1)
+    assert adapter.runner_manager.should_retain_idle_runner("runner-2") is True
+    adapter.runner_manager.load_index.track(config_hash, "runner-extra", 0)
+    assert adapter.runner_manager.should_retain_idle_runner("runner-2") is False
+    await adapter.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_select_agent_prefers_least_loaded_runner(adapter):
+    load_index = adapter.runner_manager.load_index
+    for agent_id, runner_id, sessions in (("agent-a", "runner-a", 2), ("agent-b", "runner-b", 1)):
+        adapter.agent_manager._agents[agent_id] = SimpleNamespace()
+        adapter._agent_runners[agent_id] = runner_id
+        adapter.runner_manager.runners[runner_id] = {"sessions": {f"s{i}": object() for i in range(sessions)}}
+        load_index.track("hash", runner_id, sessions)
+
+    selected = await adapter._select_agent_for_config("hash", max_sessions=3)
+    assert selected[0] == "agent-b"
+
+    load_index.update("runner-b", 3)
+    selected = await adapter._select_agent_for_config("hash", max_sessions=3)
+    assert selected[0] == "agent-a"
+
+    # Stale entries for vanished agents are dropped on the way.
+    del adapter.agent_manager._agents["agent-a"]
+    assert await adapter._select_agent_for_config("hash", max_sessions=3) is None
+    assert "runner-a" not in load_index
@@ -17,7 +17,6 @@ def test_initial_state(adk_adapter):
     assert adk_adapter._initialized is False
     assert adk_adapter._agent_runners == {}
     assert adk_adapter._agent_sessions == {}
-    assert adk_adapter._config_agents == {}
 
 
 @pytest.mark.asyncio
@@ -42,7 +41,7 @@ async def test_handle_agent_cleanup_clears_mappings(monkeypatch, adk_adapter):
     agent_id = "agent-123"
     adk_adapter._agent_runners[agent_id] = "runner-1"
     adk_adapter._agent_sessions[agent_id] = ["session-1", "session-2"]
-    adk_adapter._config_agents["hash-1"] = [agent_id]
+    adk_adapter.runner_manager.load_index.track("hash-1", "runner-1")
     adk_adapter.agent_manager._agent_configs[agent_id] = AgentConfig(
         agent_type="support", system_prompt="help"
     )
@@ -58,7 +57,7 @@ async def test_handle_agent_cleanup_clears_mappings(monkeypatch, adk_adapter):
 
     assert agent_id not in adk_adapter._agent_runners
     assert agent_id not in adk_adapter._agent_sessions
-    assert "hash-1" not in adk_adapter._config_agents
+    assert "runner-1" not in adk_adapter.runner_manager.load_index
     assert cleaned_agents == [agent_id]
 
 
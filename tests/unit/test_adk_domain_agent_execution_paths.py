@@ -141,6 +141,35 @@ async def test_run_adk_with_runner_selects_best_response(monkeypatch):
     assert "bullet point" in response
 
 
+@pytest.mark.asyncio
+async def test_run_adk_with_runner_notifies_candidate_listener(monkeypatch):
+    from aether_frame.agents.adk.response_selection import listen_for_response_candidates
+
+    _install_genai_stub(monkeypatch)
+    agent = AdkDomainAgent(agent_id="agent-listen", config={})
+    agent.adk_agent = object()
+
+    events = [
+        _FakeEvent("tiny", is_final=False),
+        _FakeEvent("Working on the request now", is_final=False),
+        _FakeEvent("Final answer: everything is ready.", is_final=True),
+    ]
+    received = []
+    with listen_for_response_candidates(lambda text, final: received.append((text, final))):
+        response = await agent._run_adk_with_runner_and_agent(
+            _FakeRunner(events), user_id="bob", session_id="s", adk_content="Hi"
+        )
+
+    # Each event exposes its text via both parts and content.text
+    assert received == [
+        ("Working on the request now", False),
+        ("Working on the request now", False),
+        ("Final answer: everything is ready.", True),
+        ("Final answer: everything is ready.", True),
+    ]
+    assert response == "Final answer: everything is ready."
+
+
 @pytest.mark.asyncio
 async def test_run_adk_with_runner_returns_mock_on_import_error(monkeypatch):
     real_import = builtins.__import__
@@ -155,3 +155,14 @@ def test_is_custom_and_supports_streaming_flags():
     assert AdkModelFactory.supports_streaming("azure/gpt-4o") is True
     assert AdkModelFactory.is_custom_model("gemini-pro") is False
     assert AdkModelFactory.supports_streaming("unknown-model") is False
+
+
+def test_context_window_tokens_matches_longest_model_family():
+    assert AdkModelFactory.context_window_tokens("azure/gpt-4o-mini") == 128_000
+    assert AdkModelFactory.context_window_tokens("gpt-4o-2024-08-06") == 128_000
+    assert AdkModelFactory.context_window_tokens("gpt-4-turbo-2024-04-09") == 128_000
+    assert AdkModelFactory.context_window_tokens("gpt-4-0613") == 8_192
+    assert AdkModelFactory.context_window_tokens("deepseek/deepseek-chat") == 64_000
+    assert AdkModelFactory.context_window_tokens("gpt-4x") is None
+    assert AdkModelFactory.context_window_tokens("unknown-model") is None
+    assert AdkModelFactory.context_window_tokens(None) is None
@@ -8,7 +8,9 @@ from unittest.mock import MagicMock, patch
 from src.aether_frame.agents.adk.adk_event_converter import AdkEventConverter
 from src.aether_frame.contracts import ContentPart, ImageReference, UniversalMessage
 from src.aether_frame.framework.adk.multimodal_utils import (
+    DecodedImageCache,
     decode_base64_image,
+    decode_image_payload,
     detect_image_mime_type,
     extract_base64_from_data_url,
     validate_image_format,
@@ -170,6 +172,46 @@ class TestAdkEventConverter:
         assert image_part["inline_data"]["mime_type"] == "image/png"
         assert image_part["inline_data"]["data"] == png_header
 
+    def test_repeated_image_is_decoded_once(self):
+        """Test that the same image payload hits the decoded image cache."""
+        cache = DecodedImageCache()
+        converter = AdkEventConverter(image_cache=cache)
+        png_bytes = b'\x89PNG\r\n\x1a\n' + b'cached png data'
+        image_ref = ImageReference.from_base64(
+            base64_data=base64.b64encode(png_bytes).decode('utf-8'),
+            image_format="png"
+        )
+        message = UniversalMessage(role="user", content=[ContentPart(image_reference=image_ref)])
+
+        with patch(
+            "src.aether_frame.agents.adk.adk_event_converter.decode_image_payload",
+            wraps=decode_image_payload,
+        ) as decode:
+            first = converter.convert_universal_message_to_adk(message)
+            second = converter.convert_universal_message_to_adk(message)
+
+        assert decode.call_count == 1
+        assert first["parts"][0]["inline_data"] == second["parts"][0]["inline_data"]
+        assert second["parts"][0]["inline_data"]["data"] == png_bytes
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_cached_image_respects_converter_size_cap(self):
+        """Test that a smaller max_image_bytes also applies to cache hits."""
+        cache = DecodedImageCache()
+        png_bytes = b'\x89PNG\r\n\x1a\n' + b'x' * 200
+        image_ref = ImageReference.from_base64(
+            base64_data=base64.b64encode(png_bytes).decode('utf-8'),
+            image_format="png"
+        )
+        message = UniversalMessage(role="user", content=[ContentPart(image_reference=image_ref)])
+
+        large = AdkEventConverter(image_cache=cache).convert_universal_message_to_adk(message)
+        small = AdkEventConverter(image_cache=cache, max_image_bytes=100).convert_universal_message_to_adk(message)
+
+        assert large["parts"][0]["inline_data"]["data"] == png_bytes
+        assert small["parts"] == []
+
     def test_convert_invalid_image_reference(self):
         """Test handling of invalid image reference."""
         # Create image reference without base64_data
@@ -38,4 +38,32 @@ async def test_tracing_and_spans_export_and_health():
 
     await observer.cleanup()
     assert observer._metrics == {}
-    assert observer._traces == []
+    assert len(observer._traces) == 0
+
+
+@pytest.mark.asyncio
+async def test_observer_buffers_are_bounded_and_summary_streams():
+    observer = AdkObserver(max_events=5, max_traces=2)
+    for index in range(100):
+        status = TaskStatus.SUCCESS if index % 4 else TaskStatus.ERROR
+        result = TaskResult(task_id=f"task-{index}", status=status)
+        await observer.record_execution_completion(f"task-{index}", result, execution_time=(index + 1) / 100)
+
+    trace_ids = [await observer.start_trace("op", {}) for _ in range(3)]
+    await observer.add_span(trace_ids[0], "evicted", 0.1, {})
+    await observer.add_span(trace_ids[-1], "kept", 0.1, {})
+
+    assert len(observer._metrics["execution_events"]) == 5
+    assert len(observer._performance_data) == 5
+    assert [trace["trace_id"] for trace in observer._traces] == trace_ids[1:]
+    assert observer._traces[-1]["spans"][0]["span_name"] == "kept"
+
+    summary = await observer.get_metrics_summary()
+    assert summary["total_executions"] == 100
+    assert summary["total_traces"] == 3
+    assert summary["success_rate"] == 0.75
+    assert summary["min_execution_time"] == 0.01
+    assert summary["max_execution_time"] == 1.0
+    assert summary["avg_execution_time"] == pytest.approx(0.505)
+    assert summary["p50_execution_time"] == pytest.approx(0.5, rel=0.03)
+    assert summary["p99_execution_time"] == pytest.approx(0.99, rel=0.02)
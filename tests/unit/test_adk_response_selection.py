@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for incremental ADK response selection."""
+
+import random
+
+from aether_frame.agents.adk.response_selection import (
+    ResponseCandidateSelector,
+    current_response_listener,
+    listen_for_response_candidates,
+    score_response_text,
+)
+
+
+def reference_score(text, is_final):
+    score = len(text) / 100
+    score += sum(5 for indicator in [".", "\n", ":", "-"] if text.count(indicator) > 0)
+    score -= sum(
+        20
+        for pattern in ["...", "please wait", "loading", "error occurred"]
+        if pattern.lower() in text.lower()
+    )
+    if is_final:
+        score += 5
+    return score
+
+
+def test_score_matches_reference_heuristic():
+    samples = [
+        ("Plain answer text", False),
+        ("Structured:\n- item one.", True),
+        ("Please WAIT while loading...", False),
+        ("An error occurred: retry later.", True),
+    ]
+    for text, is_final in samples:
+        assert score_response_text(text, is_final) == reference_score(text, is_final)
+
+
+def test_selector_matches_max_over_all_candidates():
+    rng = random.Random(7)
+    fragments = ["word", ".", "\n", ":", "-", "loading", "...", "Please wait", " "]
+    for _ in range(50):
+        candidates = [
+            ("".join(rng.choice(fragments) for _ in range(rng.randint(3, 30))), rng.random() < 0.3)
+            for _ in range(rng.randint(1, 12))
+        ]
+        selector = ResponseCandidateSelector()
+        for text, is_final in candidates:
+            selector.offer(text, is_final)
+
+        expected = max(candidates, key=lambda item: reference_score(*item))[0]
+        assert selector.best_text == expected
+        assert selector.candidate_count == len(candidates)
+
+
+def test_selector_keeps_earliest_candidate_on_tie():
+    selector = ResponseCandidateSelector()
+    assert selector.offer("first answer", False) is True
+    assert selector.offer("other answer", False) is False
+    assert selector.best_text == "first answer"
+
+
+def test_listener_binding_is_scoped():
+    received = []
+    assert current_response_listener() is None
+    with listen_for_response_candidates(lambda text, final: received.append(text)):
+        current_response_listener()("hello", False)
+    assert current_response_listener() is None
+    assert received == ["hello"]
@@ -85,3 +85,105 @@ async def test_inject_chat_history_updates_cached_session_state():
 
     assert target_session.state["conversation_history"] == history
     assert target_session.state["messages"] == history
+
+
+class RecordingSessionService:
+    def __init__(self):
+        self.get_calls = []
+        self.bulk_appends = []
+
+    async def get_session(self, app_name, user_id, session_id, config=None):
+        self.get_calls.append((session_id, config))
+        events = [
+            SimpleNamespace(
+                author="user" if index % 2 == 0 else "agent",
+                content=SimpleNamespace(role=None, parts=[SimpleNamespace(text=f"message {index} " + "x" * 40)]),
+                timestamp=float(index),
+            )
+            for index in range(10)
+        ]
+        if config is not None and config.num_recent_events:
+            events = events[-config.num_recent_events:]
+        return SimpleNamespace(events=events if session_id == "session-old" else [])
+
+    async def append_events(self, session, events):
+        self.bulk_appends.append(list(events))
+
+
+class SwitchRunnerManager(StubRunnerManager):
+    def __init__(self, runners, settings):
+        super().__init__(runners)
+        self.settings = settings
+        self.removed = []
+
+    async def remove_session_from_runner(self, runner_id, session_id):
+        self.removed.append(session_id)
+
+    async def get_runner_for_agent(self, agent_id):
+        return "runner-new"
+
+    async def _create_session_in_runner(self, runner_id, task_request=None, external_session_id=None):
+        self.runners[runner_id]["session_user_ids"][external_session_id] = "user-1"
+        return external_session_id
+
+
+@pytest.mark.asyncio
+async def test_switch_agent_session_hands_off_budgeted_history_in_bulk():
+    manager = AdkSessionManager()
+    service = RecordingSessionService()
+    runners = {
+        "runner-old": {"session_service": service, "app_name": "app", "session_user_ids": {"session-old": "user-1"}, "sessions": {}},
+        "runner-new": {"session_service": service, "app_name": "app", "session_user_ids": {}, "sessions": {}},
+    }
+    settings = SimpleNamespace(agent_switch_history_max_events=6, agent_switch_history_token_budget=60)
+    runner_manager = SwitchRunnerManager(runners, settings)
+    chat_session = make_chat_session(active_runner_id="runner-old", active_session_id="session-old")
+    summarized = []
+
+    def summarizer(dropped):
+        summarized[:] = dropped
+        return "earlier turns"
+
+    manager.history_summarizer = summarizer
+
+    task_request = SimpleNamespace(available_knowledge=[])
+    result = await manager._switch_agent_session(chat_session, "agent-2", "user-1", task_request, runner_manager)
+
+    assert result.switch_occurred is True
+    assert service.get_calls[0][1].num_recent_events == 6
+    assert len(service.bulk_appends) == 1
+    texts = [event.content.parts[0].text for event in service.bulk_appends[0]]
+    assert texts[0].endswith("earlier turns")
+    assert texts[-1].startswith("message 9")
+    assert [message["content"][:9] for message in summarized] == ["message 4", "message 5", "message 6", "message 7"]
+    assert runner_manager.removed == ["session-old"]
+
+
+class FailingBulkSessionService:
+    def __init__(self):
+        self.appended = []
+
+    async def get_session(self, app_name, user_id, session_id, config=None):
+        return SimpleNamespace(app_name=app_name, user_id=user_id, id=session_id, events=[])
+
+    async def append_events(self, session, events):
+        raise RuntimeError("bulk failed")
+
+    async def append_event(self, session, event):
+        if event.id == "bad":
+            raise ValueError("bad event")
+        self.appended.append(event.id)
+        return event
+
+
+@pytest.mark.asyncio
+async def test_bulk_injection_failure_falls_back_to_per_event_appends():
+    manager = AdkSessionManager()
+    service = FailingBulkSessionService()
+    session = await service.get_session("app", "user-1", "session-1")
+    events = [SimpleNamespace(id=event_id) for event_id in ("e1", "bad", "e2")]
+
+    injected = await manager._append_events_bulk(service, session, events)
+
+    assert injected == 2
+    assert service.appended == ["e1", "e2"]
@@ -323,6 +323,21 @@ async def test_evaluate_runner_agent_idle_cleans_runner_and_agent():
     assert runner_manager.cleaned == ["runner-1"]
     assert agent_manager.cleaned == ["agent-1"]
 
+    runner_manager.cleaned.clear()
+    agent_manager.cleaned.clear()
+    runner_manager.should_retain_idle_runner = lambda runner_id: True
+    await manager._evaluate_runner_agent_idle(
+        runner_manager,
+        agent_manager,
+        runner_id="runner-1",
+        agent_id="agent-1",
+        now=now,
+        trigger="unit-test",
+    )
+    # Warm capacity is kept together with its agent.
+    assert runner_manager.cleaned == []
+    assert agent_manager.cleaned == []
+
 
 def test_start_idle_cleanup_configures_timeouts(monkeypatch):
     manager = AdkSessionManager()
@@ -418,8 +433,9 @@ async def test_perform_idle_cleanup_archives_stale_sessions(monkeypatch):
 
     calls = {"evaluate": []}
 
-    async def fake_archive(**kwargs):
-        calls["archive"] = kwargs["reason"]
+    async def fake_archive(chat_sessions, runner_manager, reason):
+        calls["archive"] = reason
+        return {}
 
     async def fake_cleanup_session(chat_session_arg, runner_mgr):
         calls["cleanup_session"] = chat_session_arg.chat_session_id
@@ -430,7 +446,7 @@ async def test_perform_idle_cleanup_archives_stale_sessions(monkeypatch):
     async def fake_eval(**kwargs):
         calls["evaluate"].append(kwargs.get("runner_id"))
 
-    monkeypatch.setattr(manager, "_archive_chat_session_state", fake_archive)
+    monkeypatch.setattr(manager, "_archive_chat_session_states", fake_archive)
     monkeypatch.setattr(manager, "_cleanup_session_only", fake_cleanup_session)
     monkeypatch.setattr(manager, "_mark_session_cleared", fake_mark)
     monkeypatch.setattr(manager, "_evaluate_runner_agent_idle", fake_eval)
@@ -599,3 +599,62 @@ async def test_coordinate_chat_session_persists_and_hydrates_knowledge():
     assert followup_request.available_knowledge == knowledge_sources
     assert followup_request.available_knowledge is not chat_session.available_knowledge
     assert len(runner_manager.memory_service.store_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_idle_sweep_only_visits_expired_entries(monkeypatch):
+    manager = AdkSessionManager()
+    runner_manager = StubRunnerManager()
+    agent_manager = StubAgentManager()
+    old_time = datetime.now() - timedelta(hours=2)
+
+    for index in range(3):
+        runner_manager.runners[f"runner-fresh-{index}"] = {
+            "sessions": {},
+            "last_activity": datetime.now(),
+            "created_at": datetime.now(),
+        }
+    runner_manager.runners["runner-idle"] = {
+        "sessions": {},
+        "last_activity": old_time,
+        "created_at": old_time,
+    }
+    runner_manager.agent_runner_mapping["agent-idle"] = "runner-idle"
+
+    manager._idle_runner_manager = runner_manager
+    manager._idle_agent_manager = agent_manager
+    manager._runner_idle_timeout_seconds = 60
+
+    evaluated = []
+
+    async def fake_eval(**kwargs):
+        evaluated.append((kwargs["runner_id"], kwargs["agent_id"]))
+        runner_manager.runners.pop(kwargs["runner_id"], None)
+
+    monkeypatch.setattr(manager, "_evaluate_runner_agent_idle", fake_eval)
+
+    await manager._perform_idle_cleanup()
+    assert evaluated == [("runner-idle", "agent-idle")]
+
+    evaluated.clear()
+    await manager._perform_idle_cleanup()
+    assert evaluated == []
+
+
+@pytest.mark.asyncio
+async def test_recorded_activity_defers_session_cleanup():
+    manager = AdkSessionManager()
+    runner_manager = StubRunnerManager()
+    manager._idle_runner_manager = runner_manager
+    manager._session_idle_timeout_seconds = 10
+
+    chat_session = manager.get_or_create_chat_session("chat-active", "user")
+    chat_session.last_activity = datetime.now() - timedelta(minutes=5)
+    manager.note_chat_session_activity(chat_session)
+    # Activity after indexing moves the deadline forward without re-indexing
+    chat_session.last_activity = datetime.now()
+
+    await manager._perform_idle_cleanup()
+
+    assert "chat-active" in manager.chat_sessions
+    assert "chat-active" in manager._session_idle_index
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the SQLite-backed ADK session service."""
+
+from types import SimpleNamespace
+
+import pytest
+from google.adk.errors.already_exists_error import AlreadyExistsError
+from google.adk.events import Event, EventActions
+from google.adk.sessions.base_session_service import GetSessionConfig
+from google.genai import types
+
+from aether_frame.framework.adk.adk_session_manager import AdkSessionManager
+from aether_frame.framework.adk.sqlite_session_service import AdkSqliteSessionService
+
+
+def make_event(text, timestamp, state_delta=None):
+    return Event(
+        author="user",
+        invocation_id="inv-1",
+        timestamp=timestamp,
+        content=types.Content(role="user", parts=[types.Part(text=text)]),
+        actions=EventActions(state_delta=state_delta or {}),
+    )
+
+
+@pytest.fixture
+async def service(tmp_path):
+    service = AdkSqliteSessionService(str(tmp_path / "sessions.db"))
+    yield service
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_append_persists_events_state_and_counts(service, tmp_path):
+    session = await service.create_session(
+        app_name="app", user_id="user", session_id="s1", state={"app:tier": "gold", "topic": "billing"}
+    )
+    assert session.state == {"topic": "billing", "app:tier": "gold"}
+    with pytest.raises(AlreadyExistsError):
+        await service.create_session(app_name="app", user_id="user", session_id="s1")
+
+    for index in range(5):
+        await service.append_event(
+            session,
+            make_event(f"message {index}", 100.0 + index, {"step": index, "user:lang": "en", "temp:scratch": 1}),
+        )
+    await service.append_event(session, session.events[-1])
+    assert len(session.events) == 5
+
+    assert await service.get_event_count(app_name="app", user_id="user", session_id="s1") == 5
+
+    reopened = AdkSqliteSessionService(str(tmp_path / "sessions.db"))
+    try:
+        loaded = await reopened.get_session(app_name="app", user_id="user", session_id="s1")
+        assert [event.content.parts[0].text for event in loaded.events] == [f"message {i}" for i in range(5)]
+        assert loaded.state == {"topic": "billing", "step": 4, "app:tier": "gold", "user:lang": "en"}
+        assert loaded.last_update_time == 104.0
+        assert await reopened.get_user_state(app_name="app", user_id="user") == {"lang": "en"}
+    finally:
+        await reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_get_session_windows_recent_events(service):
+    session = await service.create_session(app_name="app", user_id="user", session_id="s1")
+    for index in range(6):
+        await service.append_event(session, make_event(f"message {index}", 100.0 + index))
+
+    def texts(loaded):
+        return [event.content.parts[0].text for event in loaded.events]
+
+    recent = await service.get_session(
+        app_name="app", user_id="user", session_id="s1", config=GetSessionConfig(num_recent_events=2)
+    )
+    assert texts(recent) == ["message 4", "message 5"]
+
+    after = await service.get_session(
+        app_name="app", user_id="user", session_id="s1", config=GetSessionConfig(after_timestamp=103.0)
+    )
+    assert texts(after) == ["message 3", "message 4", "message 5"]
+
+    full = await service.get_session(app_name="app", user_id="user", session_id="s1")
+    assert len(full.events) == 6
+
+    service.runner_event_window = 3
+    assert len((await service.get_session(app_name="app", user_id="user", session_id="s1")).events) == 6
+    windowed = await service.runner_view().get_session(app_name="app", user_id="user", session_id="s1")
+    assert texts(windowed) == ["message 3", "message 4", "message 5"]
+
+    empty = await service.get_session(
+        app_name="app", user_id="user", session_id="s1", config=GetSessionConfig(num_recent_events=0)
+    )
+    assert empty.events == []
+
+
+@pytest.mark.asyncio
+async def test_windowed_read_never_starts_on_function_response(service):
+    session = await service.create_session(app_name="app", user_id="user", session_id="s1")
+    await service.append_event(session, make_event("question", 100.0))
+    await service.append_event(
+        session,
+        Event(
+            author="agent",
+            invocation_id="inv-1",
+            timestamp=101.0,
+            content=types.Content(
+                role="model", parts=[types.Part(function_call=types.FunctionCall(name="lookup", args={}))]
+            ),
+        ),
+    )
+    await service.append_event(
+        session,
+        Event(
+            author="agent",
+            invocation_id="inv-1",
+            timestamp=102.0,
+            content=types.Content(
+                role="user",
+                parts=[types.Part(function_response=types.FunctionResponse(name="lookup", response={"ok": 1}))],
+            ),
+        ),
+    )
+    await service.append_event(session, make_event("answer", 103.0))
+
+    loaded = await service.get_session(
+        app_name="app", user_id="user", session_id="s1", config=GetSessionConfig(num_recent_events=2)
+    )
+    assert len(loaded.events) == 3
+    assert loaded.events[0].get_function_calls()
+    assert loaded.events[1].get_function_responses()
+
+
+@pytest.mark.asyncio
+async def test_list_and_delete_sessions(service):
+    await service.create_session(app_name="app", user_id="user", session_id="s1")
+    await service.create_session(app_name="app", user_id="other", session_id="s2")
+
+    listed = await service.list_sessions(app_name="app", user_id="user")
+    assert [session.id for session in listed.sessions] == ["s1"]
+    assert len((await service.list_sessions(app_name="app")).sessions) == 2
+
+    await service.delete_session(app_name="app", user_id="user", session_id="s1")
+    assert await service.get_session(app_name="app", user_id="user", session_id="s1") is None
+    assert await service.get_event_count(app_name="app", user_id="user", session_id="s1") == 0
+
+
+@pytest.mark.asyncio
+async def test_session_manager_shares_configured_sqlite_service(tmp_path):
+    manager = AdkSessionManager()
+    manager.configure_session_service(
+        SimpleNamespace(
+            adk_session_backend="sqlite",
+            adk_session_db_path=str(tmp_path / "sessions.db"),
+            adk_session_event_window=20,
+        )
+    )
+
+    first = manager.create_session_service()
+    assert isinstance(first, AdkSqliteSessionService)
+    assert manager.create_session_service() is first
+    assert first.runner_event_window == 20
+    assert manager.runner_session_service(first) is not first
+    assert manager.runner_session_service(first).event_window == 20
+
+    await manager.close_session_service()
+    assert not isinstance(manager.create_session_service(), AdkSqliteSessionService)
+
+
+@pytest.mark.asyncio
+async def test_append_events_persists_batch_in_one_call(service):
+    session = await service.create_session(app_name="app", user_id="user", session_id="s1")
+    events = [make_event(f"message {index}", 100.0 + index, {"step": index}) for index in range(3)]
+
+    await service.append_events(session, events)
+
+    assert await service.get_event_count(app_name="app", user_id="user", session_id="s1") == 3
+    loaded = await service.get_session(app_name="app", user_id="user", session_id="s1")
+    assert [event.id for event in loaded.events] == [event.id for event in events]
+    assert loaded.state == {"step": 2}
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for token-budgeted conversation windowing."""
+
+from types import SimpleNamespace
+
+from aether_frame.contracts import UniversalMessage
+from aether_frame.framework.adk.context_window import (
+    ContextWindowManager,
+    TokenEstimator,
+    resolve_history_token_budget,
+)
+
+
+def msg(role, text, **metadata):
+    return UniversalMessage(role=role, content=text, metadata=metadata)
+
+
+def test_token_estimator_counts_cjk_and_caches():
+    estimator = TokenEstimator(max_entries=2)
+    assert estimator.estimate_text("abcdefgh") == 2
+    assert estimator.estimate_text("你好世界") == 4
+    assert estimator.estimate_text("abcdefgh") == 2
+    assert (estimator.hits, estimator.misses) == (1, 2)
+
+    estimator.estimate_text("third")
+    assert len(estimator._cache) == 2
+
+
+def test_window_keeps_pinned_and_recent_messages():
+    estimator = TokenEstimator()
+    messages = [
+        msg("system", "You are helpful."),
+        msg("user", "old question " * 10),
+        msg("assistant", "old answer " * 10),
+        msg("user", "knowledge context", knowledge=True),
+        msg("user", "recent question"),
+        msg("assistant", "recent answer"),
+        msg("user", "current question"),
+    ]
+    costs = [estimator.estimate_message(message) for message in messages]
+    budget = costs[0] + costs[3] + sum(costs[4:])
+
+    result = ContextWindowManager(budget, estimator).apply(messages)
+
+    assert result.messages == [messages[0], messages[3], *messages[4:]]
+    assert result.dropped_count == 2
+    assert result.dropped_tokens == costs[1] + costs[2]
+    assert result.kept_tokens == budget
+    assert result.pinned_count == 2
+
+
+def test_window_always_keeps_newest_and_drops_orphan_tool_results():
+    messages = [
+        msg("assistant", "calling tool " * 20),
+        msg("tool", "tool output"),
+        msg("assistant", "summary of tool output"),
+        msg("user", "x" * 400),
+    ]
+    estimator = TokenEstimator()
+    budget = sum(estimator.estimate_message(message) for message in messages[1:])
+
+    result = ContextWindowManager(budget, estimator).apply(messages)
+    assert result.messages == messages[2:]
+
+    tiny = ContextWindowManager(1, estimator).apply(messages)
+    assert tiny.messages == [messages[-1]]
+
+
+def test_resolve_history_token_budget_uses_model_window_and_overrides():
+    enabled = SimpleNamespace(enable_conversation_windowing=True, conversation_history_budget_ratio=0.5)
+    assert resolve_history_token_budget("gpt-4", enabled) == 4096
+    assert resolve_history_token_budget("gpt-4-0613", enabled) == 4096
+    assert resolve_history_token_budget("gpt-4x", enabled) is None
+    settings = SimpleNamespace(
+        enable_conversation_windowing=True, conversation_token_budgets={"gpt-4": 1000, "gpt-4o": 5000}
+    )
+    assert resolve_history_token_budget("azure/gpt-4o-mini", settings) == 5000
+    assert resolve_history_token_budget("gpt-4-0613", settings) == 1000
+    # Overrides follow the same family rule: "gpt-4" does not cover "gpt-4x".
+    assert resolve_history_token_budget("gpt-4x", settings) is None
+    assert resolve_history_token_budget("gpt-4", SimpleNamespace(conversation_history_budget_ratio=0.5)) is None
+    assert resolve_history_token_budget("gpt-4", None) is None
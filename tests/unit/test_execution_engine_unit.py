@@ -6,7 +6,15 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from aether_frame.config.settings import Settings
-from aether_frame.contracts import ExecutionContext, FrameworkType, TaskComplexity, TaskStatus
+from aether_frame.contracts import (
+    ExecutionContext,
+    FrameworkType,
+    TaskChunkType,
+    TaskComplexity,
+    TaskStatus,
+    TaskStreamChunk,
+    task_result_to_chunk,
+)
 from aether_frame.execution.execution_engine import ExecutionEngine
 from aether_frame.execution.task_router import ExecutionStrategy
 from aether_frame.framework.framework_registry import FrameworkRegistry
@@ -106,6 +114,84 @@ async def test_execute_task_wraps_adapter_exceptions():
     assert "adapter crash" in result.error_message
 
 
+@pytest.mark.asyncio
+async def test_execute_task_stream_yields_validation_error_chunk():
+    engine = ExecutionEngine(MagicMock(spec=FrameworkRegistry), settings=Settings())
+    engine.task_router = MagicMock()
+    engine.task_router.route_task = AsyncMock()
+
+    request = make_task_request()
+    request.agent_config = None
+    request.agent_id = None
+    request.session_id = None
+
+    chunks = [chunk async for chunk in engine.execute_task_stream(request)]
+
+    assert len(chunks) == 1
+    assert chunks[0].chunk_type == TaskChunkType.ERROR
+    assert chunks[0].is_final
+    assert chunks[0].metadata["task_result"].metadata["error_stage"] == "execution_engine.validate_context"
+    engine.task_router.route_task.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_execute_task_stream_forwards_adapter_chunks():
+    request = make_task_request(agent_id="agent-1")
+    result = make_task_result()
+
+    async def adapter_stream(task_request, strategy):
+        yield TaskStreamChunk(
+            task_id=task_request.task_id,
+            chunk_type=TaskChunkType.RESPONSE,
+            sequence_id=0,
+            content="partial",
+        )
+        yield task_result_to_chunk(result, sequence_id=1)
+
+    framework_registry = MagicMock(spec=FrameworkRegistry)
+    adapter = MagicMock()
+    adapter.execute_task_stream = adapter_stream
+    framework_registry.get_adapter = AsyncMock(return_value=adapter)
+
+    engine = ExecutionEngine(framework_registry, settings=Settings())
+    engine.task_router = MagicMock()
+    engine.task_router.route_task = AsyncMock(return_value=_make_strategy())
+
+    chunks = [chunk async for chunk in engine.execute_task_stream(request)]
+
+    assert [chunk.chunk_type for chunk in chunks] == [TaskChunkType.RESPONSE, TaskChunkType.COMPLETE]
+    assert chunks[-1].metadata["task_result"] is result
+
+
+@pytest.mark.asyncio
+async def test_execute_task_stream_reports_adapter_failure_as_final_chunk():
+    request = make_task_request(agent_id="agent-1")
+
+    async def adapter_stream(task_request, strategy):
+        yield TaskStreamChunk(
+            task_id=task_request.task_id,
+            chunk_type=TaskChunkType.RESPONSE,
+            sequence_id=0,
+            content="partial",
+        )
+        raise RuntimeError("stream crash")
+
+    framework_registry = MagicMock(spec=FrameworkRegistry)
+    adapter = MagicMock()
+    adapter.execute_task_stream = adapter_stream
+    framework_registry.get_adapter = AsyncMock(return_value=adapter)
+
+    engine = ExecutionEngine(framework_registry, settings=Settings())
+    engine.task_router = MagicMock()
+    engine.task_router.route_task = AsyncMock(return_value=_make_strategy())
+
+    chunks = [chunk async for chunk in engine.execute_task_stream(request)]
+
+    assert chunks[-1].chunk_type == TaskChunkType.ERROR
+    assert chunks[-1].sequence_id == 1
+    assert "stream crash" in chunks[-1].content
+
+
 @pytest.mark.asyncio
 async def test_execute_task_live_requires_adapter_support():
     framework_registry = MagicMock(spec=FrameworkRegistry)
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for incremental live-connection history normalization."""
+
+from google.genai import types
+
+from aether_frame.framework.adk.history_buffer import NormalizedHistoryBuffer
+
+
+def user(text):
+    return types.Content(role="user", parts=[types.Part(text=text)])
+
+
+def model(text):
+    return types.Content(role="model", parts=[types.Part(text=text)])
+
+
+def call(call_id, name="lookup", args=None):
+    return types.Content(
+        role="model",
+        parts=[types.Part(function_call=types.FunctionCall(id=call_id, name=name, args=args or {}))],
+    )
+
+
+def response(call_id, name="lookup", payload=None):
+    return types.Content(
+        role="user",
+        parts=[
+            types.Part(
+                function_response=types.FunctionResponse(
+                    id=call_id, name=name, response=payload or {"result": "ok"}
+                )
+            )
+        ],
+    )
+
+
+def reference_normalize(history, tool_calls):
+    """From-scratch normalization used as the expected output."""
+    normalized = []
+    existing, emitted, pending = set(), set(), {}
+    for content in history:
+        for part in content.parts or []:
+            if part.function_call and part.function_call.id:
+                existing.add(part.function_call.id)
+    for content in history:
+        cloned = content.model_copy(deep=True)
+        response_part = next((p for p in cloned.parts or [] if p.function_response), None)
+        if response_part:
+            tool_response = response_part.function_response
+            call_id = tool_response.id or ""
+            cloned.role = "tool"
+            if not call_id or call_id not in existing:
+                args = tool_calls.get(call_id) or tool_response.response.get("arguments") or {}
+                normalized.append(
+                    types.Content(
+                        role="model",
+                        parts=[
+                            types.Part(
+                                function_call=types.FunctionCall(
+                                    name=tool_response.name, args=args, id=call_id or None
+                                )
+                            )
+                        ],
+                    )
+                )
+                if call_id:
+                    existing.add(call_id)
+                    emitted.add(call_id)
+                normalized.append(cloned)
+            elif call_id in emitted:
+                normalized.append(cloned)
+            else:
+                pending[call_id] = cloned
+            continue
+        normalized.append(cloned)
+        for part in cloned.parts or []:
+            if part.function_call and part.function_call.id:
+                tool_calls[part.function_call.id] = part.function_call.args or {}
+                emitted.add(part.function_call.id)
+                if part.function_call.id in pending:
+                    normalized.append(pending.pop(part.function_call.id))
+    return normalized
+
+
+def dump(contents):
+    return [content.model_dump(exclude_none=True) for content in contents]
+
+
+def assert_matches_reference_after_each_append(history):
+    buffer = NormalizedHistoryBuffer({})
+    source = []
+    for content in history:
+        source.append(content)
+        assert dump(buffer.sync(source)) == dump(reference_normalize(source, {}))
+
+
+def test_buffer_matches_reference_for_paired_tool_calls():
+    assert_matches_reference_after_each_append(
+        [user("hi"), call("c1"), response("c1"), model("done"), user("again")]
+    )
+
+
+def test_buffer_injects_call_for_orphan_response():
+    assert_matches_reference_after_each_append(
+        [user("hi"), response("orphan", payload={"arguments": {"q": 1}}), model("ok")]
+    )
+
+
+def test_buffer_rebuilds_when_call_arrives_after_injected_response():
+    history = [user("hi"), response("late"), call("late"), model("ok")]
+    assert_matches_reference_after_each_append(history)
+
+
+def test_buffer_shares_prefix_contents_and_only_processes_new_items():
+    buffer = NormalizedHistoryBuffer({})
+    first = user("hi")
+    history = [first, call("c1")]
+    normalized = buffer.sync(history)
+    assert normalized[0] is first
+
+    history.append(response("c1"))
+    normalized = buffer.sync(history)
+    assert normalized[0] is first
+    assert normalized[-1].role == "tool"
+    assert history[-1].role == "user"  # source content is not mutated
+    assert normalized[-1].parts is history[-1].parts
+    assert buffer.processed_count == 3
+
+
+def test_buffer_rebuilds_when_history_is_replaced():
+    buffer = NormalizedHistoryBuffer({})
+    buffer.sync([user("a"), model("b")])
+
+    replaced = [model("b"), user("a")]
+    assert dump(buffer.sync(replaced)) == dump(reference_normalize(replaced, {}))
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for agent-switch history handoff preparation."""
+
+import pytest
+
+from aether_frame.framework.adk.history_handoff import (
+    SUMMARY_PREFIX,
+    estimate_message_tokens,
+    fit_history_to_token_budget,
+    prepare_history_handoff,
+)
+
+
+def message(index, size=36):
+    return {"role": "user" if index % 2 == 0 else "assistant", "content": f"{index}" * size, "timestamp": float(index)}
+
+
+def test_fit_history_keeps_most_recent_suffix():
+    history = [message(index) for index in range(5)]
+    per_message = estimate_message_tokens(history[0])
+
+    kept, dropped = fit_history_to_token_budget(history, per_message * 2 + 1)
+
+    assert kept == history[3:]
+    assert dropped == history[:3]
+
+
+@pytest.mark.asyncio
+async def test_prepare_history_handoff_without_budget_keeps_everything():
+    history = [message(index) for index in range(3)]
+    handoff = await prepare_history_handoff(history, token_budget=0)
+    assert handoff.messages == history
+    assert handoff.dropped_count == 0
+
+
+@pytest.mark.asyncio
+async def test_prepare_history_handoff_truncates_and_summarizes():
+    history = [message(index) for index in range(6)]
+    per_message = estimate_message_tokens(history[0])
+
+    async def summarizer(dropped):
+        return f"{len(dropped)} turns"
+
+    truncated = await prepare_history_handoff(history, token_budget=per_message * 3)
+    assert truncated.messages == history[3:]
+    assert truncated.dropped_count == 3
+    assert truncated.dropped_tokens == per_message * 3
+    assert truncated.summarized is False
+
+    # The summary displaces two more messages, which are then folded into it.
+    summarized = await prepare_history_handoff(history, token_budget=per_message * 4, summarizer=summarizer)
+    assert summarized.summarized is True
+    assert summarized.messages[0]["content"] == f"{SUMMARY_PREFIX} 4 turns"
+    assert summarized.messages[1:] == history[4:]
+    assert summarized.dropped_count == 4
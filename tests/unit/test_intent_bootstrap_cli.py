@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the intent bootstrap CLI."""
+
+import json
+
+from aether_frame.intent.bootstrap.cli import main
+
+OUTPUT_FILES = [
+    "prelabels.jsonl",
+    "labeling_summary.json",
+    "unknown_samples.jsonl",
+    "review_payloads/label_studio.jsonl",
+]
+
+
+def test_streaming_workers_mode_matches_in_memory_outputs(tmp_path):
+    seeds = {
+        "capability_seeds": [
+            {
+                "intent_name": "refund_order",
+                "description": "refund an order",
+                "downstream_execution": "agent",
+                "example_messages": ["refund my order"],
+            },
+            {
+                "intent_name": "track_order",
+                "description": "track shipping for an order",
+                "downstream_execution": "agent",
+            },
+        ]
+    }
+    messages = ["refund my order", "order", "where is my shipping", "weather today", "refund order please"]
+    seed_path = tmp_path / "seeds.json"
+    seed_path.write_text(json.dumps(seeds), encoding="utf-8")
+    trace_path = tmp_path / "traces.jsonl"
+    trace_path.write_text(
+        "".join(
+            json.dumps(
+                {
+                    "sample_id": f"s{index}",
+                    "conversation_id": f"c{index}",
+                    "user_message": messages[index % len(messages)],
+                    "created_at": "2024-01-01",
+                }
+            )
+            + "\n"
+            for index in range(23)
+        ),
+        encoding="utf-8",
+    )
+
+    def run(output_dir, *extra):
+        args = [
+            "--mode", "prelabel-review",
+            "--input-traces", str(trace_path),
+            "--capability-seeds", str(seed_path),
+            "--output-dir", str(output_dir),
+            *extra,
+        ]
+        assert main(args) == 0
+
+    run(tmp_path / "baseline")
+    run(tmp_path / "streamed", "--workers", "2", "--batch-size", "4")
+
+    for name in OUTPUT_FILES:
+        assert (tmp_path / "streamed" / name).read_text() == (tmp_path / "baseline" / name).read_text()
+    summary = json.loads((tmp_path / "streamed" / "labeling_summary.json").read_text())
+    assert summary["total_samples"] == 23
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for near-duplicate collapsing in intent bootstrap."""
+
+from aether_frame.intent.bootstrap.contracts import (
+    CapabilitySeedFile,
+    CapabilitySeedIntent,
+    InputTraceSample,
+)
+from aether_frame.intent.bootstrap.dedup import group_near_duplicates
+from aether_frame.intent.bootstrap.io import PrelabelOutputWriter
+from aether_frame.intent.bootstrap.labeling import _tokenize, prelabel_samples
+
+
+def test_group_near_duplicates_by_tokens_and_minhash():
+    texts = [
+        "Refund my order 1234 now",
+        "refund my ORDER 1234 now!",
+        "refund my order 1234 now today",
+        "reset password",
+        "???",
+        "!!!",
+    ]
+    token_sets = [_tokenize(text) for text in texts]
+
+    exact = group_near_duplicates(token_sets)
+    assert [cluster.members for cluster in exact] == [[0, 1], [2], [3], [4], [5]]
+
+    near = group_near_duplicates(token_sets, method="minhash", threshold=0.7)
+    assert [cluster.members for cluster in near] == [[0, 1, 2], [3], [4], [5]]
+
+
+def test_minhash_clusters_compare_against_the_representative():
+    first = set("abcdefghij")
+    second = (first - {"j"}) | {"k"}
+    third = (second - {"i"}) | {"l"}
+
+    clusters = group_near_duplicates([first, second, third], method="minhash", threshold=0.75)
+
+    # The chain first~second~third does not pull third into first's cluster.
+    assert [cluster.members for cluster in clusters] == [[0, 1], [2]]
+
+
+def test_prelabel_samples_fans_out_cluster_labels():
+    seeds = CapabilitySeedFile(
+        capability_seeds=[
+            CapabilitySeedIntent("refund_order", "refund an order", "agent"),
+            CapabilitySeedIntent("reset_password", "reset account password", "agent"),
+        ]
+    )
+    samples = [
+        InputTraceSample(f"s{index}", f"c{index}", text, "2024-01-01")
+        for index, text in enumerate(
+            ["refund my order", "reset password", "Refund my order!", "refund order my"]
+        )
+    ]
+
+    plain, _ = prelabel_samples(samples, seeds)
+    records, summary = prelabel_samples(samples, seeds, dedup="tokens")
+
+    assert [record.predicted_intent for record in records] == [record.predicted_intent for record in plain]
+    assert [record.top_candidates for record in records] == [record.top_candidates for record in plain]
+    assert records[0].duplicate_cluster_size == 3
+    assert records[2].duplicate_of == "s0"
+    assert records[2].text == "Refund my order!"
+    assert summary.total_samples == 4
+    assert summary.collapsed_sample_count == 2
+    assert summary.duplicate_cluster_sizes == {"3": 1}
+    assert summary.top_duplicate_clusters == [{"representative_sample_id": "s0", "size": 3}]
+
+
+def test_sample_metadata_does_not_mark_duplicates(tmp_path):
+    seeds = CapabilitySeedFile(
+        capability_seeds=[CapabilitySeedIntent("refund_order", "refund an order", "agent")]
+    )
+    samples = [
+        InputTraceSample(
+            "s0",
+            "c0",
+            "something unrelated",
+            "2024-01-01",
+            metadata={"duplicate_of": "upstream-id", "duplicate_cluster_size": 7},
+        )
+    ]
+
+    records, _ = prelabel_samples(samples, seeds)
+    with PrelabelOutputWriter(tmp_path) as writer:
+        writer.write_records(records)
+
+    assert records[0].duplicate_of is None
+    assert records[0].metadata["duplicate_cluster_size"] == 7
+    review_rows = (tmp_path / "review_payloads" / "label_studio.jsonl").read_text().splitlines()
+    assert len(review_rows) == 1
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for intent bootstrap prelabeling."""
+
+import math
+import random
+
+import pytest
+
+from aether_frame.intent.bootstrap.contracts import (
+    CapabilitySeedFile,
+    CapabilitySeedIntent,
+    InputTraceSample,
+)
+from aether_frame.intent.bootstrap.labeling import SeedIndex, _seed_tokens, _tokenize, prelabel_samples
+
+VOCABULARY = ["refund", "order", "status", "invoice", "password", "reset", "shipping", "track", "cancel", "account"]
+
+
+def reference_candidates(sample_tokens, seeds):
+    """Brute-force cosine-overlap ranking against every seed."""
+    scores = []
+    for seed in seeds:
+        seed_tokens = _seed_tokens(seed)
+        overlap = sample_tokens & seed_tokens
+        score = 0.0
+        if sample_tokens and seed_tokens and overlap:
+            score = len(overlap) / math.sqrt(len(sample_tokens) * len(seed_tokens))
+        scores.append((round(score, 4), seed.intent_name))
+    scores.sort(key=lambda item: (-item[0], item[1]))
+    return scores[:3]
+
+
+def test_seed_index_matches_brute_force_scoring():
+    rng = random.Random(7)
+    seeds = [
+        CapabilitySeedIntent(
+            intent_name=f"intent_{index}",
+            description=" ".join(rng.sample(VOCABULARY, 3)),
+            downstream_execution="agent",
+            example_messages=[" ".join(rng.sample(VOCABULARY, 2))],
+        )
+        for index in range(8)
+    ]
+    seeds.append(CapabilitySeedIntent(intent_name="a", description="the", downstream_execution="agent"))
+    index = SeedIndex(seeds)
+
+    for _ in range(200):
+        tokens = _tokenize(" ".join(rng.sample(VOCABULARY + ["unrelated"], rng.randint(0, 5))))
+        ranked = [(candidate.score, candidate.intent_name) for candidate in index.top_candidates(tokens)]
+        assert ranked == reference_candidates(tokens, seeds)
+
+
+def test_prelabel_samples_flags_unknown_and_confusions():
+    seeds = CapabilitySeedFile(
+        capability_seeds=[
+            CapabilitySeedIntent("refund_order", "refund an order", "agent", example_messages=["refund my order"]),
+            CapabilitySeedIntent("track_order", "track an order", "agent", example_messages=["track my order"]),
+            CapabilitySeedIntent("disabled", "refund", "agent", enabled=False),
+        ]
+    )
+    samples = [
+        InputTraceSample("s1", "c1", "refund my order", "2024-01-01"),
+        InputTraceSample("s2", "c2", "order", "2024-01-01"),
+        InputTraceSample("s3", "c3", "weather today", "2024-01-01"),
+    ]
+
+    records, summary = prelabel_samples(samples, seeds)
+
+    assert records[0].predicted_intent == "refund_order"
+    assert [candidate.intent_name for candidate in records[0].top_candidates] == ["refund_order", "track_order"]
+    assert records[1].review_reason == "high_confusion"
+    assert records[2].predicted_intent == "unknown"
+    assert summary.unknown_count == 1
+    assert summary.top_confusions == [{"intent_a": "refund_order", "intent_b": "track_order", "count": 1}]
+
+
+def test_sparse_backend_matches_index_backend():
+    pytest.importorskip("scipy")
+    rng = random.Random(11)
+    seeds = CapabilitySeedFile(
+        capability_seeds=[
+            CapabilitySeedIntent(
+                f"intent_{index % 5}", " ".join(rng.sample(VOCABULARY, 4)), "agent"
+            )
+            for index in range(7)
+        ]
+    )
+    samples = [
+        InputTraceSample(str(index), "c", " ".join(rng.sample(VOCABULARY, rng.randint(0, 4))) or "hi", "t")
+        for index in range(100)
+    ]
+
+    assert prelabel_samples(samples, seeds, backend="sparse") == prelabel_samples(samples, seeds)
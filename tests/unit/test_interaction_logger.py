@@ -2,6 +2,10 @@
 """Unit tests for UnifiedInteractionLogger context manager."""
 
 import logging
+import os
+import subprocess
+import sys
+import textwrap
 from pathlib import Path
 
 import pytest
@@ -24,6 +28,7 @@ def test_unified_interaction_logger_writes_to_file(tmp_path, capsys):
     logger.log_interaction_complete("sess-1", "task-1", True, {"summary": "ok"})
 
     # Force flush and inspect file contents
+    logger.flush()
     assert log_path.exists()
     contents = log_path.read_text()
     assert "USER REQUEST" in contents
@@ -45,6 +50,7 @@ def test_logger_additional_branches(tmp_path):
     logger.log_error("TypeError", "bad", {"field": "name"})
     logger.log_performance("op", 5.0)
     logger.log_interaction_complete("sess-2", "task-2", False)
+    logger.flush()
 
     contents = log_path.read_text()
     assert "Agent: assistant" in contents
@@ -66,3 +72,23 @@ def test_interaction_session_context_manager(tmp_path):
     with pytest.raises(RuntimeError):
         with InteractionSession("sess-4", "task-4", "hey") as session:
             raise RuntimeError("fail")
+
+
+def test_pending_records_are_written_at_interpreter_exit(tmp_path):
+    log_path = tmp_path / "exit.log"
+    script = textwrap.dedent(
+        f"""
+        from aether_frame.common.interaction_logger import UnifiedInteractionLogger
+
+        logger = UnifiedInteractionLogger({str(log_path)!r})
+        for index in range(5000):
+            logger.logger.info("record %d", index)
+        """
+    )
+
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(path for path in sys.path if path))
+    subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, timeout=120, env=env)
+
+    lines = log_path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 5000
+    assert lines[-1].endswith("record 4999")
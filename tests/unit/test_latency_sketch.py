@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for streaming latency aggregates."""
+
+import random
+
+import pytest
+
+from aether_frame.observability.latency_sketch import LatencySketch, StreamingStats
+
+
+def test_latency_sketch_quantiles_within_relative_accuracy_and_merge():
+    rng = random.Random(5)
+    values = [rng.lognormvariate(-2, 1) for _ in range(5000)]
+    left, right, combined = LatencySketch(), LatencySketch(), LatencySketch()
+    for index, value in enumerate(values):
+        (left if index % 2 else right).add(value)
+        combined.add(value)
+    left.merge(right)
+
+    ordered = sorted(values)
+    for q in (0.5, 0.95, 0.99):
+        exact = ordered[int(q * (len(values) - 1))]
+        assert left.quantile(q) == pytest.approx(exact, rel=0.011)
+        assert left.quantile(q) == combined.quantile(q)
+
+    assert LatencySketch().quantile(0.5) is None
+    with pytest.raises(ValueError):
+        left.merge(LatencySketch(relative_accuracy=0.05))
+
+
+def test_streaming_stats_merge():
+    first, second = StreamingStats(), StreamingStats()
+    for value in (3.0, 1.0):
+        first.add(value)
+    second.add(5.0)
+    first.merge(second)
+    first.merge(StreamingStats())
+
+    assert (first.count, first.total, first.minimum, first.maximum, first.mean) == (3, 9.0, 1.0, 5.0, 3.0)
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the background log pipeline."""
+
+import json
+import logging
+import threading
+
+import pytest
+
+from aether_frame.common import log_pipeline
+from aether_frame.common.log_pipeline import (
+    BackgroundLogPipeline,
+    BatchedFileHandler,
+    JsonLinesFormatter,
+)
+
+
+class BlockingHandler(logging.Handler):
+    """Handler that holds the writer thread until released."""
+
+    def __init__(self):
+        super().__init__()
+        self.unblock = threading.Event()
+        self.started = threading.Event()
+        self.messages = []
+
+    def emit(self, record):
+        self.started.set()
+        self.unblock.wait(timeout=5)
+        self.messages.append(record.getMessage())
+
+
+def make_logger(name, pipeline):
+    logger = logging.getLogger(name)
+    logger.handlers = [pipeline.queue_handler]
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    return logger
+
+
+def test_pipeline_writes_json_lines_in_batches(tmp_path):
+    log_file = tmp_path / "pipeline.jsonl"
+    handler = BatchedFileHandler(log_file, encoding="utf-8")
+    handler.setFormatter(JsonLinesFormatter())
+    pipeline = BackgroundLogPipeline([handler])
+    logger = make_logger("test.pipeline.jsonl", pipeline)
+
+    payload = {"count": 1}
+    logger.info("hello %s", "world", extra={"execution_id": "exec-1", "key_data": payload})
+    payload["count"] = 2  # mutation after logging must not leak into the record
+    pipeline.flush()
+
+    lines = log_file.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1
+    entry = json.loads(lines[0])
+    assert entry["message"] == "hello world"
+    assert entry["execution_id"] == "exec-1"
+    assert entry["key_data"] == {"count": 1}
+    assert ": " not in lines[0]
+
+    stats = pipeline.get_stats()
+    assert stats["enqueued"] == 1
+    assert stats["written"] == 1
+    assert stats["dropped"] == 0
+    pipeline.close()
+
+
+@pytest.mark.parametrize(
+    "policy, expected",
+    [
+        (log_pipeline.OVERFLOW_DROP_NEWEST, ["first", "second"]),
+        (log_pipeline.OVERFLOW_DROP_OLDEST, ["first", "third"]),
+    ],
+)
+def test_pipeline_overflow_policies_count_drops(policy, expected):
+    handler = BlockingHandler()
+    pipeline = BackgroundLogPipeline(
+        [handler], max_queue_size=1, batch_size=1, overflow_policy=policy
+    )
+    logger = make_logger(f"test.pipeline.{policy}", pipeline)
+
+    logger.info("first")
+    assert handler.started.wait(timeout=5)
+    logger.info("second")
+    logger.info("third")
+
+    handler.unblock.set()
+    pipeline.flush()
+
+    warnings = [message for message in handler.messages if "dropped" in message]
+    assert [message for message in handler.messages if message not in warnings] == expected
+    assert warnings == ["Log pipeline queue full; dropped 1 record(s)"]
+    assert pipeline.get_stats()["dropped"] == 1
+    pipeline.close()
+
+
+def test_pipeline_rejects_unknown_policy():
+    with pytest.raises(ValueError):
+        BackgroundLogPipeline([], overflow_policy="explode")
+
+
+def test_pipeline_close_drains_and_drops_late_records(tmp_path):
+    log_file = tmp_path / "pipeline.log"
+    handler = BatchedFileHandler(log_file, encoding="utf-8")
+    pipeline = BackgroundLogPipeline([handler])
+    logger = make_logger("test.pipeline.close", pipeline)
+
+    logger.info("before close")
+    pipeline.close()
+    logger.info("after close")
+
+    assert log_file.read_text(encoding="utf-8").strip() == "before close"
+    assert pipeline.get_stats()["dropped"] == 1
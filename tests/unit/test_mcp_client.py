@@ -79,32 +79,48 @@ def make_config():
     )
 
 
+def patch_session_call(monkeypatch, call_tool):
+    @asynccontextmanager
+    async def fake_session_scope(self, extra_headers=None):
+        yield SimpleNamespace(call_tool=call_tool)
+
+    monkeypatch.setattr(MCPClient, "_session_scope", fake_session_scope, raising=False)
+
+
 @pytest.mark.asyncio
-async def test_call_tool_collects_complete_result(monkeypatch):
+async def test_call_tool_returns_result_without_progress_plumbing(monkeypatch):
     client = MCPClient(make_config())
     client.is_connected = True
     client._session = object()
+    calls = []
+
+    async def fake_call_tool(name, arguments, **kwargs):
+        calls.append(kwargs)
+        return SimpleNamespace(content=[SimpleNamespace(data={"ok": True})])
+
+    patch_session_call(monkeypatch, fake_call_tool)
 
-    async def fake_stream(name, arguments, extra_headers=None):
-        yield {"type": "stream_start"}
-        yield {"type": "complete_result", "is_final": True, "content": {"ok": True}}
+    def unexpected_stream(*args, **kwargs):
+        raise AssertionError("call_tool must not go through the streaming path")
 
-    monkeypatch.setattr(client, "call_tool_stream", fake_stream)
+    monkeypatch.setattr(client, "call_tool_stream", unexpected_stream)
 
     result = await client.call_tool("search", {"q": "docs"})
     assert result == {"ok": True}
+    assert calls == [{}]
+    assert client._progress_handlers == {}
 
 
 @pytest.mark.asyncio
-async def test_call_tool_raises_when_no_final_chunk(monkeypatch):
+async def test_call_tool_raises_when_no_result(monkeypatch):
     client = MCPClient(make_config())
     client.is_connected = True
     client._session = object()
 
-    async def incomplete_stream(name, arguments, extra_headers=None):
-        yield {"type": "stream_start"}
+    async def empty_call_tool(name, arguments, **kwargs):
+        return None
 
-    monkeypatch.setattr(client, "call_tool_stream", incomplete_stream)
+    patch_session_call(monkeypatch, empty_call_tool)
 
     with pytest.raises(MCPToolError):
         await client.call_tool("search", {})
@@ -281,21 +297,79 @@ async def test_connect_eventually_raises_after_retries(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_call_tool_raises_when_error_chunk_emitted(monkeypatch):
+async def test_call_tool_raises_when_call_fails(monkeypatch):
     client = MCPClient(make_config())
     client.is_connected = True
     client._session = object()
 
-    async def stream_with_error(name, arguments, extra_headers=None):
-        yield {"type": "stream_start"}
-        yield {"type": "error", "is_final": True, "error": "bad news"}
+    async def failing_call_tool(name, arguments, **kwargs):
+        raise RuntimeError("bad news")
 
-    monkeypatch.setattr(client, "call_tool_stream", stream_with_error)
+    patch_session_call(monkeypatch, failing_call_tool)
 
     with pytest.raises(MCPToolError, match="bad news"):
         await client.call_tool("search", {})
 
 
+@pytest.mark.asyncio
+async def test_call_tool_stream_close_cancels_call_and_clears_handler(monkeypatch):
+    client = MCPClient(make_config())
+    client.is_connected = True
+    client._session = object()
+    cancelled = asyncio.Event()
+
+    async def slow_call_tool(name, arguments, progress_callback=None):
+        await progress_callback(0.1, 1.0, "started")
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    patch_session_call(monkeypatch, slow_call_tool)
+
+    stream = client.call_tool_stream("search", {})
+    assert (await stream.__anext__())["type"] == "stream_start"
+    assert (await stream.__anext__())["message"] == "started"
+    assert len(client._progress_handlers) == 1
+
+    await stream.aclose()
+    assert cancelled.is_set()
+    assert client._progress_handlers == {}
+
+
+@pytest.mark.asyncio
+async def test_call_tool_stream_close_stops_call_before_releasing_session(monkeypatch):
+    client = MCPClient(make_config())
+    client.is_connected = True
+    client._session = object()
+    events = []
+
+    async def slow_call_tool(name, arguments, progress_callback=None):
+        await progress_callback(0.1, 1.0, "started")
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            events.append("call_cancelled")
+            raise
+
+    @asynccontextmanager
+    async def recording_session_scope(self, extra_headers=None):
+        try:
+            yield SimpleNamespace(call_tool=slow_call_tool)
+        finally:
+            events.append("session_released")
+
+    monkeypatch.setattr(MCPClient, "_session_scope", recording_session_scope, raising=False)
+
+    stream = client.call_tool_stream("search", {}, extra_headers={"X-AF-User-ID": "u1"})
+    await stream.__anext__()
+    assert (await stream.__anext__())["message"] == "started"
+
+    await stream.aclose()
+    assert events == ["call_cancelled", "session_released"]
+
+
 @pytest.mark.asyncio
 async def test_call_tool_stream_drains_remaining_progress(monkeypatch):
     client = MCPClient(make_config())
@@ -398,6 +472,16 @@ async def test_session_scope_merges_extra_headers(monkeypatch):
 
     assert recorded["headers"]["Authorization"] == "Bearer token"
     assert recorded["headers"]["X-Test"] == "123"
+    # Session is parked in the pool for reuse until the client disconnects
+    assert "session_closed" not in recorded
+    assert client.get_session_pool_stats()["idle"] == 1
+
+    async with client._session_scope(extra_headers={"x-test": " 123 "}):
+        pass
+    assert client.get_session_pool_stats()["created"] == 1
+    assert client.get_session_pool_stats()["reused"] == 1
+
+    await client.disconnect()
     assert recorded["session_closed"] is True
     assert recorded["stream_closed"] is True
 
@@ -82,3 +82,22 @@ def test_mcp_config_validation_errors():
 
     with pytest.raises(TypeError):
         MCPServerConfig.from_dict("not a dict")
+
+
+def test_mcp_config_call_limits_roundtrip_and_validation():
+    config = MCPServerConfig.from_dict(
+        {
+            "name": "search",
+            "endpoint": "http://localhost:8000/mcp",
+            "max_concurrent_calls": 2,
+            "rate_limit_per_second": 5.0,
+            "rate_limit_burst": 3,
+        }
+    )
+    data = config.to_dict()
+    assert (data["max_concurrent_calls"], data["rate_limit_per_second"], data["rate_limit_burst"]) == (2, 5.0, 3)
+
+    with pytest.raises(ValueError):
+        MCPServerConfig(name="search", endpoint="http://x", max_concurrent_calls=-1)
+    with pytest.raises(ValueError):
+        MCPServerConfig(name="search", endpoint="http://x", rate_limit_burst=0)
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the header-aware MCP session pool."""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from aether_frame.tools.mcp.session_pool import MCPSessionPool, header_fingerprint
+
+
+class FakeSession:
+    def __init__(self, headers, healthy=True):
+        self.headers = headers
+        self.healthy = healthy
+        self.closed = False
+        self.pings = 0
+
+    async def send_ping(self):
+        self.pings += 1
+        if not self.healthy:
+            raise RuntimeError("connection lost")
+
+
+class FakeOpener:
+    def __init__(self):
+        self.sessions = []
+
+    @asynccontextmanager
+    async def __call__(self, headers):
+        session = FakeSession(headers)
+        self.sessions.append(session)
+        try:
+            yield session
+        finally:
+            session.closed = True
+
+
+def test_header_fingerprint_normalizes_case_and_whitespace():
+    assert header_fingerprint({"X-User": "alice", "Auth": "t"}) == header_fingerprint(
+        {"auth": " t ", "x-user": "alice"}
+    )
+    assert header_fingerprint({"X-User": "alice"}) != header_fingerprint({"X-User": "bob"})
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_session_for_same_headers():
+    opener = FakeOpener()
+    pool = MCPSessionPool(opener)
+
+    async with pool.session({"X-User": "alice"}) as first:
+        pass
+    async with pool.session({"x-user": "alice"}) as second:
+        pass
+    async with pool.session({"X-User": "bob"}) as third:
+        pass
+
+    assert first is second
+    assert third is not first
+    stats = pool.get_stats()
+    assert stats["created"] == 2
+    assert stats["reused"] == 1
+    assert stats["idle"] == 2
+
+    await pool.close()
+    assert all(session.closed for session in opener.sessions)
+    assert pool.get_stats()["idle"] == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_discards_session_when_call_fails():
+    opener = FakeOpener()
+    pool = MCPSessionPool(opener)
+
+    with pytest.raises(RuntimeError):
+        async with pool.session({"X-User": "alice"}):
+            raise RuntimeError("tool failed")
+
+    assert opener.sessions[0].closed is True
+    assert pool.get_stats()["discarded"] == 1
+    assert pool.get_stats()["idle"] == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_limits_concurrent_sessions_per_key():
+    opener = FakeOpener()
+    pool = MCPSessionPool(opener, max_per_key=1)
+    release = asyncio.Event()
+    order = []
+
+    async def borrow(label):
+        async with pool.session({"X-User": "alice"}) as session:
+            order.append((label, id(session)))
+            await release.wait()
+
+    first = asyncio.create_task(borrow("first"))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(borrow("second"))
+    await asyncio.sleep(0.01)
+    assert [label for label, _ in order] == ["first"]
+
+    release.set()
+    await asyncio.gather(first, second)
+
+    assert len(opener.sessions) == 1
+    assert order[0][1] == order[1][1]
+
+
+@pytest.mark.asyncio
+async def test_pool_evicts_least_recently_used_idle_sessions():
+    opener = FakeOpener()
+    pool = MCPSessionPool(opener, max_idle_sessions=2)
+
+    for user in ("a", "b", "c"):
+        async with pool.session({"X-User": user}):
+            pass
+
+    assert pool.get_stats()["idle"] == 2
+    assert pool.get_stats()["evicted"] == 1
+    assert opener.sessions[0].closed is True
+    assert not opener.sessions[2].closed
+
+
+@pytest.mark.asyncio
+async def test_pool_evicts_sessions_past_idle_timeout():
+    opener = FakeOpener()
+    pool = MCPSessionPool(opener, idle_timeout=0.0)
+
+    async with pool.session({"X-User": "alice"}):
+        pass
+    async with pool.session({"X-User": "bob"}):
+        pass
+
+    assert opener.sessions[0].closed is True
+    assert pool.get_stats()["evicted"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_replaces_session_failing_health_probe():
+    opener = FakeOpener()
+    pool = MCPSessionPool(opener, health_check_interval=0.0)
+
+    async with pool.session({"X-User": "alice"}) as first:
+        pass
+    first.healthy = False
+
+    async with pool.session({"X-User": "alice"}) as second:
+        pass
+
+    assert second is not first
+    assert first.pings == 1
+    assert first.closed is True
+    assert pool.get_stats()["probe_failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_sweeps_idle_sessions_without_new_checkouts():
+    opener = FakeOpener()
+    pool = MCPSessionPool(opener, idle_timeout=0.01, sweep_interval=0.01)
+
+    async with pool.session({"X-User": "alice"}):
+        pass
+    await asyncio.sleep(0.05)
+
+    assert opener.sessions[0].closed is True
+    assert pool.get_stats()["idle"] == 0
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_open_cancellation_stops_owner_task():
+    started = asyncio.Event()
+    closed = []
+
+    @asynccontextmanager
+    async def slow_opener(headers):
+        started.set()
+        try:
+            await asyncio.sleep(10)
+            yield FakeSession(headers)
+        finally:
+            closed.append(True)
+
+    pool = MCPSessionPool(slow_opener)
+
+    async def borrow():
+        async with pool.session({"X-User": "alice"}):
+            pass
+
+    task = asyncio.create_task(borrow())
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert closed == [True]
+    assert pool.get_stats()["in_use"] == 0
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for stage latency and in-flight metric helpers."""
+
+import asyncio
+
+import pytest
+
+from aether_frame.contracts import ToolRequest
+from aether_frame.observability import metrics_backend
+from aether_frame.observability.metrics_backend import (
+    MetricsBackend,
+    time_stage,
+    time_stream,
+    track_in_flight,
+)
+from aether_frame.tools.service import ToolService
+
+
+class RecordingBackend(MetricsBackend):
+    def __init__(self):
+        self.stages = []
+        self.in_flight = {}
+
+    def observe_stage_latency(self, stage, seconds, labels=None):
+        self.stages.append((stage, seconds, dict(labels or {})))
+
+    def adjust_in_flight(self, kind, delta):
+        self.in_flight[kind] = self.in_flight.get(kind, 0) + delta
+
+    def set_in_flight(self, kind, value):
+        self.in_flight[kind] = value
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    recording = RecordingBackend()
+    monkeypatch.setattr(metrics_backend, "_METRICS_BACKEND", recording)
+    return recording
+
+
+def test_time_stage_labels_status(backend):
+    with time_stage("tool_call", namespace="search"):
+        pass
+    with pytest.raises(RuntimeError):
+        with time_stage("tool_call", namespace="search"):
+            raise RuntimeError("boom")
+    with time_stage("llm_call", model="gpt-4o") as labels:
+        labels["status"] = "timeout"
+    with time_stage("session_coordination", stage="live"):
+        pass
+
+    statuses = [(stage, labels["status"]) for stage, _, labels in backend.stages]
+    assert statuses == [
+        ("tool_call", "success"),
+        ("tool_call", "error"),
+        ("llm_call", "timeout"),
+        ("session_coordination", "success"),
+    ]
+    assert backend.stages[-1][2]["stage"] == "live"
+    assert all(seconds >= 0 for _, seconds, _ in backend.stages)
+
+
+@pytest.mark.asyncio
+async def test_time_stream_excludes_consumer_time(backend):
+    async def upstream():
+        for item in range(3):
+            await asyncio.sleep(0.01)
+            yield item
+
+    received = []
+    async for item in time_stream("llm_call", upstream(), first_item_stage="ttft", model="gpt-4o"):
+        received.append(item)
+        await asyncio.sleep(0.1)
+
+    assert received == [0, 1, 2]
+    assert [stage for stage, _, _ in backend.stages] == ["ttft", "llm_call"]
+    _, seconds, labels = backend.stages[-1]
+    assert labels == {"model": "gpt-4o", "status": "success"}
+    assert 0.03 <= seconds < 0.2
+
+
+def test_track_in_flight_restores_gauge(backend):
+    with track_in_flight("streams"):
+        with track_in_flight("streams"):
+            assert backend.in_flight["streams"] == 2
+    assert backend.in_flight["streams"] == 0
+
+
+@pytest.mark.asyncio
+async def test_tool_service_records_tool_latency(backend):
+    service = ToolService()
+    result = await service.execute_tool(ToolRequest(tool_name="missing", tool_namespace="mcp"))
+
+    assert backend.stages[-1][0] == "tool_call"
+    assert backend.stages[-1][2] == {"namespace": "mcp", "status": result.status.value}
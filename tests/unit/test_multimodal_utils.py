@@ -43,3 +43,50 @@ def test_extract_base64_from_data_url_and_raw():
     mime, data = mm.extract_base64_from_data_url("YWJjZA==")
     assert mime is None
     assert data == "YWJjZA=="
+
+
+def test_decoded_image_cache_evicts_by_bytes_and_counts():
+    cache = mm.DecodedImageCache(max_bytes=10, max_entries=8)
+    key_a = mm.DecodedImageCache.make_key("aaaa")
+    key_b = mm.DecodedImageCache.make_key("bbbb")
+    assert key_a != key_b
+
+    cache.put(key_a, mm.DecodedImage("image/png", b"123456"))
+    assert cache.get(key_a).data == b"123456"
+    cache.put(key_b, mm.DecodedImage("image/png", b"abcdef"))
+
+    assert cache.get(key_a) is None
+    assert cache.get(key_b).mime_type == "image/png"
+    cache.put(mm.DecodedImageCache.make_key("big"), mm.DecodedImage("image/png", b"x" * 11))
+    assert cache.stats() == {"entries": 1, "bytes": 6, "hits": 2, "misses": 1, "evicted_bytes": 6}
+
+
+def test_decode_image_payload_chunked_matches_full_decode():
+    image = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 40
+    encoded = base64.b64encode(image).decode("utf-8")
+    wrapped = "\n".join(encoded[i:i + 76] for i in range(0, len(encoded), 76))
+
+    decoded = mm.decode_image_payload(wrapped, chunk_chars=128)
+    assert decoded == mm.DecodedImage("image/png", image)
+    assert mm.estimate_decoded_size(wrapped) == len(image)
+
+    declared = mm.decode_image_payload(f"data:image/jpeg;base64,{encoded}", chunk_chars=64)
+    assert declared.mime_type == "image/jpeg"
+    assert mm.decode_base64_image(f"data:image/png;base64,{encoded}", max_bytes=len(image)) == image
+
+
+def test_decode_image_payload_rejects_before_full_decode(monkeypatch):
+    encoded = base64.b64encode(b"\x89PNG\r\n\x1a\n" + b"x" * 1000).decode("utf-8")
+    calls = []
+    real_decode = mm.binascii.a2b_base64
+    monkeypatch.setattr(mm.binascii, "a2b_base64", lambda data: calls.append(data) or real_decode(data))
+
+    assert mm.decode_image_payload(encoded, max_bytes=100) is None
+    assert calls == []
+
+    unknown = base64.b64encode(b"NOTANIMAGE" * 100).decode("utf-8")
+    assert mm.decode_image_payload(unknown, chunk_chars=64) is None
+    assert len(calls) == 1
+    assert mm.decode_image_payload("data:image/svg+xml;base64," + unknown) is None
+    # A declared unsupported type is rejected before anything is decoded.
+    assert len(calls) == 1
@@ -221,6 +221,7 @@ async def test_cleanup_runner_shuts_down_resources(stub_settings):
     assert result is True
     assert runner.shutdown_called is True
     assert service.shutdown_called is True
+    assert service.deleted == [("sess-1", "app", "bob")]
     assert cleaned_agents == ["agent-a"]
     assert "runner-clean" not in manager.runners
     assert "hash-clean" not in manager.config_to_runner
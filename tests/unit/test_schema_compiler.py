@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for compiled tool parameter schemas."""
+
+from aether_frame.agents.adk import tool_conversion
+from aether_frame.tools.schema_compiler import compile_schema
+
+SEARCH_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "query": {"type": "string"},
+        "limit": {"type": "integer", "default": 5},
+        "threshold": {"type": "number"},
+        "mode": {"type": "string", "enum": ["fast", "deep"]},
+        "filters": {
+            "type": "object",
+            "properties": {"tags": {"type": "array", "items": {"type": "string"}}},
+            "required": ["tags"],
+            "additionalProperties": False,
+        },
+    },
+    "required": ["query"],
+}
+
+
+def test_compiled_schema_validates_nested_values():
+    compiled = compile_schema(SEARCH_SCHEMA)
+
+    assert compiled.validate({"query": "docs", "limit": 3, "threshold": 1, "filters": {"tags": ["a"]}})
+    assert compiled.validate({"query": "docs", "limit": None})
+    assert not compiled.validate({"limit": 3})
+    assert not compiled.validate({"query": "docs", "limit": 2.5})
+    assert compiled.validate({"query": "docs", "limit": 5.0})
+    assert not compiled.validate({"query": "docs", "limit": False})
+    assert not compiled.validate({"query": "docs", "threshold": True})
+    assert not compiled.validate({"query": "docs", "mode": "slow"})
+    assert not compiled.validate({"query": "docs", "filters": {"tags": [1]}})
+    assert "extra" in compiled.first_error({"query": "docs", "filters": {"tags": [], "extra": 1}})
+
+
+def test_compile_schema_is_cached_by_content():
+    first = compile_schema(SEARCH_SCHEMA)
+    again = compile_schema({key: SEARCH_SCHEMA[key] for key in reversed(list(SEARCH_SCHEMA))})
+    assert again is first
+
+    union = compile_schema({"anyOf": [{"type": "string"}, {"type": "null"}]})
+    assert union.validate(None) and union.validate("x") and not union.validate(1)
+
+
+def test_signature_is_derived_once_per_compiled_schema():
+    signature = tool_conversion._build_signature_from_schema(SEARCH_SCHEMA)
+
+    assert signature is tool_conversion._build_signature_from_schema(dict(SEARCH_SCHEMA))
+    assert [param.name for param in signature.parameters.values()][:2] == ["query", "limit"]
+    assert signature.parameters["limit"].annotation is int
+
+
+def test_untyped_schema_keeps_parameter_docs_and_opaque_signature():
+    schema = {"properties": {"q": {"type": "string", "description": "query"}}, "required": ["q"]}
+    compiled = compile_schema(schema)
+
+    assert not compiled.is_object
+    doc = tool_conversion._augment_doc_with_schema("Doc", compiled)
+    assert doc == "Doc\n\nParameters:\n- q (required) [string]: query"
+    signature = tool_conversion._build_signature_from_schema(schema)
+    assert list(signature.parameters) == ["payload"]
@@ -2,6 +2,8 @@
 """Unit tests for session recovery models and stores."""
 
 import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 
 import pytest
 
@@ -11,6 +13,11 @@ from aether_frame.framework.adk.session_recovery import (
     InMemorySessionRecoveryStore,
     SessionRecoveryRecord,
 )
+from aether_frame.framework.adk.session_recovery_stores import (
+    FileSessionRecoveryStore,
+    SqliteSessionRecoveryStore,
+    create_session_recovery_store,
+)
 
 
 def make_agent_config():
@@ -81,3 +88,126 @@ async def test_archive_session_service_roundtrip():
 
     await service.shutdown()
     assert service.shutdown_called is True
+
+
+def make_record(chat_session_id, archived_at=None, history=None):
+    kwargs = {}
+    if archived_at is not None:
+        kwargs["archived_at"] = archived_at
+    return SessionRecoveryRecord(
+        chat_session_id=chat_session_id,
+        user_id="user-1",
+        agent_id="agent-1",
+        agent_config=make_agent_config(),
+        chat_history=history if history is not None else [{"role": "user", "content": "hello"}],
+        **kwargs,
+    )
+
+
+def test_session_recovery_record_payload_roundtrip():
+    record = make_record("chat-1")
+    restored = SessionRecoveryRecord.from_payload(record.to_payload())
+    assert restored == record
+    assert restored.agent_config.framework_type is FrameworkType.ADK
+
+
+@pytest.mark.asyncio
+async def test_in_memory_store_batch_api():
+    store = InMemorySessionRecoveryStore()
+    await store.save_many([make_record("chat-1"), make_record("chat-2")])
+    loaded = await store.load_many(["chat-1", "chat-2", "missing"])
+    assert sorted(loaded) == ["chat-1", "chat-2"]
+
+
+@pytest.fixture(params=["sqlite", "file"])
+def durable_store_factory(request, tmp_path):
+    stores = []
+
+    def factory(**kwargs):
+        if request.param == "sqlite":
+            store = SqliteSessionRecoveryStore(str(tmp_path / "recovery.db"), **kwargs)
+        else:
+            store = FileSessionRecoveryStore(str(tmp_path / "recovery.log"), **kwargs)
+        stores.append(store)
+        return store
+
+    yield factory
+    for store in stores:
+        if not store._closed:
+            asyncio.run(store.close())
+
+
+@pytest.mark.asyncio
+async def test_durable_store_persists_across_reopen(durable_store_factory):
+    store = durable_store_factory()
+    await store.save_many([make_record("chat-1"), make_record("chat-2", history=[])])
+    await store.save(make_record("chat-1", history=[{"role": "assistant", "content": "newer"}]))
+    await store.purge("chat-2")
+    await store.close()
+
+    reopened = durable_store_factory()
+    loaded = await reopened.load_many(["chat-1", "chat-2"])
+    assert list(loaded) == ["chat-1"]
+    assert loaded["chat-1"].chat_history == [{"role": "assistant", "content": "newer"}]
+    assert loaded["chat-1"].agent_config == make_agent_config()
+
+
+@pytest.mark.asyncio
+async def test_durable_store_ttl_and_bound(durable_store_factory):
+    now = datetime.now(timezone.utc)
+    store = durable_store_factory(ttl_seconds=3600, max_records=2)
+    await store.save_many(
+        [
+            make_record("expired", archived_at=now - timedelta(hours=2)),
+            make_record("oldest", archived_at=now - timedelta(minutes=30)),
+            make_record("middle", archived_at=now - timedelta(minutes=20)),
+            make_record("newest", archived_at=now - timedelta(minutes=10)),
+        ]
+    )
+
+    loaded = await store.load_many(["expired", "oldest", "middle", "newest"])
+    assert sorted(loaded) == ["middle", "newest"]
+
+    store.ttl_seconds = 15 * 60
+    assert await store.purge_expired() == 1
+    assert await store.load("middle") is None
+    assert await store.load("newest") is not None
+
+
+@pytest.mark.asyncio
+async def test_file_store_compacts_and_recovers_truncated_tail(tmp_path):
+    path = tmp_path / "recovery.log"
+    store = FileSessionRecoveryStore(str(path), compact_min_bytes=0)
+    await store.save(make_record("chat-1"))
+    single_frame_size = path.stat().st_size
+    for _ in range(4):
+        await store.save(make_record("chat-1"))
+    await store.close()
+    compacted_size = path.stat().st_size
+    assert compacted_size < 3 * single_frame_size
+
+    with open(path, "ab") as handle:
+        handle.write(b"\x01partial")
+
+    reopened = FileSessionRecoveryStore(str(path))
+    loaded = await reopened.load("chat-1")
+    assert loaded.chat_history == [{"role": "user", "content": "hello"}]
+    await reopened.close()
+    assert path.stat().st_size == compacted_size
+
+
+def test_create_session_recovery_store_selects_backend(tmp_path):
+    settings = SimpleNamespace(
+        session_recovery_backend="sqlite",
+        session_recovery_path=str(tmp_path / "recovery.db"),
+        session_recovery_ttl_seconds=0,
+        session_recovery_max_records=10,
+    )
+    store = create_session_recovery_store(settings)
+    assert isinstance(store, SqliteSessionRecoveryStore)
+    assert store.ttl_seconds is None and store.max_records == 10
+    asyncio.run(store.close())
+
+    assert isinstance(create_session_recovery_store(None), InMemorySessionRecoveryStore)
+    with pytest.raises(ValueError):
+        create_session_recovery_store(SimpleNamespace(session_recovery_backend="redis"))
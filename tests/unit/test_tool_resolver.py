@@ -88,3 +88,43 @@ async def test_resolve_tools_raises_error_when_not_found():
 
     with pytest.raises(ToolNotFoundError):
         await resolver.resolve_tools(["missingtool"])
+
+
+class CountingToolService(StubToolService):
+    def __init__(self, mapping):
+        super().__init__(mapping)
+        self.registry_generation = 0
+        self.fetches = 0
+
+    async def get_tools_dict(self, namespace=None):
+        self.fetches += 1
+        return await super().get_tools_dict(namespace)
+
+
+@pytest.mark.asyncio
+async def test_resolver_index_reused_until_registry_generation_changes():
+    echo = StubTool("builtin.echo")
+    service = CountingToolService({"builtin.echo": echo, "mcp.web_search": StubTool("mcp.web_search")})
+    resolver = ToolResolver(service)
+
+    first = await resolver.resolve_tools(["echo", "web_search", "search"])
+    again = await resolver.resolve_tools(["builtin.echo"])
+    assert service.fetches == 1
+    assert again[0] is first[0]
+    assert first[2].name == "mcp.web_search"
+
+    service.mapping["data.search"] = StubTool("data.search")
+    service.registry_generation += 1
+    refreshed = await resolver.resolve_tools(["echo", "search"])
+
+    assert service.fetches == 2
+    assert refreshed[0] is first[0]
+    assert refreshed[1].name == "data.search"
+
+
+@pytest.mark.asyncio
+async def test_resolver_suggests_similar_names_case_insensitively():
+    resolver = ToolResolver(StubToolService({"mcp.WebSearch": StubTool("mcp.WebSearch")}))
+
+    with pytest.raises(ToolNotFoundError, match="mcp.WebSearch"):
+        await resolver.resolve_tools(["websearch"])
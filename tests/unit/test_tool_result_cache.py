@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the opt-in tool result cache."""
+
+import asyncio
+
+import pytest
+
+from aether_frame.contracts import ToolRequest, ToolResult, ToolStatus, UserContext
+from aether_frame.tools.base.tool import Tool
+from aether_frame.tools.result_cache import ToolCachePolicy, ToolResultCache, build_cache_key
+from aether_frame.tools.service import ToolService
+
+
+class CountingTool(Tool):
+    def __init__(self, status=ToolStatus.SUCCESS):
+        super().__init__(name="lookup", namespace="kb")
+        self.calls = 0
+        self.status = status
+
+    async def initialize(self, config=None):
+        self._initialized = True
+
+    async def execute(self, tool_request: ToolRequest) -> ToolResult:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return ToolResult(
+            tool_name=self.name,
+            tool_namespace=self.namespace,
+            status=self.status,
+            result_data={"calls": self.calls},
+        )
+
+    async def get_schema(self):
+        return {"type": "object"}
+
+    async def validate_parameters(self, parameters):
+        return True
+
+    async def cleanup(self):
+        self._initialized = False
+
+
+def make_request(user_id="alice", **parameters):
+    return ToolRequest(
+        tool_name="lookup",
+        tool_namespace="kb",
+        parameters=parameters,
+        user_context=UserContext(user_id=user_id),
+    )
+
+
+def test_cache_key_canonicalizes_parameters_and_varies_by_user():
+    policy = ToolCachePolicy()
+    first = build_cache_key("kb.lookup", make_request(q="x", limit=1), policy)
+    reordered = build_cache_key("kb.lookup", make_request(limit=1, q="x"), policy)
+    other_user = build_cache_key("kb.lookup", make_request(user_id="bob", q="x", limit=1), policy)
+
+    assert first == reordered
+    assert first != other_user
+
+
+def test_cache_key_uses_headers_built_by_the_tool():
+    class HeaderTool:
+        def _build_request_headers(self, tool_request):
+            return {"X-AF-User-ID": "alice", "X-AF-Session-Token": tool_request.metadata["token"]}
+
+    policy = ToolCachePolicy()
+    first = make_request(q="x")
+    first.metadata = {"token": "t1"}
+    second = make_request(q="x")
+    second.metadata = {"token": "t2"}
+
+    assert build_cache_key("kb.lookup", first, policy, HeaderTool()) != build_cache_key(
+        "kb.lookup", second, policy, HeaderTool()
+    )
+    assert build_cache_key("kb.lookup", first, policy) == build_cache_key("kb.lookup", second, policy)
+
+
+@pytest.mark.asyncio
+async def test_cached_results_are_isolated_copies():
+    cache = ToolResultCache()
+
+    async def execute():
+        return ToolResult(tool_name="a", status=ToolStatus.SUCCESS, result_data={"items": [1]})
+
+    first = await cache.get_or_execute(("a", "", ()), 10, execute)
+    first.result_data["items"].append(2)
+    second = await cache.get_or_execute(("a", "", ()), 10, execute)
+
+    assert second.metadata["cache"]["hit"] is True
+    assert second.result_data == {"items": [1]}
+
+
+@pytest.mark.asyncio
+async def test_waiter_runs_the_call_when_the_owner_is_cancelled():
+    cache = ToolResultCache()
+    started = asyncio.Event()
+    calls = []
+
+    async def execute():
+        calls.append(1)
+        started.set()
+        await asyncio.sleep(0.01 if len(calls) > 1 else 3600)
+        return ToolResult(tool_name="a", status=ToolStatus.SUCCESS, result_data={"calls": len(calls)})
+
+    owner = asyncio.create_task(cache.get_or_execute(("a", "", ()), 10, execute))
+    await started.wait()
+    waiter = asyncio.create_task(cache.get_or_execute(("a", "", ()), 10, execute))
+    await asyncio.sleep(0)
+    owner.cancel()
+
+    result = await waiter
+    assert owner.cancelled()
+    assert result.result_data == {"calls": 2}
+    assert result.metadata["cache"]["hit"] is False
+
+
+@pytest.mark.asyncio
+async def test_only_one_waiter_takes_over_from_a_cancelled_owner():
+    cache = ToolResultCache()
+    started = asyncio.Event()
+    calls = []
+
+    async def execute():
+        calls.append(1)
+        started.set()
+        await asyncio.sleep(0.01 if len(calls) > 1 else 3600)
+        return ToolResult(tool_name="a", status=ToolStatus.SUCCESS, result_data={"calls": len(calls)})
+
+    owner = asyncio.create_task(cache.get_or_execute(("a", "", ()), 10, execute))
+    await started.wait()
+    waiters = [asyncio.create_task(cache.get_or_execute(("a", "", ()), 10, execute)) for _ in range(2)]
+    await asyncio.sleep(0)
+    owner.cancel()
+
+    results = await asyncio.gather(*waiters)
+    assert len(calls) == 2
+    assert [result.result_data for result in results] == [{"calls": 2}, {"calls": 2}]
+    assert sorted(result.metadata["cache"].get("shared", False) for result in results) == [False, True]
+    assert cache.stats.shared == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_the_shared_call_running():
+    cache = ToolResultCache()
+    release = asyncio.Event()
+
+    async def execute():
+        await release.wait()
+        return ToolResult(tool_name="a", status=ToolStatus.SUCCESS)
+
+    owner = asyncio.create_task(cache.get_or_execute(("a", "", ()), 10, execute))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(cache.get_or_execute(("a", "", ()), 10, execute))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    release.set()
+    result = await owner
+    assert result.status == ToolStatus.SUCCESS
+
+
+@pytest.mark.asyncio
+async def test_cache_expires_and_evicts_least_recent():
+    now = [0.0]
+    cache = ToolResultCache(max_entries=2, clock=lambda: now[0])
+    calls = []
+
+    def loader(name):
+        async def execute():
+            calls.append(name)
+            return ToolResult(tool_name=name, status=ToolStatus.SUCCESS)
+
+        return execute
+
+    await cache.get_or_execute(("a", "", ()), 10, loader("a"))
+    await cache.get_or_execute(("b", "", ()), 10, loader("b"))
+    hit = await cache.get_or_execute(("a", "", ()), 10, loader("a"))
+    await cache.get_or_execute(("c", "", ()), 10, loader("c"))
+
+    assert hit.metadata["cache"]["hit"] is True
+    assert ("b", "", ()) not in cache._entries
+    now[0] = 11.0
+    await cache.get_or_execute(("a", "", ()), 10, loader("a"))
+    assert calls == ["a", "b", "c", "a"]
+    assert cache.stats.evictions == 1
+
+
+@pytest.mark.asyncio
+async def test_tool_service_caches_declared_tools_with_single_flight():
+    service = ToolService()
+    tool = CountingTool()
+    await service.register_tool(tool)
+    service.configure_tool_cache("kb.lookup", ToolCachePolicy(ttl_seconds=60))
+
+    concurrent = await service.execute_tools([make_request(q="x"), make_request(q="x")])
+    repeat = await service.execute_tool(make_request(q="x"))
+    other_user = await service.execute_tool(make_request(user_id="bob", q="x"))
+
+    assert tool.calls == 2
+    assert sorted(result.metadata["cache"].get("shared", False) for result in concurrent) == [False, True]
+    assert repeat.metadata["cache"]["hit"] is True
+    assert repeat.result_data == {"calls": 1}
+    assert other_user.metadata["cache"]["hit"] is False
+    assert service.get_result_cache_stats()["entries"] == 2
+
+
+@pytest.mark.asyncio
+async def test_tool_service_does_not_cache_failures_or_undeclared_tools():
+    service = ToolService()
+    failing = CountingTool(status=ToolStatus.ERROR)
+    failing.cache_policy = ToolCachePolicy(ttl_seconds=60)
+    await service.register_tool(failing)
+
+    await service.execute_tool(make_request(q="x"))
+    await service.execute_tool(make_request(q="x"))
+    assert failing.calls == 2
+
+    service.configure_tool_cache("kb.lookup", None)
+    failing.cache_policy = None
+    result = await service.execute_tool(make_request(q="x"))
+    assert "cache" not in result.metadata
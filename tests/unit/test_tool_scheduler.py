@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for per-namespace tool call admission."""
+
+import asyncio
+
+import pytest
+
+from aether_frame.contracts import ToolRequest, ToolResult, ToolStatus
+from aether_frame.tools.base.tool import Tool
+from aether_frame.tools.scheduler import TokenBucket, ToolCallScheduler
+from aether_frame.tools.service import ToolService
+
+
+class SlowTool(Tool):
+    def __init__(self, namespace="search"):
+        super().__init__(name="lookup", namespace=namespace)
+        self.active = 0
+        self.peak = 0
+
+    async def initialize(self, config=None):
+        self._initialized = True
+
+    async def execute(self, tool_request: ToolRequest) -> ToolResult:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return ToolResult(
+            tool_name=self.name,
+            tool_namespace=self.namespace,
+            status=ToolStatus.SUCCESS,
+            result_data=tool_request.parameters,
+        )
+
+    async def get_schema(self):
+        return {"type": "object"}
+
+    async def validate_parameters(self, parameters):
+        return True
+
+    async def cleanup(self):
+        self._initialized = False
+
+
+def test_token_bucket_reserves_in_order():
+    now = [0.0]
+    bucket = TokenBucket(rate=10, burst=2, clock=lambda: now[0])
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.1)
+    assert bucket.reserve() == pytest.approx(0.2)
+
+    now[0] = 1.0
+    assert bucket.reserve() == 0.0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_caps_concurrency_and_reports_waits():
+    scheduler = ToolCallScheduler()
+    scheduler.configure("search", max_concurrent=2)
+    active = peak = 0
+
+    async def call():
+        nonlocal active, peak
+        async with scheduler.slot("search"):
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(call() for _ in range(5)))
+
+    stats = scheduler.stats()["search"]
+    assert peak == 2
+    assert stats["admitted"] == 5
+    assert stats["queued"] == 0 and stats["running"] == 0
+    assert stats["wait_max"] > 0
+
+
+@pytest.mark.asyncio
+async def test_call_cancelled_while_waiting_for_semaphore_refunds_token():
+    scheduler = ToolCallScheduler()
+    scheduler.configure("search", max_concurrent=1, rate_per_second=0.001, burst=2)
+    bucket = scheduler._limiters["search"].bucket
+    release = asyncio.Event()
+
+    async def hold():
+        async with scheduler.slot("search"):
+            await release.wait()
+
+    async def wait_for_slot():
+        async with scheduler.slot("search"):
+            pass
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(wait_for_slot())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert scheduler.stats()["search"]["queued"] == 0
+    assert bucket.reserve() == 0.0
+    release.set()
+    await holder
+
+
+@pytest.mark.asyncio
+async def test_execute_tools_runs_concurrently_within_namespace_limit():
+    service = ToolService()
+    limited, free = SlowTool("search"), SlowTool("files")
+    await service.register_tool(limited)
+    await service.register_tool(free)
+    service.configure_namespace_limits("search", max_concurrent=1)
+
+    requests = [
+        ToolRequest(tool_name="lookup", tool_namespace=namespace, parameters={"i": index})
+        for index, namespace in enumerate(["search", "files", "search", "files"])
+    ]
+    results = await service.execute_tools(requests)
+
+    assert [result.result_data["i"] for result in results] == [0, 1, 2, 3]
+    assert limited.peak == 1
+    assert free.peak == 2
+    assert set(service.get_scheduler_stats()) == {"search"}
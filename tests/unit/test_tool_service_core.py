@@ -96,6 +96,7 @@ async def test_register_tool_tracks_namespace():
     assert service._tools["builtin.echo"] is tool
     assert "builtin" in service._tool_namespaces
     assert "echo" in service._tool_namespaces["builtin"]
+    assert service.registry_generation == 1
 
 
 @pytest.mark.asyncio
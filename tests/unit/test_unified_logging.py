@@ -41,6 +41,7 @@ def test_execution_context_logs_flow_and_writes_file(tmp_path):
     context.log_error("Minor issue", data={"retry": True})
     context.log_success("Completed step")
     context.log_flow_end(success=True, summary_data={"status": "ok"})
+    config.flush()
 
     contents = read_log_file(log_dir)
     assert "EXECUTION STARTED" in contents
@@ -49,6 +50,46 @@ def test_execution_context_logs_flow_and_writes_file(tmp_path):
     assert '"status": "ok"' in contents
 
 
+def test_execution_contexts_share_single_sink(tmp_path):
+    log_dir = tmp_path / "logs"
+    config = unified_logging.UnifiedLoggingConfig(log_base_dir=log_dir)
+
+    first = config.create_execution_context("tool_a")
+    second = config.create_execution_context("tool_b")
+    first.log_key_data("First", {"value": 1})
+    second.log_key_data("Second", {"value": 2})
+    config.flush()
+
+    assert first.logger.handlers == second.logger.handlers
+    assert len(first.logger.handlers) == 1
+    assert len(list(log_dir.glob("execution_*.log"))) == 1
+    contents = read_log_file(log_dir)
+    assert "tool_a" in contents and "tool_b" in contents
+    config.shutdown()
+
+
+def test_execution_logger_cache_is_bounded(tmp_path):
+    config = unified_logging.UnifiedLoggingConfig(
+        log_base_dir=tmp_path / "logs", logger_cache_size=2
+    )
+
+    first = config.setup_execution_logger("lru-1", enable_console=False)
+    config.setup_execution_logger("lru-2", enable_console=False)
+    config.setup_execution_logger("lru-3", enable_console=False)
+
+    # Evicted while still referenced: stays registered and configured.
+    assert logging.getLogger("execution.lru-1") is first
+    assert len(first.handlers) == 1
+
+    del first
+    config.setup_execution_logger("lru-4", enable_console=False)
+    assert "execution.lru-1" not in logging.Logger.manager.loggerDict
+    assert "execution.lru-2" not in logging.Logger.manager.loggerDict
+    assert "execution.lru-4" in logging.Logger.manager.loggerDict
+    config.shutdown()
+    assert "execution.lru-4" not in logging.Logger.manager.loggerDict
+
+
 def test_setup_logger_and_execution_flow_formatter(capsys):
     logger = unified_logging.setup_logger("test.logger", level="INFO")
     logger.info("hello world")